@@ -0,0 +1,88 @@
+"""Benchmark the shared output sink against plain writes to the final path.
+
+Writes the same document many times into a target directory (point --dir at
+an NFS or other network mount to see the effect of large buffered writes):
+
+    python scripts/bench_output.py --pages 200 --files 50 --dir /mnt/nfs/bench
+"""
+
+from __future__ import annotations
+
+import argparse
+import shutil
+import tempfile
+import time
+from collections.abc import Callable
+from pathlib import Path
+
+from pypdf import PdfWriter
+
+from prism_docs.core.output import write_pdf
+
+
+def _make_writer(pages: int) -> PdfWriter:
+    from pypdf.generic import DecodedStreamObject, NameObject
+
+    writer = PdfWriter()
+    for i in range(pages):
+        page = writer.add_blank_page(width=612, height=792)
+        content = DecodedStreamObject()
+        # Enough content per page that the output is a few hundred KB per 100 pages
+        content.set_data(
+            b"".join(
+                b"BT /F1 9 Tf 20 %d Td (line %d of page %d) Tj ET\n" % (780 - j * 12, j, i)
+                for j in range(60)
+            )
+        )
+        page[NameObject("/Contents")] = writer._add_object(content)
+    return writer
+
+
+def _plain(writer: PdfWriter, path: Path) -> None:
+    # What operations did before: default-buffered writes straight to the final path
+    with open(path, "wb") as f:
+        writer.write(f)
+
+
+def _run(
+    name: str,
+    write: Callable[[PdfWriter, Path], None],
+    writer: PdfWriter,
+    directory: Path,
+    files: int,
+) -> None:
+    start = time.perf_counter()
+    total = 0
+    for i in range(files):
+        path = directory / f"{name.replace(' ', '_')}_{i}.pdf"
+        write(writer, path)
+        total += path.stat().st_size
+    elapsed = time.perf_counter() - start
+    print(f"{name:>16}: {elapsed / files * 1000:8.2f} ms/file  {total / elapsed / 1e6:8.1f} MB/s")
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--pages", type=int, default=200, help="Pages per document")
+    parser.add_argument("--files", type=int, default=30, help="Files written per variant")
+    parser.add_argument("--dir", type=Path, help="Target directory (default: a temp dir)")
+    args = parser.parse_args()
+
+    writer = _make_writer(args.pages)
+    directory = Path(tempfile.mkdtemp(dir=args.dir, prefix="bench_output_"))
+    try:
+        variants: list[tuple[str, Callable[[PdfWriter, Path], None]]] = [
+            ("direct", _plain),
+            ("sink", lambda w, p: write_pdf(w, p)),
+            ("sink no rename", lambda w, p: write_pdf(w, p, atomic=False)),
+            ("sink fsync", lambda w, p: write_pdf(w, p, fsync=True)),
+        ]
+        for name, write in variants:
+            _run(name, write, writer, directory, args.files)
+    finally:
+        shutil.rmtree(directory, ignore_errors=True)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,93 @@
+"""Benchmark the page rasterizers per page.
+
+Renders the same pages with each backend, once as a batch and once a page per
+call (the pattern of per-page OCR, where process start-up and PPM decoding
+dominate for small pages):
+
+    python scripts/bench_raster.py --pdf scan.pdf --dpi 300 --pages 20
+"""
+
+from __future__ import annotations
+
+import argparse
+import tempfile
+import time
+from pathlib import Path
+
+from pypdf import PdfWriter
+from pypdf.generic import DecodedStreamObject, DictionaryObject, NameObject
+
+from prism_docs.core.raster import RASTERIZERS, get_rasterizer
+
+
+def _make_pdf(path: Path, pages: int) -> Path:
+    writer = PdfWriter()
+    font = writer._add_object(
+        DictionaryObject(
+            {
+                NameObject("/Type"): NameObject("/Font"),
+                NameObject("/Subtype"): NameObject("/Type1"),
+                NameObject("/BaseFont"): NameObject("/Helvetica"),
+            }
+        )
+    )
+    for i in range(pages):
+        page = writer.add_blank_page(width=612, height=792)
+        page[NameObject("/Resources")] = DictionaryObject(
+            {NameObject("/Font"): DictionaryObject({NameObject("/F1"): font})}
+        )
+        content = DecodedStreamObject()
+        content.set_data(
+            b"".join(
+                b"BT /F1 10 Tf 40 %d Td (Line %d of page %d, some text to rasterize) Tj ET\n"
+                % (750 - j * 14, j, i)
+                for j in range(50)
+            )
+        )
+        page[NameObject("/Contents")] = writer._add_object(content)
+    with open(path, "wb") as f:
+        writer.write(f)
+    return path
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--pdf", type=Path, help="Document to render (default: generated text)")
+    parser.add_argument("--pages", type=int, default=10, help="Pages to render")
+    parser.add_argument("--dpi", type=int, default=300, help="Resolution")
+    parser.add_argument(
+        "--backends",
+        default=",".join(RASTERIZERS),
+        help=f"Comma-separated backends (default: {','.join(RASTERIZERS)})",
+    )
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        pdf = args.pdf or _make_pdf(Path(tmp) / "bench.pdf", args.pages)
+        pages = list(range(1, args.pages + 1))
+
+        for name in args.backends.split(","):
+            rasterizer = get_rasterizer(name)
+            try:
+                start = time.perf_counter()
+                rendered = sum(1 for _ in rasterizer.render(pdf, pages, dpi=args.dpi))
+                batch = time.perf_counter() - start
+
+                start = time.perf_counter()
+                for page in pages:
+                    for _ in rasterizer.render(pdf, [page], dpi=args.dpi):
+                        pass
+                per_call = time.perf_counter() - start
+            except Exception as e:  # Missing backend or binaries
+                print(f"{name:>10}: skipped ({e})")
+                continue
+
+            print(
+                f"{name:>10}: {batch / rendered * 1000:8.1f} ms/page batched"
+                f"  {per_call / rendered * 1000:8.1f} ms/page one call per page"
+            )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,167 @@
+"""Benchmark ocr-table's table detection per page.
+
+Starts from tesseract's TSV output of synthetic dense statements (jittered
+columns, multi-word and empty cells, stray words, several blocks). The
+previous path parses it with pytesseract, as ``image_to_data`` does, and
+runs the per-word detector; the current one hands the TSV to the
+array-based detector. Checks that both find the same tables and reports
+the best time per page over several repeats:
+
+    python scripts/bench_table.py --pages 20 --rows 150 --columns 8
+"""
+
+from __future__ import annotations
+
+import argparse
+import timeit
+
+import numpy as np
+from pytesseract.pytesseract import file_to_dict
+
+from prism_docs.operations.ocr.engine import TSV_HEADER
+from prism_docs.operations.ocr.ocr_table import _detect_table_regions
+
+WIDTH = 2550  # Letter width at 300 DPI
+
+
+def _make_data(seed: int, rows: int, columns: int) -> dict[str, list]:
+    """``image_to_data`` of a page: a heading block, then a table block."""
+    rng = np.random.default_rng(seed)
+    data: dict[str, list] = {
+        key: []
+        for key in ("block_num", "par_num", "line_num", "left", "top", "width", "height", "text")
+    }
+
+    def word(block: int, line: int, left: int, top: int, text: str) -> None:
+        for key, value in zip(
+            data,
+            (block, 1, line, left, top, 18 * len(text), 30, text),
+            strict=True,
+        ):
+            data[key].append(value)
+
+    for i, text in enumerate(["Consolidated", "statement", "of", "income"]):
+        word(1, 1, 150 + i * 260, 100, text)
+
+    starts = np.linspace(150, WIDTH - 350, columns).astype(int)
+    for row in range(rows):
+        top = 200 + row * 40
+        # Tesseract's layout rows also carry empty marker entries
+        word(2, row + 1, 0, top, " ")
+        for column, start in enumerate(starts):
+            if rng.random() < 0.1:
+                continue  # Empty cell
+            left = int(start + rng.integers(-20, 20))
+            for part in range(1 if column else int(rng.integers(1, 4))):
+                word(2, row + 1, left + part * 110, top, f"r{row}c{column}w{part}")
+        if rng.random() < 0.05:
+            word(2, row + 1, int(rng.integers(0, WIDTH)), top, "stray")
+    return data
+
+
+def _make_tsv(seed: int, rows: int, columns: int) -> str:
+    """Tesseract's TSV output of the page from :func:`_make_data`."""
+    data = _make_data(seed, rows, columns)
+    lines = [TSV_HEADER]
+    for i, text in enumerate(data["text"]):
+        block, par, line = (data[key][i] for key in ("block_num", "par_num", "line_num"))
+        box = (data[key][i] for key in ("left", "top", "width", "height"))
+        lines.append("\t".join(map(str, (5, 1, block, par, line, i + 1, *box, 96.5, text))))
+    return "\n".join(lines) + "\n"
+
+
+def _previous(ocr_data: dict[str, list], img_width: int, min_columns: int = 2) -> list[dict]:
+    """The per-word detector ocr-table used before the array-based one."""
+    blocks: dict[int, dict[int, list[dict]]] = {}
+    for i in range(len(ocr_data["text"])):
+        text = ocr_data["text"][i].strip()
+        if not text:
+            continue
+        left, width = ocr_data["left"][i], ocr_data["width"][i]
+        line = blocks.setdefault(ocr_data["block_num"][i], {})
+        line.setdefault(ocr_data["line_num"][i], []).append(
+            {"text": text, "left": left, "width": width}
+        )
+
+    tables = []
+    for block_num, lines in blocks.items():
+        if len(lines) < 2:
+            continue
+        positions = [w["left"] for words in lines.values() for w in words]
+        if len(positions) < 4:
+            continue
+
+        tolerance = img_width * 0.05
+        sorted_positions = sorted(set(positions))
+        clusters: list[list[int]] = []
+        current = [sorted_positions[0]]
+        for pos in sorted_positions[1:]:
+            if pos - current[-1] < tolerance:
+                current.append(pos)
+            else:
+                if len(current) >= 2:
+                    clusters.append(current)
+                current = [pos]
+        if len(current) >= 2:
+            clusters.append(current)
+        if len(clusters) < min_columns:
+            continue
+
+        bounds = [(min(c), max(c)) for c in clusters]
+        rows = []
+        for line_num in sorted(lines):
+            row = [""] * len(bounds)
+            for w in sorted(lines[line_num], key=lambda w: w["left"]):
+                center = w["left"] + w["width"] // 2
+                for index, (low, high) in enumerate(bounds):
+                    if low - tolerance <= center <= high + tolerance * 3:
+                        break
+                else:
+                    distances = [min(abs(center - low), abs(center - high)) for low, high in bounds]
+                    index = distances.index(min(distances))
+                row[index] = f"{row[index]} {w['text']}" if row[index] else w["text"]
+            if sum(1 for cell in row if cell.strip()) >= min_columns:
+                rows.append(row)
+        if len(rows) >= 2:
+            tables.append({"block": block_num, "rows": rows})
+    return tables
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--pages", type=int, default=10, help="Synthetic pages")
+    parser.add_argument("--rows", type=int, default=150, help="Table rows per page")
+    parser.add_argument("--columns", type=int, default=8, help="Table columns")
+    parser.add_argument("--repeat", type=int, default=5, help="Timed runs; the best is reported")
+    args = parser.parse_args()
+
+    pages = [_make_tsv(seed, args.rows, args.columns) for seed in range(args.pages)]
+    words = sum(page.count("\n") - 1 for page in pages) / len(pages)
+
+    def previous(tsv: str, img_width: int) -> list[dict]:
+        return _previous(file_to_dict(tsv, "\t", -1), img_width)
+
+    timings = {}
+    results = {}
+    for name, detect in (("previous", previous), ("arrays", _detect_table_regions)):
+        results[name] = [detect(page, WIDTH) for page in pages]
+        # Best of several runs, as other load on the machine only adds time
+        runs = timeit.repeat(
+            lambda detect=detect: [detect(page, WIDTH) for page in pages],
+            number=1,
+            repeat=args.repeat,
+        )
+        timings[name] = min(runs) / len(pages)
+
+    same = sum(a == b for a, b in zip(results["previous"], results["arrays"], strict=True))
+    print(
+        f"{words:.0f} words/page: previous {timings['previous'] * 1000:.2f} ms/page, "
+        f"arrays {timings['arrays'] * 1000:.2f} ms/page "
+        f"({timings['previous'] / timings['arrays']:.1f}x), "
+        f"same tables on {same}/{len(pages)} pages"
+    )
+    return 0 if same == len(pages) else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -7,8 +7,10 @@ from typing import Any
 
 # Import operations to register them
 import prism_docs.operations  # noqa: F401
-from prism_docs.core import Config, load_config
+from prism_docs.core import Config, PageSelection, load_config
 from prism_docs.core.runner import PDFRunner
+from prism_docs.core.scanner import iter_pdf_files
+from prism_docs.operations.security.redact import PATTERN_PRESETS
 
 
 def create_parser() -> argparse.ArgumentParser:
@@ -48,11 +50,46 @@ def create_parser() -> argparse.ArgumentParser:
         action="store_true",
         help="Process multiple files in parallel",
     )
+    parser.add_argument(
+        "--executor",
+        choices=["thread", "process"],
+        help="Worker type for --parallel (processes suit CPU-bound work such as encryption)",
+    )
     parser.add_argument(
         "--output-dir",
         type=Path,
         help="Directory for output files",
     )
+    parser.add_argument(
+        "--linearize",
+        action="store_true",
+        help="Write linearized (fast web view) PDFs; requires pikepdf",
+    )
+    parser.add_argument(
+        "--fsync",
+        action="store_true",
+        help="Flush each output to disk before reporting success",
+    )
+    parser.add_argument(
+        "--rasterizer",
+        choices=["pdf2image", "pdfium"],
+        help="Page renderer for OCR and page images (pdfium needs pypdfium2)",
+    )
+    parser.add_argument(
+        "--ocr-engine",
+        choices=["auto", "tesserocr", "pytesseract"],
+        help="OCR engine (default: auto, tesserocr when installed)",
+    )
+    parser.add_argument(
+        "--ocr-cache-dir",
+        type=Path,
+        help="Directory of the OCR cache (default: ~/.cache/prism-docs/ocr)",
+    )
+    parser.add_argument(
+        "--no-ocr-cache",
+        action="store_true",
+        help="Turn off the OCR cache, which is on by default",
+    )
 
     subparsers = parser.add_subparsers(dest="command", help="Available commands")
 
@@ -86,9 +123,13 @@ def create_parser() -> argparse.ArgumentParser:
     _add_permissions_command(subparsers)
     _add_redact_command(subparsers)
 
+    # Form operations
+    _add_form_fill_command(subparsers)
+
     # Info and utility operations
     _add_info_command(subparsers)
     _add_validate_command(subparsers)
+    _add_inventory_command(subparsers)
     _add_crop_command(subparsers)
     _add_resize_command(subparsers)
     _add_bookmarks_command(subparsers)
@@ -112,8 +153,8 @@ def create_parser() -> argparse.ArgumentParser:
 
 
 def _add_encrypt_command(subparsers) -> None:
-    parser = subparsers.add_parser("encrypt", help="Encrypt a PDF with a password")
-    parser.add_argument("input", type=Path, help="Input PDF file")
+    parser = subparsers.add_parser("encrypt", help="Encrypt PDFs with a password")
+    parser.add_argument("inputs", type=Path, nargs="+", help="Input PDF files")
     parser.add_argument("password", help="Password to encrypt the PDF")
     parser.add_argument("-o", "--output", type=Path, help="Output PDF file")
     parser.add_argument("--owner-password", help="Owner password (defaults to user password)")
@@ -126,10 +167,14 @@ def _add_encrypt_command(subparsers) -> None:
 
 
 def _add_decrypt_command(subparsers) -> None:
-    parser = subparsers.add_parser("decrypt", help="Decrypt a password-protected PDF")
-    parser.add_argument("input", type=Path, help="Encrypted PDF file")
-    parser.add_argument("password", help="Password to decrypt the PDF")
+    parser = subparsers.add_parser("decrypt", help="Decrypt password-protected PDFs")
+    parser.add_argument(
+        "inputs", nargs="+", help="Encrypted PDF files (a trailing password is still accepted)"
+    )
     parser.add_argument("-o", "--output", type=Path, help="Output PDF file")
+    parser.add_argument("--password", help="Password to decrypt the PDF (tried first)")
+    parser.add_argument("--passwords", type=str, help="Comma-separated candidate passwords")
+    parser.add_argument("--keyring", type=Path, help="File with one candidate password per line")
 
 
 def _add_merge_command(subparsers) -> None:
@@ -233,6 +278,16 @@ def _add_metadata_command(subparsers) -> None:
     parser.add_argument("--title", help="Set document title")
     parser.add_argument("--author", help="Set document author")
     parser.add_argument("--subject", help="Set document subject")
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help="Append only the changed objects to a copy of the input instead of rewriting it",
+    )
+    parser.add_argument(
+        "--in-place",
+        action="store_true",
+        help="Append the changes to the input file itself (implies --incremental)",
+    )
 
 
 # Page manipulation commands
@@ -332,6 +387,17 @@ def _add_pdf_to_images_command(subparsers) -> None:
     )
     parser.add_argument("--dpi", type=int, default=150, help="Image resolution (DPI)")
     parser.add_argument("--pages", type=str, help="Pages to convert (e.g., '1,3,5' or '1-5')")
+    parser.add_argument(
+        "--workers", type=int, help="Page chunks rendered in parallel (default: CPU count)"
+    )
+    parser.add_argument(
+        "--chunk-size", type=int, help="Pages per renderer process (default: spread evenly)"
+    )
+    parser.add_argument(
+        "--thumbnails",
+        type=str,
+        help="Also write thumbnails of these longest-edge sizes in pixels (e.g., '256,128')",
+    )
 
 
 def _add_extract_images_command(subparsers) -> None:
@@ -344,20 +410,44 @@ def _add_extract_images_command(subparsers) -> None:
     parser.add_argument("--min-size", type=int, default=0, help="Minimum image dimension in pixels")
 
 
+# Form operation commands
+def _add_form_fill_command(subparsers) -> None:
+    parser = subparsers.add_parser("form-fill", help="Fill a form template from CSV or JSONL")
+    parser.add_argument("input", type=Path, help="Form template PDF")
+    parser.add_argument("--data", type=Path, required=True, help="CSV or JSONL records")
+    parser.add_argument(
+        "-o", "--output", type=Path, help="Output directory (or output file with --merge)"
+    )
+    parser.add_argument(
+        "--format", choices=["csv", "jsonl"], help="Record format (default: from extension)"
+    )
+    parser.add_argument("--merge", action="store_true", help="Write one merged PDF")
+    parser.add_argument("--name-field", type=str, help="Record field used to name outputs")
+    parser.add_argument("--flatten", action="store_true", help="Flatten each filled form")
+    parser.add_argument(
+        "--annotations", action="store_true", help="With --flatten, also flatten annotations"
+    )
+    parser.add_argument("--workers", type=int, default=1, help="Worker processes")
+    parser.add_argument("--batch-size", type=int, default=64, help="Records per worker task")
+
+
 # Security operation commands
 def _add_flatten_command(subparsers) -> None:
     parser = subparsers.add_parser("flatten", help="Flatten PDF annotations and forms")
     parser.add_argument("input", type=Path, help="Input PDF file")
     parser.add_argument("-o", "--output", type=Path, help="Output PDF file")
     parser.add_argument(
-        "--annotations", action="store_true", default=True, help="Flatten annotations"
+        "--annotations", action="store_true", help="Also flatten non-form annotations"
     )
     parser.add_argument("--forms", action="store_true", default=True, help="Flatten form fields")
+    parser.add_argument(
+        "--no-forms", action="store_false", dest="forms", help="Leave form fields interactive"
+    )
 
 
 def _add_permissions_command(subparsers) -> None:
     parser = subparsers.add_parser("permissions", help="Set PDF permissions")
-    parser.add_argument("input", type=Path, help="Input PDF file")
+    parser.add_argument("inputs", type=Path, nargs="+", help="Input PDF files")
     parser.add_argument("--owner-password", required=True, help="Owner password")
     parser.add_argument("-o", "--output", type=Path, help="Output PDF file")
     parser.add_argument("--allow-print", action="store_true", help="Allow printing")
@@ -374,22 +464,92 @@ def _add_redact_command(subparsers) -> None:
     parser.add_argument(
         "--regions", type=str, help="Regions to redact (format: page:x1,y1,x2,y2;...)"
     )
-    parser.add_argument("--text", type=str, help="Text pattern to redact (regex)")
+    parser.add_argument(
+        "--text", type=str, action="append", help="Text pattern to redact (regex, repeatable)"
+    )
+    parser.add_argument("--terms", type=str, help="Comma-separated literal terms to redact")
+    parser.add_argument("--terms-file", type=Path, help="File with one literal term per line")
+    parser.add_argument(
+        "--preset",
+        choices=sorted(PATTERN_PRESETS),
+        action="append",
+        help="Built-in pattern to redact (repeatable)",
+    )
+    parser.add_argument("--ignore-case", action="store_true", help="Case-insensitive matching")
+    parser.add_argument(
+        "--ocr-fallback", action="store_true", help="OCR pages without a text layer"
+    )
+    parser.add_argument("--pages", type=str, help="Pages to redact (e.g., '1,3,5' or '1-5')")
+    parser.add_argument("--workers", type=int, default=1, help="Worker processes for page search")
     parser.add_argument("--color", default="black", help="Redaction color")
 
 
 # Info and utility commands
 def _add_info_command(subparsers) -> None:
     parser = subparsers.add_parser("info", help="Show PDF information")
-    parser.add_argument("input", type=Path, help="Input PDF file")
+    parser.add_argument("inputs", nargs="+", type=Path, help="PDF files or directories")
     parser.add_argument("-v", "--verbose", action="store_true", help="Show detailed metadata")
     parser.add_argument("--json", action="store_true", help="Output as JSON")
+    parser.add_argument(
+        "--fast",
+        action="store_true",
+        help="Read only the header, trailer and xref instead of parsing the whole file",
+    )
+    parser.add_argument(
+        "--jsonl",
+        help="Stream one JSON line per file to this path ('-' for stdout, the default for "
+        "directories)",
+    )
+    parser.add_argument(
+        "--workers", type=int, default=1, help="Worker processes for JSONL scans (default: 1)"
+    )
 
 
 def _add_validate_command(subparsers) -> None:
     parser = subparsers.add_parser("validate", help="Validate PDF file integrity")
-    parser.add_argument("inputs", nargs="+", type=Path, help="PDF files to validate")
+    parser.add_argument("inputs", nargs="+", type=Path, help="PDF files or directories")
     parser.add_argument("--strict", action="store_true", help="Use strict validation mode")
+    parser.add_argument(
+        "--fast",
+        action="store_true",
+        help="Check only the header, trailer and xref instead of parsing the whole file",
+    )
+    parser.add_argument(
+        "--deep",
+        action="store_true",
+        help="Like --fast, and verify every object offset and stream length",
+    )
+    parser.add_argument(
+        "--jsonl",
+        help="Stream one JSON line per file to this path ('-' for stdout, the default for "
+        "directories)",
+    )
+    parser.add_argument(
+        "--workers", type=int, default=1, help="Worker processes for JSONL scans (default: 1)"
+    )
+    parser.add_argument(
+        "--repair",
+        action="store_true",
+        help="Rebuild damaged files' xref into <name>-repaired.pdf (checks as --deep)",
+    )
+
+
+def _add_inventory_command(subparsers) -> None:
+    parser = subparsers.add_parser("inventory", help="Report statistics for a corpus of PDFs")
+    parser.add_argument("inputs", nargs="+", type=Path, help="PDF files or directories")
+    parser.add_argument(
+        "-o", "--output", type=Path, help="Summary file, .json or .parquet (default: JSON)"
+    )
+    parser.add_argument(
+        "--records", type=Path, help="Per-file JSONL (default: summary path with .jsonl)"
+    )
+    parser.add_argument("--workers", type=int, default=1, help="Worker processes (default: 1)")
+    parser.add_argument(
+        "--deep", action="store_true", help="Also verify every object offset and stream length"
+    )
+    parser.add_argument(
+        "--resume", action="store_true", help="Continue an interrupted run from its records"
+    )
 
 
 def _add_crop_command(subparsers) -> None:
@@ -434,19 +594,67 @@ def _add_bookmarks_command(subparsers) -> None:
     parser.add_argument(
         "--from-file", type=Path, help="File with bookmarks to add (format: title|page)"
     )
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help="Append only the changed objects to a copy of the input instead of rewriting it",
+    )
+    parser.add_argument(
+        "--in-place",
+        action="store_true",
+        help="Append the changes to the input file itself (implies --incremental)",
+    )
 
 
 # OCR operation commands
+def _ocr_dpi(value: str) -> int | str:
+    """A resolution in DPI, or 'auto' to choose one per page from the text size."""
+    return value if value == "auto" else int(value)
+
+
 def _add_ocr_command(subparsers) -> None:
     parser = subparsers.add_parser("ocr", help="Extract text from scanned PDF using OCR")
     parser.add_argument("input", type=Path, help="Input PDF file")
     parser.add_argument("-o", "--output", type=Path, help="Output text file")
     parser.add_argument("--lang", default="eng", help="OCR language (default: eng)")
-    parser.add_argument("--dpi", type=int, default=300, help="DPI for conversion (default: 300)")
+    parser.add_argument(
+        "--dpi",
+        type=_ocr_dpi,
+        default=300,
+        help="DPI for conversion, or 'auto' per page (default: 300)",
+    )
     parser.add_argument("--psm", type=int, default=3, help="Page segmentation mode (default: 3)")
     parser.add_argument("--oem", type=int, default=3, help="OCR engine mode (default: 3)")
     parser.add_argument("--pages", type=str, help="Pages to OCR (e.g., '1-5' or '1,3,5')")
     parser.add_argument("--timeout", type=int, default=30, help="Timeout per page in seconds")
+    _add_cascade_arguments(parser)
+    _add_region_arguments(parser)
+
+
+def _add_cascade_arguments(parser) -> None:
+    parser.add_argument(
+        "--cascade",
+        action="store_true",
+        help="Read fast first, then retry low-confidence pages at higher DPI with preprocessing",
+    )
+    parser.add_argument(
+        "--retry-confidence",
+        type=float,
+        default=80,
+        help="Mean word confidence (0-100) below which --cascade retries a page (default: 80)",
+    )
+
+
+def _add_region_arguments(parser) -> None:
+    parser.add_argument(
+        "--roi", action="store_true", help="OCR only the text blocks found by a layout pre-pass"
+    )
+    parser.add_argument(
+        "--template", type=Path, help="JSON file of named regions to OCR instead of whole pages"
+    )
+    parser.add_argument(
+        "--workers", type=int, default=4, help="Threads OCRing the regions of a page (default: 4)"
+    )
 
 
 def _add_ocr_extract_command(subparsers) -> None:
@@ -454,16 +662,31 @@ def _add_ocr_extract_command(subparsers) -> None:
     parser.add_argument("input", type=Path, help="Input PDF file")
     parser.add_argument("-o", "--output", type=Path, help="Output file")
     parser.add_argument("--lang", default="eng", help="OCR language")
-    parser.add_argument("--dpi", type=int, default=300, help="DPI for conversion")
+    parser.add_argument(
+        "--dpi", type=_ocr_dpi, default=300, help="DPI for conversion, or 'auto' per page"
+    )
     parser.add_argument("--psm", type=int, default=3, help="Page segmentation mode")
     parser.add_argument(
-        "--preprocess", choices=["none", "threshold", "blur", "sharpen", "denoise"], default="none"
+        "--preprocess",
+        choices=["none", "threshold", "otsu", "sauvola", "blur", "sharpen", "denoise"],
+        default="none",
     )
     parser.add_argument("--threshold", type=int, default=128, help="Binarization threshold (0-255)")
     parser.add_argument("--contrast", type=float, default=1.0, help="Contrast factor")
     parser.add_argument("--brightness", type=float, default=1.0, help="Brightness factor")
     parser.add_argument("--invert", action="store_true", help="Invert colors")
-    parser.add_argument("--format", choices=["text", "hocr", "tsv", "box", "data"], default="text")
+    parser.add_argument("--deskew", action="store_true", help="Straighten skewed text lines")
+    parser.add_argument(
+        "--crop-borders", action="store_true", help="Cut dark scanner borders from the edges"
+    )
+    parser.add_argument("--window", type=int, default=31, help="Sauvola window size in pixels")
+    parser.add_argument("--k", type=float, default=0.2, help="Sauvola sensitivity")
+    parser.add_argument(
+        "--format",
+        default="text",
+        help="Output format: text, hocr, tsv, alto, box, data, pdf, or several comma-separated "
+        "(e.g., 'text,hocr,pdf') from one OCR pass",
+    )
 
 
 def _add_searchable_pdf_command(subparsers) -> None:
@@ -473,9 +696,21 @@ def _add_searchable_pdf_command(subparsers) -> None:
     parser.add_argument("input", type=Path, help="Input scanned PDF file")
     parser.add_argument("-o", "--output", type=Path, help="Output searchable PDF file")
     parser.add_argument("--lang", default="eng", help="OCR language")
-    parser.add_argument("--dpi", type=int, default=300, help="DPI for conversion")
+    parser.add_argument(
+        "--dpi", type=_ocr_dpi, default=300, help="DPI for conversion, or 'auto' per page"
+    )
     parser.add_argument("--psm", type=int, default=3, help="Page segmentation mode")
     parser.add_argument("--timeout", type=int, default=60, help="Timeout per page in seconds")
+    parser.add_argument(
+        "--mode",
+        choices=["image", "overlay"],
+        default="image",
+        help="image: rebuild pages from the rendered images; "
+        "overlay: keep the original pages and add invisible text",
+    )
+    parser.add_argument(
+        "--sidecar", action="store_true", help="Also write the OCR text to a .txt beside the PDF"
+    )
 
 
 def _add_ocr_batch_command(subparsers) -> None:
@@ -483,9 +718,15 @@ def _add_ocr_batch_command(subparsers) -> None:
     parser.add_argument("inputs", nargs="+", type=Path, help="Input PDF files")
     parser.add_argument("--output-dir", type=Path, help="Output directory")
     parser.add_argument("--lang", default="eng", help="OCR language")
-    parser.add_argument("--dpi", type=int, default=300, help="DPI for conversion")
+    parser.add_argument(
+        "--dpi", type=_ocr_dpi, default=300, help="DPI for conversion, or 'auto' per page"
+    )
     parser.add_argument("--psm", type=int, default=3, help="Page segmentation mode")
-    parser.add_argument("--output-type", choices=["txt", "pdf"], default="txt", help="Output type")
+    parser.add_argument(
+        "--output-type",
+        default="txt",
+        help="Output type: txt, pdf, or 'txt,pdf' for both from one OCR pass",
+    )
     parser.add_argument("--fast", action="store_true", help="Fast mode with lower DPI")
 
 
@@ -494,10 +735,14 @@ def _add_ocr_data_command(subparsers) -> None:
     parser.add_argument("input", type=Path, help="Input PDF file")
     parser.add_argument("-o", "--output", type=Path, help="Output JSON file")
     parser.add_argument("--lang", default="eng", help="OCR language")
-    parser.add_argument("--dpi", type=int, default=300, help="DPI for conversion")
+    parser.add_argument(
+        "--dpi", type=_ocr_dpi, default=300, help="DPI for conversion, or 'auto' per page"
+    )
     parser.add_argument("--psm", type=int, default=3, help="Page segmentation mode")
     parser.add_argument("--min-confidence", type=int, default=0, help="Minimum confidence (0-100)")
     parser.add_argument("--level", choices=["word", "line", "block", "page"], default="word")
+    _add_cascade_arguments(parser)
+    _add_region_arguments(parser)
 
 
 def _add_ocr_table_command(subparsers) -> None:
@@ -505,9 +750,12 @@ def _add_ocr_table_command(subparsers) -> None:
     parser.add_argument("input", type=Path, help="Input PDF file")
     parser.add_argument("-o", "--output", type=Path, help="Output file")
     parser.add_argument("--lang", default="eng", help="OCR language")
-    parser.add_argument("--dpi", type=int, default=300, help="DPI for conversion")
+    parser.add_argument(
+        "--dpi", type=_ocr_dpi, default=300, help="DPI for conversion, or 'auto' per page"
+    )
     parser.add_argument("--format", choices=["csv", "tsv", "json"], default="csv")
     parser.add_argument("--pages", type=str, help="Pages to extract (e.g., '1-5')")
+    _add_region_arguments(parser)
 
 
 def _add_ocr_table_v2_command(subparsers) -> None:
@@ -546,9 +794,17 @@ def _add_ocr_detect_lang_command(subparsers) -> None:
     parser = subparsers.add_parser("ocr-detect-lang", help="Auto-detect language and OCR")
     parser.add_argument("input", type=Path, help="Input PDF file")
     parser.add_argument("-o", "--output", type=Path, help="Output text file")
-    parser.add_argument("--dpi", type=int, default=300, help="DPI for conversion")
+    parser.add_argument(
+        "--dpi", type=_ocr_dpi, default=300, help="DPI for conversion, or 'auto' per page"
+    )
     parser.add_argument("--fallback-lang", default="eng", help="Fallback language")
     parser.add_argument("--sample-pages", type=int, default=1, help="Pages to sample for detection")
+    parser.add_argument("--psm", type=int, default=3, help="Page segmentation mode")
+    parser.add_argument(
+        "--per-page",
+        action="store_true",
+        help="Detect the script of every page and OCR each in its own language",
+    )
 
 
 def _add_ocr_multi_lang_command(subparsers) -> None:
@@ -556,7 +812,9 @@ def _add_ocr_multi_lang_command(subparsers) -> None:
     parser.add_argument("input", type=Path, help="Input PDF file")
     parser.add_argument("-o", "--output", type=Path, help="Output text file")
     parser.add_argument("--langs", default="eng+fra+deu", help="Languages (+-separated)")
-    parser.add_argument("--dpi", type=int, default=300, help="DPI for conversion")
+    parser.add_argument(
+        "--dpi", type=_ocr_dpi, default=300, help="DPI for conversion, or 'auto' per page"
+    )
     parser.add_argument("--psm", type=int, default=3, help="Page segmentation mode")
 
 
@@ -573,17 +831,9 @@ def _add_list_command(subparsers) -> None:
     subparsers.add_parser("list", help="List available operations")
 
 
-def parse_page_spec(spec: str) -> list[int]:
-    """Parse a page specification like '1,3,5-8' into a list of page numbers."""
-    pages: list[int] = []
-    for part in spec.split(","):
-        part = part.strip()
-        if "-" in part:
-            start, end = part.split("-", 1)
-            pages.extend(range(int(start), int(end) + 1))
-        else:
-            pages.append(int(part))
-    return sorted(set(pages))
+def parse_page_spec(spec: str) -> PageSelection:
+    """Parse a page specification like '1,3,5-8,-2-,1-:2' into a page selection."""
+    return PageSelection.parse(spec)
 
 
 def parse_ranges(spec: str) -> list[tuple[int, int]]:
@@ -636,8 +886,22 @@ def main() -> int:
         config.global_settings.dry_run = True
     if args.parallel:
         config.global_settings.parallel = True
+    if args.executor:
+        config.global_settings.executor = args.executor
     if hasattr(args, "output_dir") and args.output_dir:
         config.default_output.output_dir = args.output_dir
+    if args.linearize:
+        config.default_output.linearize = True
+    if args.fsync:
+        config.default_output.fsync = True
+    if args.rasterizer:
+        config.global_settings.rasterizer = args.rasterizer
+    if args.ocr_engine:
+        config.global_settings.ocr_engine = args.ocr_engine
+    if args.ocr_cache_dir:
+        config.global_settings.ocr_cache_dir = str(args.ocr_cache_dir)
+    if args.no_ocr_cache:
+        config.global_settings.ocr_cache = False
 
     # Create runner
     runner = PDFRunner(config)
@@ -671,11 +935,28 @@ def _execute_command(args, runner: PDFRunner, config: Config) -> int:
         if args.owner_password:
             kwargs["owner_password"] = args.owner_password
         kwargs["algorithm"] = args.algorithm
-        results = runner.run("encrypt", args.input, args.output, **kwargs)
+        results = runner.run("encrypt", args.inputs, args.output, **kwargs)
 
     elif args.command == "decrypt":
-        kwargs["password"] = args.password
-        results = runner.run("decrypt", args.input, args.output, **kwargs)
+        inputs = list(args.inputs)
+        if args.password is None and not args.passwords and not args.keyring:
+            if len(inputs) < 2:
+                raise ValueError("decrypt needs --password, --passwords or --keyring")
+            # Old form: prism-docs decrypt input password
+            args.password = inputs.pop()
+            if not config.global_settings.quiet:
+                print(
+                    "Warning: passing the password as the last argument is deprecated; "
+                    "use --password",
+                    file=sys.stderr,
+                )
+        if args.password is not None:
+            kwargs["password"] = args.password
+        if args.passwords:
+            kwargs["passwords"] = args.passwords.split(",")
+        if args.keyring:
+            kwargs["keyring"] = args.keyring
+        results = runner.run("decrypt", [Path(p) for p in inputs], args.output, **kwargs)
 
     elif args.command == "merge":
         kwargs["merge_inputs"] = [Path(p) for p in args.inputs]
@@ -726,6 +1007,8 @@ def _execute_command(args, runner: PDFRunner, config: Config) -> int:
             kwargs["author"] = args.author
         if args.subject:
             kwargs["subject"] = args.subject
+        kwargs["incremental"] = args.incremental
+        kwargs["in_place"] = args.in_place
         results = runner.run("metadata", args.input, args.output, **kwargs)
 
     # Page manipulation commands
@@ -781,6 +1064,12 @@ def _execute_command(args, runner: PDFRunner, config: Config) -> int:
         kwargs["dpi"] = args.dpi
         if args.pages:
             kwargs["pages"] = parse_page_spec(args.pages)
+        if args.workers:
+            kwargs["workers"] = args.workers
+        if args.chunk_size:
+            kwargs["chunk_size"] = args.chunk_size
+        if args.thumbnails:
+            kwargs["thumbnails"] = [int(size) for size in args.thumbnails.split(",")]
         if args.output_dir:
             config.default_output.output_dir = args.output_dir
         results = runner.run("pdf-to-images", args.input, **kwargs)
@@ -792,6 +1081,20 @@ def _execute_command(args, runner: PDFRunner, config: Config) -> int:
             config.default_output.output_dir = args.output_dir
         results = runner.run("extract-images", args.input, **kwargs)
 
+    # Form operation commands
+    elif args.command == "form-fill":
+        kwargs["data"] = args.data
+        if args.format:
+            kwargs["data_format"] = args.format
+        kwargs["merge"] = args.merge
+        if args.name_field:
+            kwargs["name_field"] = args.name_field
+        kwargs["flatten"] = args.flatten
+        kwargs["annotations"] = args.annotations
+        kwargs["workers"] = args.workers
+        kwargs["batch_size"] = args.batch_size
+        results = runner.run("form-fill", args.input, args.output, **kwargs)
+
     # Security operation commands
     elif args.command == "flatten":
         kwargs["annotations"] = args.annotations
@@ -805,13 +1108,28 @@ def _execute_command(args, runner: PDFRunner, config: Config) -> int:
         kwargs["modify"] = args.allow_modify
         kwargs["annotations"] = args.allow_annotate
         kwargs["forms"] = args.allow_forms
-        results = runner.run("permissions", args.input, args.output, **kwargs)
+        results = runner.run("permissions", args.inputs, args.output, **kwargs)
 
     elif args.command == "redact":
         if args.regions:
             kwargs["regions"] = _parse_redact_regions(args.regions)
         if args.text:
-            kwargs["text_pattern"] = args.text
+            kwargs["patterns"] = args.text
+        terms: list[str] = []
+        if args.terms:
+            terms.extend(t.strip() for t in args.terms.split(",") if t.strip())
+        if args.terms_file:
+            lines = args.terms_file.read_text(encoding="utf-8").splitlines()
+            terms.extend(line.strip() for line in lines if line.strip())
+        if terms:
+            kwargs["terms"] = terms
+        if args.preset:
+            kwargs["presets"] = args.preset
+        kwargs["ignore_case"] = args.ignore_case
+        kwargs["ocr_fallback"] = args.ocr_fallback
+        kwargs["workers"] = args.workers
+        if args.pages:
+            kwargs["pages"] = parse_page_spec(args.pages)
         color_name = (args.color or "black").lower()
         color_map = {
             "black": (0, 0, 0),
@@ -828,11 +1146,24 @@ def _execute_command(args, runner: PDFRunner, config: Config) -> int:
     elif args.command == "info":
         kwargs["verbose"] = getattr(args, "verbose", False)
         kwargs["json"] = args.json
-        results = runner.run("info", args.input, **kwargs)
+        kwargs["fast"] = args.fast
+        results = _run_scan(runner, "info", args, kwargs)
 
     elif args.command == "validate":
         kwargs["strict"] = args.strict
-        results = runner.run("validate", args.inputs, **kwargs)
+        kwargs["fast"] = args.fast
+        kwargs["deep"] = args.deep
+        kwargs["repair"] = args.repair
+        results = _run_scan(runner, "validate", args, kwargs)
+
+    elif args.command == "inventory":
+        kwargs["inputs"] = args.inputs
+        kwargs["workers"] = args.workers
+        kwargs["deep"] = args.deep
+        kwargs["resume"] = args.resume
+        if args.records:
+            kwargs["records"] = args.records
+        results = runner.run("inventory", args.inputs[0], args.output, **kwargs)
 
     elif args.command == "crop":
         kwargs["left"] = args.left
@@ -867,6 +1198,8 @@ def _execute_command(args, runner: PDFRunner, config: Config) -> int:
             kwargs["from_file"] = str(args.from_file)
         if args.output:
             kwargs["output_path"] = args.output
+        kwargs["incremental"] = args.incremental
+        kwargs["in_place"] = args.in_place
         results = runner.run("bookmarks", args.input, **kwargs)
 
     # OCR commands
@@ -876,6 +1209,12 @@ def _execute_command(args, runner: PDFRunner, config: Config) -> int:
         kwargs["psm"] = args.psm
         kwargs["oem"] = args.oem
         kwargs["timeout"] = args.timeout
+        kwargs["cascade"] = args.cascade
+        kwargs["retry_confidence"] = args.retry_confidence
+        kwargs["roi"] = args.roi
+        kwargs["workers"] = args.workers
+        if args.template:
+            kwargs["template"] = args.template
         if args.pages:
             kwargs["pages"] = parse_page_spec(args.pages)
         results = runner.run("ocr", args.input, args.output, **kwargs)
@@ -885,6 +1224,8 @@ def _execute_command(args, runner: PDFRunner, config: Config) -> int:
         kwargs["dpi"] = args.dpi
         kwargs["psm"] = args.psm
         kwargs["timeout"] = args.timeout
+        kwargs["mode"] = args.mode
+        kwargs["sidecar"] = args.sidecar
         results = runner.run("searchable-pdf", args.input, args.output, **kwargs)
 
     elif args.command == "ocr-extract":
@@ -896,6 +1237,10 @@ def _execute_command(args, runner: PDFRunner, config: Config) -> int:
         kwargs["contrast"] = args.contrast
         kwargs["brightness"] = args.brightness
         kwargs["invert"] = args.invert
+        kwargs["deskew"] = args.deskew
+        kwargs["crop_borders"] = args.crop_borders
+        kwargs["window"] = args.window
+        kwargs["k"] = args.k
         kwargs["format"] = args.format
         results = runner.run("ocr-extract", args.input, args.output, **kwargs)
 
@@ -915,12 +1260,20 @@ def _execute_command(args, runner: PDFRunner, config: Config) -> int:
         kwargs["psm"] = args.psm
         kwargs["min_confidence"] = args.min_confidence
         kwargs["level"] = args.level
+        kwargs["cascade"] = args.cascade
+        kwargs["retry_confidence"] = args.retry_confidence
+        kwargs["roi"] = args.roi
+        kwargs["workers"] = args.workers
+        if args.template:
+            kwargs["template"] = args.template
         results = runner.run("ocr-data", args.input, args.output, **kwargs)
 
     elif args.command == "ocr-detect-lang":
         kwargs["dpi"] = args.dpi
         kwargs["fallback_lang"] = args.fallback_lang
         kwargs["sample_pages"] = args.sample_pages
+        kwargs["psm"] = args.psm
+        kwargs["per_page"] = args.per_page
         results = runner.run("ocr-detect-lang", args.input, args.output, **kwargs)
 
     elif args.command == "ocr-multi-lang":
@@ -933,6 +1286,10 @@ def _execute_command(args, runner: PDFRunner, config: Config) -> int:
         kwargs["lang"] = args.lang
         kwargs["dpi"] = args.dpi
         kwargs["format"] = args.format
+        kwargs["roi"] = args.roi
+        kwargs["workers"] = args.workers
+        if args.template:
+            kwargs["template"] = args.template
         if args.pages:
             kwargs["pages"] = parse_page_spec(args.pages)
         results = runner.run("ocr-table", args.input, args.output, **kwargs)
@@ -960,6 +1317,19 @@ def _execute_command(args, runner: PDFRunner, config: Config) -> int:
     return 0 if all(r.success for r in results) else 1
 
 
+def _run_scan(runner: PDFRunner, command: str, args, kwargs: dict) -> list:
+    """Run info/validate per file, or as one JSONL scan over files and directories."""
+    if getattr(args, "repair", False):
+        # Repairs write a file per input, so directories are expanded and run per file
+        return runner.run(command, list(iter_pdf_files(args.inputs)), **kwargs)
+    if args.jsonl or any(path.is_dir() for path in args.inputs):
+        kwargs["jsonl"] = args.jsonl
+        kwargs["inputs"] = args.inputs
+        kwargs["workers"] = args.workers
+        return runner.run(command, args.inputs[0], **kwargs)
+    return runner.run(command, args.inputs, **kwargs)
+
+
 def _handle_config_command(args, config: Config) -> int:
     """Handle config subcommand."""
     from prism_docs.core.config import get_default_config_path
@@ -1,6 +1,7 @@
 """Core module exports."""
 
 from prism_docs.core.config import Config, GlobalConfig, load_config
+from prism_docs.core.pages import PageSelection
 from prism_docs.core.registry import OperationRegistry, register_operation, registry
 from prism_docs.core.types import (
     BasePDFOperation,
@@ -21,6 +22,7 @@ __all__ = [
     "OutputNaming",
     "OverwritePolicy",
     "OperationConfig",
+    "PageSelection",
     # Config
     "Config",
     "GlobalConfig",
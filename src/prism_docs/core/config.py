@@ -1,6 +1,6 @@
 """Configuration management for Prism Docs."""
 
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, fields
 from pathlib import Path
 from typing import Any
 
@@ -28,6 +28,25 @@ class GlobalConfig:
     dry_run: bool = False
     parallel: bool = False
     max_workers: int = 4
+    executor: str = "thread"  # thread or process
+    rasterizer: str = "pdf2image"  # pdf2image or pdfium, for OCR and page images
+    ocr_engine: str = "auto"  # auto, tesserocr or pytesseract
+    ocr_cache: bool = True  # Remember what OCR detected per document
+    ocr_cache_dir: str = ""  # Default: $XDG_CACHE_HOME/prism-docs/ocr
+
+
+@dataclass
+class StorageConfig:
+    """Settings for remote (``http(s)://`` and ``s3://``) inputs and outputs."""
+
+    prefetch: int = 2  # Remote inputs downloaded ahead of the one being processed
+    pool_size: int = 8  # Keep-alive connections kept per host
+    timeout: float = 60.0  # Seconds before a stalled request fails
+    block_size: int = 256 * 1024  # Granularity of ranged reads
+    s3_endpoint_url: str = ""  # e.g. http://localhost:9000 for MinIO (default: AWS)
+    s3_region: str = ""  # Default: $AWS_REGION, then us-east-1
+    multipart_threshold: int = 64 * 1024 * 1024  # Larger uploads are sent in parts
+    part_size: int = 16 * 1024 * 1024
 
 
 @dataclass
@@ -37,6 +56,7 @@ class Config:
     global_settings: GlobalConfig = field(default_factory=GlobalConfig)
     default_output: OutputConfig = field(default_factory=OutputConfig)
     operations: dict[str, OperationConfig] = field(default_factory=dict)
+    storage: StorageConfig = field(default_factory=StorageConfig)
 
     def get_operation_config(self, operation_name: str) -> OperationConfig:
         """Get configuration for a specific operation, with defaults."""
@@ -56,6 +76,11 @@ class Config:
             dry_run=global_data.get("dry_run", False),
             parallel=global_data.get("parallel", False),
             max_workers=global_data.get("max_workers", 4),
+            executor=global_data.get("executor", "thread"),
+            rasterizer=global_data.get("rasterizer", "pdf2image"),
+            ocr_engine=global_data.get("ocr_engine", "auto"),
+            ocr_cache=global_data.get("ocr_cache", True),
+            ocr_cache_dir=global_data.get("ocr_cache_dir", ""),
         )
 
         default_output_data = data.get("default_output", {})
@@ -69,10 +94,20 @@ class Config:
                 options=op_data.get("options", {}),
             )
 
+        storage_data = data.get("storage", {})
+        storage = StorageConfig(
+            **{
+                f.name: storage_data[f.name]
+                for f in fields(StorageConfig)
+                if f.name in storage_data
+            }
+        )
+
         return cls(
             global_settings=global_settings,
             default_output=default_output,
             operations=operations,
+            storage=storage,
         )
 
     @classmethod
@@ -107,6 +142,11 @@ class Config:
                 "dry_run": self.global_settings.dry_run,
                 "parallel": self.global_settings.parallel,
                 "max_workers": self.global_settings.max_workers,
+                "executor": self.global_settings.executor,
+                "rasterizer": self.global_settings.rasterizer,
+                "ocr_engine": self.global_settings.ocr_engine,
+                "ocr_cache": self.global_settings.ocr_cache,
+                "ocr_cache_dir": self.global_settings.ocr_cache_dir,
             },
             "default_output": _output_config_to_dict(self.default_output),
             "operations": {
@@ -117,6 +157,7 @@ class Config:
                 }
                 for name, op in self.operations.items()
             },
+            "storage": {f.name: getattr(self.storage, f.name) for f in fields(self.storage)},
         }
 
     def to_yaml(self, path: Path | str) -> None:
@@ -154,6 +195,9 @@ def _parse_output_config(
         pattern=data.get("pattern", default.pattern),
         output_dir=output_dir or default.output_dir,
         overwrite=overwrite,
+        linearize=data.get("linearize", default.linearize),
+        atomic=data.get("atomic", default.atomic),
+        fsync=data.get("fsync", default.fsync),
     )
 
 
@@ -174,6 +218,12 @@ def _output_config_to_dict(config: OutputConfig) -> dict[str, Any]:
         result["pattern"] = config.pattern
     if config.output_dir:
         result["output_dir"] = str(config.output_dir)
+    if config.linearize:
+        result["linearize"] = True
+    if not config.atomic:
+        result["atomic"] = False
+    if config.fsync:
+        result["fsync"] = True
 
     return result
 
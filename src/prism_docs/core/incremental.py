@@ -0,0 +1,228 @@
+"""Incremental updates: append changed objects to an existing PDF."""
+
+import os
+import shutil
+from io import BytesIO
+from pathlib import Path
+from typing import Any, Self
+
+from prism_docs.core.output import OUTPUT_BUFFER_SIZE, atomic_output
+from prism_docs.core.scanner import read_startxref
+
+
+class IncrementalWriter:
+    """
+    Append new and modified objects to an existing PDF as an incremental update.
+
+    The original bytes are never rewritten. The update holds only the changed
+    objects, a cross-reference section for them and a trailer whose /Prev
+    points at the previous section. The document is opened lazily, so only
+    the objects an edit touches are parsed and the cost does not grow with
+    the file size.
+
+    Usage::
+
+        with IncrementalWriter("in.pdf") as writer:
+            info = writer.info()
+            info[NameObject("/Title")] = TextStringObject("New title")
+            writer.write("out.pdf")  # or writer.write() to append in place
+    """
+
+    def __init__(self, path: Path):
+        from pypdf import PdfReader
+
+        self.path = Path(path)
+        self._file = open(self.path, "rb")  # noqa: SIM115 - objects are read lazily
+        try:
+            self.reader = PdfReader(self._file)
+            if self.reader.is_encrypted:
+                raise ValueError("Incremental updates of encrypted PDFs are not supported")
+            self._prev = read_startxref(self._file)
+            self._file.seek(self._prev)
+            # Keep the xref flavour of the previous section (table vs stream)
+            self._xref_stream = not self._file.read(4).startswith(b"xref")
+        except Exception:
+            self._file.close()
+            raise
+
+        self._size = int(self.reader.trailer["/Size"])
+        self._objects: dict[int, tuple[int, Any]] = {}
+        self._trailer: dict[str, Any] = {}
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Close the underlying file."""
+        self._file.close()
+
+    @property
+    def root(self) -> Any:
+        """The document catalog. Call :meth:`update` after changing it."""
+        return self.reader.trailer["/Root"].get_object()
+
+    def info(self) -> Any:
+        """Return the document info dictionary, creating it if missing, marked as changed."""
+        from pypdf.generic import DictionaryObject
+
+        info_ref = self.reader.trailer.get("/Info")
+        if info_ref is None:
+            info = DictionaryObject()
+            self._trailer["/Info"] = self.add_object(info)
+            return info
+        info = info_ref.get_object()
+        if info.indirect_reference is None:
+            # A direct /Info in the trailer: promote it to an object of its own
+            info = DictionaryObject(info)
+            self._trailer["/Info"] = self.add_object(info)
+            return info
+        self.update(info)
+        return info
+
+    def update(self, obj: Any) -> None:
+        """Mark an object read from the document as changed."""
+        ref = obj.indirect_reference
+        if ref is None:
+            raise ValueError("Only indirect objects can be updated; use add_object instead")
+        self._objects[ref.idnum] = (ref.generation, obj)
+
+    def add_object(self, obj: Any) -> Any:
+        """Add a new object to the update and return a reference to it."""
+        from pypdf.generic import IndirectObject
+
+        ref = IndirectObject(self._size, 0, self.reader)
+        self._size += 1
+        obj.indirect_reference = ref
+        self._objects[ref.idnum] = (0, obj)
+        return ref
+
+    @property
+    def changed(self) -> int:
+        """Number of new and modified objects."""
+        return len(self._objects)
+
+    def write(self, output_path: Path | None = None, fsync: bool = False) -> Path:
+        """
+        Write the update.
+
+        Without ``output_path`` (or when it names the input) the update is
+        appended to the original file. Otherwise the original is copied and
+        the update appended to the copy through :func:`atomic_output`, so the
+        copy appears complete or not at all. ``fsync`` flushes the result to
+        disk before returning.
+        """
+        target = Path(output_path) if output_path is not None else self.path
+        base = os.fstat(self._file.fileno()).st_size
+        update = self._update(base)
+
+        if target.resolve() == self.path.resolve():
+            with open(target, "ab") as f:
+                f.write(update)
+                f.flush()
+                if fsync:
+                    os.fsync(f.fileno())
+            return target
+
+        self._file.seek(0)
+        with atomic_output(target, fsync=fsync) as f:
+            shutil.copyfileobj(self._file, f, OUTPUT_BUFFER_SIZE)
+            f.write(update)
+        return target
+
+    def _update(self, base: int) -> bytes:
+        """Serialize the changed objects, xref section and trailer for offset ``base``."""
+        body = BytesIO()
+        body.write(b"\n")
+        offsets: dict[int, tuple[int, int]] = {}
+        for idnum in sorted(self._objects):
+            generation, obj = self._objects[idnum]
+            offsets[idnum] = (generation, base + body.tell())
+            body.write(f"{idnum} {generation} obj\n".encode())
+            obj.write_to_stream(body)
+            body.write(b"\nendobj\n")
+
+        xref_offset = base + body.tell()
+        if self._xref_stream:
+            self._write_xref_stream(body, offsets, xref_offset)
+        else:
+            self._write_xref_table(body, offsets)
+        body.write(f"\nstartxref\n{xref_offset}\n%%EOF\n".encode())
+        return body.getvalue()
+
+    def _trailer_entries(self) -> dict[str, Any]:
+        from pypdf.generic import NameObject, NumberObject
+
+        entries = {
+            NameObject(key): self.reader.trailer.raw_get(key)
+            for key in ("/Root", "/Info", "/ID")
+            if key in self.reader.trailer
+        }
+        entries.update({NameObject(key): value for key, value in self._trailer.items()})
+        entries[NameObject("/Size")] = NumberObject(self._size)
+        entries[NameObject("/Prev")] = NumberObject(self._prev)
+        return entries
+
+    @staticmethod
+    def _subsections(numbers: list[int]) -> list[tuple[int, list[int]]]:
+        """Group sorted object numbers into runs of consecutive numbers."""
+        runs: list[tuple[int, list[int]]] = []
+        for number in numbers:
+            if runs and number == runs[-1][0] + len(runs[-1][1]):
+                runs[-1][1].append(number)
+            else:
+                runs.append((number, [number]))
+        return runs
+
+    def _write_xref_table(self, body: BytesIO, offsets: dict[int, tuple[int, int]]) -> None:
+        from pypdf.generic import DictionaryObject
+
+        body.write(b"xref\n")
+        # Restate the head of the free list so the table starts at object 0;
+        # some readers take a first subsection > 0 as a misnumbered table
+        for first, numbers in self._subsections(sorted({0, *offsets})):
+            body.write(f"{first} {len(numbers)}\n".encode())
+            for number in numbers:
+                if number == 0:
+                    body.write(b"0000000000 65535 f\r\n")
+                    continue
+                generation, offset = offsets[number]
+                body.write(f"{offset:010d} {generation:05d} n\r\n".encode())
+        body.write(b"trailer\n")
+        DictionaryObject(self._trailer_entries()).write_to_stream(body)
+
+    def _write_xref_stream(
+        self, body: BytesIO, offsets: dict[int, tuple[int, int]], xref_offset: int
+    ) -> None:
+        from pypdf.generic import ArrayObject, NameObject, NumberObject, StreamObject
+
+        # The xref stream is itself an object and lists its own offset. Its
+        # number is not allocated, so writing again reuses it
+        idnum = self._size
+        offsets = {**offsets, idnum: (0, xref_offset)}
+
+        width = max(1, (xref_offset.bit_length() + 7) // 8)
+        index = ArrayObject()
+        rows = bytearray()
+        for first, numbers in self._subsections(sorted(offsets)):
+            index.extend([NumberObject(first), NumberObject(len(numbers))])
+            for number in numbers:
+                generation, offset = offsets[number]
+                rows += b"\x01" + offset.to_bytes(width, "big") + generation.to_bytes(2, "big")
+
+        stream = StreamObject()
+        stream.set_data(bytes(rows))
+        stream.update(self._trailer_entries())
+        stream[NameObject("/Size")] = NumberObject(idnum + 1)
+        stream[NameObject("/Type")] = NameObject("/XRef")
+        stream[NameObject("/W")] = ArrayObject(
+            [NumberObject(1), NumberObject(width), NumberObject(2)]
+        )
+        stream[NameObject("/Index")] = index
+        encoded = stream.flate_encode()
+
+        body.write(f"{idnum} 0 obj\n".encode())
+        encoded.write_to_stream(body)
+        body.write(b"\nendobj\n")
@@ -0,0 +1,187 @@
+"""Shared output: operations write PDFs through :func:`write_pdf`, and text
+and images through :func:`write_text` and :func:`write_image`.
+
+Outputs go through :func:`atomic_output`, which writes to a hidden temporary
+file in the destination directory with a large buffer and renames it over the
+destination once complete. A crash or error never leaves a truncated file at
+the final path (which ``OverwritePolicy.SKIP`` would take as finished), and
+because the temporary file sits next to the destination the rename stays on
+one filesystem even when outputs go to a different one than the inputs.
+"""
+
+import os
+import secrets
+from collections.abc import Iterator
+from contextlib import contextmanager
+from io import BytesIO, TextIOWrapper
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, BinaryIO, TextIO
+
+if TYPE_CHECKING:
+    from PIL import Image
+
+# Write buffer for output files; few large writes suit network filesystems
+OUTPUT_BUFFER_SIZE = 1024 * 1024
+
+
+@contextmanager
+def atomic_output(output_path: Path, /, **kwargs: Any) -> Iterator[BinaryIO]:
+    """
+    Open ``output_path`` for a buffered binary write that appears all at once.
+
+    Args:
+        output_path: Destination file
+        atomic: Write to a temporary file and rename it into place (default: True)
+        fsync: Flush the file, and the directory entry after the rename, to
+            disk before returning (default: False)
+    """
+    output_path = Path(output_path)
+    fsync: bool = kwargs.get("fsync", False)
+
+    if not kwargs.get("atomic", True):
+        with open(output_path, "wb", buffering=OUTPUT_BUFFER_SIZE) as f:
+            yield f
+            _flush(f, fsync)
+        return
+
+    temp_path = output_path.with_name(f".{output_path.name}.{secrets.token_hex(4)}.tmp")
+    try:
+        with open(temp_path, "xb", buffering=OUTPUT_BUFFER_SIZE) as f:
+            yield f
+            _flush(f, fsync)
+        os.replace(temp_path, output_path)
+    except BaseException:
+        temp_path.unlink(missing_ok=True)
+        raise
+
+    if fsync:
+        _fsync_directory(output_path.parent)
+
+
+@contextmanager
+def atomic_text_output(
+    output_path: Path, /, newline: str | None = None, **kwargs: Any
+) -> Iterator[TextIO]:
+    """
+    :func:`atomic_output` for UTF-8 text, such as CSV written with :mod:`csv`.
+
+    ``newline`` works as for :func:`open`; pass ``""`` for the csv module.
+    """
+    with atomic_output(output_path, **kwargs) as f:
+        text = TextIOWrapper(f, encoding="utf-8", newline=newline)
+        try:
+            yield text
+        finally:
+            # Flushes into the binary file and leaves closing it to atomic_output
+            text.detach()
+
+
+def _flush(f: BinaryIO, fsync: bool) -> None:
+    f.flush()
+    if fsync:
+        os.fsync(f.fileno())
+
+
+def _fsync_directory(path: Path) -> None:
+    """Persist a rename by syncing the directory (not possible on Windows)."""
+    if not hasattr(os, "O_DIRECTORY"):
+        return
+    fd = os.open(path, os.O_RDONLY | os.O_DIRECTORY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+def write_pdf(writer: Any, output_path: Path, /, **kwargs: Any) -> Path:
+    """
+    Write a pypdf ``PdfWriter`` to ``output_path``.
+
+    Operations pass their own keyword arguments through, so output options
+    set on the command line or in the config reach every writer.
+
+    Args:
+        writer: The document to write
+        output_path: Destination file
+        linearize: Write a linearized ("fast web view") file (needs pikepdf)
+        password: Password of an encrypted result, needed to linearize it
+        atomic, fsync: See :func:`atomic_output`
+    """
+    output_path = Path(output_path)
+    with atomic_output(output_path, **kwargs) as f:
+        if not kwargs.get("linearize", False):
+            writer.write(f)
+            return output_path
+
+        buffer = BytesIO()
+        writer.write(buffer)
+        buffer.seek(0)
+        password = kwargs.get("password") or kwargs.get("user_password") or ""
+        _linearize(buffer, f, password)
+    return output_path
+
+
+def write_text(text: str, output_path: Path, /, **kwargs: Any) -> Path:
+    """
+    Write ``text`` to ``output_path`` as UTF-8.
+
+    Keyword arguments are passed to :func:`atomic_output`.
+    """
+    output_path = Path(output_path)
+    with atomic_text_output(output_path, **kwargs) as f:
+        f.write(text)
+    return output_path
+
+
+def write_image(image: "Image.Image", output_path: Path, /, **kwargs: Any) -> Path:
+    """
+    Save a Pillow image to ``output_path`` in the format its suffix names.
+
+    Keyword arguments are passed to :func:`atomic_output`.
+    """
+    from PIL import Image
+
+    output_path = Path(output_path)
+    image_format = Image.registered_extensions().get(output_path.suffix.lower())
+    if image_format is None:
+        raise ValueError(f"Unknown image file extension: {output_path.suffix!r}")
+    with atomic_output(output_path, **kwargs) as f:
+        image.save(f, format=image_format)
+    return output_path
+
+
+def linearize_pdf(
+    input_path: Path, output_path: Path | None = None, password: str = "", **kwargs: Any
+) -> Path:
+    """
+    Linearize an existing file, in place unless ``output_path`` is given.
+
+    For outputs not produced by a ``PdfWriter`` (such as images saved by
+    Pillow). Keyword arguments are passed to :func:`atomic_output`.
+    """
+    input_path = Path(input_path)
+    output_path = Path(output_path) if output_path is not None else input_path
+    with atomic_output(output_path, **kwargs) as f:
+        _linearize(input_path, f, password)
+    return output_path
+
+
+def _linearize(source: BytesIO | Path, target: BinaryIO, password: str) -> None:
+    """
+    Rewrite ``source`` with qpdf's linearizer.
+
+    The result starts with the linearization dictionary, the first page's
+    cross-reference section and objects, and the hint stream, so a viewer
+    reading over HTTP can show page one before the rest arrives. An
+    encrypted source stays encrypted with its own settings; pikepdf would
+    otherwise drop the encryption on save.
+    """
+    try:
+        import pikepdf
+    except ImportError:
+        raise ImportError(
+            "pikepdf is required for linearized output. Install with: pip install pikepdf"
+        )
+
+    with pikepdf.open(source, password=password) as pdf:
+        pdf.save(target, linearize=True, encryption=pdf.is_encrypted)
@@ -0,0 +1,319 @@
+"""Compact page selections built on sorted ranges."""
+
+import heapq
+import re
+from bisect import bisect_right
+from collections.abc import Iterable, Iterator
+from itertools import groupby
+from typing import Any
+
+# One part of a page spec: "5", "-3", "2-8", "4-", "-5-", "-5--1", "1-:2"
+_PART = re.compile(r"^(-?\d+)?(?:(-)(-?\d+)?)?(?::(\d+))?$")
+
+
+class PageSelection:
+    """
+    A set of 1-indexed pages stored as ranges instead of expanded lists.
+
+    Specs are comma-separated parts:
+
+    - ``5`` - a single page; ``-1`` is the last page, ``-2`` the one before
+    - ``2-8`` - an inclusive range; ``4-`` runs to the last page
+    - ``-5-`` or ``-5--1`` - the last five pages
+    - ``1-:2`` or ``1-99:2`` - every second page of a range (step)
+
+    Negative and open-ended parts need the page count; call :meth:`resolve`
+    (or :meth:`coerce` with ``page_count``) before testing membership.
+    Resolved selections test membership with a binary search over merged
+    ranges and iterate pages lazily in ascending order.
+    """
+
+    def __init__(self, ranges: Iterable[tuple[int, int | None, int]] = ()):
+        """
+        Build a selection from ``(start, stop, step)`` parts.
+
+        ``stop`` is inclusive and ``None`` means the last page. Negative
+        values count from the end of the document.
+        """
+        self._ranges: list[tuple[int, int | None, int]] = []
+        for start, stop, step in ranges:
+            if step < 1:
+                raise ValueError(f"Page step must be positive, got {step}")
+            if start == 0 or stop == 0:
+                raise ValueError("Pages are 1-indexed; 0 is not a page")
+            self._ranges.append((start, stop, step))
+
+        self._resolved = all(
+            start > 0 and stop is not None and stop > 0 for start, stop, _ in self._ranges
+        )
+        self._starts: list[int] = []
+        self._stops: list[int] = []
+        self._stepped: list[tuple[int, int, int]] = []
+        if self._resolved:
+            self._index()
+
+    def _index(self) -> None:
+        """Merge contiguous ranges and split off stepped ones."""
+        contiguous = []
+        for start, stop, step in self._ranges:
+            if start > stop:  # type: ignore[operator]
+                continue
+            if step == 1 or start == stop:
+                contiguous.append((start, stop))
+            else:
+                self._stepped.append((start, stop, step))  # type: ignore[arg-type]
+
+        for start, stop in sorted(contiguous):  # type: ignore[type-var]
+            if self._stops and start <= self._stops[-1] + 1:
+                self._stops[-1] = max(self._stops[-1], stop)  # type: ignore[type-var]
+            else:
+                self._starts.append(start)  # type: ignore[arg-type]
+                self._stops.append(stop)  # type: ignore[arg-type]
+
+        # Stepped ranges fully covered by contiguous ones add nothing
+        self._stepped = sorted(
+            (start, stop, step)
+            for start, stop, step in self._stepped
+            if not self._covers(start, stop)
+        )
+
+    def _covers(self, start: int, stop: int) -> bool:
+        index = bisect_right(self._starts, start) - 1
+        return index >= 0 and self._stops[index] >= stop
+
+    @classmethod
+    def parse(cls, spec: str) -> "PageSelection":
+        """Parse a spec such as ``"1,3,5-8,-2-,10-:2"``."""
+        ranges = []
+        for part in spec.split(","):
+            part = part.strip().replace(" ", "")
+            if not part:
+                continue
+            match = _PART.match(part)
+            if not match or match.group(1) is None and match.group(2) is None:
+                raise ValueError(f"Invalid page spec '{part}'")
+            first, dash, last, step = match.groups()
+            start = int(first) if first is not None else 1
+            if dash is None:
+                stop: int | None = start
+            else:
+                stop = int(last) if last is not None else None
+            ranges.append((start, stop, int(step) if step else 1))
+        return cls(ranges)
+
+    @classmethod
+    def from_pages(cls, pages: Iterable[int]) -> "PageSelection":
+        """Build a selection from page numbers, collapsing runs into ranges."""
+        ranges = []
+        unique = sorted(set(pages))
+        for _, run in groupby(enumerate(unique), key=lambda item: item[1] - item[0]):
+            numbers = [page for _, page in run]
+            ranges.append((numbers[0], numbers[-1], 1))
+        return cls(ranges)
+
+    @classmethod
+    def all(cls) -> "PageSelection":
+        """Select every page."""
+        return cls([(1, None, 1)])
+
+    @classmethod
+    def coerce(cls, value: Any, page_count: int | None = None) -> "PageSelection | None":
+        """
+        Turn any accepted ``pages`` value into a selection.
+
+        Accepts None (no selection), a :class:`PageSelection`, a spec string
+        or an iterable of page numbers. With ``page_count`` the result is
+        resolved against the document.
+        """
+        if value is None:
+            return None
+        if isinstance(value, PageSelection):
+            selection = value
+        elif isinstance(value, str):
+            selection = cls.parse(value)
+        elif isinstance(value, int):
+            selection = cls([(value, value, 1)])
+        else:
+            selection = cls.from_pages(value)
+        return selection.resolve(page_count) if page_count is not None else selection
+
+    @property
+    def is_resolved(self) -> bool:
+        """Whether all parts are absolute page numbers."""
+        return self._resolved
+
+    def resolve(self, page_count: int) -> "PageSelection":
+        """Return an absolute selection clipped to ``1..page_count``."""
+
+        def absolute(page: int) -> int:
+            return page_count + 1 + page if page < 0 else page
+
+        ranges = []
+        for start, stop, step in self._ranges:
+            first = absolute(start)
+            last = page_count if stop is None else absolute(stop)
+            if first < 1:
+                # Clip to page 1, staying on the original step
+                first += -(-(1 - first) // step) * step
+            last = min(last, page_count)
+            if first <= last:
+                ranges.append((first, last, step))
+        return PageSelection(ranges)
+
+    def _require_resolved(self) -> None:
+        if not self._resolved:
+            raise ValueError(
+                "Page selection has negative or open-ended parts; resolve it with the page count"
+            )
+
+    def __contains__(self, page: object) -> bool:
+        self._require_resolved()
+        if not isinstance(page, int):
+            return False
+        index = bisect_right(self._starts, page) - 1
+        if index >= 0 and page <= self._stops[index]:
+            return True
+        return any(
+            start <= page <= stop and (page - start) % step == 0
+            for start, stop, step in self._stepped
+        )
+
+    def __iter__(self) -> Iterator[int]:
+        self._require_resolved()
+        streams = [range(start, stop + 1) for start, stop in zip(self._starts, self._stops)]
+        streams.extend(range(start, stop + 1, step) for start, stop, step in self._stepped)
+        previous = None
+        for page in heapq.merge(*streams):
+            if page != previous:
+                yield page
+                previous = page
+
+    def __len__(self) -> int:
+        self._require_resolved()
+        if not self._stepped:
+            return sum(stop - start + 1 for start, stop in zip(self._starts, self._stops))
+        return sum(1 for _ in self)
+
+    def __bool__(self) -> bool:
+        if not self._resolved:
+            return bool(self._ranges)
+        return bool(self._starts or self._stepped)
+
+    @property
+    def first(self) -> int | None:
+        """Lowest selected page, or None when empty."""
+        return next(iter(self), None)
+
+    @property
+    def last(self) -> int | None:
+        """Highest selected page, or None when empty."""
+        self._require_resolved()
+        candidates = self._stops[-1:] + [
+            stop - (stop - start) % step for start, stop, step in self._stepped
+        ]
+        return max(candidates, default=None)
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, PageSelection):
+            if self._resolved and other._resolved:
+                return list(self) == list(other)
+            return self._ranges == other._ranges
+        return NotImplemented
+
+    def __str__(self) -> str:
+        parts = []
+        for start, stop, step in self._ranges:
+            if stop == start and step == 1:
+                parts.append(str(start))
+                continue
+            text = f"{start}-{'' if stop is None else stop}"
+            parts.append(f"{text}:{step}" if step > 1 else text)
+        return ",".join(parts)
+
+    def __repr__(self) -> str:
+        return f"PageSelection('{self}')"
+
+
+# Page attributes a leaf inherits from its /Pages ancestors (PDF 32000-1, 7.7.3.4)
+INHERITABLE_ATTRIBUTES = ("/Resources", "/MediaBox", "/CropBox", "/Rotate")
+
+
+def page_count(reader: Any) -> int:
+    """
+    Return the number of pages from the page tree root's /Count.
+
+    Unlike ``len(reader.pages)`` this does not load every page dictionary.
+    """
+    try:
+        return int(reader.trailer["/Root"].get_object()["/Pages"].get_object()["/Count"])
+    except (KeyError, TypeError, ValueError):
+        return len(reader.pages)
+
+
+def iter_pages(reader: Any, pages: Iterable[int]) -> Iterator[tuple[int, Any]]:
+    """
+    Yield ``(page_number, page)`` for the given 1-indexed pages, in ascending order.
+
+    The page tree is descended using the /Count of each /Pages node, so only
+    the nodes on the path to a requested page are loaded; untouched subtrees
+    are skipped whole. Inherited attributes are copied onto each page, so the
+    result can be passed straight to ``PdfWriter.add_page``, which copies just
+    the objects the page references.
+    """
+    from pypdf import PageObject
+    from pypdf.generic import NameObject
+
+    wanted = sorted({p - 1 for p in pages if p >= 1})
+    if not wanted:
+        return
+
+    root = reader.trailer["/Root"].get_object()["/Pages"]
+    position = 0  # index into wanted
+
+    def descend(node_ref: Any, offset: int, inherited: dict) -> Iterator[tuple[int, Any]]:
+        nonlocal position
+        node = node_ref.get_object()
+        inherited = {
+            **inherited,
+            **{key: node[key] for key in INHERITABLE_ATTRIBUTES if key in node},
+        }
+        kids = node.get("/Kids")
+        if kids is None:
+            return
+        kids = kids.get_object()
+
+        if int(node.get("/Count", -1)) == len(kids):
+            # Every kid is a leaf page: jump straight to the requested ones
+            while position < len(wanted) and wanted[position] < offset + len(kids):
+                kid_ref = kids[wanted[position] - offset]
+                if kid_ref.get_object().get("/Type") != "/Page":
+                    break  # not a flat node after all; fall back to the scan below
+                yield from leaf(kid_ref, wanted[position], inherited)
+            else:
+                return
+
+        for kid_ref in kids:
+            if position >= len(wanted):
+                return
+            kid = kid_ref.get_object()
+            if kid.get("/Type") == "/Pages" or "/Kids" in kid:
+                count = int(kid.get("/Count", 0))
+                if wanted[position] < offset + count:
+                    yield from descend(kid_ref, offset, inherited)
+                offset += count
+            else:
+                if wanted[position] == offset:
+                    yield from leaf(kid_ref, offset, inherited)
+                offset += 1
+
+    def leaf(kid_ref: Any, index: int, inherited: dict) -> Iterator[tuple[int, Any]]:
+        nonlocal position
+        page = PageObject(reader, kid_ref.indirect_reference)
+        page.update(kid_ref.get_object())
+        for key, value in inherited.items():
+            if key not in page:
+                page[NameObject(key)] = value
+        position += 1
+        yield index + 1, page
+
+    yield from descend(root, 0, {})
@@ -0,0 +1,211 @@
+"""Page rasterizers: render PDF pages to images for OCR and image export.
+
+Two backends are available, chosen with the ``rasterizer`` setting (global
+config, ``--rasterizer``, or an operation option):
+
+* ``pdf2image`` (default) - poppler's ``pdftoppm`` through pdf2image. Each
+  call starts a subprocess and moves pixels through PPM output, but poppler
+  can write PNG/JPEG/TIFF files itself.
+* ``pdfium`` - pypdfium2, rendering in-process straight into an image buffer.
+  No process start or PPM decode per call, which dominates for small pages.
+  pdfium is not thread-safe, so renders are serialized within a process; use
+  the process executor to render documents in parallel.
+
+``scripts/bench_raster.py`` compares the backends per page.
+"""
+
+import threading
+from abc import ABC, abstractmethod
+from collections.abc import Iterable, Iterator
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from prism_docs.core.output import write_image
+from prism_docs.core.pages import page_count
+
+if TYPE_CHECKING:
+    from PIL import Image
+
+# Formats poppler writes itself; others are rendered to memory and saved by Pillow
+POPPLER_FORMATS = {"png", "jpeg", "jpg", "tiff", "tif"}
+
+# Pages per pdftoppm call when streaming, bounding the images held at once
+RENDER_BATCH = 8
+
+_PDFIUM_LOCK = threading.Lock()
+
+
+def page_runs(pages: Iterable[int], size: int) -> list[tuple[int, int]]:
+    """Split sorted pages into contiguous ``(first, last)`` runs of at most ``size`` pages."""
+    runs: list[tuple[int, int]] = []
+    for page in pages:
+        if runs and page == runs[-1][1] + 1 and page - runs[-1][0] < size:
+            runs[-1] = (runs[-1][0], page)
+        else:
+            runs.append((page, page))
+    return runs
+
+
+class Rasterizer(ABC):
+    """Renders PDF pages to images."""
+
+    name = ""
+    # Renders in the calling process (parallelise with processes, not threads)
+    in_process = False
+    # Page box an image covers, as a pypdf PageObject attribute (before /Rotate)
+    page_box = "mediabox"
+
+    @abstractmethod
+    def render(
+        self,
+        input_path: Path,
+        pages: Iterable[int] | None = None,
+        dpi: int = 200,
+    ) -> Iterator[tuple[int, "Image.Image"]]:
+        """
+        Yield ``(page_number, image)`` for the given 1-indexed pages, in order.
+
+        Only the requested pages are rendered (default: all); pages outside
+        the document are skipped. Images are produced one batch at a time, so
+        a long document is never held in memory whole.
+        """
+        ...
+
+    def render_files(
+        self,
+        input_path: Path,
+        pages: tuple[int, int],
+        directory: Path,
+        dpi: int = 200,
+        format: str = "png",
+    ) -> list[Path]:
+        """Render pages ``first``..``last`` to image files in ``directory``, in page order."""
+        directory.mkdir(parents=True, exist_ok=True)
+        first, last = pages
+        paths = []
+        for page_num, image in self.render(input_path, range(first, last + 1), dpi):
+            path = directory / f"{page_num}.{format}"
+            write_image(image, path)
+            paths.append(path)
+        return paths
+
+    def _pages(self, input_path: Path, pages: Iterable[int] | None) -> list[int]:
+        from pypdf import PdfReader
+
+        with open(input_path, "rb") as f:
+            total = page_count(PdfReader(f))
+        return [p for p in (range(1, total + 1) if pages is None else pages) if 1 <= p <= total]
+
+
+class Pdf2ImageRasterizer(Rasterizer):
+    """poppler's pdftoppm through pdf2image, one subprocess per run of pages."""
+
+    name = "pdf2image"
+
+    def render(
+        self,
+        input_path: Path,
+        pages: Iterable[int] | None = None,
+        dpi: int = 200,
+    ) -> Iterator[tuple[int, "Image.Image"]]:
+        pdf2image = _import_pdf2image()
+        for first, last in page_runs(self._pages(input_path, pages), RENDER_BATCH):
+            images = pdf2image.convert_from_path(
+                input_path, dpi=dpi, first_page=first, last_page=last
+            )
+            yield from zip(range(first, last + 1), images, strict=True)
+
+    def render_files(
+        self,
+        input_path: Path,
+        pages: tuple[int, int],
+        directory: Path,
+        dpi: int = 200,
+        format: str = "png",
+    ) -> list[Path]:
+        """Have poppler write the files itself, for the formats it supports."""
+        if format.lower() not in POPPLER_FORMATS:
+            return super().render_files(input_path, pages, directory, dpi, format)
+
+        directory.mkdir(parents=True, exist_ok=True)
+        first, last = pages
+        paths = _import_pdf2image().convert_from_path(
+            input_path,
+            dpi=dpi,
+            first_page=first,
+            last_page=last,
+            fmt=format,
+            output_folder=directory,
+            paths_only=True,
+            thread_count=1,
+        )
+        if len(paths) != last - first + 1:
+            raise RuntimeError(f"Rendered {len(paths)} images for pages {first}-{last}")
+        return [Path(path) for path in paths]
+
+
+class PdfiumRasterizer(Rasterizer):
+    """pypdfium2, rendering in-process into a PIL image."""
+
+    name = "pdfium"
+    in_process = True
+    page_box = "cropbox"
+
+    def render(
+        self,
+        input_path: Path,
+        pages: Iterable[int] | None = None,
+        dpi: int = 200,
+    ) -> Iterator[tuple[int, "Image.Image"]]:
+        try:
+            import pypdfium2 as pdfium
+        except ImportError:
+            raise ImportError(
+                "pypdfium2 is required for the pdfium rasterizer. "
+                "Install with: pip install pypdfium2"
+            )
+
+        with _PDFIUM_LOCK:
+            document = pdfium.PdfDocument(str(input_path))
+            total = len(document)
+        try:
+            for page_num in range(1, total + 1) if pages is None else pages:
+                if not 1 <= page_num <= total:
+                    continue
+                with _PDFIUM_LOCK:
+                    page = document[page_num - 1]
+                    try:
+                        # Copied so the image outlives pdfium's bitmap buffer
+                        image = page.render(scale=dpi / 72).to_pil().copy()
+                    finally:
+                        page.close()
+                yield page_num, image
+        finally:
+            with _PDFIUM_LOCK:
+                document.close()
+
+
+RASTERIZERS: dict[str, type[Rasterizer]] = {
+    Pdf2ImageRasterizer.name: Pdf2ImageRasterizer,
+    PdfiumRasterizer.name: PdfiumRasterizer,
+}
+
+
+def get_rasterizer(name: str | Rasterizer | None = None) -> Rasterizer:
+    """Return the rasterizer called ``name`` (default: pdf2image)."""
+    if isinstance(name, Rasterizer):
+        return name
+    name = name or Pdf2ImageRasterizer.name
+    if name not in RASTERIZERS:
+        raise ValueError(f"Unknown rasterizer '{name}' (choose from {', '.join(RASTERIZERS)})")
+    return RASTERIZERS[name]()
+
+
+def _import_pdf2image() -> Any:
+    try:
+        import pdf2image
+    except ImportError:
+        raise ImportError(
+            "pdf2image is required for PDF to image conversion. Install with: pip install pdf2image"
+        )
+    return pdf2image
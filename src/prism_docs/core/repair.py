@@ -0,0 +1,466 @@
+"""Rebuild a damaged PDF's cross-reference data from its object markers.
+
+The file is memory-mapped and searched once, front to back, for ``N G obj``
+markers. Each object found is parsed where it stands; a stream's extent comes
+from its /Length when that reaches ``endstream`` and from the ``endstream``
+keyword otherwise, and the search resumes after it, so stream data is never
+mistaken for objects. Later copies of an object (from incremental updates)
+replace earlier ones and objects that cannot be parsed are dropped.
+
+The repaired file is the original bytes followed by an update section: the
+objects that had to change, a fresh cross-reference section covering every
+recovered object and a trailer without /Prev, so the damaged sections are
+never consulted again.
+"""
+
+import mmap
+import re
+import zlib
+from dataclasses import dataclass, field
+from io import BytesIO
+from pathlib import Path
+from typing import Any
+
+from prism_docs.core.output import atomic_output
+from prism_docs.core.pages import INHERITABLE_ATTRIBUTES, PageSelection
+from prism_docs.core.scanner import _ENDSTREAM, PDFScanner, Ref, Stream, _Parser
+
+# "12 0 obj", but not the tail of "112 0 obj"
+_OBJ_MARKER = re.compile(
+    rb"(?<![0-9])(\d{1,10})[\x00\t\n\x0c\r ]+(\d{1,5})[\x00\t\n\x0c\r ]+obj(?![A-Za-z0-9])"
+)
+_TRAILER = re.compile(rb"trailer[\x00\t\n\x0c\r ]*<<")
+
+# Characters written as #xx in names
+_NAME_ESCAPE = re.compile(rb"[^!-~]|[#()<>\[\]{}/%]")
+
+# Trailer entries carried over into the rebuilt trailer
+TRAILER_KEYS = ("/Root", "/Info", "/ID", "/Encrypt")
+
+# Deepest page tree accepted; anything below is treated as a cycle
+MAX_TREE_DEPTH = 64
+
+_RECOVERABLE = (ValueError, IndexError, TypeError, KeyError, zlib.error)
+
+
+@dataclass
+class RepairReport:
+    """What a repair recovered."""
+
+    objects: int = 0
+    dropped: list[int] = field(default_factory=list)
+    fixed_streams: int = 0
+    pages: int = 0
+    salvaged: PageSelection = field(default_factory=PageSelection)
+    rebuilt_page_tree: bool = False
+
+    @property
+    def lost_pages(self) -> int:
+        return self.pages - len(self.salvaged)
+
+    def summary(self) -> str:
+        parts = [f"recovered {self.objects} objects"]
+        if self.dropped:
+            shown = ", ".join(map(str, self.dropped[:10]))
+            more = ", ..." if len(self.dropped) > 10 else ""
+            parts.append(f"dropped {len(self.dropped)} unreadable ({shown}{more})")
+        if self.fixed_streams:
+            parts.append(f"corrected {self.fixed_streams} stream /Length entries")
+        salvaged = f"salvaged pages {self.salvaged or 'none'} of {self.pages}"
+        if self.rebuilt_page_tree:
+            salvaged += " (page tree rebuilt)"
+        return ", ".join(parts) + "; " + salvaged
+
+
+def serialize(value: Any) -> bytes:
+    """Write a value as parsed by the scanner (names are ``str``, strings ``bytes``)."""
+    if value is None:
+        return b"null"
+    if isinstance(value, bool):
+        return b"true" if value else b"false"
+    if isinstance(value, Ref):
+        return f"{value.num} {value.gen} R".encode()
+    if isinstance(value, int):
+        return str(value).encode()
+    if isinstance(value, float):
+        return (f"{value:.6f}".rstrip("0").rstrip(".") or "0").encode()
+    if isinstance(value, str):
+        name = value[1:].encode("latin-1")
+        return b"/" + _NAME_ESCAPE.sub(lambda m: b"#%02X" % m[0][0], name)
+    if isinstance(value, bytes):
+        return b"<" + value.hex().encode() + b">"
+    if isinstance(value, list):
+        return b"[" + b" ".join(serialize(item) for item in value) + b"]"
+    if isinstance(value, dict):
+        return (
+            b"<<"
+            + b"".join(
+                serialize(key) + b" " + serialize(item) + b" " for key, item in value.items()
+            )
+            + b">>"
+        )
+    raise TypeError(f"Cannot serialize {type(value).__name__}")
+
+
+def _subsections(numbers: list[int]) -> list[tuple[int, list[int]]]:
+    """Group sorted object numbers into runs of consecutive numbers."""
+    runs: list[tuple[int, list[int]]] = []
+    for number in numbers:
+        if runs and number == runs[-1][0] + len(runs[-1][1]):
+            runs[-1][1].append(number)
+        else:
+            runs.append((number, [number]))
+    return runs
+
+
+class _Recovery:
+    """Object recovery over one memory-mapped file."""
+
+    def __init__(self, data: Any):
+        self.data = data
+        self.scanner = PDFScanner(data)
+        self.report = RepairReport()
+        # object number -> (file position of the version kept, xref entry)
+        self.entries: dict[int, tuple[int, tuple]] = {}
+        # object number -> /Type of the recovered dictionary
+        self.kinds: dict[int, str] = {}
+        # object number -> (stream, actual data length) for current stream versions
+        self.streams: dict[int, tuple[Stream, int]] = {}
+        self.trailers: list[tuple[int, dict[str, Any]]] = []
+        # object number -> replacement body, written in the update section
+        self.rewritten: dict[int, bytes] = {}
+        self.trailer: dict[str, Any] = {}
+
+    def recover(self) -> None:
+        failed = self._scan_objects()
+        self._unpack_object_streams(failed)
+        self.scanner.xref = {number: entry for number, (_, entry) in self.entries.items()}
+        self._fix_stream_lengths()
+        self.report.objects = len(self.entries)
+        self.report.dropped = sorted(failed - self.entries.keys())
+        self._recover_trailer()
+
+    def _scan_objects(self) -> set[int]:
+        """The linear pass: find, parse and keep the last readable copy of every object."""
+        data = self.data
+        failed: set[int] = set()
+        pos = 0
+        while match := _OBJ_MARKER.search(data, pos):
+            number, generation = int(match[1]), int(match[2])
+            pos = match.end()
+            try:
+                value, end = self.scanner._parse_object(pos)
+            except _RECOVERABLE:
+                failed.add(number)
+                continue
+
+            if isinstance(value, Stream):
+                length = self._stream_extent(value)
+                if length is None:
+                    failed.add(number)
+                    continue
+                end = value.start + length
+                self.streams[number] = (value, length)
+                if value.dict.get("/Type") == "/XRef":
+                    self.trailers.append((match.start(), value.dict))
+                value = value.dict
+            else:
+                self.streams.pop(number, None)
+
+            self._note_kind(number, value)
+            self.entries[number] = (match.start(), ("n", match.start(), generation))
+            pos = end
+
+        for match in _TRAILER.finditer(data):
+            try:
+                trailer, _ = self.scanner.parser.parse(match.end() - 2)
+            except _RECOVERABLE:
+                continue
+            if isinstance(trailer, dict):
+                self.trailers.append((match.start(), trailer))
+        return failed
+
+    def _stream_extent(self, stream: Stream) -> int | None:
+        """Length of a stream's data: its /Length if that reaches endstream, else measured."""
+        declared = stream.dict.get("/Length")
+        if isinstance(declared, int) and _ENDSTREAM.match(self.data, stream.start + declared):
+            return declared
+        end = self.data.find(b"endstream", stream.start)
+        if end < 0:
+            return None
+        # The end-of-line marker before endstream is not part of the data
+        if self.data[end - 2 : end] == b"\r\n":
+            end -= 2
+        elif self.data[end - 1 : end] in (b"\n", b"\r"):
+            end -= 1
+        return max(0, end - stream.start)
+
+    def _note_kind(self, number: int, value: Any) -> None:
+        if isinstance(value, dict) and isinstance(value.get("/Type"), str):
+            self.kinds[number] = value["/Type"]
+        else:
+            self.kinds.pop(number, None)
+
+    def _unpack_object_streams(self, failed: set[int]) -> None:
+        """Register objects packed in object streams, unless a later copy exists."""
+        for number, (stream, length) in list(self.streams.items()):
+            if stream.dict.get("/Type") != "/ObjStm":
+                continue
+            position = self.entries[number][0]
+            try:
+                data = self.scanner.stream_data(stream, length)
+                header = _Parser(data)
+                pairs, pos = [], 0
+                for _ in range(stream.dict.get("/N", 0)):
+                    packed, pos = header.parse(pos)
+                    offset, pos = header.parse(pos)
+                    pairs.append((packed, stream.dict.get("/First", 0) + offset))
+            except _RECOVERABLE:
+                continue
+            # Seed the scanner's cache so lookups do not re-read the (possibly wrong) /Length
+            self.scanner._object_streams[number] = (data, [offset for _, offset in pairs])
+
+            for index, (packed, offset) in enumerate(pairs):
+                if packed in self.entries and self.entries[packed][0] > position:
+                    continue
+                try:
+                    value, _ = _Parser(data).parse(offset)
+                except _RECOVERABLE:
+                    failed.add(packed)
+                    continue
+                self._note_kind(packed, value)
+                self.streams.pop(packed, None)
+                self.entries[packed] = (position, ("c", number, index))
+
+    def _fix_stream_lengths(self) -> None:
+        """Rewrite streams whose /Length does not match the data found."""
+        for number, (stream, length) in self.streams.items():
+            if self.entries[number][1][0] != "n":
+                continue
+            try:
+                declared = self.scanner.resolve(stream.dict.get("/Length"))
+            except _RECOVERABLE:
+                declared = None
+            if declared == length:
+                continue
+            raw = bytes(self.data[stream.start : stream.start + length])
+            self.rewritten[number] = (
+                serialize({**stream.dict, "/Length": length}) + b"\nstream\n" + raw + b"\nendstream"
+            )
+            self.report.fixed_streams += 1
+
+    def _resolve(self, value: Any) -> Any:
+        try:
+            return self.scanner.resolve(value)
+        except _RECOVERABLE:
+            return None
+
+    def _recover_trailer(self) -> None:
+        """Merge the surviving trailers, newest first, keeping entries that still resolve."""
+        for _, trailer in sorted(self.trailers, key=lambda item: item[0], reverse=True):
+            for key in TRAILER_KEYS:
+                if key in trailer:
+                    self.trailer.setdefault(key, trailer[key])
+
+        for key in ("/Info", "/Encrypt"):
+            if key in self.trailer and not isinstance(self._resolve(self.trailer[key]), dict):
+                del self.trailer[key]
+        if not isinstance(self.trailer.get("/ID"), list):
+            self.trailer.pop("/ID", None)
+
+        root = self._resolve(self.trailer.get("/Root"))
+        if not isinstance(root, dict) or root.get("/Type", "/Catalog") != "/Catalog":
+            # Fall back to the newest catalog object in the file
+            catalogs = [number for number, kind in self.kinds.items() if kind == "/Catalog"]
+            newest = max(catalogs, key=lambda number: self.entries[number][0], default=None)
+            if newest is None:
+                self.trailer.pop("/Root", None)
+            else:
+                self.trailer["/Root"] = Ref(newest, self._generation(newest))
+
+    def _generation(self, number: int) -> int:
+        entry = self.entries[number][1]
+        return entry[2] if entry[0] == "n" else 0
+
+    def rebuild_pages(self) -> None:
+        """Walk the page tree, and replace it with a flat one if any part was lost."""
+        root_ref = self.trailer.get("/Root")
+        root = self._resolve(root_ref)
+        pages_ref = root.get("/Pages") if isinstance(root, dict) else None
+        pages_root = self._resolve(pages_ref)
+
+        slots = 0
+        lost = False
+        leaves: list[tuple[int, int, dict[str, Any]]] = []  # (slot, object number, inherited)
+        seen: set[int] = set()
+
+        def visit(ref: Any, inherited: dict[str, Any], depth: int) -> None:
+            nonlocal slots, lost
+            node = self._resolve(ref)
+            if (
+                not isinstance(ref, Ref)
+                or not isinstance(node, dict)
+                or ref.num in seen
+                or depth > MAX_TREE_DEPTH
+            ):
+                slots += 1
+                lost = True
+                return
+            seen.add(ref.num)
+            kids = self._resolve(node.get("/Kids"))
+            if node.get("/Type") != "/Pages" and kids is None:
+                slots += 1
+                leaves.append((slots, ref.num, inherited))
+                return
+            inherited = {
+                **inherited,
+                **{key: node[key] for key in INHERITABLE_ATTRIBUTES if key in node},
+            }
+            if not isinstance(kids, list):
+                slots += 1
+                lost = True
+                return
+            for kid in kids:
+                visit(kid, inherited, depth + 1)
+
+        if isinstance(pages_root, dict):
+            visit(pages_ref, {}, 0)
+            count = self._resolve(pages_root.get("/Count"))
+            rebuild = lost or count != len(leaves)
+        else:
+            # No page tree: gather every page object, in file order
+            numbers = [number for number, kind in self.kinds.items() if kind == "/Page"]
+            numbers.sort(key=lambda number: self.entries[number][0])
+            leaves = [(slot, number, {}) for slot, number in enumerate(numbers, 1)]
+            slots = len(leaves)
+            rebuild = True
+
+        self.report.pages = slots
+        self.report.salvaged = PageSelection.from_pages(slot for slot, _, _ in leaves)
+        if not rebuild:
+            return
+
+        self.report.rebuilt_page_tree = True
+        next_number = max(self.entries, default=0) + 1
+        tree = Ref(next_number, 0)
+        kids = []
+        for _, number, inherited in leaves:
+            page = dict(self._resolve(Ref(number, 0)))
+            for key, value in inherited.items():
+                page.setdefault(key, value)
+            page["/Parent"] = tree
+            self.rewritten[number] = serialize(page)
+            kids.append(Ref(number, self._generation(number)))
+        self.rewritten[tree.num] = serialize(
+            {"/Type": "/Pages", "/Kids": kids, "/Count": len(kids)}
+        )
+        self.entries[tree.num] = (len(self.data), ("n", 0, 0))
+
+        if isinstance(root, dict):
+            self.rewritten[root_ref.num] = serialize({**root, "/Pages": tree})
+        else:
+            catalog = next_number + 1
+            self.rewritten[catalog] = serialize({"/Type": "/Catalog", "/Pages": tree})
+            self.entries[catalog] = (len(self.data), ("n", 0, 0))
+            self.trailer["/Root"] = Ref(catalog, 0)
+
+    def update_section(self) -> bytes:
+        """The bytes appended to a copy of the file: changed objects, xref and trailer."""
+        base = len(self.data)
+        body = BytesIO()
+        body.write(b"\n")
+        # object number -> (type, field 2, field 3) as in an xref stream row
+        rows: dict[int, tuple[int, int, int]] = {}
+        for number, (_, entry) in self.entries.items():
+            if entry[0] == "n":
+                rows[number] = (1, entry[1], entry[2])
+            else:
+                rows[number] = (2, entry[1], entry[2])
+        for number in sorted(self.rewritten):
+            generation = self._generation(number) if rows[number][0] == 1 else 0
+            rows[number] = (1, base + body.tell(), generation)
+            body.write(f"{number} {generation} obj\n".encode())
+            body.write(self.rewritten[number])
+            body.write(b"\nendobj\n")
+
+        size = max(rows, default=0) + 1
+        trailer = {**self.trailer, "/Size": size}
+        xref_offset = base + body.tell()
+        if any(row[0] == 2 for row in rows.values()):
+            self._write_xref_stream(body, rows, trailer, xref_offset)
+        else:
+            body.write(b"xref\n")
+            for first, numbers in _subsections(sorted({0, *rows})):
+                body.write(f"{first} {len(numbers)}\n".encode())
+                for number in numbers:
+                    if number == 0:
+                        body.write(b"0000000000 65535 f\r\n")
+                        continue
+                    _, offset, generation = rows[number]
+                    body.write(f"{offset:010d} {generation:05d} n\r\n".encode())
+            body.write(b"trailer\n" + serialize(trailer))
+        body.write(f"\nstartxref\n{xref_offset}\n%%EOF\n".encode())
+        return body.getvalue()
+
+    @staticmethod
+    def _write_xref_stream(
+        body: BytesIO,
+        rows: dict[int, tuple[int, int, int]],
+        trailer: dict[str, Any],
+        xref_offset: int,
+    ) -> None:
+        # The xref stream is itself an object and lists its own offset
+        number = trailer["/Size"]
+        rows = {**rows, number: (1, xref_offset, 0)}
+        widths = [
+            1,
+            max(1, (max(row[1] for row in rows.values()).bit_length() + 7) // 8),
+            max(2, (max(row[2] for row in rows.values()).bit_length() + 7) // 8),
+        ]
+        index: list[int] = []
+        packed = bytearray()
+        for first, numbers in _subsections(sorted(rows)):
+            index += [first, len(numbers)]
+            for row_number in numbers:
+                for value, width in zip(rows[row_number], widths):
+                    packed += value.to_bytes(width, "big")
+        data = zlib.compress(bytes(packed))
+        stream = {
+            **trailer,
+            "/Type": "/XRef",
+            "/Size": number + 1,
+            "/W": widths,
+            "/Index": index,
+            "/Filter": "/FlateDecode",
+            "/Length": len(data),
+        }
+        body.write(f"{number} 0 obj\n".encode())
+        body.write(serialize(stream) + b"\nstream\n" + data + b"\nendstream\nendobj\n")
+
+
+def repair_pdf(input_path: Path, output_path: Path, /, **kwargs: Any) -> RepairReport:
+    """
+    Rebuild a damaged file's cross-reference data into ``output_path``.
+
+    The trailer is recovered from the newest surviving trailer dictionaries
+    (falling back to the newest catalog object), unreadable objects are
+    dropped and streams get their measured length. When the page tree has
+    lost nodes it is replaced by a flat one holding every page still
+    reachable. The report lists which page positions of the original tree
+    were salvaged. Keyword arguments are passed to :func:`atomic_output`.
+    """
+    input_path, output_path = Path(input_path), Path(output_path)
+    if input_path.resolve() == output_path.resolve():
+        raise ValueError("A repaired file must be written to a new path")
+
+    with open(input_path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+        recovery = _Recovery(data)
+        recovery.recover()
+        recovery.rebuild_pages()
+        if not recovery.report.salvaged:
+            raise ValueError("No pages could be recovered")
+        update = recovery.update_section()
+        with atomic_output(output_path, **kwargs) as f:
+            f.write(data)
+            f.write(update)
+    return recovery.report
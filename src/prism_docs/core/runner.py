@@ -1,6 +1,8 @@
 """PDF operation runner with configuration support."""
 
-from concurrent.futures import ThreadPoolExecutor, as_completed
+import dataclasses
+import tempfile
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 from pathlib import Path
 
 from prism_docs.core import (
@@ -9,6 +11,16 @@ from prism_docs.core import (
     OutputConfig,
     registry,
 )
+from prism_docs.core.storage import (
+    expand_locations,
+    get_storage,
+    is_remote,
+    parse_location,
+    prefetch,
+    url_join,
+    url_name,
+    url_parent,
+)
 
 
 class PDFRunner:
@@ -20,13 +32,16 @@ class PDFRunner:
     def run(
         self,
         operation_name: str,
-        input_paths: list[Path] | Path,
-        output_path: Path | None = None,
+        input_paths: list[Path | str] | Path | str,
+        output_path: Path | str | None = None,
         **kwargs,
     ) -> list[OperationResult]:
         """
         Run an operation on one or more input files.
 
+        Inputs, ``output_path`` and the configured output directory may be
+        ``http(s)://`` or ``s3://`` URLs (see ``core.storage``).
+
         Args:
             operation_name: Name of the registered operation.
             input_paths: Single path or list of input paths.
@@ -36,11 +51,11 @@ class PDFRunner:
         Returns:
             List of OperationResult objects.
         """
-        # Normalize input paths
+        # Normalize input paths (remote inputs stay URL strings)
         if isinstance(input_paths, (str, Path)):
-            input_paths = [Path(input_paths)]
+            input_paths = [parse_location(input_paths)]
         else:
-            input_paths = [Path(p) for p in input_paths]
+            input_paths = [parse_location(p) for p in input_paths]
 
         # Get operation
         operation = registry.get_instance(operation_name)
@@ -57,11 +72,25 @@ class PDFRunner:
         output_config = op_config.output
         if output_path:
             merged_kwargs["output_path"] = output_path
+        for key, value in output_config.write_options().items():
+            merged_kwargs.setdefault(key, value)
+        merged_kwargs.setdefault("rasterizer", self.config.global_settings.rasterizer)
+        merged_kwargs.setdefault("ocr_engine", self.config.global_settings.ocr_engine)
+        merged_kwargs.setdefault(
+            "ocr_cache",
+            self.config.global_settings.ocr_cache
+            and (self.config.global_settings.ocr_cache_dir or True),
+        )
 
         # Run operation(s)
         results = []
 
-        if self.config.global_settings.parallel and len(input_paths) > 1:
+        remote = any(isinstance(p, str) for p in input_paths) or any(
+            is_remote(p) for p in (output_config.output_dir, merged_kwargs.get("output_path"))
+        )
+        if remote and not self.config.global_settings.dry_run:
+            results = self._run_remote(operation, input_paths, output_config, merged_kwargs)
+        elif self.config.global_settings.parallel and len(input_paths) > 1:
             results = self._run_parallel(operation, input_paths, output_config, merged_kwargs)
         else:
             for input_path in input_paths:
@@ -88,11 +117,15 @@ class PDFRunner:
         output_config: OutputConfig,
         kwargs: dict,
     ) -> list[OperationResult]:
-        """Run operations in parallel."""
+        """Run operations in parallel, in threads or (for CPU-bound work) processes."""
         results = []
         max_workers = self.config.global_settings.max_workers
+        if self.config.global_settings.executor == "process":
+            executor_class = ProcessPoolExecutor
+        else:
+            executor_class = ThreadPoolExecutor
 
-        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        with executor_class(max_workers=max_workers) as executor:
             futures = {
                 executor.submit(operation.execute, path, output_config, **kwargs): path
                 for path in input_paths
@@ -107,6 +140,107 @@ class PDFRunner:
 
         return results
 
+    def _run_remote(
+        self,
+        operation,
+        locations: list[Path | str],
+        output_config: OutputConfig,
+        kwargs: dict,
+    ) -> list[OperationResult]:
+        """
+        Run an operation over remote inputs or into remote outputs.
+
+        Operations that read URLs themselves get them directly. For the rest,
+        remote inputs are downloaded a few files ahead into a staging directory,
+        and outputs bound for a remote directory are written there too, then
+        uploaded, so local disk use stays bounded however large the batch.
+        """
+        storage = self.config.storage
+        locations = expand_locations(locations, storage)
+
+        if operation.reads_urls:
+            return [
+                self._report(operation.execute(location, output_config, storage=storage, **kwargs))
+                for location in locations
+            ]
+
+        results = []
+        with tempfile.TemporaryDirectory(prefix="prism-docs-") as staging:
+            inputs = prefetch(locations, Path(staging) / "inputs", storage)
+            for index, (location, staged) in enumerate(inputs):
+                if isinstance(staged, Exception):
+                    result = OperationResult(
+                        success=False,
+                        input_path=location,
+                        message=f"Failed to download '{location}': {staged}",
+                        error=staged,
+                    )
+                else:
+                    outputs = Path(staging) / "outputs" / str(index)
+                    result = self._run_staged(
+                        operation, location, staged, outputs, output_config, kwargs
+                    )
+                results.append(self._report(result))
+        return results
+
+    def _run_staged(
+        self,
+        operation,
+        location: Path | str,
+        input_path: Path,
+        staging: Path,
+        output_config: OutputConfig,
+        kwargs: dict,
+    ) -> OperationResult:
+        """Run one staged input, then upload what it wrote for remote targets."""
+        kwargs = dict(kwargs)
+        explicit = parse_location(kwargs["output_path"]) if kwargs.get("output_path") else None
+        if isinstance(explicit, str):
+            kwargs["output_path"] = staging / url_name(explicit)
+
+        output_dir = parse_location(output_config.output_dir) if output_config.output_dir else None
+        if output_dir is None and isinstance(location, str):
+            output_dir = url_parent(location)  # Next to the input, as for local files
+        if isinstance(output_dir, str):
+            output_config = dataclasses.replace(output_config, output_dir=staging)
+
+        result = operation.execute(input_path, output_config, **kwargs)
+        result.input_path = location
+        result.message = result.message.replace(str(input_path), str(location))
+        if not result.success or not staging.exists():
+            return result
+
+        # Files written beside an explicit remote output go beside it remotely
+        target_dir = output_dir if isinstance(output_dir, str) else url_parent(str(explicit))
+        uploads = {
+            path: explicit
+            if isinstance(explicit, str) and path == kwargs["output_path"]
+            else url_join(target_dir, path.relative_to(staging).as_posix())
+            for path in sorted(staging.rglob("*"))
+            if path.is_file()
+        }
+        try:
+            for path, url in uploads.items():
+                get_storage(url, self.config.storage).upload(path, url)
+        except Exception as e:
+            return OperationResult(
+                success=False,
+                input_path=location,
+                message=f"Failed to upload outputs of '{location}': {e}",
+                error=e,
+            )
+
+        for path, url in uploads.items():
+            result.message = result.message.replace(str(path), url)
+        if result.output_path in uploads:
+            result.output_path = uploads[result.output_path]
+        return result
+
+    def _report(self, result: OperationResult) -> OperationResult:
+        if self.config.global_settings.verbose and not self.config.global_settings.quiet:
+            print(result.message)
+        return result
+
     def list_operations(self) -> list[tuple[str, str]]:
         """List all available operations."""
         return [(name, op_class().description) for name, op_class in registry.all().items()]
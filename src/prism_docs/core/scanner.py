@@ -0,0 +1,701 @@
+"""Lightweight PDF structure scanner.
+
+Reads the header, the cross-reference sections and the trailer from a
+memory-mapped file, then resolves only the handful of objects it reports on
+(the catalog, the page tree root, the first page and the info dictionary).
+No content streams are decoded and the page tree is never walked, so a scan
+touches a few pages of the file regardless of its size. Deep mode additionally
+checks every xref offset and stream length.
+"""
+
+import json
+import mmap
+import os
+import re
+import sys
+import zlib
+from bisect import bisect_right
+from collections import deque
+from collections.abc import Iterable, Iterator
+from concurrent.futures import Future, ProcessPoolExecutor
+from dataclasses import asdict, dataclass, field
+from itertools import islice
+from pathlib import Path
+from typing import Any, NamedTuple
+
+# How much of the file tail to search for the last startxref keyword
+TAIL_SIZE = 2048
+
+# Files handed to a worker per task when scanning many files
+SCAN_BATCH_SIZE = 64
+
+# Issues reported per file before the rest are summarised
+MAX_ISSUES = 20
+
+_STARTXREF = re.compile(rb"startxref\s+(\d+)\s+%%EOF")
+_HEADER = re.compile(rb"%PDF-(\d\.\d)")
+_WHITESPACE = b"\x00\t\n\x0c\r "
+_DELIMITERS = b"()<>[]{}/%"
+_NUMBER = re.compile(rb"[+-]?(?:\d+\.?\d*|\.\d+)")
+_REF = re.compile(rb"\s+(\d+)\s+R(?![^\x00\t\n\x0c\r ()<>\[\]{}/%])")
+_OBJ_HEADER = re.compile(rb"\s*(\d+)\s+(\d+)\s+obj")
+_XREF_SUBSECTION = re.compile(rb"\s*(\d+)\s+(\d+)")
+_XREF_ENTRY = re.compile(rb"\s*(\d{1,10})\s+(\d{1,5})\s+([nf])")
+_STREAM = re.compile(rb"\s*stream(?:\r\n|\n|\r)")
+_STREAM_START = re.compile(rb">>\s*stream[\r\n]")
+_SKIP = re.compile(rb"(?:[\x00\t\n\x0c\r ]+|%[^\r\n]*)*")
+_ENDSTREAM = re.compile(rb"\s*endstream")
+_FONT = re.compile(rb"/Type\s*/Font(?![A-Za-z])")
+_ESCAPES = {b"n": b"\n", b"r": b"\r", b"t": b"\t", b"b": b"\b", b"f": b"\f"}
+
+
+class Ref(NamedTuple):
+    """An indirect reference (``12 0 R``)."""
+
+    num: int
+    gen: int
+
+
+class Stream(NamedTuple):
+    """A stream object: its dictionary and where its data starts."""
+
+    dict: dict[str, Any]
+    start: int
+
+
+def read_startxref(f: Any) -> int:
+    """Return the offset of the last cross-reference section of an open PDF."""
+    f.seek(0, os.SEEK_END)
+    size = f.tell()
+    f.seek(max(0, size - TAIL_SIZE))
+    matches = _STARTXREF.findall(f.read())
+    if not matches:
+        raise ValueError("No startxref found at the end of the file")
+    return int(matches[-1])
+
+
+def decode_text(value: Any) -> str | None:
+    """Decode a PDF text string (UTF-16 with BOM, UTF-8 with BOM or PDFDocEncoding)."""
+    if not isinstance(value, bytes):
+        return None if value is None else str(value)
+    if value.startswith(b"\xfe\xff"):
+        return value[2:].decode("utf-16-be", errors="replace")
+    if value.startswith(b"\xef\xbb\xbf"):
+        return value[3:].decode("utf-8", errors="replace")
+    return value.decode("latin-1")
+
+
+class _Parser:
+    """Minimal PDF object parser over a bytes-like buffer."""
+
+    def __init__(self, data: Any):
+        self.data = data
+
+    def skip(self, pos: int) -> int:
+        """Skip whitespace and comments."""
+        return _SKIP.match(self.data, pos).end()  # type: ignore[union-attr]
+
+    def parse(self, pos: int) -> tuple[Any, int]:
+        """Parse one object at ``pos``; return it and the position after it."""
+        data = self.data
+        pos = self.skip(pos)
+        if pos >= len(data):
+            raise ValueError("Unexpected end of data")
+        char = data[pos : pos + 1]
+
+        if char == b"/":
+            end = pos + 1
+            while end < len(data) and data[end] not in _WHITESPACE and data[end] not in _DELIMITERS:
+                end += 1
+            name = bytes(data[pos:end])
+            if b"#" in name:
+                name = re.sub(rb"#([0-9A-Fa-f]{2})", lambda m: bytes([int(m[1], 16)]), name)
+            return name.decode("latin-1"), end
+
+        if char == b"<":
+            if data[pos + 1 : pos + 2] == b"<":
+                return self._dict(pos + 2)
+            end = data.find(b">", pos)
+            if end < 0:
+                raise ValueError("Unterminated hex string")
+            digits = re.sub(rb"\s", b"", bytes(data[pos + 1 : end]))
+            if len(digits) % 2:
+                digits += b"0"
+            return bytes.fromhex(digits.decode("ascii")), end + 1
+
+        if char == b"[":
+            items = []
+            pos += 1
+            while True:
+                pos = self.skip(pos)
+                if data[pos : pos + 1] == b"]":
+                    return items, pos + 1
+                item, pos = self.parse(pos)
+                items.append(item)
+
+        if char == b"(":
+            return self._literal(pos + 1)
+
+        match = _NUMBER.match(data, pos)
+        if match:
+            text = match.group()
+            if b"." in text:
+                return float(text), match.end()
+            ref = _REF.match(data, match.end())
+            if ref:
+                return Ref(int(text), int(ref.group(1))), ref.end()
+            return int(text), match.end()
+
+        end = pos
+        while end < len(data) and data[end] not in _WHITESPACE and data[end] not in _DELIMITERS:
+            end += 1
+        keyword = bytes(data[pos:end])
+        if keyword == b"true":
+            return True, end
+        if keyword == b"false":
+            return False, end
+        if keyword == b"null":
+            return None, end
+        raise ValueError(f"Unexpected token {keyword[:20]!r} at offset {pos}")
+
+    def _dict(self, pos: int) -> tuple[dict[str, Any], int]:
+        data = self.data
+        result: dict[str, Any] = {}
+        while True:
+            pos = self.skip(pos)
+            if data[pos : pos + 2] == b">>":
+                return result, pos + 2
+            key, pos = self.parse(pos)
+            if not isinstance(key, str):
+                raise TypeError(f"Dictionary key is not a name at offset {pos}")
+            result[key], pos = self.parse(pos)
+
+    def _literal(self, pos: int) -> tuple[bytes, int]:
+        data = self.data
+        out = bytearray()
+        depth = 1
+        while pos < len(data):
+            char = data[pos : pos + 1]
+            if char == b"\\":
+                pos += 1
+                escaped = data[pos : pos + 1]
+                if escaped in _ESCAPES:
+                    out += _ESCAPES[escaped]
+                elif escaped.isdigit():
+                    octal = re.match(rb"[0-7]{1,3}", data[pos : pos + 3])
+                    if octal:
+                        out.append(int(octal.group(), 8) & 0xFF)
+                        pos += len(octal.group())
+                        continue
+                elif escaped == b"\r":
+                    if data[pos + 1 : pos + 2] == b"\n":
+                        pos += 1
+                elif escaped != b"\n":
+                    out += escaped
+                pos += 1
+                continue
+            if char == b"(":
+                depth += 1
+            elif char == b")":
+                depth -= 1
+                if depth == 0:
+                    return bytes(out), pos + 1
+            out += char
+            pos += 1
+        raise ValueError("Unterminated string")
+
+
+def _unpredict(data: bytes, params: dict[str, Any]) -> bytes:
+    """Undo a PNG predictor (as used by xref and object streams)."""
+    predictor = params.get("/Predictor", 1)
+    if predictor < 10:
+        return data
+    columns = params.get("/Columns", 1) * params.get("/Colors", 1)
+    columns = columns * params.get("/BitsPerComponent", 8) // 8
+    previous = bytearray(columns)
+    out = bytearray()
+    for row_start in range(0, len(data), columns + 1):
+        kind = data[row_start]
+        row = bytearray(data[row_start + 1 : row_start + 1 + columns])
+        if kind == 2:  # Up, by far the most common for xref streams
+            row = bytearray((a + b) & 0xFF for a, b in zip(row, previous))
+            out += row
+            previous = row
+            continue
+        for i in range(len(row) if kind else 0):
+            left = row[i - 1] if i else 0
+            up = previous[i]
+            if kind == 1:
+                row[i] = (row[i] + left) & 0xFF
+            elif kind == 3:
+                row[i] = (row[i] + (left + up) // 2) & 0xFF
+            elif kind == 4:
+                upper_left = previous[i - 1] if i else 0
+                estimate = left + up - upper_left
+                pa, pb, pc = abs(estimate - left), abs(estimate - up), abs(estimate - upper_left)
+                nearest = left if pa <= pb and pa <= pc else up if pb <= pc else upper_left
+                row[i] = (row[i] + nearest) & 0xFF
+        out += row
+        previous = row
+    return bytes(out)
+
+
+@dataclass
+class ScanResult:
+    """What a scan learned about one file."""
+
+    path: str
+    size: int = 0
+    version: str | None = None
+    pages: int | None = None
+    encrypted: bool = False
+    linearized: bool = False
+    xref: str | None = None  # "table", "stream" or "hybrid"
+    objects: int | None = None
+    page_size: tuple[float, float] | None = None
+    info: dict[str, str] = field(default_factory=dict)
+    # Content survey, filled in with survey=True
+    images: int | None = None
+    image_bytes: int | None = None
+    fonts: int | None = None
+    issues: list[str] = field(default_factory=list)
+
+    @property
+    def valid(self) -> bool:
+        return not self.issues
+
+    @property
+    def scanned(self) -> bool | None:
+        """
+        Whether the file looks like a scan, from the content survey.
+
+        A scan has at least one image per page and either no fonts or images
+        making up half the file (an OCR text layer adds a font). None without
+        a survey.
+        """
+        if self.images is None or not self.pages:
+            return None
+        if self.images < self.pages:
+            return False
+        return not self.fonts or (self.image_bytes or 0) >= self.size / 2
+
+    def to_dict(self) -> dict[str, Any]:
+        return {**asdict(self), "valid": self.valid, "scanned": self.scanned}
+
+
+class PDFScanner:
+    """
+    Structural reader for one PDF file.
+
+    Objects are resolved on demand through the cross-reference data; object
+    streams are decompressed only when an object inside one is needed.
+    """
+
+    def __init__(self, data: Any):
+        self.data = data
+        self.parser = _Parser(data)
+        # object number -> ("n", offset, gen) or ("c", object stream number, index);
+        # free entries are left out, so hybrid files' stream entries are not shadowed
+        self.xref: dict[int, tuple] = {}
+        self.trailer: dict[str, Any] = {}
+        self.xref_kinds: set[str] = set()
+        self.startxref: int | None = None
+        self._cache: dict[int, Any] = {}
+        self._object_streams: dict[int, tuple[bytes, list[int]]] = {}
+
+    def read_xref(self) -> None:
+        """Read every cross-reference section, newest first, following /Prev."""
+        tail = bytes(self.data[max(0, len(self.data) - TAIL_SIZE) :])
+        matches = _STARTXREF.findall(tail)
+        if not matches:
+            raise ValueError("No startxref found at the end of the file")
+        self.startxref = offset = int(matches[-1])
+
+        seen: set[int] = set()
+        pending: list[int] = [offset]
+        while pending:
+            offset = pending.pop(0)
+            if offset in seen:
+                continue
+            seen.add(offset)
+            if not 0 <= offset < len(self.data):
+                raise ValueError(f"Cross-reference offset {offset} is outside the file")
+
+            pos = self.parser.skip(offset)
+            if self.data[pos : pos + 4] == b"xref":
+                trailer = self._read_table(pos + 4)
+                self.xref_kinds.add("table")
+                if "/XRefStm" in trailer:
+                    self._read_stream(trailer["/XRefStm"])
+                    self.xref_kinds.add("stream")
+            else:
+                trailer = self._read_stream(offset)
+                self.xref_kinds.add("stream")
+
+            for key, value in trailer.items():
+                self.trailer.setdefault(key, value)
+            if isinstance(trailer.get("/Prev"), int):
+                pending.append(trailer["/Prev"])
+
+    def _read_table(self, pos: int) -> dict[str, Any]:
+        data = self.data
+        while True:
+            pos = self.parser.skip(pos)
+            if data[pos : pos + 7] == b"trailer":
+                trailer, _ = self.parser.parse(pos + 7)
+                return trailer
+            header = _XREF_SUBSECTION.match(data, pos)
+            if header is None:
+                raise ValueError(f"Malformed cross-reference table at offset {pos}")
+            first, count = int(header.group(1)), int(header.group(2))
+            pos = header.end()
+            for number in range(first, first + count):
+                entry = _XREF_ENTRY.match(data, pos)
+                if entry is None:
+                    raise ValueError(f"Malformed cross-reference entry for object {number}")
+                pos = entry.end()
+                if entry.group(3) == b"n":
+                    self.xref.setdefault(number, ("n", int(entry.group(1)), int(entry.group(2))))
+
+    def _read_stream(self, offset: int) -> dict[str, Any]:
+        header = _OBJ_HEADER.match(self.data, offset)
+        if header is None:
+            raise ValueError(f"No cross-reference section at offset {offset}")
+        stream, _ = self._parse_object(header.end())
+        if not isinstance(stream, Stream) or stream.dict.get("/Type") != "/XRef":
+            raise ValueError(f"Object at offset {offset} is not a cross-reference stream")
+
+        rows = self.stream_data(stream)
+        widths = stream.dict["/W"]
+        index = stream.dict.get("/Index", [0, stream.dict["/Size"]])
+        row_size = sum(widths)
+        pos = 0
+        for first, count in zip(index[::2], index[1::2]):
+            for number in range(first, first + count):
+                row = rows[pos : pos + row_size]
+                pos += row_size
+                fields = []
+                start = 0
+                for width in widths:
+                    fields.append(int.from_bytes(row[start : start + width], "big"))
+                    start += width
+                kind = fields[0] if widths[0] else 1
+                if kind == 1:
+                    self.xref.setdefault(number, ("n", fields[1], fields[2]))
+                elif kind == 2:
+                    self.xref.setdefault(number, ("c", fields[1], fields[2]))
+        return stream.dict
+
+    def _parse_object(self, pos: int) -> tuple[Any, int]:
+        """Parse an object body (after ``N G obj``), detecting streams."""
+        value, pos = self.parser.parse(pos)
+        if isinstance(value, dict):
+            match = _STREAM.match(self.data, pos)
+            if match:
+                return Stream(value, match.end()), match.end()
+        return value, pos
+
+    def stream_length(self, stream: Stream) -> int:
+        length = self.resolve(stream.dict.get("/Length"))
+        if not isinstance(length, int):
+            raise TypeError("Stream has no valid /Length")
+        return length
+
+    def stream_data(self, stream: Stream, length: int | None = None) -> bytes:
+        """
+        Return decoded stream data (Flate with optional PNG predictor only).
+
+        ``length`` overrides the stream's /Length, for streams whose declared
+        length is known to be wrong.
+        """
+        if length is None:
+            length = self.stream_length(stream)
+        raw = bytes(self.data[stream.start : stream.start + length])
+        filters = self.resolve(stream.dict.get("/Filter"))
+        params = self.resolve(stream.dict.get("/DecodeParms")) or {}
+        if isinstance(filters, str):
+            filters, params = [filters], [params]
+        elif isinstance(params, dict):
+            params = [params]
+        for name, param in zip(filters or [], params or [{}] * len(filters or [])):
+            if name not in ("/FlateDecode", "/Fl"):
+                raise ValueError(f"Unsupported filter {name}")
+            raw = _unpredict(zlib.decompressobj().decompress(raw), param or {})
+        return raw
+
+    def resolve(self, value: Any) -> Any:
+        """Follow references until a direct value is reached."""
+        depth = 0
+        while isinstance(value, Ref) and depth < 32:
+            value = self.get_object(value.num)
+            depth += 1
+        return value
+
+    def get_object(self, number: int) -> Any:
+        if number in self._cache:
+            return self._cache[number]
+
+        entry = self.xref.get(number, ("f",))
+        if entry[0] == "n":
+            header = _OBJ_HEADER.match(self.data, entry[1])
+            if header is None or int(header.group(1)) != number:
+                raise ValueError(f"Object {number} not found at offset {entry[1]}")
+            value, _ = self._parse_object(header.end())
+        elif entry[0] == "c":
+            value = self._compressed_object(entry[1], entry[2])
+        else:
+            value = None
+
+        self._cache[number] = value
+        return value
+
+    def _compressed_object(self, stream_number: int, index: int) -> Any:
+        if stream_number not in self._object_streams:
+            stream = self.get_object(stream_number)
+            if not isinstance(stream, Stream):
+                raise ValueError(f"Object stream {stream_number} is missing")
+            data = self.stream_data(stream)
+            numbers = _Parser(data)
+            offsets, pos = [], 0
+            for _ in range(stream.dict.get("/N", 0)):
+                _, pos = numbers.parse(pos)
+                offset, pos = numbers.parse(pos)
+                offsets.append(stream.dict.get("/First", 0) + offset)
+            self._object_streams[stream_number] = (data, offsets)
+
+        data, offsets = self._object_streams[stream_number]
+        if index >= len(offsets):
+            raise ValueError(f"Object stream {stream_number} has no object at index {index}")
+        value, _ = _Parser(data).parse(offsets[index])
+        return value
+
+    def first_page(self, pages_root: Any) -> dict[str, Any] | None:
+        """Descend the first /Kids entries to the first page, with inherited boxes."""
+        node = self.resolve(pages_root)
+        inherited: dict[str, Any] = {}
+        for _ in range(64):
+            if not isinstance(node, dict):
+                return None
+            for key in ("/MediaBox", "/CropBox", "/Rotate"):
+                if key in node:
+                    inherited[key] = node[key]
+            kids = self.resolve(node.get("/Kids"))
+            if not kids:
+                return {**inherited, **node}
+            node = self.resolve(kids[0])
+        return None
+
+    def inspect(self, result: "ScanResult", verify: bool = True, survey: bool = False) -> None:
+        """
+        Walk every object once to verify offsets and streams and/or survey content.
+
+        ``verify`` checks that every xref offset points at its object and every
+        stream /Length ends at ``endstream``. ``survey`` counts image XObjects
+        (and their encoded bytes) and font dictionaries, including fonts packed
+        in object streams.
+
+        Only stream dictionaries are parsed. An object's extent ends at the
+        next object's offset, and a ``>> stream`` keyword inside that extent
+        marks it as a stream; other objects are only searched for /Font.
+        """
+        issues = result.issues
+        images = image_bytes = fonts = 0
+        ends = sorted({entry[1] for entry in self.xref.values() if entry[0] == "n"})
+        ends.append(len(self.data))
+
+        for number, entry in sorted(self.xref.items()):
+            if entry[0] == "c":
+                container = self.xref.get(entry[1])
+                if verify and (container is None or container[0] != "n"):
+                    issues.append(f"Object {number}: object stream {entry[1]} is missing")
+                continue
+
+            offset = entry[1]
+            header = _OBJ_HEADER.match(self.data, offset)
+            if header is None or int(header.group(1)) != number:
+                if verify:
+                    issues.append(f"Object {number}: xref offset {offset} does not point at it")
+                continue
+            end = ends[bisect_right(ends, offset)]
+            if not _STREAM_START.search(self.data, header.end(), end):
+                if survey and _FONT.search(self.data, header.end(), end):
+                    fonts += 1
+                continue
+            try:
+                value, _ = self._parse_object(header.end())
+                if not isinstance(value, Stream):
+                    continue
+                length = self.stream_length(value)
+                stop = value.start + length
+                if verify and (stop > len(self.data) or not _ENDSTREAM.match(self.data, stop)):
+                    issues.append(f"Object {number}: stream /Length does not reach endstream")
+                if not survey:
+                    continue
+                if value.dict.get("/Subtype") == "/Image":
+                    images += 1
+                    image_bytes += length
+                elif value.dict.get("/Type") == "/ObjStm":
+                    fonts += len(_FONT.findall(self.stream_data(value)))
+            except (ValueError, IndexError, TypeError, RecursionError, zlib.error) as e:
+                if verify:
+                    issues.append(f"Object {number}: {e}")
+
+        if survey:
+            result.images, result.image_bytes, result.fonts = images, image_bytes, fonts
+
+
+def scan_pdf(path: Path, deep: bool = False, survey: bool = False) -> ScanResult:
+    """
+    Scan one file's structure without building a full reader.
+
+    ``deep`` verifies every object offset and stream length; ``survey`` counts
+    images and fonts (see :meth:`PDFScanner.inspect`). Problems are recorded
+    in ``issues`` instead of raised, so a scan never fails; an unreadable file
+    (or one nested too deeply to parse) yields a result with an issue and no
+    pages.
+    """
+    path = Path(path)
+    result = ScanResult(path=str(path))
+    try:
+        result.size = path.stat().st_size
+        if result.size == 0:
+            result.issues.append("File is empty")
+            return result
+        with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            _scan(PDFScanner(data), result, deep, survey)
+    except (OSError, ValueError, IndexError, TypeError, KeyError, RecursionError, zlib.error) as e:
+        result.issues.append(str(e) or type(e).__name__)
+
+    if len(result.issues) > MAX_ISSUES:
+        extra = len(result.issues) - MAX_ISSUES
+        result.issues = result.issues[:MAX_ISSUES] + [f"... and {extra} more issues"]
+    return result
+
+
+def _scan(scanner: PDFScanner, result: ScanResult, deep: bool, survey: bool) -> None:
+    data = scanner.data
+    header = _HEADER.search(data, 0, 1024)
+    if header is None:
+        result.issues.append("No %PDF header in the first 1024 bytes")
+    else:
+        result.version = header.group(1).decode()
+    result.linearized = b"/Linearized" in data[:1024]
+
+    scanner.read_xref()
+    trailer = scanner.trailer
+    result.xref = "hybrid" if len(scanner.xref_kinds) > 1 else scanner.xref_kinds.pop()
+    result.objects = trailer.get("/Size")
+    result.encrypted = "/Encrypt" in trailer
+
+    root = scanner.resolve(trailer.get("/Root"))
+    if not isinstance(root, dict):
+        raise TypeError("Trailer has no document catalog (/Root)")
+    pages_root = scanner.resolve(root.get("/Pages"))
+    if not isinstance(pages_root, dict):
+        raise TypeError("Document catalog has no page tree (/Pages)")
+    count = scanner.resolve(pages_root.get("/Count"))
+    result.pages = count if isinstance(count, int) else None
+    if not result.pages:
+        result.issues.append("PDF has no pages")
+
+    page = scanner.first_page(pages_root)
+    box = scanner.resolve(page.get("/MediaBox")) if page else None
+    if isinstance(box, list) and len(box) == 4:
+        x0, y0, x1, y1 = (float(scanner.resolve(v)) for v in box)
+        result.page_size = (abs(x1 - x0), abs(y1 - y0))
+
+    # Strings in an encrypted document's info dictionary are encrypted too
+    info = scanner.resolve(trailer.get("/Info"))
+    if isinstance(info, dict) and not result.encrypted:
+        for key, value in info.items():
+            text = decode_text(scanner.resolve(value))
+            if text:
+                result.info[key.lstrip("/").lower()] = text
+
+    if deep or survey:
+        scanner.inspect(result, verify=deep, survey=survey)
+
+
+def iter_pdf_files(paths: Iterable[Path]) -> Iterator[Path]:
+    """Yield files, expanding directories recursively to the PDFs they contain."""
+    for path in paths:
+        path = Path(path)
+        if not path.is_dir():
+            yield path
+            continue
+        for directory, dirnames, filenames in os.walk(path):
+            dirnames.sort()
+            for name in sorted(filenames):
+                if name.lower().endswith(".pdf"):
+                    yield Path(directory) / name
+
+
+def _scan_batch(paths: list[Path], deep: bool, survey: bool) -> list[ScanResult]:
+    return [scan_pdf(path, deep=deep, survey=survey) for path in paths]
+
+
+def scan_many(
+    paths: Iterable[Path],
+    deep: bool = False,
+    workers: int = 1,
+    batch_size: int = SCAN_BATCH_SIZE,
+    survey: bool = False,
+    skip: int = 0,
+) -> Iterator[ScanResult]:
+    """
+    Scan files (directories are walked) and yield results in input order.
+
+    Directories are walked in sorted order, so the same inputs always give
+    the same sequence and ``skip`` can resume a scan after that many files.
+    With several workers, batches of files are scanned in worker processes,
+    keeping a bounded number of batches in flight so memory stays flat
+    however many files there are.
+    """
+    files = islice(iter_pdf_files(paths), skip, None)
+    if workers <= 1:
+        for path in files:
+            yield scan_pdf(path, deep=deep, survey=survey)
+        return
+
+    def batches() -> Iterator[list[Path]]:
+        batch: list[Path] = []
+        for path in files:
+            batch.append(path)
+            if len(batch) >= batch_size:
+                yield batch
+                batch = []
+        if batch:
+            yield batch
+
+    pending: deque[Future] = deque()
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        for batch in batches():
+            pending.append(executor.submit(_scan_batch, batch, deep, survey))
+            if len(pending) >= workers * 2:
+                yield from pending.popleft().result()
+        while pending:
+            yield from pending.popleft().result()
+
+
+def write_jsonl(
+    results: Iterable[ScanResult], output: Path | str, append: bool = False
+) -> tuple[int, int]:
+    """
+    Stream scan results as JSON lines to ``output`` (``"-"`` for stdout).
+
+    Returns the number of files scanned and how many had issues.
+    """
+    scanned = failed = 0
+    mode = "a" if append else "w"
+    f = sys.stdout if str(output) == "-" else open(output, mode, encoding="utf-8")  # noqa: SIM115
+    try:
+        for result in results:
+            f.write(json.dumps(result.to_dict()) + "\n")
+            scanned += 1
+            failed += not result.valid
+    finally:
+        if f is not sys.stdout:
+            f.close()
+        else:
+            f.flush()
+    return scanned, failed
@@ -0,0 +1,676 @@
+"""Storage backends for remote inputs and outputs.
+
+Inputs, output directories and explicit outputs may be URLs as well as local
+paths:
+
+* ``file:///path`` - the local filesystem
+* ``http://`` and ``https://`` - web servers (ranged ``GET`` reads, ``PUT`` uploads)
+* ``s3://bucket/key`` - Amazon S3 and S3-compatible stores such as MinIO
+
+Backends send their requests through a :class:`ConnectionPool`, which keeps
+connections to each host open between requests and threads. Reads are
+ranged: :func:`open_input` returns a seekable file that fetches only the
+blocks a reader touches, so ``info`` reads a file's trailer, cross-reference
+data and a few objects rather than the whole file. Other operations need a
+local file; the runner downloads remote inputs a few files ahead of the one
+being processed (:func:`prefetch`) and uploads outputs once they are written,
+S3 uploads in concurrent parts above ``multipart_threshold``.
+"""
+
+import hashlib
+import hmac
+import http.client
+import io
+import os
+import re
+import shutil
+import threading
+import xml.etree.ElementTree as ET
+from abc import ABC, abstractmethod
+from collections import OrderedDict, deque
+from collections.abc import Iterable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import contextmanager
+from dataclasses import astuple, dataclass
+from datetime import UTC, datetime
+from pathlib import Path, PurePosixPath
+from typing import Any, BinaryIO
+from urllib.parse import quote, unquote, urlencode, urlsplit
+
+from prism_docs.core.config import StorageConfig
+from prism_docs.core.output import OUTPUT_BUFFER_SIZE, atomic_output
+
+# A scheme, then one or more slashes: pathlib folds "s3://b/k" to "s3:/b/k"
+_URL = re.compile(r"^([A-Za-z][A-Za-z0-9+.-]+):/+(.*)$", re.DOTALL)
+
+UNSIGNED_PAYLOAD = "UNSIGNED-PAYLOAD"
+EMPTY_SHA256 = hashlib.sha256(b"").hexdigest()
+MIN_PART_SIZE = 5 * 1024 * 1024  # S3 rejects smaller parts (except the last)
+
+_BACKENDS: dict[str, type["StorageBackend"]] = {}
+_INSTANCES: dict[tuple[str, tuple], "StorageBackend"] = {}
+_INSTANCES_LOCK = threading.Lock()
+
+
+def register_storage(*schemes: str):
+    """Class decorator registering a :class:`StorageBackend` for URL schemes."""
+
+    def decorator(cls: type["StorageBackend"]) -> type["StorageBackend"]:
+        for scheme in schemes:
+            _BACKENDS[scheme] = cls
+        return cls
+
+    return decorator
+
+
+def parse_location(value: str | Path) -> str | Path:
+    """
+    Return ``value`` as a URL string if it names remote storage, else as a ``Path``.
+
+    Accepts URLs whose double slash ``pathlib`` has folded (``s3:/bucket/key``),
+    which is how they arrive from arguments parsed as paths. ``file://`` URLs
+    become local paths.
+    """
+    match = _URL.match(str(value))
+    if match is None:
+        return Path(value)
+    scheme, rest = match.group(1).lower(), match.group(2)
+    if scheme == "file":
+        return Path("/" + rest.removeprefix("localhost/"))
+    if scheme not in _BACKENDS:
+        return Path(value)
+    return f"{scheme}://{rest}"
+
+
+def is_remote(value: str | Path | None) -> bool:
+    """Whether ``value`` is a URL handled by a storage backend."""
+    return value is not None and isinstance(parse_location(value), str)
+
+
+def url_name(url: str) -> str:
+    """Final path component of a URL (its file name)."""
+    return PurePosixPath(unquote(urlsplit(url).path)).name
+
+
+def url_parent(url: str) -> str:
+    """The URL of the "directory" containing ``url``."""
+    parts = urlsplit(url)
+    parent = parts.path.rsplit("/", 1)[0]
+    return f"{parts.scheme}://{parts.netloc}{parent}/"
+
+
+def url_join(base: str, relative: str) -> str:
+    """Append a relative POSIX path to a directory URL."""
+    return base.rstrip("/") + "/" + relative.lstrip("/")
+
+
+def get_storage(url: str, config: StorageConfig | None = None) -> "StorageBackend":
+    """
+    Return the backend for ``url``.
+
+    Backends, and with them their connection pools, are shared by every caller
+    using the same settings.
+    """
+    config = config or StorageConfig()
+    scheme = urlsplit(url).scheme.lower()
+    if scheme not in _BACKENDS:
+        raise ValueError(f"No storage backend for '{url}'")
+
+    key = (scheme, astuple(config))
+    with _INSTANCES_LOCK:
+        if key not in _INSTANCES:
+            _INSTANCES[key] = _BACKENDS[scheme](config)
+        return _INSTANCES[key]
+
+
+def open_input(url: str, config: StorageConfig | None = None) -> BinaryIO:
+    """Open a remote file for reading; only the blocks that are read are fetched."""
+    config = config or StorageConfig()
+    return io.BufferedReader(RangedFile(get_storage(url, config), url, config.block_size))  # type: ignore[return-value]
+
+
+class ConnectionPool:
+    """Keep-alive HTTP(S) connections, reused across requests and threads."""
+
+    def __init__(self, size: int = 8, timeout: float = 60.0):
+        self.size = size
+        self.timeout = timeout
+        self.opened = 0  # Connections created so far
+        self._idle: dict[tuple[str, str], list[http.client.HTTPConnection]] = {}
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def request(
+        self,
+        method: str,
+        url: str,
+        headers: dict[str, str] | None = None,
+        body: bytes | BinaryIO | None = None,
+    ) -> Iterator[http.client.HTTPResponse]:
+        """
+        Send a request and yield its response.
+
+        The response must be read inside the block; the connection then goes
+        back to the pool. Status codes are not checked.
+        """
+        parts = urlsplit(url)
+        key = (parts.scheme.lower(), parts.netloc)
+        target = (parts.path or "/") + (f"?{parts.query}" if parts.query else "")
+        start = body.tell() if body is not None and hasattr(body, "tell") else 0
+
+        connection, reused = self._acquire(key)
+        try:
+            try:
+                connection.request(method, target, body=body, headers=headers or {})
+                response = connection.getresponse()
+            except (http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError):
+                if not reused:
+                    raise
+                # The server dropped an idle connection: retry once on a new one
+                connection.close()
+                connection = self._connect(key)
+                if body is not None and hasattr(body, "seek"):
+                    body.seek(start)
+                connection.request(method, target, body=body, headers=headers or {})
+                response = connection.getresponse()
+
+            yield response
+            response.read()
+        except BaseException:
+            connection.close()
+            raise
+
+        if response.will_close:
+            connection.close()
+        else:
+            self._release(key, connection)
+
+    def close(self) -> None:
+        """Close all idle connections."""
+        with self._lock:
+            idle, self._idle = self._idle, {}
+        for connections in idle.values():
+            for connection in connections:
+                connection.close()
+
+    def _acquire(self, key: tuple[str, str]) -> tuple[http.client.HTTPConnection, bool]:
+        with self._lock:
+            idle = self._idle.get(key)
+            if idle:
+                return idle.pop(), True
+        return self._connect(key), False
+
+    def _connect(self, key: tuple[str, str]) -> http.client.HTTPConnection:
+        scheme, netloc = key
+        connection_class = (
+            http.client.HTTPSConnection if scheme == "https" else http.client.HTTPConnection
+        )
+        with self._lock:
+            self.opened += 1
+        return connection_class(netloc, timeout=self.timeout, blocksize=OUTPUT_BUFFER_SIZE)
+
+    def _release(self, key: tuple[str, str], connection: http.client.HTTPConnection) -> None:
+        with self._lock:
+            idle = self._idle.setdefault(key, [])
+            if len(idle) < self.size:
+                idle.append(connection)
+                return
+        connection.close()
+
+
+class StorageBackend(ABC):
+    """Reads and writes files at URLs of one or more schemes."""
+
+    def __init__(self, config: StorageConfig):
+        self.config = config
+        self.pool = ConnectionPool(config.pool_size, config.timeout)
+
+    @abstractmethod
+    def size(self, url: str) -> int:
+        """Size of the file in bytes."""
+        ...
+
+    @abstractmethod
+    def read_range(self, url: str, start: int, end: int) -> bytes:
+        """Bytes ``start`` up to (not including) ``end``."""
+        ...
+
+    @abstractmethod
+    def download(self, url: str, path: Path) -> None:
+        """Copy the file at ``url`` to a local path."""
+        ...
+
+    @abstractmethod
+    def upload(self, path: Path, url: str) -> None:
+        """Copy a local file to ``url``."""
+        ...
+
+    def list(self, url: str) -> list[str]:
+        """URLs of the files under a directory URL."""
+        raise ValueError(f"Cannot list '{url}': {urlsplit(url).scheme} storage has no listing")
+
+
+@register_storage("http", "https")
+class HTTPStorage(StorageBackend):
+    """Files on a web server: ranged ``GET`` for reads, ``PUT`` for uploads."""
+
+    def size(self, url: str) -> int:
+        with self._request("HEAD", url) as response:
+            return int(response.headers["Content-Length"])
+
+    def read_range(self, url: str, start: int, end: int) -> bytes:
+        if end <= start:
+            return b""
+        headers = {"Range": f"bytes={start}-{end - 1}"}
+        with self._request("GET", url, headers, expect=(200, 206, 416)) as response:
+            if response.status == 416:
+                return b""
+            data = response.read()
+        # A server that ignores Range sends the whole file
+        return data[start:end] if response.status == 200 else data
+
+    def download(self, url: str, path: Path) -> None:
+        with self._request("GET", url) as response, atomic_output(path) as f:
+            shutil.copyfileobj(response, f, OUTPUT_BUFFER_SIZE)
+
+    def upload(self, path: Path, url: str) -> None:
+        size = Path(path).stat().st_size
+        with open(path, "rb") as body:
+            headers = {"Content-Length": str(size), "Content-Type": _content_type(path)}
+            with self._request("PUT", url, headers, body, expect=(200, 201, 204)):
+                pass
+
+    @contextmanager
+    def _request(
+        self,
+        method: str,
+        url: str,
+        headers: dict[str, str] | None = None,
+        body: bytes | BinaryIO | None = None,
+        expect: tuple[int, ...] = (200, 206),
+    ) -> Iterator[http.client.HTTPResponse]:
+        """Send a request through the pool, raising for unexpected statuses."""
+        with self.pool.request(method, url, headers, body) as response:
+            if response.status not in expect:
+                detail = response.read(2048).decode("utf-8", "replace").strip()
+                if response.status == 404:
+                    raise FileNotFoundError(f"No such file: '{url}'")
+                raise OSError(
+                    f"{method} {url} failed: {response.status} {response.reason} {detail}".rstrip()
+                )
+            yield response
+
+
+@dataclass(frozen=True)
+class Credentials:
+    """AWS-style access keys."""
+
+    access_key: str
+    secret_key: str
+    token: str = ""
+
+    @classmethod
+    def from_env(cls) -> "Credentials | None":
+        """Read ``AWS_ACCESS_KEY_ID``/``AWS_SECRET_ACCESS_KEY``/``AWS_SESSION_TOKEN``."""
+        access_key = os.environ.get("AWS_ACCESS_KEY_ID", "")
+        secret_key = os.environ.get("AWS_SECRET_ACCESS_KEY", "")
+        if not access_key or not secret_key:
+            return None
+        return cls(access_key, secret_key, os.environ.get("AWS_SESSION_TOKEN", ""))
+
+
+def sign_v4(
+    method: str,
+    url: str,
+    headers: dict[str, str],
+    credentials: Credentials,
+    region: str,
+    service: str = "s3",
+    now: datetime | None = None,
+) -> dict[str, str]:
+    """
+    Return ``headers`` plus the AWS Signature Version 4 headers for a request.
+
+    Every header given is signed. The payload hash is taken from an
+    ``x-amz-content-sha256`` header if present, else the payload is unsigned.
+    """
+    parts = urlsplit(url)
+    amz_date = (now or datetime.now(UTC)).strftime("%Y%m%dT%H%M%SZ")
+    scope = f"{amz_date[:8]}/{region}/{service}/aws4_request"
+
+    signed_headers = {key.lower(): value for key, value in headers.items()}
+    signed_headers.setdefault("x-amz-content-sha256", UNSIGNED_PAYLOAD)
+    signed_headers.update({"host": parts.netloc, "x-amz-date": amz_date})
+    if credentials.token:
+        signed_headers["x-amz-security-token"] = credentials.token
+    names = sorted(signed_headers)
+
+    query = sorted(
+        (quote(unquote(key), safe="-_.~"), quote(unquote(value), safe="-_.~"))
+        for key, _, value in (pair.partition("=") for pair in parts.query.split("&") if pair)
+    )
+    canonical_request = "\n".join(
+        [
+            method,
+            parts.path or "/",
+            "&".join(f"{key}={value}" for key, value in query),
+            "".join(f"{name}:{' '.join(str(signed_headers[name]).split())}\n" for name in names),
+            ";".join(names),
+            signed_headers["x-amz-content-sha256"],
+        ]
+    )
+    string_to_sign = "\n".join(
+        [
+            "AWS4-HMAC-SHA256",
+            amz_date,
+            scope,
+            hashlib.sha256(canonical_request.encode()).hexdigest(),
+        ]
+    )
+
+    key = f"AWS4{credentials.secret_key}".encode()
+    for part in scope.split("/"):
+        key = hmac.new(key, part.encode(), hashlib.sha256).digest()
+    signature = hmac.new(key, string_to_sign.encode(), hashlib.sha256).hexdigest()
+
+    signed_headers["authorization"] = (
+        f"AWS4-HMAC-SHA256 Credential={credentials.access_key}/{scope}, "
+        f"SignedHeaders={';'.join(names)}, Signature={signature}"
+    )
+    return signed_headers
+
+
+@register_storage("s3")
+class S3Storage(HTTPStorage):
+    """
+    Objects in S3 or an S3-compatible store, addressed as ``s3://bucket/key``.
+
+    Requests use path-style addressing against ``s3_endpoint_url`` (or
+    ``$AWS_ENDPOINT_URL_S3``/``$AWS_ENDPOINT_URL``, else AWS itself) and are
+    signed with credentials from the environment; without credentials they are
+    sent unsigned, for public buckets.
+    """
+
+    def __init__(self, config: StorageConfig):
+        super().__init__(config)
+        self.region = (
+            config.s3_region
+            or os.environ.get("AWS_REGION")
+            or os.environ.get("AWS_DEFAULT_REGION")
+            or "us-east-1"
+        )
+        self.endpoint = (
+            config.s3_endpoint_url
+            or os.environ.get("AWS_ENDPOINT_URL_S3")
+            or os.environ.get("AWS_ENDPOINT_URL")
+            or f"https://s3.{self.region}.amazonaws.com"
+        ).rstrip("/")
+        self.credentials = Credentials.from_env()
+
+    def upload(self, path: Path, url: str) -> None:
+        size = Path(path).stat().st_size
+        if size > self.config.multipart_threshold:
+            self._upload_multipart(path, url, size)
+        else:
+            super().upload(path, url)
+
+    def list(self, url: str) -> list[str]:
+        bucket, prefix = _split_s3(url)
+        if prefix and not prefix.endswith("/"):
+            prefix += "/"
+        urls: list[str] = []
+        token = ""
+        while True:
+            params = {"list-type": "2", "prefix": prefix}
+            if token:
+                params["continuation-token"] = token
+            with self._request("GET", f"s3://{bucket}/", params=params) as response:
+                root = ET.fromstring(response.read())
+            urls.extend(f"s3://{bucket}/{key.text}" for key in root.iterfind("{*}Contents/{*}Key"))
+            token = root.findtext("{*}NextContinuationToken") or ""
+            if root.findtext("{*}IsTruncated") != "true" or not token:
+                return urls
+
+    def _upload_multipart(self, path: Path, url: str, size: int) -> None:
+        """Upload ``path`` in parts sent concurrently over pooled connections."""
+        with self._request("POST", url, params={"uploads": ""}) as response:
+            upload_id = ET.fromstring(response.read()).findtext("{*}UploadId")
+        if not upload_id:
+            raise OSError(f"No upload ID returned for '{url}'")
+
+        part_size = max(self.config.part_size, MIN_PART_SIZE)
+        parts = [
+            (number, offset, min(part_size, size - offset))
+            for number, offset in enumerate(range(0, size, part_size), start=1)
+        ]
+
+        def send(part: tuple[int, int, int]) -> str:
+            number, offset, length = part
+            with open(path, "rb") as f:
+                f.seek(offset)
+                data = f.read(length)
+            params = {"partNumber": str(number), "uploadId": upload_id}
+            with self._request(
+                "PUT", url, {"Content-Length": str(length)}, data, params=params
+            ) as response:
+                return response.headers["ETag"]
+
+        try:
+            with ThreadPoolExecutor(max_workers=max(1, self.config.pool_size)) as executor:
+                etags = list(executor.map(send, parts))
+            body = "".join(
+                f"<Part><PartNumber>{number}</PartNumber><ETag>{etag}</ETag></Part>"
+                for (number, _, _), etag in zip(parts, etags, strict=True)
+            )
+            document = f"<CompleteMultipartUpload>{body}</CompleteMultipartUpload>".encode()
+            with self._request(
+                "POST", url, {}, document, params={"uploadId": upload_id}
+            ) as response:
+                # Completion can fail after a 200 status, reported in the body
+                if b"<Error>" in response.read():
+                    raise OSError(f"Multipart upload of '{url}' failed")
+        except BaseException:
+            try:
+                with self._request(
+                    "DELETE", url, params={"uploadId": upload_id}, expect=(200, 204)
+                ):
+                    pass
+            except OSError:
+                pass
+            raise
+
+    @contextmanager
+    def _request(
+        self,
+        method: str,
+        url: str,
+        headers: dict[str, str] | None = None,
+        body: bytes | BinaryIO | None = None,
+        expect: tuple[int, ...] = (200, 206),
+        params: dict[str, str] | None = None,
+    ) -> Iterator[http.client.HTTPResponse]:
+        bucket, key = _split_s3(url)
+        target = f"{self.endpoint}/{bucket}" + (f"/{quote(key, safe='/-_.~')}" if key else "")
+        if params:
+            target += "?" + urlencode(sorted(params.items()), quote_via=quote, safe="-_.~")
+
+        headers = dict(headers or {})
+        if self.credentials is not None:
+            if body is None:
+                headers["x-amz-content-sha256"] = EMPTY_SHA256
+            headers = sign_v4(method, target, headers, self.credentials, self.region)
+
+        try:
+            with super()._request(method, target, headers, body, expect) as response:
+                yield response
+        except FileNotFoundError:
+            raise FileNotFoundError(f"No such file: '{url}'") from None
+
+
+def _split_s3(url: str) -> tuple[str, str]:
+    parts = urlsplit(url)
+    if not parts.netloc:
+        raise ValueError(f"No bucket in '{url}'")
+    return parts.netloc, unquote(parts.path.lstrip("/"))
+
+
+def _content_type(path: Path) -> str:
+    suffix = Path(path).suffix.lower()
+    return {
+        ".pdf": "application/pdf",
+        ".png": "image/png",
+        ".jpg": "image/jpeg",
+        ".jpeg": "image/jpeg",
+        ".tif": "image/tiff",
+        ".tiff": "image/tiff",
+        ".txt": "text/plain; charset=utf-8",
+        ".json": "application/json",
+        ".jsonl": "application/x-ndjson",
+        ".csv": "text/csv",
+    }.get(suffix, "application/octet-stream")
+
+
+class RangedFile(io.RawIOBase):
+    """
+    A seekable, read-only view of a remote file.
+
+    Data is fetched in aligned blocks of ``block_size``, adjacent missing
+    blocks in one request, and recent blocks are kept, so the back-and-forth
+    reads of a PDF parser near the trailer cost a request or two.
+    """
+
+    MAX_BLOCKS = 16
+
+    def __init__(self, backend: StorageBackend, url: str, block_size: int = 256 * 1024):
+        self.backend = backend
+        self.url = url
+        self.name = url
+        self.block_size = block_size
+        self.size = backend.size(url)
+        self.requests = 0  # Ranged reads sent so far
+        self._position = 0
+        self._blocks: OrderedDict[int, bytes] = OrderedDict()
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def tell(self) -> int:
+        return self._position
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        if whence == io.SEEK_CUR:
+            offset += self._position
+        elif whence == io.SEEK_END:
+            offset += self.size
+        if offset < 0:
+            raise ValueError(f"Negative seek position {offset}")
+        self._position = offset
+        return offset
+
+    def readinto(self, buffer: Any) -> int:
+        end = min(self._position + len(buffer), self.size)
+        if end <= self._position:
+            return 0
+
+        first, last = self._position // self.block_size, (end - 1) // self.block_size
+        missing = [index for index in range(first, last + 1) if index not in self._blocks]
+        if missing:
+            self._fetch(missing[0], missing[-1])
+
+        data = b"".join(self._block(index) for index in range(first, last + 1))
+        offset = self._position - first * self.block_size
+        count = end - self._position
+        buffer[:count] = data[offset : offset + count]
+        self._position = end
+        return count
+
+    def _block(self, index: int) -> bytes:
+        self._blocks.move_to_end(index)
+        return self._blocks[index]
+
+    def _fetch(self, first: int, last: int) -> None:
+        start = first * self.block_size
+        data = self.backend.read_range(
+            self.url, start, min((last + 1) * self.block_size, self.size)
+        )
+        self.requests += 1
+        for index in range(first, last + 1):
+            offset = (index - first) * self.block_size
+            self._blocks[index] = data[offset : offset + self.block_size]
+            self._blocks.move_to_end(index)
+        while len(self._blocks) > max(self.MAX_BLOCKS, last - first + 1):
+            self._blocks.popitem(last=False)
+
+
+def expand_locations(
+    locations: Iterable[str | Path], config: StorageConfig | None = None
+) -> list[str | Path]:
+    """
+    Replace directory URLs with the PDF files listed under them.
+
+    A URL ending in ``/`` is a directory, as is an ``s3://`` URL not naming a
+    ``.pdf`` object (paths parsed by the CLI lose their trailing slash).
+    """
+    expanded: list[str | Path] = []
+    for location in locations:
+        if isinstance(location, str) and (
+            location.endswith("/")
+            or (location.startswith("s3://") and not location.lower().endswith(".pdf"))
+        ):
+            urls = get_storage(location, config).list(location)
+            expanded.extend(url for url in urls if url.lower().endswith(".pdf"))
+        else:
+            expanded.append(location)
+    return expanded
+
+
+def prefetch(
+    locations: Iterable[str | Path],
+    directory: Path,
+    config: StorageConfig | None = None,
+) -> Iterator[tuple[str | Path, Path | Exception]]:
+    """
+    Yield each location with a local copy, downloading ``config.prefetch`` ahead.
+
+    Local paths are yielded as they are. A download that fails is yielded as
+    its exception. Each download is deleted once the caller moves on, so at
+    most ``prefetch + 1`` inputs are staged at a time.
+    """
+    config = config or StorageConfig()
+    items = iter(enumerate(locations))
+    pending: deque[tuple[str | Path, Future[Path]]] = deque()
+
+    def fetch(index: int, url: str) -> Path:
+        path = directory / str(index) / url_name(url)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        get_storage(url, config).download(url, path)
+        return path
+
+    def submit() -> None:
+        for index, location in items:
+            if isinstance(location, str):
+                pending.append((location, executor.submit(fetch, index, location)))
+            else:
+                done: Future[Path] = Future()
+                done.set_result(location)
+                pending.append((location, done))
+            return
+
+    with ThreadPoolExecutor(max_workers=max(1, config.prefetch)) as executor:
+        for _ in range(config.prefetch + 1):
+            submit()
+        while pending:
+            location, future = pending.popleft()
+            submit()
+            try:
+                path: Path | Exception = future.result()
+            except Exception as e:
+                path = e
+            try:
+                yield location, path
+            finally:
+                if isinstance(location, str) and isinstance(path, Path):
+                    shutil.rmtree(path.parent, ignore_errors=True)
@@ -36,6 +36,9 @@ class OutputConfig:
     pattern: str = "{stem}{suffix}{ext}"  # For custom naming
     output_dir: Path | None = None  # None = same as input
     overwrite: OverwritePolicy = OverwritePolicy.OVERWRITE
+    linearize: bool = False  # Write linearized ("fast web view") PDFs
+    atomic: bool = True  # Write to a temporary file and rename it into place
+    fsync: bool = False  # Flush outputs to disk before reporting success
 
     def resolve_output_path(self, input_path: Path, operation_suffix: str = "") -> Path:
         """Resolve the output path based on configuration."""
@@ -68,6 +71,10 @@ class OutputConfig:
 
         return self._handle_existing(output_path)
 
+    def write_options(self) -> dict[str, Any]:
+        """Options understood by every output writer (see ``core.output``)."""
+        return {"linearize": self.linearize, "atomic": self.atomic, "fsync": self.fsync}
+
     def _handle_existing(self, path: Path) -> Path:
         """Handle existing files based on overwrite policy."""
         if not path.exists() or self.overwrite == OverwritePolicy.OVERWRITE:
@@ -94,8 +101,8 @@ class OperationResult:
     """Result of a PDF operation."""
 
     success: bool
-    input_path: Path
-    output_path: Path | None = None
+    input_path: Path | str  # A URL string for remote inputs
+    output_path: Path | str | None = None  # A URL string for remote outputs
     message: str = ""
     error: Exception | None = None
 
@@ -132,6 +139,10 @@ class PDFOperation(Protocol):
 class BasePDFOperation(ABC):
     """Base class for PDF operations with common functionality."""
 
+    # Operations that read http(s):// and s3:// inputs themselves (through
+    # core.storage.open_input) instead of having the runner download them
+    reads_urls: bool = False
+
     @property
     @abstractmethod
     def name(self) -> str:
@@ -39,11 +39,15 @@ from prism_docs.operations.security import (
     RedactOperation,
 )
 
+# Form operations
+from prism_docs.operations.forms import FormFillOperation
+
 # Utility operations
 from prism_docs.operations.utils import (
     BookmarksOperation,
     CropOperation,
     InfoOperation,
+    InventoryOperation,
     ResizeOperation,
     ValidateOperation,
 )
@@ -100,10 +104,13 @@ __all__ = [
     "FlattenOperation",
     "PermissionsOperation",
     "RedactOperation",
+    # Forms
+    "FormFillOperation",
     # Utils
     "BookmarksOperation",
     "CropOperation",
     "InfoOperation",
+    "InventoryOperation",
     "ResizeOperation",
     "ValidateOperation",
     # OCR (optional)
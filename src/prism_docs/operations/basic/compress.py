@@ -6,6 +6,7 @@ from typing import Any
 from pypdf import PdfReader, PdfWriter
 
 from prism_docs.core import BasePDFOperation, register_operation
+from prism_docs.core.output import write_pdf
 
 
 @register_operation("compress")
@@ -38,5 +39,4 @@ class CompressOperation(BasePDFOperation):
         if reader.metadata:
             writer.add_metadata(reader.metadata)
 
-        with open(output_path, "wb") as f:
-            writer.write(f)
+        write_pdf(writer, output_path, **kwargs)
@@ -1,11 +1,83 @@
 """Decrypt PDF operation."""
 
+import threading
 from pathlib import Path
 from typing import Any
 
 from pypdf import PdfReader, PdfWriter
 
 from prism_docs.core import BasePDFOperation, register_operation
+from prism_docs.core.output import write_pdf
+
+# Password that last opened a file, per sender (parent) directory
+_winning_passwords: dict[Path, str] = {}
+_winning_lock = threading.Lock()
+
+
+def read_keyring(path: Path) -> list[str]:
+    """
+    Read candidate passwords from a keyring file.
+
+    One password per line; blank lines and lines starting with ``#`` are
+    skipped. Surrounding whitespace is kept, since it can be part of a password.
+    """
+    passwords = []
+    for line in Path(path).read_text(encoding="utf-8").splitlines():
+        if not line or line.startswith("#"):
+            continue
+        passwords.append(line)
+    return passwords
+
+
+def candidate_passwords(
+    input_path: Path,
+    password: str | None = None,
+    passwords: list[str] | None = None,
+    keyring: Path | None = None,
+) -> list[str]:
+    """
+    Order candidate passwords for a file, cheapest guess first.
+
+    The explicit password comes first, then the password that last opened a
+    file from the same directory, then the list and keyring entries. The
+    empty password is always tried last.
+    """
+    ordered: list[str] = []
+    if password is not None:
+        ordered.append(password)
+
+    with _winning_lock:
+        cached = _winning_passwords.get(Path(input_path).resolve().parent)
+    if cached is not None:
+        ordered.append(cached)
+
+    ordered.extend(passwords or [])
+    if keyring is not None:
+        ordered.extend(read_keyring(keyring))
+    ordered.append("")
+
+    # Drop duplicates, keep first occurrence
+    return list(dict.fromkeys(ordered))
+
+
+def find_password(reader: PdfReader, candidates: list[str]) -> str | None:
+    """
+    Return the first candidate that opens an encrypted reader, or None.
+
+    Each check only derives the key and validates it against the /U and /O
+    entries of the encryption dictionary; no page or object is decrypted
+    until a candidate matches.
+    """
+    for candidate in candidates:
+        if reader.decrypt(candidate):
+            return candidate
+    return None
+
+
+def remember_password(input_path: Path, password: str) -> None:
+    """Cache the password that opened a file for its sender directory."""
+    with _winning_lock:
+        _winning_passwords[Path(input_path).resolve().parent] = password
 
 
 @register_operation("decrypt")
@@ -25,20 +97,32 @@ class DecryptOperation(BasePDFOperation):
         return "decrypted"
 
     def _execute(self, input_path: Path, output_path: Path, **kwargs: Any) -> None:
-        password: str = kwargs["password"]
+        """
+        Decrypt a PDF with a password, a password list or a keyring file.
+
+        Args:
+            input_path: Path to the encrypted PDF
+            output_path: Path to output PDF
+            password: Password to try first
+            passwords: Further candidate passwords
+            keyring: File with one candidate password per line
+        """
+        password: str | None = kwargs.get("password")
+        passwords: list[str] = kwargs.get("passwords", [])
+        keyring: Path | None = kwargs.get("keyring")
 
         reader = PdfReader(input_path)
-        writer = PdfWriter()
 
         if reader.is_encrypted:
-            reader.decrypt(password)
-
-        for page in reader.pages:
-            writer.add_page(page)
+            candidates = candidate_passwords(input_path, password, passwords, keyring)
+            found = find_password(reader, candidates)
+            if found is None:
+                raise ValueError(
+                    f"None of {len(candidates)} candidate password(s) opens '{input_path}'"
+                )
+            remember_password(input_path, found)
 
-        # Copy metadata if exists
-        if reader.metadata:
-            writer.add_metadata(reader.metadata)
+        # Clone keeps metadata, outlines, forms and names along with the pages
+        writer = PdfWriter(clone_from=reader)
 
-        with open(output_path, "wb") as f:
-            writer.write(f)
+        write_pdf(writer, output_path, **kwargs)
@@ -4,8 +4,31 @@ from pathlib import Path
 from typing import Any
 
 from pypdf import PdfReader, PdfWriter
+from pypdf.constants import UserAccessPermissions
 
 from prism_docs.core import BasePDFOperation, register_operation
+from prism_docs.core.output import write_pdf
+
+
+def encrypt_writer(
+    writer: PdfWriter,
+    user_password: str,
+    owner_password: str | None = None,
+    algorithm: str = "AES-256",
+    permissions: int = UserAccessPermissions.all(),
+) -> None:
+    """
+    Encrypt a writer with the standard security handler.
+
+    Every document gets its own random file key, even when several are
+    encrypted with the same password.
+    """
+    writer.encrypt(
+        user_password=user_password,
+        owner_password=owner_password or user_password,
+        permissions_flag=permissions,
+        algorithm=algorithm,
+    )
 
 
 @register_operation("encrypt")
@@ -29,21 +52,15 @@ class EncryptOperation(BasePDFOperation):
         owner_password: str | None = kwargs.get("owner_password")
         algorithm: str = kwargs.get("algorithm", "AES-256")
 
+        # Clone keeps metadata, outlines, forms and names along with the pages
         reader = PdfReader(input_path)
-        writer = PdfWriter()
-
-        for page in reader.pages:
-            writer.add_page(page)
-
-        # Copy metadata if exists
-        if reader.metadata:
-            writer.add_metadata(reader.metadata)
+        writer = PdfWriter(clone_from=reader)
 
-        writer.encrypt(
+        encrypt_writer(
+            writer,
             user_password=password,
-            owner_password=owner_password or password,
+            owner_password=owner_password,
             algorithm=algorithm,
         )
 
-        with open(output_path, "wb") as f:
-            writer.write(f)
+        write_pdf(writer, output_path, **kwargs)
@@ -6,6 +6,7 @@ from typing import Any
 from pypdf import PdfReader, PdfWriter
 
 from prism_docs.core import BasePDFOperation, OperationResult, OutputConfig, register_operation
+from prism_docs.core.output import write_pdf
 
 
 @register_operation("merge")
@@ -41,7 +42,7 @@ class MergeOperation(BasePDFOperation):
             output_path = Path(output_path)
             output_path.parent.mkdir(parents=True, exist_ok=True)
 
-            self._execute_merge(input_paths, output_path)
+            self._execute_merge(input_paths, output_path, **kwargs)
 
             return OperationResult(
                 success=True,
@@ -61,7 +62,7 @@ class MergeOperation(BasePDFOperation):
         """Not used for merge - see _execute_merge."""
         pass
 
-    def _execute_merge(self, input_paths: list[Path], output_path: Path) -> None:
+    def _execute_merge(self, input_paths: list[Path], output_path: Path, **kwargs: Any) -> None:
         """Execute the merge operation."""
         writer = PdfWriter()
 
@@ -70,5 +71,4 @@ class MergeOperation(BasePDFOperation):
             for page in reader.pages:
                 writer.add_page(page)
 
-        with open(output_path, "wb") as f:
-            writer.write(f)
+        write_pdf(writer, output_path, **kwargs)
@@ -4,8 +4,11 @@ from pathlib import Path
 from typing import Any
 
 from pypdf import PdfReader, PdfWriter
+from pypdf.generic import NameObject, TextStringObject
 
 from prism_docs.core import BasePDFOperation, OperationResult, OutputConfig, register_operation
+from prism_docs.core.incremental import IncrementalWriter
+from prism_docs.core.output import write_pdf
 
 
 @register_operation("metadata")
@@ -81,14 +84,27 @@ class MetadataOperation(BasePDFOperation):
         output_config: OutputConfig,
         **kwargs: Any,
     ) -> OperationResult:
-        """Edit PDF metadata."""
-        output_path = output_config.resolve_output_path(input_path, self.default_suffix)
-
-        reader = PdfReader(input_path)
-        writer = PdfWriter()
-
-        for page in reader.pages:
-            writer.add_page(page)
+        """
+        Edit PDF metadata.
+
+        Args:
+            input_path: Path to input PDF
+            output_config: Output configuration
+            title, author, subject: New values for the info dictionary
+            incremental: Append only the changed info dictionary to a copy of
+                the original instead of rewriting the file (default: False)
+            in_place: Append the incremental update to the input file itself
+        """
+        in_place: bool = kwargs.get("in_place", False)
+        incremental: bool = kwargs.get("incremental", False) or in_place
+
+        output_path = kwargs.get("output_path")
+        if in_place:
+            output_path = input_path
+        elif output_path is None:
+            output_path = output_config.resolve_output_path(input_path, self.default_suffix)
+        else:
+            output_path = Path(output_path)
 
         # Build metadata dict
         new_metadata = {}
@@ -99,11 +115,25 @@ class MetadataOperation(BasePDFOperation):
         if "subject" in kwargs:
             new_metadata["/Subject"] = kwargs["subject"]
 
-        if new_metadata:
-            writer.add_metadata(new_metadata)
+        if incremental:
+            if kwargs.get("linearize", False):
+                raise ValueError("An incremental update cannot be linearized")
+            with IncrementalWriter(input_path) as writer:
+                info = writer.info()
+                for key, value in new_metadata.items():
+                    info[NameObject(key)] = TextStringObject(value)
+                writer.write(output_path, fsync=kwargs.get("fsync", False))
+        else:
+            reader = PdfReader(input_path)
+            writer = PdfWriter()
+
+            for page in reader.pages:
+                writer.add_page(page)
+
+            if new_metadata:
+                writer.add_metadata(new_metadata)
 
-        with open(output_path, "wb") as f:
-            writer.write(f)
+            write_pdf(writer, output_path, **kwargs)
 
         return OperationResult(
             success=True,
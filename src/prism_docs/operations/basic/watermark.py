@@ -5,7 +5,8 @@ from typing import Any
 
 from pypdf import PdfReader, PdfWriter
 
-from prism_docs.core import BasePDFOperation, register_operation
+from prism_docs.core import BasePDFOperation, PageSelection, register_operation
+from prism_docs.core.output import write_pdf
 
 
 @register_operation("watermark")
@@ -26,13 +27,13 @@ class WatermarkOperation(BasePDFOperation):
 
     def _execute(self, input_path: Path, output_path: Path, **kwargs: Any) -> None:
         watermark_path: Path = Path(kwargs["watermark_path"])
-        pages: list[int] | None = kwargs.get("pages")  # None = all pages
         layer: str = kwargs.get("layer", "below")  # "below" or "above"
 
         watermark_reader = PdfReader(watermark_path)
         watermark_page = watermark_reader.pages[0]
 
         reader = PdfReader(input_path)
+        pages = PageSelection.coerce(kwargs.get("pages"), len(reader.pages))  # None = all
         writer = PdfWriter()
 
         for i, page in enumerate(reader.pages):
@@ -50,5 +51,4 @@ class WatermarkOperation(BasePDFOperation):
             else:
                 writer.add_page(page)
 
-        with open(output_path, "wb") as f:
-            writer.write(f)
+        write_pdf(writer, output_path, **kwargs)
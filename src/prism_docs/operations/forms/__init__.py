@@ -0,0 +1,7 @@
+"""PDF form operations."""
+
+from prism_docs.operations.forms.form_fill import FormFillOperation
+
+__all__ = [
+    "FormFillOperation",
+]
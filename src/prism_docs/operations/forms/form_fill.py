@@ -0,0 +1,425 @@
+"""Fill a PDF form template from CSV or JSONL records."""
+
+import csv
+import json
+import re
+from collections import deque
+from collections.abc import Iterator
+from concurrent.futures import Future, ProcessPoolExecutor
+from functools import lru_cache
+from io import BytesIO
+from pathlib import Path
+from typing import Any
+
+from pypdf import PdfReader, PdfWriter
+from pypdf.generic import ArrayObject, DictionaryObject, NameObject, TextStringObject
+
+from prism_docs.core import (
+    BasePDFOperation,
+    OperationResult,
+    OutputConfig,
+    OverwritePolicy,
+    register_operation,
+)
+from prism_docs.core.output import write_pdf
+from prism_docs.operations.security.flatten import flatten_writer
+
+# Records handed to a worker per task
+RECORD_BATCH_SIZE = 64
+
+# Checkbox values that switch a box on
+TRUE_VALUES = {"1", "true", "yes", "y", "on", "x", "checked"}
+
+_UNSAFE_NAME = re.compile(r"[^\w.-]+")
+
+
+def _qualified_name(annot: DictionaryObject) -> str | None:
+    """Return the fully qualified field name of a widget (``parent.child``)."""
+    parts = []
+    node: DictionaryObject | None = annot
+    while node is not None:
+        if "/T" in node:
+            parts.append(str(node["/T"]))
+        parent = node.get("/Parent")
+        node = parent.get_object() if parent is not None else None
+    return ".".join(reversed(parts)) if parts else None
+
+
+class FormTemplate:
+    """
+    A parsed form template, reused for every record.
+
+    The template is parsed once; its field tree (field name to pages and
+    checkbox states) is indexed up front so each fill only touches pages
+    holding fields present in the record. Checkbox and radio appearance
+    streams come from the template and are selected by state, never rebuilt.
+    """
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self.reader = PdfReader(BytesIO(self.path.read_bytes()))
+        if "/AcroForm" not in self.reader.trailer["/Root"]:
+            raise ValueError(f"'{self.path}' has no form fields")
+
+        self.field_pages: dict[str, set[int]] = {}
+        self.field_types: dict[str, str] = {}
+        self.field_states: dict[str, list[str]] = {}
+
+        for page_index, page in enumerate(self.reader.pages):
+            for annot_ref in page.get("/Annots") or []:
+                annot = annot_ref.get_object()
+                if annot.get("/Subtype") != "/Widget":
+                    continue
+                name = _qualified_name(annot)
+                if name is None:
+                    continue
+                self.field_pages.setdefault(name, set()).add(page_index)
+
+                field = annot if "/FT" in annot else annot.get("/Parent", annot).get_object()
+                self.field_types[name] = str(field.get("/FT", ""))
+
+                appearances = annot.get("/AP", {}).get("/N")
+                if appearances is not None and isinstance(
+                    appearances.get_object(), DictionaryObject
+                ):
+                    states = self.field_states.setdefault(name, [])
+                    states.extend(s for s in appearances.get_object() if s not in states)
+
+    @property
+    def field_names(self) -> list[str]:
+        """Names of all fields that have a widget on some page."""
+        return list(self.field_pages)
+
+    def _field_value(self, name: str, value: Any) -> str | list[str]:
+        """Convert a record value into what the field expects."""
+        if isinstance(value, list):
+            return [str(v) for v in value]
+
+        text = str(value)
+        if self.field_types.get(name) != "/Btn":
+            return text
+
+        on_states = [s for s in self.field_states.get(name, []) if s != "/Off"]
+        if f"/{text}" in on_states or text in on_states:
+            # Radio button (or checkbox) addressed by state name
+            return text if text.startswith("/") else f"/{text}"
+        if text.lower() in TRUE_VALUES and on_states:
+            return on_states[0]
+        return "/Off"
+
+    def fill(
+        self, record: dict[str, Any], flatten: bool = False, annotations: bool = False
+    ) -> PdfWriter:
+        """Return a writer holding a copy of the template filled with ``record``."""
+        values: dict[str, str | list[str]] = {}
+        pages: set[int] = set()
+        for name, value in record.items():
+            if name not in self.field_pages or value is None or value == "":
+                continue
+            values[name] = self._field_value(name, value)
+            pages.update(self.field_pages[name])
+
+        writer = PdfWriter(clone_from=self.reader)
+        if values:
+            writer.update_page_form_field_values(
+                [writer.pages[i] for i in sorted(pages)], values, auto_regenerate=False
+            )
+        if flatten:
+            flatten_writer(writer, forms=True, annotations=annotations)
+        return writer
+
+
+@lru_cache(maxsize=4)
+def _load_template(path: str, mtime_ns: int) -> FormTemplate:
+    """Parse a template once per process (keyed on mtime so edits are picked up)."""
+    return FormTemplate(Path(path))
+
+
+def load_template(path: Path) -> FormTemplate:
+    """Return the cached :class:`FormTemplate` for ``path``."""
+    path = Path(path).resolve()
+    return _load_template(str(path), path.stat().st_mtime_ns)
+
+
+def read_records(data_path: Path, data_format: str | None = None) -> Iterator[dict[str, Any]]:
+    """
+    Stream records from a CSV (header row) or JSONL (one object per line) file.
+
+    The format is taken from the file extension unless ``data_format`` is given.
+    """
+    data_path = Path(data_path)
+    data_format = data_format or data_path.suffix.lower().lstrip(".")
+
+    if data_format == "csv":
+        with open(data_path, newline="", encoding="utf-8-sig") as f:
+            yield from csv.DictReader(f)
+    elif data_format in ("jsonl", "ndjson", "json"):
+        with open(data_path, encoding="utf-8") as f:
+            for line_num, line in enumerate(f, start=1):
+                if not line.strip():
+                    continue
+                record = json.loads(line)
+                if not isinstance(record, dict):
+                    raise TypeError(f"{data_path}:{line_num}: expected a JSON object per line")
+                yield record
+    else:
+        raise ValueError(f"Unsupported record format '{data_format}'. Use csv or jsonl.")
+
+
+def _output_name(template: Path, index: int, record: dict[str, Any], name_field: str | None) -> str:
+    """Build the per-record output file name."""
+    if name_field and record.get(name_field):
+        stem = _UNSAFE_NAME.sub("_", str(record[name_field])).strip("._")
+        if stem:
+            return f"{stem}.pdf"
+    return f"{template.stem}_{index}.pdf"
+
+
+def _record_path(path: Path, used: set[Path], overwrite: OverwritePolicy) -> Path | None:
+    """
+    Where a record's form is written, or ``None`` to skip it.
+
+    Records named alike in one run get a number suffix instead of
+    overwriting each other; files from earlier runs follow ``overwrite``.
+    """
+    stem = path.stem
+    counter = 1
+    while path in used or (overwrite == OverwritePolicy.RENAME and path.exists()):
+        path = path.with_stem(f"{stem}_{counter}")
+        counter += 1
+    used.add(path)
+
+    if path.exists():
+        if overwrite == OverwritePolicy.ERROR:
+            raise FileExistsError(f"Output file already exists: {path}")
+        if overwrite == OverwritePolicy.SKIP:
+            return None
+    return path
+
+
+def _scope_fields(writer: PdfWriter, name: str) -> None:
+    """
+    Nest a filled form's fields under one parent field called ``name``.
+
+    Merged copies of a template share its field names, and fields of the
+    same name share one value; ``record1.name`` and ``record2.name`` don't.
+    """
+    acroform = writer._root_object["/AcroForm"].get_object()
+    fields = acroform.get("/Fields")
+    if not fields:
+        return
+    parent = DictionaryObject(
+        {
+            NameObject("/T"): TextStringObject(name),
+            NameObject("/Kids"): ArrayObject(fields.get_object()),
+        }
+    )
+    parent_ref = writer._add_object(parent)
+    for field in parent["/Kids"]:
+        field.get_object()[NameObject("/Parent")] = parent_ref
+    acroform[NameObject("/Fields")] = ArrayObject([parent_ref])
+
+
+def fill_batch(
+    template_path: Path,
+    batch: list[tuple[int, dict[str, Any], Path | None]],
+    **kwargs: Any,
+) -> list[Path | bytes]:
+    """
+    Fill a batch of ``(index, record, output_path)`` entries from a template.
+
+    Writes each record with an output path to it and returns the path. For
+    records without one, returns the serialized PDF for merging, its fields
+    nested under ``record<index>`` unless the form is flattened.
+    """
+    flatten: bool = kwargs.get("flatten", False)
+    annotations: bool = kwargs.get("annotations", False)
+
+    template = load_template(template_path)
+    results: list[Path | bytes] = []
+
+    for index, record, output_path in batch:
+        writer = template.fill(record, flatten=flatten, annotations=annotations)
+        if output_path is None:
+            if not flatten:
+                _scope_fields(writer, f"record{index}")
+            buffer = BytesIO()
+            writer.write(buffer)
+            results.append(buffer.getvalue())
+        else:
+            write_pdf(writer, output_path, **kwargs)
+            results.append(output_path)
+
+    return results
+
+
+def _batches(
+    entries: Iterator[tuple[int, dict[str, Any], Path | None]], size: int
+) -> Iterator[list[tuple[int, dict[str, Any], Path | None]]]:
+    batch: list[tuple[int, dict[str, Any], Path | None]] = []
+    for entry in entries:
+        batch.append(entry)
+        if len(batch) >= size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+@register_operation("form-fill")
+class FormFillOperation(BasePDFOperation):
+    """Fill a form template once per record from CSV or JSONL data."""
+
+    @property
+    def name(self) -> str:
+        return "form-fill"
+
+    @property
+    def description(self) -> str:
+        return "Fill a PDF form template from CSV or JSONL records"
+
+    @property
+    def default_suffix(self) -> str:
+        return "filled"
+
+    def execute(
+        self,
+        input_path: Path,
+        output_config: OutputConfig,
+        **kwargs: Any,
+    ) -> OperationResult:
+        """
+        Override to handle one output per record (or one merged output).
+
+        Args:
+            input_path: Path to the form template
+            output_config: Output configuration
+            data: CSV or JSONL file with one record per form
+            data_format: Force "csv" or "jsonl" instead of using the extension
+            merge: Write all filled forms into a single PDF (default: False)
+            name_field: Record field used to name per-record outputs
+            flatten: Flatten each filled form (default: False)
+            annotations: When flattening, also flatten other annotations
+            workers: Worker processes (default: 1)
+            batch_size: Records per worker task (default: 64)
+        """
+        input_path = Path(input_path)
+
+        try:
+            data_path = kwargs.get("data")
+            if not data_path:
+                raise ValueError("No record data given (expected a CSV or JSONL file)")
+            merge: bool = kwargs.get("merge", False)
+            workers: int = kwargs.get("workers", 1)
+            batch_size: int = kwargs.get("batch_size", RECORD_BATCH_SIZE)
+            explicit_output = kwargs.get("output_path")
+            name_field: str | None = kwargs.get("name_field")
+            fill_kwargs = {
+                key: kwargs[key]
+                for key in ("flatten", "annotations", "linearize", "atomic", "fsync")
+                if key in kwargs
+            }
+
+            # Fail early on a bad template instead of once per worker
+            load_template(input_path)
+
+            if merge:
+                output_path = Path(explicit_output) if explicit_output else None
+                output_path = output_path or output_config.resolve_output_path(
+                    input_path, self.default_suffix
+                )
+                output_path.parent.mkdir(parents=True, exist_ok=True)
+                output_dir = None
+            else:
+                output_dir = (
+                    Path(explicit_output)
+                    if explicit_output
+                    else output_config.output_dir or input_path.parent
+                )
+                output_dir.mkdir(parents=True, exist_ok=True)
+
+            records = read_records(Path(data_path), kwargs.get("data_format"))
+            skipped = 0
+
+            def entries() -> Iterator[tuple[int, dict[str, Any], Path | None]]:
+                # Output names are settled here, in order, so records named
+                # alike never race for one file across workers
+                nonlocal skipped
+                used: set[Path] = set()
+                for index, record in enumerate(records, start=1):
+                    if output_dir is None:
+                        yield index, record, None
+                        continue
+                    name = _output_name(input_path, index, record, name_field)
+                    path = _record_path(output_dir / name, used, output_config.overwrite)
+                    if path is None:
+                        skipped += 1
+                    else:
+                        yield index, record, path
+
+            batches = _batches(entries(), batch_size)
+            merged = PdfWriter() if merge else None
+            count = 0
+
+            for results in self._fill(input_path, batches, workers, fill_kwargs):
+                count += len(results)
+                if merged is not None:
+                    for data in results:
+                        merged.append(PdfReader(BytesIO(data)))
+
+            if merged is not None:
+                write_pdf(merged, output_path, **kwargs)
+                message = f"Filled {count} forms from '{data_path}' -> '{output_path}'"
+            else:
+                output_path = output_dir
+                message = f"Filled {count} forms from '{data_path}' into '{output_dir}'"
+                if skipped:
+                    message += f" ({skipped} existing skipped)"
+
+            return OperationResult(
+                success=True,
+                input_path=input_path,
+                output_path=output_path,
+                message=message,
+            )
+
+        except FileExistsError as e:
+            return OperationResult(
+                success=False,
+                input_path=input_path,
+                message=str(e),
+                error=e,
+            )
+
+        except Exception as e:
+            return OperationResult(
+                success=False,
+                input_path=input_path,
+                message=f"Failed to fill '{input_path}': {e}",
+                error=e,
+            )
+
+    def _fill(
+        self,
+        template_path: Path,
+        batches: Iterator[list[tuple[int, dict[str, Any], Path | None]]],
+        workers: int,
+        fill_kwargs: dict[str, Any],
+    ) -> Iterator[list[Path | bytes]]:
+        """Fill batches in order, keeping a bounded number in flight across workers."""
+        if workers <= 1:
+            for batch in batches:
+                yield fill_batch(template_path, batch, **fill_kwargs)
+            return
+
+        pending: deque[Future] = deque()
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            for batch in batches:
+                pending.append(executor.submit(fill_batch, template_path, batch, **fill_kwargs))
+                if len(pending) >= workers * 2:
+                    yield pending.popleft().result()
+            while pending:
+                yield pending.popleft().result()
+
+    def _execute(self, input_path: Path, output_path: Path, **kwargs: Any) -> None:
+        """Not used for form-fill - see execute override."""
@@ -5,7 +5,14 @@ from typing import Any
 
 from pypdf import PdfReader
 
-from prism_docs.core import BasePDFOperation, OperationResult, OutputConfig, register_operation
+from prism_docs.core import (
+    BasePDFOperation,
+    OperationResult,
+    OutputConfig,
+    PageSelection,
+    register_operation,
+)
+from prism_docs.core.output import atomic_output, write_image
 
 
 @register_operation("extract-images")
@@ -65,17 +72,17 @@ class ExtractImagesOperation(BasePDFOperation):
         output_dir: Path,
         **kwargs: Any,
     ) -> int:
-        pages: list[int] | None = kwargs.get("pages")
         min_size: int = kwargs.get("min_size", 100)  # Minimum dimension in pixels
         requested_format: str = str(kwargs.get("format", "original")).lower()
 
         reader = PdfReader(input_path)
+        pages = PageSelection.coerce(kwargs.get("pages"), len(reader.pages))
         stem = input_path.stem
         image_count = 0
 
         for page_num, page in enumerate(reader.pages, start=1):
             # Skip pages not in the requested list
-            if pages and page_num not in pages:
+            if pages is not None and page_num not in pages:
                 continue
 
             resources = page.get("/Resources")
@@ -116,7 +123,7 @@ class ExtractImagesOperation(BasePDFOperation):
 
                         if requested_format == "original" and filter_type != "/FlateDecode":
                             output_path = base.with_suffix(f".{original_ext}")
-                            with open(output_path, "wb") as f:
+                            with atomic_output(output_path, **kwargs) as f:
                                 f.write(obj.get_data())
                             continue
 
@@ -149,7 +156,7 @@ class ExtractImagesOperation(BasePDFOperation):
 
                         if img is None:
                             output_path = base.with_suffix(f".{original_ext}")
-                            with open(output_path, "wb") as f:
+                            with atomic_output(output_path, **kwargs) as f:
                                 f.write(obj.get_data())
                             continue
 
@@ -163,7 +170,7 @@ class ExtractImagesOperation(BasePDFOperation):
                             img = img.convert("RGB")
 
                         output_path = base.with_suffix(f".{output_ext}")
-                        img.save(output_path)
+                        write_image(img, output_path, **kwargs)
 
                     except Exception:
                         # Skip problematic images
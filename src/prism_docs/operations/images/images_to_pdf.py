@@ -4,6 +4,7 @@ from pathlib import Path
 from typing import Any
 
 from prism_docs.core import BasePDFOperation, OperationResult, OutputConfig, register_operation
+from prism_docs.core.output import atomic_output, linearize_pdf
 
 
 @register_operation("images-to-pdf")
@@ -89,12 +90,16 @@ class ImagesToPdfOperation(BasePDFOperation):
 
         # Save as PDF
         first_image = images[0]
-        if len(images) > 1:
-            first_image.save(
-                output_path,
-                "PDF",
-                save_all=True,
-                append_images=images[1:],
-            )
-        else:
-            first_image.save(output_path, "PDF")
+        with atomic_output(output_path, **kwargs) as f:
+            if len(images) > 1:
+                first_image.save(
+                    f,
+                    "PDF",
+                    save_all=True,
+                    append_images=images[1:],
+                )
+            else:
+                first_image.save(f, "PDF")
+
+        if kwargs.get("linearize", False):
+            linearize_pdf(output_path, fsync=kwargs.get("fsync", False))
@@ -1,9 +1,25 @@
 """Convert PDF pages to images."""
 
+import os
+import shutil
+import tempfile
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import partial
 from pathlib import Path
 from typing import Any
 
-from prism_docs.core import BasePDFOperation, OperationResult, OutputConfig, register_operation
+from pypdf import PdfReader
+
+from prism_docs.core import (
+    BasePDFOperation,
+    OperationResult,
+    OutputConfig,
+    PageSelection,
+    register_operation,
+)
+from prism_docs.core.output import write_image
+from prism_docs.core.pages import page_count
+from prism_docs.core.raster import Rasterizer, get_rasterizer, page_runs
 
 
 @register_operation("pdf-to-images")
@@ -32,7 +48,9 @@ class PdfToImagesOperation(BasePDFOperation):
         input_path = Path(input_path)
 
         try:
-            output_dir = kwargs.get("output_dir") or output_config.output_dir or input_path.parent
+            output_dir = (
+                kwargs.pop("output_dir", None) or output_config.output_dir or input_path.parent
+            )
             output_dir = Path(output_dir)
             output_dir.mkdir(parents=True, exist_ok=True)
 
@@ -55,7 +73,6 @@ class PdfToImagesOperation(BasePDFOperation):
 
     def _execute(self, input_path: Path, output_path: Path, **kwargs: Any) -> None:
         """Not used - see _execute_pdf_to_images."""
-        pass
 
     def _execute_pdf_to_images(
         self,
@@ -63,48 +80,102 @@ class PdfToImagesOperation(BasePDFOperation):
         output_dir: Path,
         **kwargs: Any,
     ) -> list[Path]:
+        """
+        Render the requested pages in parallel chunks.
+
+        With the pdf2image rasterizer each chunk is one poppler process, which
+        writes PNG, JPEG and TIFF files itself into a staging directory inside
+        ``output_dir``; they are then renamed into place. In-process
+        rasterizers render chunks in worker processes. Only requested pages
+        are rendered.
+
+        Args:
+            format: Image format (default: png)
+            dpi: Resolution (default: 200)
+            pages: Pages to convert (default: all)
+            rasterizer: Rendering backend: pdf2image, pdfium (default: pdf2image)
+            workers: Chunks rendered at once (default: CPU count)
+            chunk_size: Pages per chunk (default: spread over the workers)
+            thumbnails: Longest-edge sizes in pixels of thumbnails to write beside
+                each page image, as ``<stem>_page_<n>_<size>px.<format>``
+        """
+        rasterizer = get_rasterizer(kwargs.get("rasterizer"))
+        workers: int = kwargs.get("workers") or os.cpu_count() or 1
+        chunk_size: int | None = kwargs.get("chunk_size")
+
+        with open(input_path, "rb") as f:
+            total = page_count(PdfReader(f))
+        selection = PageSelection.coerce(kwargs.get("pages"), total)
+        pages = [
+            p
+            for p in (selection if selection is not None else range(1, total + 1))
+            if 1 <= p <= total
+        ]
+        if not pages:
+            return []
+
+        chunks = page_runs(pages, chunk_size or -(-len(pages) // workers))
+        render = partial(
+            self._render_chunk,
+            rasterizer,
+            input_path,
+            output_dir,
+            format=kwargs.get("format", "png"),
+            dpi=kwargs.get("dpi", 200),
+            thumbnails=sorted(kwargs.get("thumbnails") or [], reverse=True),
+        )
+        staging = Path(tempfile.mkdtemp(prefix=".pdf-to-images-", dir=output_dir))
         try:
-            import pdf2image
-        except ImportError:
-            raise ImportError(
-                "pdf2image is required for PDF to image conversion. "
-                "Install with: pip install pdf2image"
-            )
-
-        format: str = kwargs.get("format", "png")
-        dpi: int = kwargs.get("dpi", 200)
-        pages: list[int] | None = kwargs.get("pages")
-
-        # Convert pages (1-indexed) to pdf2image format
-        if pages:
-            first_page = min(pages)
-            last_page = max(pages)
-            images = pdf2image.convert_from_path(
-                input_path,
-                dpi=dpi,
-                first_page=first_page,
-                last_page=last_page,
-                fmt=format,
-            )
-        else:
-            first_page = None
-            images = pdf2image.convert_from_path(
-                input_path,
-                dpi=dpi,
-                fmt=format,
-            )
+            if workers == 1 or len(chunks) == 1:
+                return [
+                    path
+                    for index, chunk in enumerate(chunks)
+                    for path in render(staging / str(index), chunk)
+                ]
+
+            # Subprocess renderers only wait on poppler, so threads suffice
+            executor_class = ProcessPoolExecutor if rasterizer.in_process else ThreadPoolExecutor
+            with executor_class(max_workers=min(workers, len(chunks))) as executor:
+                futures = [
+                    executor.submit(render, staging / str(index), chunk)
+                    for index, chunk in enumerate(chunks)
+                ]
+                return [path for future in futures for path in future.result()]
+        finally:
+            shutil.rmtree(staging, ignore_errors=True)
+
+    def _render_chunk(
+        self,
+        rasterizer: Rasterizer,
+        input_path: Path,
+        output_dir: Path,
+        staging: Path,
+        chunk: tuple[int, int],
+        format: str,
+        dpi: int,
+        thumbnails: list[int],
+    ) -> list[Path]:
+        """Render a run of pages and move them (and their thumbnails) into place."""
+        first, last = chunk
+        rendered = rasterizer.render_files(input_path, chunk, staging, dpi, format)
 
         output_paths = []
-        stem = input_path.stem
-
-        for i, image in enumerate(images):
-            page_num = (first_page or 1) + i
-            # Skip pages not in the requested list
-            if pages and page_num not in pages:
-                continue
-
-            output_path = output_dir / f"{stem}_page_{page_num}.{format}"
-            image.save(output_path)
+        for page_num, path in zip(range(first, last + 1), rendered, strict=True):
+            output_path = output_dir / f"{input_path.stem}_page_{page_num}.{format}"
+            os.replace(path, output_path)
             output_paths.append(output_path)
 
+            if thumbnails:
+                from PIL import Image
+
+                with Image.open(output_path) as thumbnail:
+                    # Sizes run largest first, each reduced from the previous one
+                    for size in thumbnails:
+                        thumbnail.thumbnail((size, size))
+                        thumbnail_path = output_path.with_name(
+                            f"{output_path.stem}_{size}px{output_path.suffix}"
+                        )
+                        write_image(thumbnail, thumbnail_path)
+                        output_paths.append(thumbnail_path)
+
         return output_paths
@@ -1,12 +1,16 @@
 """Batch OCR processing for multiple PDFs."""
 
+from io import BytesIO
 from pathlib import Path
 from typing import Any
 
-import pytesseract
-from pdf2image import convert_from_path
+from pypdf import PdfReader, PdfWriter
 
 from prism_docs.core import BasePDFOperation, register_operation
+from prism_docs.core.output import write_pdf, write_text
+from prism_docs.core.raster import get_rasterizer
+from prism_docs.operations.ocr.engine import get_ocr_engine
+from prism_docs.operations.ocr.resolution import render_for_ocr
 
 
 @register_operation("ocr-batch")
@@ -33,47 +37,46 @@ class BatchOCROperation(BasePDFOperation):
             input_path: Path to input PDF
             output_path: Path to output
             lang: OCR language(s) (default: eng)
-            dpi: DPI for conversion (default: 200 for speed)
+            dpi: DPI for conversion, or auto per page (default: 200 for speed)
             psm: Page segmentation mode (default: 3)
-            output_type: Output type: txt, pdf (default: txt)
+            output_type: Output type: txt, pdf, or 'txt,pdf' for both from one pass (default: txt)
             fast: Use fast mode with lower DPI (default: False)
+            rasterizer: Page renderer: pdf2image, pdfium (default: pdf2image)
+            ocr_engine: OCR engine: auto, tesserocr, pytesseract (default: auto)
         """
         lang = kwargs.get("lang", "eng")
         fast = kwargs.get("fast", False)
         dpi = kwargs.get("dpi", 150 if fast else 300)
         psm = kwargs.get("psm", 3)
         output_type = kwargs.get("output_type", "txt")
+        output_types = output_type.split(",") if isinstance(output_type, str) else output_type
+
+        unknown = set(output_types) - {"txt", "pdf"}
+        if unknown:
+            raise ValueError(f"Unsupported output type(s): {', '.join(sorted(unknown))}")
+        # Both outputs come from the same OCR pass over each page
+        formats = ["text" if t == "txt" else t for t in output_types]
 
         tess_config = f"--psm {psm} --oem 3"
         if fast:
             tess_config = f"{tess_config} -c tessedit_do_invert=0"
 
-        images = convert_from_path(input_path, dpi=dpi)
-
-        if output_type == "pdf":
-            # Create searchable PDF
-            from io import BytesIO
+        images = render_for_ocr(get_rasterizer(kwargs.get("rasterizer")), input_path, dpi=dpi)
+        engine = get_ocr_engine(kwargs.get("ocr_engine"))
 
-            from pypdf import PdfReader, PdfWriter
-
-            writer = PdfWriter()
-            for image in images:
-                pdf_result = pytesseract.image_to_pdf_or_hocr(
-                    image, lang=lang, config=tess_config, extension="pdf"
-                )
-                pdf_bytes = pdf_result if isinstance(pdf_result, bytes) else pdf_result.encode()
-                reader = PdfReader(BytesIO(pdf_bytes))
-                for page in reader.pages:
+        writer = PdfWriter()
+        text_parts = []
+        for i, image in images:
+            outputs = engine.image_to_outputs(image, formats, lang=lang, config=tess_config)
+            if "pdf" in outputs:
+                # Create searchable PDF
+                for page in PdfReader(BytesIO(outputs["pdf"])).pages:
                     writer.add_page(page)
+            if "text" in outputs:
+                text_parts.append(f"--- Page {i} ---\n{outputs['text']}")
 
-            with open(output_path, "wb") as f:
-                writer.write(f)
-        else:
-            # Extract text
-            text_parts = []
-            for i, image in enumerate(images, start=1):
-                text = pytesseract.image_to_string(image, lang=lang, config=tess_config)
-                text_parts.append(f"--- Page {i} ---\n{text}")
-
+        if "pdf" in formats:
+            write_pdf(writer, output_path, **kwargs)
+        if "text" in formats:
             output_path = output_path.with_suffix(".txt")
-            output_path.write_text("\n\n".join(text_parts), encoding="utf-8")
+            write_text("\n\n".join(text_parts), output_path, **kwargs)
@@ -0,0 +1,82 @@
+"""On-disk cache of what OCR passes learn about a document.
+
+Entries are keyed by a hash of the document's bytes, so a renamed or copied
+file hits the cache and an edited one misses it. Each document has one small
+JSON file of named values (such as the scripts OSD detected per page), so
+reruns can skip work whose answer cannot have changed.
+"""
+
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import Any
+
+from prism_docs.core.config import CONFIG_DIR_NAME
+
+
+def default_cache_dir() -> Path:
+    """``$XDG_CACHE_HOME/prism-docs/ocr`` (default: ``~/.cache/prism-docs/ocr``)."""
+    base = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(base) / CONFIG_DIR_NAME / "ocr"
+
+
+def document_key(path: Path) -> str:
+    """SHA-256 of a document's bytes."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class OCRCache:
+    """Named values per document, stored as JSON files in ``directory``."""
+
+    def __init__(self, directory: Path | str | None = None) -> None:
+        self.directory = Path(directory).expanduser() if directory else default_cache_dir()
+        self._keys: dict[Path, str] = {}
+
+    def get(self, document: Path, name: str, default: Any = None) -> Any:
+        """The value stored under ``name`` for ``document``, or ``default``."""
+        return self._load(document).get(name, default)
+
+    def set(self, document: Path, name: str, value: Any) -> None:
+        """Store ``value`` under ``name`` for ``document``."""
+        entry = self._load(document)
+        entry[name] = value
+        path = self._path(document)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # Written beside the entry and renamed, so readers never see half a file
+        temp = path.with_suffix(f".{os.getpid()}.tmp")
+        temp.write_text(json.dumps(entry, ensure_ascii=False), encoding="utf-8")
+        os.replace(temp, path)
+
+    def _load(self, document: Path) -> dict[str, Any]:
+        try:
+            return json.loads(self._path(document).read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return {}
+
+    def _path(self, document: Path) -> Path:
+        document = Path(document)
+        if document not in self._keys:
+            self._keys[document] = document_key(document)
+        key = self._keys[document]
+        return self.directory / key[:2] / f"{key}.json"
+
+
+def get_ocr_cache(setting: "OCRCache | Path | str | bool | None") -> "OCRCache | None":
+    """
+    The cache an ``ocr_cache`` option selects.
+
+    ``None``, ``False`` or ``""`` disable caching, ``True`` uses the default
+    directory, a path uses that directory, and a cache is used as is.
+    """
+    if isinstance(setting, OCRCache):
+        return setting
+    if setting is None or setting is False or setting == "":
+        return None
+    if setting is True:
+        return OCRCache()
+    return OCRCache(setting)
@@ -0,0 +1,114 @@
+"""Confidence-driven OCR retries.
+
+The cascade reads every page with fast settings first (a low resolution,
+the LSTM engine only, no preprocessing). Pages whose mean word confidence
+falls below ``retry_confidence`` are read again with slower settings, stage
+by stage, until they pass or the stages run out; each page keeps its most
+confident reading. Clean pages cost a single fast pass, so the average cost
+stays near the fast path while hard pages get the slow one.
+"""
+
+from collections.abc import Iterable, Iterator, Sequence
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from prism_docs.core.raster import Rasterizer
+from prism_docs.operations.ocr.engine import OCREngine
+from prism_docs.operations.ocr.preprocess import preprocess_image
+from prism_docs.operations.ocr.resolution import render_for_ocr
+
+# Mean word confidence (0-100) a page needs to skip the slower stages
+RETRY_CONFIDENCE = 80
+
+
+@dataclass(frozen=True)
+class CascadeStage:
+    """Settings for one pass over the pages still below the confidence bar."""
+
+    dpi: int
+    oem: int = 3
+    preprocess: str = "none"
+    psm: int | None = None  # None: the operation's own
+
+
+CASCADE_STAGES = (
+    CascadeStage(dpi=150, oem=1),
+    CascadeStage(dpi=300, preprocess="otsu"),
+    CascadeStage(dpi=400, preprocess="sauvola", psm=6),
+)
+
+
+@dataclass
+class CascadeResult:
+    """The most confident reading of one page."""
+
+    outputs: dict[str, Any]
+    confidence: float
+    stage: int
+    size: tuple[int, int]
+
+
+def mean_confidence(data: dict[str, list]) -> float:
+    """Mean confidence of the recognized words in ``image_to_data`` output (0 without words)."""
+    confidences = [
+        float(conf)
+        for conf, text in zip(data.get("conf", []), data.get("text", []), strict=False)
+        if float(conf) >= 0 and str(text).strip()
+    ]
+    return sum(confidences) / len(confidences) if confidences else 0.0
+
+
+def ocr_cascade(
+    rasterizer: Rasterizer,
+    engine: OCREngine,
+    input_path: Path,
+    pages: Iterable[int] | None = None,
+    formats: Sequence[str] = ("text",),
+    lang: str = "eng",
+    psm: int = 3,
+    config: str = "",
+    timeout: float = 0,
+    retry_confidence: float = RETRY_CONFIDENCE,
+    stages: Sequence[CascadeStage] = CASCADE_STAGES,
+) -> Iterator[tuple[int, CascadeResult]]:
+    """
+    Yield ``(page_number, result)`` in page order, reading each page until it is confident.
+
+    Args:
+        rasterizer: Renders the pages of each stage
+        engine: OCR engine
+        input_path: PDF to read
+        pages: 1-indexed pages (default: all)
+        formats: Outputs to keep per page (``data`` is always produced)
+        lang: OCR language(s)
+        psm: Page segmentation mode, unless a stage sets its own
+        config: Extra Tesseract options for every stage
+        timeout: Timeout per page and stage in seconds
+        retry_confidence: Mean word confidence below which a page is read again
+        stages: Settings from fastest to slowest
+    """
+    formats = list(dict.fromkeys([*formats, "data"]))
+    results: dict[int, CascadeResult] = {}
+    pending: list[int] | None = None if pages is None else list(pages)
+
+    for index, stage in enumerate(stages):
+        tess_config = f"--psm {stage.psm or psm} --oem {stage.oem} {config}".strip()
+        # Each stage renders the pages still pending in one batch
+        for page_num, image in render_for_ocr(rasterizer, input_path, pending, stage.dpi):
+            if stage.preprocess != "none":
+                image = preprocess_image(image, stage.preprocess)
+            outputs = engine.image_to_outputs(
+                image, formats, lang=lang, config=tess_config, timeout=timeout
+            )
+            confidence = mean_confidence(outputs["data"])
+            best = results.get(page_num)
+            if best is None or confidence > best.confidence:
+                results[page_num] = CascadeResult(outputs, confidence, index, image.size)
+
+        pending = sorted(p for p, r in results.items() if r.confidence < retry_confidence)
+        if not pending:
+            break
+
+    for page_num in sorted(results):
+        yield page_num, results[page_num]
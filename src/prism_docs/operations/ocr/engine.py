@@ -0,0 +1,387 @@
+"""OCR engines: recognize text in page images for the OCR operations.
+
+Two backends are available, chosen with the ``ocr_engine`` setting (global
+config, ``--ocr-engine``, or an operation option):
+
+* ``tesserocr`` - the tesseract C++ API through tesserocr. Each worker thread
+  keeps one initialized API per language and engine mode, so models load once
+  per worker rather than once per page, and images are passed in memory.
+* ``pytesseract`` - runs the ``tesseract`` command per call, writing the image
+  to a temporary file and reloading the language models each time.
+
+``auto`` (the default) uses tesserocr when it is installed and pytesseract
+otherwise. Searchable PDF output always goes through pytesseract.
+
+``image_to_outputs`` produces several formats from one recognition pass:
+tesseract runs all the requested renderers in a single invocation, and a
+tesserocr session reads each format from the same result.
+"""
+
+import shlex
+import threading
+from collections.abc import Iterable
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+import pytesseract
+from pytesseract.pytesseract import file_to_dict, run_tesseract, save
+
+if TYPE_CHECKING:
+    from PIL import Image
+
+# Column header of tesseract's TSV output, which the C++ API omits
+TSV_HEADER = (
+    "level\tpage_num\tblock_num\tpar_num\tline_num\tword_num\tleft\ttop\twidth\theight\tconf\ttext"
+)
+
+# Formats image_to_outputs produces -> (tesseract renderer, output file extension).
+# "data" is parsed from the TSV renderer's output.
+OUTPUT_FORMATS = {
+    "text": ("txt", "txt"),
+    "hocr": ("hocr", "hocr"),
+    "tsv": ("tsv", "tsv"),
+    "alto": ("alto", "xml"),
+    "pdf": ("pdf", "pdf"),
+    "data": ("tsv", "tsv"),
+}
+
+
+class OCREngine:
+    """Recognizes text in images.
+
+    The base implementation runs the ``tesseract`` command through pytesseract;
+    engines override the calls they can serve themselves.
+    """
+
+    name = ""
+
+    def image_to_string(
+        self, image: "Image.Image", lang: str = "eng", config: str = "", timeout: float = 0
+    ) -> str:
+        """Recognized text."""
+        return pytesseract.image_to_string(
+            image, lang=lang, config=_with_dpi(config, image), timeout=timeout
+        )
+
+    def image_to_data(
+        self, image: "Image.Image", lang: str = "eng", config: str = "", timeout: float = 0
+    ) -> dict[str, list[Any]]:
+        """Word boxes as columns, in pytesseract's ``Output.DICT`` layout."""
+        return pytesseract.image_to_data(
+            image,
+            lang=lang,
+            config=_with_dpi(config, image),
+            timeout=timeout,
+            output_type=pytesseract.Output.DICT,
+        )
+
+    def image_to_tsv(
+        self, image: "Image.Image", lang: str = "eng", config: str = "", timeout: float = 0
+    ) -> str:
+        """Word boxes as tesseract TSV, with a header row."""
+        return pytesseract.image_to_data(
+            image, lang=lang, config=_with_dpi(config, image), timeout=timeout
+        )
+
+    def image_to_hocr(
+        self, image: "Image.Image", lang: str = "eng", config: str = "", timeout: float = 0
+    ) -> str:
+        """hOCR (HTML) markup."""
+        result = pytesseract.image_to_pdf_or_hocr(
+            image, lang=lang, config=_with_dpi(config, image), timeout=timeout, extension="hocr"
+        )
+        return result.decode("utf-8") if isinstance(result, bytes) else result
+
+    def image_to_boxes(
+        self, image: "Image.Image", lang: str = "eng", config: str = "", timeout: float = 0
+    ) -> str:
+        """Character boxes in tesseract's box-file format."""
+        return pytesseract.image_to_boxes(
+            image, lang=lang, config=_with_dpi(config, image), timeout=timeout
+        )
+
+    def image_to_pdf(
+        self, image: "Image.Image", lang: str = "eng", config: str = "", timeout: float = 0
+    ) -> bytes:
+        """A one-page PDF of the image with an invisible text layer."""
+        result = pytesseract.image_to_pdf_or_hocr(
+            image, lang=lang, config=_with_dpi(config, image), timeout=timeout, extension="pdf"
+        )
+        return result if isinstance(result, bytes) else result.encode()
+
+    def image_to_osd(self, image: "Image.Image", timeout: float = 0) -> dict[str, Any]:
+        """Orientation and script detection, in pytesseract's ``Output.DICT`` layout."""
+        return pytesseract.image_to_osd(
+            image,
+            config=_with_dpi("", image),
+            timeout=timeout,
+            output_type=pytesseract.Output.DICT,
+        )
+
+    def image_to_outputs(
+        self,
+        image: "Image.Image",
+        formats: Iterable[str],
+        lang: str = "eng",
+        config: str = "",
+        timeout: float = 0,
+    ) -> dict[str, Any]:
+        """
+        Recognize ``image`` once and return each of ``formats``.
+
+        Formats are keys of ``OUTPUT_FORMATS``: text, hOCR, TSV and ALTO come
+        back as strings, ``pdf`` as the bytes of a one-page PDF with a text
+        layer, and ``data`` as an ``image_to_data`` dict.
+        """
+        formats = _check_formats(formats)
+        renderers = {OUTPUT_FORMATS[fmt][0]: OUTPUT_FORMATS[fmt][1] for fmt in formats}
+        flags = " ".join(f"-c tessedit_create_{renderer}=1" for renderer in renderers)
+        config = _with_dpi(config, image)
+
+        files: dict[str, bytes] = {}
+        with save(image) as (temp_name, input_filename):
+            run_tesseract(
+                input_filename, temp_name, "", lang, f"{config} {flags}".strip(), timeout=timeout
+            )
+            for renderer, extension in renderers.items():
+                files[renderer] = Path(f"{temp_name}.{extension}").read_bytes()
+
+        outputs: dict[str, Any] = {}
+        for fmt in formats:
+            data = files[OUTPUT_FORMATS[fmt][0]]
+            outputs[fmt] = data if fmt == "pdf" else _decode_output(fmt, data.decode("utf-8"))
+        return outputs
+
+
+class PytesseractEngine(OCREngine):
+    """The ``tesseract`` command through pytesseract, one process per call."""
+
+    name = "pytesseract"
+
+
+class TesserocrEngine(OCREngine):
+    """The tesseract API through tesserocr, with models kept loaded per worker thread.
+
+    PDF output, and calls with config options the API cannot apply, fall back
+    to pytesseract.
+    """
+
+    name = "tesserocr"
+
+    def __init__(self) -> None:
+        self._tesserocr = _import_tesserocr()
+        # Sessions per thread, as TessBaseAPI is not thread-safe
+        self._local = threading.local()
+
+    def _api(self, lang: str, oem: int, variables: dict[str, str] | None = None) -> Any:
+        """The thread's session for ``lang``, ``oem`` and init ``variables``, loading it once."""
+        sessions: dict[tuple, Any] | None = getattr(self._local, "sessions", None)
+        if sessions is None:
+            sessions = self._local.sessions = {}
+        # Variables stick to a session once set, so they are part of its key
+        key = (lang, oem, tuple(sorted((variables or {}).items())))
+        api = sessions.get(key)
+        if api is None:
+            try:
+                api = self._tesserocr.PyTessBaseAPI(
+                    lang=lang, oem=oem, variables=dict(variables or {})
+                )
+            except RuntimeError as e:
+                raise pytesseract.TesseractError(1, f"Failed to load language '{lang}': {e}")
+            sessions[key] = api
+        return api
+
+    def _recognize(self, image: "Image.Image", lang: str, config: str, timeout: float) -> Any:
+        """Set up a session for ``config`` and recognize ``image``, or None to fall back."""
+        options = _parse_config(config)
+        if options is None:
+            return None
+        psm, oem, dpi, variables = options
+
+        api = self._api(lang, oem, variables)
+        api.SetPageSegMode(psm)
+        api.SetImage(image)
+        if dpi or image.info.get("dpi"):
+            api.SetSourceResolution(int(dpi or image.info["dpi"][0]))
+        if not api.Recognize(int(timeout * 1000)):
+            raise RuntimeError("Tesseract process timeout")  # As pytesseract reports it
+        return api
+
+    def image_to_string(
+        self, image: "Image.Image", lang: str = "eng", config: str = "", timeout: float = 0
+    ) -> str:
+        api = self._recognize(image, lang, config, timeout)
+        if api is None:
+            return super().image_to_string(image, lang, config, timeout)
+        return api.GetUTF8Text()
+
+    def image_to_data(
+        self, image: "Image.Image", lang: str = "eng", config: str = "", timeout: float = 0
+    ) -> dict[str, list[Any]]:
+        api = self._recognize(image, lang, config, timeout)
+        if api is None:
+            return super().image_to_data(image, lang, config, timeout)
+        return file_to_dict(f"{TSV_HEADER}\n{api.GetTSVText(0)}", "\t", -1)
+
+    def image_to_tsv(
+        self, image: "Image.Image", lang: str = "eng", config: str = "", timeout: float = 0
+    ) -> str:
+        api = self._recognize(image, lang, config, timeout)
+        if api is None:
+            return super().image_to_tsv(image, lang, config, timeout)
+        return f"{TSV_HEADER}\n{api.GetTSVText(0)}"
+
+    def image_to_hocr(
+        self, image: "Image.Image", lang: str = "eng", config: str = "", timeout: float = 0
+    ) -> str:
+        api = self._recognize(image, lang, config, timeout)
+        if api is None:
+            return super().image_to_hocr(image, lang, config, timeout)
+        return api.GetHOCRText(0)
+
+    def image_to_boxes(
+        self, image: "Image.Image", lang: str = "eng", config: str = "", timeout: float = 0
+    ) -> str:
+        api = self._recognize(image, lang, config, timeout)
+        if api is None:
+            return super().image_to_boxes(image, lang, config, timeout)
+        return api.GetBoxText(0)
+
+    def image_to_osd(self, image: "Image.Image", timeout: float = 0) -> dict[str, Any]:
+        api = self._api("osd", 3)
+        api.SetPageSegMode(self._tesserocr.PSM.OSD_ONLY)
+        api.SetImage(image)
+        osd = api.DetectOrientationScript()
+        if not osd:
+            raise pytesseract.TesseractError(1, "Orientation and script detection failed")
+        return {
+            "page_num": 0,
+            "orientation": osd["orient_deg"],
+            "rotate": (360 - osd["orient_deg"]) % 360,
+            "orientation_conf": osd["orient_conf"],
+            "script": osd["script_name"],
+            "script_conf": osd["script_conf"],
+        }
+
+    def image_to_outputs(
+        self,
+        image: "Image.Image",
+        formats: Iterable[str],
+        lang: str = "eng",
+        config: str = "",
+        timeout: float = 0,
+    ) -> dict[str, Any]:
+        formats = _check_formats(formats)
+        # The API has no in-memory PDF renderer; tesseract renders it with the rest
+        if "pdf" in formats:
+            return super().image_to_outputs(image, formats, lang, config, timeout)
+        api = self._recognize(image, lang, config, timeout)
+        if api is None or ("alto" in formats and not hasattr(api, "GetAltoText")):
+            return super().image_to_outputs(image, formats, lang, config, timeout)
+
+        readers = {
+            "text": api.GetUTF8Text,
+            "hocr": lambda: api.GetHOCRText(0),
+            "tsv": lambda: f"{TSV_HEADER}\n{api.GetTSVText(0)}",
+            "data": lambda: f"{TSV_HEADER}\n{api.GetTSVText(0)}",
+            "alto": lambda: api.GetAltoText(0),
+        }
+        return {fmt: _decode_output(fmt, readers[fmt]()) for fmt in formats}
+
+
+OCR_ENGINES: dict[str, type[OCREngine]] = {
+    TesserocrEngine.name: TesserocrEngine,
+    PytesseractEngine.name: PytesseractEngine,
+}
+
+# Engines are shared so their sessions outlive a single operation
+_ENGINES: dict[str, OCREngine] = {}
+_ENGINES_LOCK = threading.Lock()
+
+
+def get_ocr_engine(name: str | OCREngine | None = None) -> OCREngine:
+    """Return the shared OCR engine called ``name`` (default: ``auto``)."""
+    if isinstance(name, OCREngine):
+        return name
+    name = name or "auto"
+    if name == "auto":
+        try:
+            _import_tesserocr()
+            name = TesserocrEngine.name
+        except ImportError:
+            name = PytesseractEngine.name
+    if name not in OCR_ENGINES:
+        raise ValueError(
+            f"Unknown OCR engine '{name}' (choose from auto, {', '.join(OCR_ENGINES)})"
+        )
+    with _ENGINES_LOCK:
+        if name not in _ENGINES:
+            _ENGINES[name] = OCR_ENGINES[name]()
+        return _ENGINES[name]
+
+
+def _check_formats(formats: Iterable[str]) -> list[str]:
+    formats = list(dict.fromkeys(formats))
+    unknown = [fmt for fmt in formats if fmt not in OUTPUT_FORMATS]
+    if unknown or not formats:
+        raise ValueError(
+            f"Unsupported OCR output format(s) {', '.join(unknown) or '(none)'} "
+            f"(choose from {', '.join(OUTPUT_FORMATS)})"
+        )
+    return formats
+
+
+def _decode_output(fmt: str, output: str) -> Any:
+    """``output`` of a text renderer as returned for ``fmt``."""
+    return file_to_dict(output, "\t", -1) if fmt == "data" else output
+
+
+def _with_dpi(config: str, image: "Image.Image") -> str:
+    """
+    ``config`` with ``--dpi`` set from the image's resolution, unless it sets one.
+
+    pytesseract hands the image to tesseract as a file without a resolution,
+    so tesseract would otherwise guess one from the text size.
+    """
+    dpi = image.info.get("dpi")
+    if not dpi or "--dpi" in shlex.split(config):
+        return config
+    return f"{config} --dpi {round(dpi[0])}".strip()
+
+
+def _parse_config(config: str) -> tuple[int, int, int, dict[str, str]] | None:
+    """Split a tesseract command-line config into ``(psm, oem, dpi, variables)``.
+
+    Returns None when it holds options the API cannot apply.
+    """
+    psm, oem, dpi = 3, 3, 0
+    variables: dict[str, str] = {}
+    args = shlex.split(config)
+    try:
+        while args:
+            arg = args.pop(0)
+            if arg == "--psm":
+                psm = int(args.pop(0))
+            elif arg == "--oem":
+                oem = int(args.pop(0))
+            elif arg == "--dpi":
+                dpi = int(args.pop(0))
+            elif arg == "-c":
+                name, _, value = args.pop(0).partition("=")
+                variables[name] = value
+            else:
+                return None
+    except (IndexError, ValueError):
+        return None
+    return psm, oem, dpi, variables
+
+
+def _import_tesserocr() -> Any:
+    try:
+        import tesserocr
+    except ImportError:
+        raise ImportError(
+            "tesserocr is required for the tesserocr OCR engine. "
+            "Install with: pip install tesserocr"
+        )
+    return tesserocr
@@ -1,13 +1,17 @@
 """Extract text from PDF using OCR with advanced options."""
 
+from io import BytesIO
 from pathlib import Path
 from typing import Any
 
-import pytesseract
-from pdf2image import convert_from_path
-from PIL import Image, ImageEnhance, ImageFilter
+from pypdf import PdfReader, PdfWriter
 
 from prism_docs.core import BasePDFOperation, register_operation
+from prism_docs.core.output import write_pdf, write_text
+from prism_docs.core.raster import get_rasterizer
+from prism_docs.operations.ocr.engine import get_ocr_engine
+from prism_docs.operations.ocr.preprocess import preprocess_image
+from prism_docs.operations.ocr.resolution import render_for_ocr
 
 
 @register_operation("ocr-extract")
@@ -34,16 +38,22 @@ class ExtractOCRTextOperation(BasePDFOperation):
             input_path: Path to input PDF
             output_path: Path to output text file
             lang: OCR language(s) (default: eng)
-            dpi: DPI for conversion (default: 300)
+            dpi: DPI for conversion, or auto per page (default: 300)
             psm: Page segmentation mode (default: 3)
             oem: OCR engine mode (default: 3)
-            preprocess: Preprocessing mode: none, threshold, blur, sharpen, denoise (default: none)
+            preprocess: Preprocessing mode: none, threshold, otsu, sauvola, blur, sharpen, denoise (default: none)
             threshold: Binarization threshold 0-255 (default: 128)
             contrast: Contrast enhancement factor (default: 1.0)
             brightness: Brightness enhancement factor (default: 1.0)
             invert: Invert colors (default: False)
-            format: Output format: text, hocr, tsv, box, data (default: text)
+            deskew: Straighten skewed text lines before OCR (default: False)
+            crop_borders: Cut dark scanner borders from the page edges (default: False)
+            window: Sauvola window size in pixels (default: 31)
+            k: Sauvola sensitivity (default: 0.2)
+            format: Comma-separated output formats: text (default), hocr, tsv, alto, box, data, pdf
             timeout: Timeout per page (default: 30)
+            rasterizer: Page renderer: pdf2image, pdfium (default: pdf2image)
+            ocr_engine: OCR engine: auto, tesserocr, pytesseract (default: auto)
         """
         lang = kwargs.get("lang", "eng")
         dpi = kwargs.get("dpi", 300)
@@ -54,120 +64,73 @@ class ExtractOCRTextOperation(BasePDFOperation):
         contrast = kwargs.get("contrast", 1.0)
         brightness = kwargs.get("brightness", 1.0)
         invert = kwargs.get("invert", False)
+        deskew = kwargs.get("deskew", False)
+        crop_borders = kwargs.get("crop_borders", False)
+        window = kwargs.get("window", 31)
+        k = kwargs.get("k", 0.2)
         output_format = kwargs.get("format", "text")
         timeout = kwargs.get("timeout", 30)
 
         tess_config = f"--psm {psm} --oem {oem}"
 
         # Convert PDF to images
-        images = convert_from_path(input_path, dpi=dpi)
-
-        # Process each page
-        results: list[str] = []
-        for i, image in enumerate(images, start=1):
+        images = render_for_ocr(get_rasterizer(kwargs.get("rasterizer")), input_path, dpi=dpi)
+        engine = get_ocr_engine(kwargs.get("ocr_engine"))
+
+        # One OCR pass per page produces every requested format (except box,
+        # which runs tesseract in box-making mode)
+        formats = output_format.split(",") if isinstance(output_format, str) else output_format
+        if "box" in formats and len(formats) > 1:
+            raise ValueError("box output cannot be combined with other formats")
+
+        results: dict[str, list[str]] = {fmt: [] for fmt in formats}
+        writer = PdfWriter()
+        for i, image in images:
             # Preprocess image
-            processed = self._preprocess_image(
+            processed = preprocess_image(
                 image,
                 preprocess=preprocess,
                 threshold=threshold_val,
                 contrast=contrast,
                 brightness=brightness,
                 invert=invert,
+                deskew=deskew,
+                crop_borders=crop_borders,
+                window=window,
+                k=k,
             )
 
-            # OCR based on output format
-            if output_format == "text":
-                text = pytesseract.image_to_string(
-                    processed, lang=lang, config=tess_config, timeout=timeout
-                )
-            elif output_format == "hocr":
-                hocr_result = pytesseract.image_to_pdf_or_hocr(
-                    processed,
-                    lang=lang,
-                    config=tess_config,
-                    timeout=timeout,
-                    extension="hocr",
-                )
-                text = (
-                    hocr_result.decode("utf-8") if isinstance(hocr_result, bytes) else hocr_result
-                )
-            elif output_format == "tsv":
-                text = pytesseract.image_to_data(
-                    processed, lang=lang, config=tess_config, timeout=timeout
-                )
-            elif output_format == "box":
-                text = pytesseract.image_to_boxes(
-                    processed, lang=lang, config=tess_config, timeout=timeout
-                )
-            elif output_format == "data":
-                data = pytesseract.image_to_data(
-                    processed,
-                    lang=lang,
-                    config=tess_config,
-                    timeout=timeout,
-                    output_type=pytesseract.Output.DICT,
-                )
-                text = str(data)
+            if formats == ["box"]:
+                outputs: dict[str, Any] = {
+                    "box": engine.image_to_boxes(
+                        processed, lang=lang, config=tess_config, timeout=timeout
+                    )
+                }
             else:
-                text = pytesseract.image_to_string(
-                    processed, lang=lang, config=tess_config, timeout=timeout
+                outputs = engine.image_to_outputs(
+                    processed, formats, lang=lang, config=tess_config, timeout=timeout
                 )
 
-            results.append(f"--- Page {i} ---\n{text}")
+            for fmt, output in outputs.items():
+                if fmt == "pdf":
+                    for page in PdfReader(BytesIO(output)).pages:
+                        writer.add_page(page)
+                else:
+                    results[fmt].append(f"--- Page {i} ---\n{output}")
 
-        # Determine output extension
+        # Write one file per format, named by its extension
         ext_map = {
             "text": ".txt",
             "hocr": ".hocr",
             "tsv": ".tsv",
+            "alto": ".xml",
             "box": ".box",
             "data": ".json",
+            "pdf": ".pdf",
         }
-        output_ext = ext_map.get(output_format, ".txt")
-        output_path = output_path.with_suffix(output_ext)
-
-        # Write output
-        output_path.write_text("\n\n".join(results), encoding="utf-8")
-
-    def _preprocess_image(
-        self,
-        image: Image.Image,
-        preprocess: str,
-        threshold: int,
-        contrast: float,
-        brightness: float,
-        invert: bool,
-    ) -> Image.Image:
-        """Apply preprocessing to image for better OCR."""
-        # Convert to grayscale
-        if image.mode != "L":
-            image = image.convert("L")
-
-        # Apply contrast
-        if contrast != 1.0:
-            contrast_enhancer = ImageEnhance.Contrast(image)
-            image = contrast_enhancer.enhance(contrast)
-
-        # Apply brightness
-        if brightness != 1.0:
-            brightness_enhancer = ImageEnhance.Brightness(image)
-            image = brightness_enhancer.enhance(brightness)
-
-        # Apply preprocessing
-        if preprocess == "threshold":
-            thresh = threshold  # Capture for lambda
-            image = image.point(lambda p, t=thresh: 255 if p > t else 0)  # type: ignore[misc]
-        elif preprocess == "blur":
-            image = image.filter(ImageFilter.GaussianBlur(radius=1))
-        elif preprocess == "sharpen":
-            image = image.filter(ImageFilter.SHARPEN)
-        elif preprocess == "denoise":
-            image = image.filter(ImageFilter.MedianFilter(size=3))
-
-        # Invert if requested
-        if invert:
-            from PIL import ImageOps
-
-            image = ImageOps.invert(image)
-
-        return image
+        for fmt in formats:
+            path = output_path.with_suffix(ext_map[fmt])
+            if fmt == "pdf":
+                write_pdf(writer, path, **kwargs)
+            else:
+                write_text("\n\n".join(results[fmt]), path, **kwargs)
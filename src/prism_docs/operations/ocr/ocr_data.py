@@ -1,13 +1,70 @@
 """Get detailed OCR data with bounding boxes and confidence."""
 
+import json
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Any
-import json
 
-import pytesseract
-from pdf2image import convert_from_path
+from PIL import Image
 
 from prism_docs.core import BasePDFOperation, register_operation
+from prism_docs.core.output import write_text
+from prism_docs.core.raster import get_rasterizer
+from prism_docs.operations.ocr.cascade import RETRY_CONFIDENCE, ocr_cascade
+from prism_docs.operations.ocr.engine import get_ocr_engine
+from prism_docs.operations.ocr.regions import load_template, ocr_regions, page_regions
+from prism_docs.operations.ocr.resolution import render_for_ocr
+
+
+def page_items_from_data(
+    data: dict[str, list], target_level: int = 5, min_confidence: int = 0
+) -> list[dict]:
+    """
+    Convert Tesseract ``image_to_data`` output into word/line/block items.
+
+    Args:
+        data: Tesseract OCR data dict
+        target_level: Tesseract level to keep (1=page ... 5=word)
+        min_confidence: Minimum confidence threshold 0-100
+
+    Returns:
+        List of items with text, confidence and pixel bounding box
+    """
+    page_items = []
+    n_boxes = len(data["text"])
+
+    for i in range(n_boxes):
+        # Filter by level
+        if data["level"][i] != target_level:
+            continue
+
+        # Filter by confidence
+        conf = data["conf"][i]
+        if conf < min_confidence:
+            continue
+
+        text = data["text"][i].strip()
+        if not text:
+            continue
+
+        item = {
+            "text": text,
+            "confidence": conf,
+            "bbox": {
+                "x": data["left"][i],
+                "y": data["top"][i],
+                "width": data["width"][i],
+                "height": data["height"][i],
+            },
+            "block_num": data["block_num"][i],
+            "line_num": data["line_num"][i],
+            "word_num": data["word_num"][i],
+        }
+        if "region" in data:
+            item["region"] = data["region"][i]
+        page_items.append(item)
+
+    return page_items
 
 
 @register_operation("ocr-data")
@@ -34,10 +91,17 @@ class OCRDataOperation(BasePDFOperation):
             input_path: Path to input PDF
             output_path: Path to output JSON file
             lang: OCR language(s) (default: eng)
-            dpi: DPI for conversion (default: 300)
+            dpi: DPI for conversion, or auto per page (default: 300)
             psm: Page segmentation mode (default: 3)
             min_confidence: Minimum confidence threshold 0-100 (default: 0)
             level: Data level: word, line, block, page (default: word)
+            cascade: Fast pass, then retry low-confidence pages slower (default: False)
+            retry_confidence: Mean word confidence that skips the retries (default: 80)
+            roi: OCR only the text blocks found by a layout pre-pass (default: False)
+            template: JSON file or list of named regions to OCR instead of the page
+            workers: Threads OCRing the regions of a page (default: 4)
+            rasterizer: Page renderer: pdf2image, pdfium (default: pdf2image)
+            ocr_engine: OCR engine: auto, tesserocr, pytesseract (default: auto)
         """
         lang = kwargs.get("lang", "eng")
         dpi = kwargs.get("dpi", 300)
@@ -47,66 +111,58 @@ class OCRDataOperation(BasePDFOperation):
 
         tess_config = f"--psm {psm} --oem 3"
 
-        images = convert_from_path(input_path, dpi=dpi)
+        template = load_template(kwargs["template"]) if kwargs.get("template") else None
+        roi = kwargs.get("roi", False) or template is not None
+        workers = kwargs.get("workers", 4)
+
+        rasterizer = get_rasterizer(kwargs.get("rasterizer"))
+        engine = get_ocr_engine(kwargs.get("ocr_engine"))
+        # One pool for the run, so region workers keep their engine sessions
+        # (threads start on first use)
+        pool = ThreadPoolExecutor(max_workers=max(1, workers))
+
+        def read(page_num: int, image: Image.Image) -> dict[str, list]:
+            if not roi:
+                return engine.image_to_data(image, lang=lang, config=tess_config)
+            # Word boxes come back in page coordinates
+            regions = page_regions(image, page_num, template)
+            return ocr_regions(
+                engine, image, regions, ["data"], lang=lang, config=tess_config, executor=pool
+            )["data"]
+
+        if kwargs.get("cascade", False):
+            if roi:
+                raise ValueError("cascade cannot be combined with roi or template")
+            results = ocr_cascade(
+                rasterizer,
+                engine,
+                input_path,
+                formats=["data"],
+                lang=lang,
+                psm=psm,
+                retry_confidence=kwargs.get("retry_confidence", RETRY_CONFIDENCE),
+            )
+            pages_data = ((i, r.outputs["data"], r.size) for i, r in results)
+        else:
+            images = render_for_ocr(rasterizer, input_path, dpi=dpi)
+            pages_data = ((i, read(i, image), image.size) for i, image in images)
 
         # Level mapping for Tesseract
         level_map = {"page": 1, "block": 2, "para": 3, "line": 4, "word": 5}
         target_level = level_map.get(level, 5)
 
         all_pages_data = []
-        for page_num, image in enumerate(images, start=1):
-            # Get detailed data
-            data = pytesseract.image_to_data(
-                image,
-                lang=lang,
-                config=tess_config,
-                output_type=pytesseract.Output.DICT,
-            )
-
-            # Process data
-            page_items = []
-            n_boxes = len(data["text"])
-
-            for i in range(n_boxes):
-                # Filter by level
-                if data["level"][i] != target_level:
-                    continue
-
-                # Filter by confidence
-                conf = data["conf"][i]
-                if conf < min_confidence:
-                    continue
-
-                text = data["text"][i].strip()
-                if not text:
-                    continue
-
-                item = {
-                    "text": text,
-                    "confidence": conf,
-                    "bbox": {
-                        "x": data["left"][i],
-                        "y": data["top"][i],
-                        "width": data["width"][i],
-                        "height": data["height"][i],
-                    },
-                    "block_num": data["block_num"][i],
-                    "line_num": data["line_num"][i],
-                    "word_num": data["word_num"][i],
-                }
-                page_items.append(item)
-
-            all_pages_data.append(
-                {
-                    "page": page_num,
-                    "width": image.width,
-                    "height": image.height,
-                    "items": page_items,
-                }
-            )
+        with pool:
+            for page_num, data, (width, height) in pages_data:
+                all_pages_data.append(
+                    {
+                        "page": page_num,
+                        "width": width,
+                        "height": height,
+                        "items": page_items_from_data(data, target_level, min_confidence),
+                    }
+                )
 
         # Write JSON output
         output_path = output_path.with_suffix(".json")
-        output_path.write_text(
-            json.dumps(all_pages_data, indent=2, ensure_ascii=False), encoding="utf-8"
-        )
+        write_text(json.dumps(all_pages_data, indent=2, ensure_ascii=False), output_path, **kwargs)
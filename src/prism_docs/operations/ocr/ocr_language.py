@@ -1,12 +1,71 @@
 """OCR language detection and multi-language support."""
 
+from collections import Counter
+from itertools import chain, islice
 from pathlib import Path
 from typing import Any
 
 import pytesseract
-from pdf2image import convert_from_path
-
-from prism_docs.core import BasePDFOperation, register_operation
+from PIL import Image
+
+from prism_docs.core import BasePDFOperation, PageSelection, register_operation
+from prism_docs.core.output import write_text
+from prism_docs.core.raster import get_rasterizer
+from prism_docs.operations.ocr.cache import get_ocr_cache
+from prism_docs.operations.ocr.engine import OCREngine, get_ocr_engine
+from prism_docs.operations.ocr.regions import find_text_blocks
+from prism_docs.operations.ocr.resolution import render_for_ocr
+
+# Tesseract language for each script OSD reports
+SCRIPT_LANGUAGES = {
+    "latin": "eng",
+    "cyrillic": "rus",
+    "arabic": "ara",
+    "hebrew": "heb",
+    "han": "chi_sim",
+    "hangul": "kor",
+    "hiragana": "jpn",
+    "katakana": "jpn",
+    "thai": "tha",
+    "devanagari": "hin",
+    "greek": "ell",
+}
+
+# Resolution OSD runs at; script detection needs far less than recognition
+OSD_DPI = 150
+
+# OCR cache entry holding the detected script of each page ("" when OSD failed)
+SCRIPTS_CACHE_KEY = "scripts"
+
+
+def detect_script(engine: OCREngine, image: Image.Image) -> str:
+    """
+    Script of the text on a page image, or ``""`` when OSD can't tell.
+
+    The image is scaled down to ``OSD_DPI`` and cropped to its text blocks,
+    so OSD reads a small image that is all text.
+    """
+    dpi = image.info.get("dpi", (300, 300))[0]
+    if dpi > OSD_DPI:
+        size = (max(1, image.width * OSD_DPI // dpi), max(1, image.height * OSD_DPI // dpi))
+        image = image.convert("L").resize(size, Image.Resampling.BOX)
+        image.info["dpi"] = (OSD_DPI, OSD_DPI)
+
+    blocks = find_text_blocks(image)
+    if blocks:
+        image = image.crop(
+            (
+                min(block.box[0] for block in blocks),
+                min(block.box[1] for block in blocks),
+                max(block.box[2] for block in blocks),
+                max(block.box[3] for block in blocks),
+            )
+        )
+
+    try:
+        return engine.image_to_osd(image).get("script", "")
+    except pytesseract.TesseractError:
+        return ""
 
 
 @register_operation("ocr-detect-lang")
@@ -32,53 +91,80 @@ class OCRDetectLanguageOperation(BasePDFOperation):
         Args:
             input_path: Path to input PDF
             output_path: Path to output text file
-            dpi: DPI for conversion (default: 300)
+            dpi: DPI for conversion, or auto per page (default: 300)
             fallback_lang: Fallback language if detection fails (default: eng)
             sample_pages: Number of pages to sample for detection (default: 1)
+            psm: Page segmentation mode (default: 3)
+            per_page: Detect the script of every page and OCR each in its language (default: False)
+            ocr_cache: OCR cache directory, True for the default one, or False for
+                none (default: True)
+            rasterizer: Page renderer: pdf2image, pdfium (default: pdf2image)
+            ocr_engine: OCR engine: auto, tesserocr, pytesseract (default: auto)
         """
         dpi = kwargs.get("dpi", 300)
         fallback_lang = kwargs.get("fallback_lang", "eng")
-        sample_pages = kwargs.get("sample_pages", 1)
+        sample_pages = max(1, kwargs.get("sample_pages", 1))
+        psm = kwargs.get("psm", 3)
+        per_page = kwargs.get("per_page", False)
+
+        tess_config = f"--psm {psm} --oem 3"
+
+        rasterizer = get_rasterizer(kwargs.get("rasterizer"))
+        engine = get_ocr_engine(kwargs.get("ocr_engine"))
+        cache = get_ocr_cache(kwargs.get("ocr_cache", True))
 
-        # Convert first few pages for language detection
-        images = convert_from_path(input_path, dpi=dpi, last_page=sample_pages)
+        cached = cache.get(input_path, SCRIPTS_CACHE_KEY, {}) if cache else {}
+        scripts = {int(page): script for page, script in cached.items()}
+        known = len(scripts)
 
-        # Detect language using OSD
+        def script_of(page_num: int, image: Image.Image) -> str:
+            if page_num not in scripts:
+                scripts[page_num] = detect_script(engine, image)
+            return scripts[page_num]
+
+        # Pages are rendered once; the sampled ones are held until the
+        # document language is known, then OCRed with the rest
+        images = render_for_ocr(rasterizer, input_path, dpi=dpi)
+        sampled = list(islice(images, sample_pages))
+        votes = Counter(filter(None, (script_of(page_num, image) for page_num, image in sampled)))
         detected_lang = fallback_lang
-        try:
-            for image in images[:sample_pages]:
-                osd = pytesseract.image_to_osd(image, output_type=pytesseract.Output.DICT)
-                script = osd.get("script", "").lower()
-
-                # Map script to Tesseract language code
-                script_lang_map = {
-                    "latin": "eng",
-                    "cyrillic": "rus",
-                    "arabic": "ara",
-                    "hebrew": "heb",
-                    "han": "chi_sim",
-                    "hangul": "kor",
-                    "hiragana": "jpn",
-                    "katakana": "jpn",
-                    "thai": "tha",
-                    "devanagari": "hin",
-                    "greek": "ell",
-                }
-                detected_lang = script_lang_map.get(script, fallback_lang)
-                break
-        except pytesseract.TesseractError:
-            detected_lang = fallback_lang
-
-        # Now OCR all pages with detected language
-        all_images = convert_from_path(input_path, dpi=dpi)
+        if votes:
+            detected_lang = SCRIPT_LANGUAGES.get(votes.most_common(1)[0][0].lower(), fallback_lang)
+
+        pages: list[tuple[int, str, str]] = []
+        for page_num, image in chain(sampled, images):
+            lang = detected_lang
+            if per_page:
+                lang = SCRIPT_LANGUAGES.get(script_of(page_num, image).lower(), detected_lang)
+            text = engine.image_to_string(image, lang=lang, config=tess_config)
+            pages.append((page_num, lang, text))
+
+        if cache and len(scripts) > known:
+            cache.set(
+                input_path,
+                SCRIPTS_CACHE_KEY,
+                {str(page): script for page, script in sorted(scripts.items())},
+            )
 
         text_parts = [f"Detected language: {detected_lang}\n"]
-        for i, image in enumerate(all_images, start=1):
-            text = pytesseract.image_to_string(image, lang=detected_lang)
-            text_parts.append(f"--- Page {i} ---\n{text}")
+        if per_page:
+            by_lang: dict[str, list[int]] = {}
+            for page_num, lang, _ in pages:
+                by_lang.setdefault(lang, []).append(page_num)
+            text_parts[0] = (
+                "Detected languages: "
+                + ", ".join(
+                    f"{lang} (pages {PageSelection.from_pages(nums)})"
+                    for lang, nums in by_lang.items()
+                )
+                + "\n"
+            )
+        for page_num, lang, text in pages:
+            header = f"--- Page {page_num} ({lang}) ---" if per_page else f"--- Page {page_num} ---"
+            text_parts.append(f"{header}\n{text}")
 
         output_path = output_path.with_suffix(".txt")
-        output_path.write_text("\n\n".join(text_parts), encoding="utf-8")
+        write_text("\n\n".join(text_parts), output_path, **kwargs)
 
 
 @register_operation("ocr-multi-lang")
@@ -105,8 +191,10 @@ class OCRMultiLanguageOperation(BasePDFOperation):
             input_path: Path to input PDF
             output_path: Path to output text file
             langs: List of languages or '+'-separated string (default: eng+fra+deu)
-            dpi: DPI for conversion (default: 300)
+            dpi: DPI for conversion, or auto per page (default: 300)
             psm: Page segmentation mode (default: 3)
+            rasterizer: Page renderer: pdf2image, pdfium (default: pdf2image)
+            ocr_engine: OCR engine: auto, tesserocr, pytesseract (default: auto)
         """
         langs = kwargs.get("langs", "eng+fra+deu")
         if isinstance(langs, list):
@@ -117,12 +205,13 @@ class OCRMultiLanguageOperation(BasePDFOperation):
 
         tess_config = f"--psm {psm} --oem 3"
 
-        images = convert_from_path(input_path, dpi=dpi)
+        images = render_for_ocr(get_rasterizer(kwargs.get("rasterizer")), input_path, dpi=dpi)
+        engine = get_ocr_engine(kwargs.get("ocr_engine"))
 
         text_parts = [f"Languages: {langs}\n"]
-        for i, image in enumerate(images, start=1):
-            text = pytesseract.image_to_string(image, lang=langs, config=tess_config)
+        for i, image in images:
+            text = engine.image_to_string(image, lang=langs, config=tess_config)
             text_parts.append(f"--- Page {i} ---\n{text}")
 
         output_path = output_path.with_suffix(".txt")
-        output_path.write_text("\n\n".join(text_parts), encoding="utf-8")
+        write_text("\n\n".join(text_parts), output_path, **kwargs)
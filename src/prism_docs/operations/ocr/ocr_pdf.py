@@ -1,12 +1,19 @@
 """OCR PDF pages to extract text."""
 
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Any
 
-import pytesseract
-from pdf2image import convert_from_path
+from PIL import Image
+from pypdf import PdfReader
 
-from prism_docs.core import BasePDFOperation, register_operation
+from prism_docs.core import BasePDFOperation, PageSelection, register_operation
+from prism_docs.core.output import write_text
+from prism_docs.core.raster import get_rasterizer
+from prism_docs.operations.ocr.cascade import RETRY_CONFIDENCE, ocr_cascade
+from prism_docs.operations.ocr.engine import get_ocr_engine
+from prism_docs.operations.ocr.regions import load_template, ocr_regions, page_regions
+from prism_docs.operations.ocr.resolution import render_for_ocr
 
 
 @register_operation("ocr")
@@ -33,12 +40,19 @@ class OCRPDFOperation(BasePDFOperation):
             input_path: Path to input PDF
             output_path: Path to output text file
             lang: OCR language(s) (default: eng)
-            dpi: DPI for PDF to image conversion (default: 300)
+            dpi: DPI for PDF to image conversion, or auto per page (default: 300)
             psm: Page segmentation mode (default: 3)
             oem: OCR engine mode (default: 3)
             config: Additional Tesseract config string
             pages: Specific pages to OCR (default: all)
             timeout: Timeout per page in seconds (default: 30)
+            cascade: Fast pass, then retry low-confidence pages slower (default: False)
+            retry_confidence: Mean word confidence that skips the retries (default: 80)
+            roi: OCR only the text blocks found by a layout pre-pass (default: False)
+            template: JSON file or list of named regions to OCR instead of the page
+            workers: Threads OCRing the regions of a page (default: 4)
+            rasterizer: Page renderer: pdf2image, pdfium (default: pdf2image)
+            ocr_engine: OCR engine: auto, tesserocr, pytesseract (default: auto)
         """
         lang = kwargs.get("lang", "eng")
         dpi = kwargs.get("dpi", 300)
@@ -46,6 +60,8 @@ class OCRPDFOperation(BasePDFOperation):
         oem = kwargs.get("oem", 3)
         extra_config = kwargs.get("config", "")
         pages = kwargs.get("pages")
+        if pages is not None:
+            pages = PageSelection.coerce(pages, len(PdfReader(input_path).pages))
         timeout = kwargs.get("timeout", 30)
 
         # Build Tesseract config
@@ -53,28 +69,58 @@ class OCRPDFOperation(BasePDFOperation):
         if extra_config:
             tess_config = f"{tess_config} {extra_config}"
 
-        # Convert PDF to images
-        if pages:
-            images = convert_from_path(
-                input_path,
-                dpi=dpi,
-                first_page=pages[0],
-                last_page=pages[-1],
-            )
-        else:
-            images = convert_from_path(input_path, dpi=dpi)
+        template = load_template(kwargs["template"]) if kwargs.get("template") else None
+        roi = kwargs.get("roi", False) or template is not None
+        workers = kwargs.get("workers", 4)
 
-        # OCR each page
-        text_parts: list[str] = []
-        for i, image in enumerate(images, start=1):
-            page_text = pytesseract.image_to_string(
+        rasterizer = get_rasterizer(kwargs.get("rasterizer"))
+        engine = get_ocr_engine(kwargs.get("ocr_engine"))
+        # One pool for the run, so region workers keep their engine sessions
+        # (threads start on first use)
+        pool = ThreadPoolExecutor(max_workers=max(1, workers))
+
+        def read(page_num: int, image: Image.Image) -> str:
+            if not roi:
+                return engine.image_to_string(image, lang=lang, config=tess_config, timeout=timeout)
+            regions = page_regions(image, page_num, template)
+            return ocr_regions(
+                engine,
                 image,
+                regions,
+                ["text"],
                 lang=lang,
                 config=tess_config,
                 timeout=timeout,
+                executor=pool,
+            )["text"]
+
+        if kwargs.get("cascade", False):
+            if roi:
+                raise ValueError("cascade cannot be combined with roi or template")
+            results = ocr_cascade(
+                rasterizer,
+                engine,
+                input_path,
+                pages,
+                ["text"],
+                lang=lang,
+                psm=psm,
+                config=extra_config,
+                timeout=timeout,
+                retry_confidence=kwargs.get("retry_confidence", RETRY_CONFIDENCE),
             )
-            text_parts.append(f"--- Page {i} ---\n{page_text}")
+            page_texts = ((i, result.outputs["text"]) for i, result in results)
+        else:
+            # Render only the requested pages
+            images = render_for_ocr(rasterizer, input_path, pages, dpi=dpi)
+            page_texts = ((i, read(i, image)) for i, image in images)
+
+        # OCR each page
+        text_parts: list[str] = []
+        with pool:
+            for i, page_text in page_texts:
+                text_parts.append(f"--- Page {i} ---\n{page_text}")
 
         # Write output
         output_path = output_path.with_suffix(".txt")
-        output_path.write_text("\n\n".join(text_parts), encoding="utf-8")
+        write_text("\n\n".join(text_parts), output_path, **kwargs)
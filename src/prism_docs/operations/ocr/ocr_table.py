@@ -2,135 +2,291 @@
 
 import csv
 import json
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Any
 
-import pytesseract
-from pdf2image import convert_from_path
+import numpy as np
+from PIL import Image
+from pypdf import PdfReader
+from pytesseract.pytesseract import file_to_dict
 
-from prism_docs.core import BasePDFOperation, register_operation
+from prism_docs.core import BasePDFOperation, PageSelection, register_operation
+from prism_docs.core.output import atomic_text_output, write_text
+from prism_docs.core.raster import get_rasterizer
+from prism_docs.operations.ocr.engine import get_ocr_engine
+from prism_docs.operations.ocr.preprocess import otsu_threshold
+from prism_docs.operations.ocr.regions import load_template, ocr_regions, page_regions
+from prism_docs.operations.ocr.resolution import render_for_ocr
+
+# Column alignment tolerance, as a fraction of the image width
+COLUMN_TOLERANCE = 0.05
+
+# Share of a table's height a dark pixel column must cover to be a ruling line
+RULE_COVERAGE = 0.9
 
 
 def _detect_table_regions(
-    ocr_data: dict[str, list], img_width: int, min_columns: int = 2
+    ocr_data: dict[str, list] | str,
+    img_width: int,
+    min_columns: int = 2,
+    image: Image.Image | None = None,
 ) -> list[dict]:
     """
     Detect table-like regions by analyzing column alignment.
 
+    Words are held as NumPy arrays. Within each block, the sorted unique
+    left edges are split into columns wherever they jump by more than the
+    tolerance, and every word is placed with ``searchsorted`` over the column
+    bounds. Given the page image, vertical ruling lines inside a block
+    separate its columns instead.
+
     Args:
-        ocr_data: Tesseract OCR data dict
+        ocr_data: Tesseract OCR data dict, or the TSV it is parsed from
         img_width: Image width in pixels
         min_columns: Minimum columns to consider as table
+        image: Page image to find ruling lines in (default: none)
 
     Returns:
         List of detected tables with rows
     """
-    n_boxes = len(ocr_data["text"])
-    if n_boxes == 0:
+    keys = ("block_num", "line_num", "left", "width")
+    if image is not None:
+        keys += ("top", "height")
+    if isinstance(ocr_data, str):
+        words = _tsv_arrays(ocr_data, keys)
+    else:
+        words = _word_arrays(ocr_data, keys)
+    if not len(words["text"]):
         return []
 
-    # Group words by block and line
-    blocks: dict[int, dict[int, list[dict]]] = {}
-    for i in range(n_boxes):
-        text = ocr_data["text"][i].strip()
-        if not text:
-            continue
-
-        block_num = ocr_data["block_num"][i]
-        line_num = ocr_data["line_num"][i]
-        left = ocr_data["left"][i]
-        width = ocr_data["width"][i]
+    tolerance = img_width * COLUMN_TOLERANCE
+    dark = None
+    if image is not None:
+        gray = image.convert("L")
+        dark = np.asarray(gray) <= otsu_threshold(np.array(gray.histogram()))
 
-        if block_num not in blocks:
-            blocks[block_num] = {}
-        if line_num not in blocks[block_num]:
-            blocks[block_num][line_num] = []
+    tables = []
+    bounds = np.flatnonzero(np.diff(words["block"])) + 1
+    for start, end in zip(
+        np.concatenate(([0], bounds)), np.concatenate((bounds, [len(words["text"])])), strict=True
+    ):
+        block = {key: values[start:end] for key, values in words.items()}
+        # Line index of each word within the block
+        line = np.concatenate(([0], np.cumsum(np.diff(block["line_num"]) != 0)))
+        if line[-1] < 1 or len(line) < 4:
+            continue
 
-        blocks[block_num][line_num].append(
-            {"text": text, "left": left, "width": width, "right": left + width}
-        )
+        center = block["left"] + block["width"] // 2
+        rules = _vertical_rules(dark, block) if dark is not None else np.empty(0)
+        # Rules outside the words (such as a border read as "|" words) split nothing
+        rules = rules[(rules > center.min()) & (rules < center.max())]
+        if len(rules) + 1 >= min_columns:
+            columns = len(rules) + 1
+            column = np.searchsorted(rules, center)
+        else:
+            column_bounds = _column_bounds(block["left"], tolerance)
+            if column_bounds is None or len(column_bounds[0]) < min_columns:
+                continue
+            columns = len(column_bounds[0])
+            column = _assign_columns(center, *column_bounds, tolerance)
 
-    tables = []
+        rows = _table_rows(block["text"], line, column, columns, min_columns)
+        if len(rows) >= 2:  # Need at least 2 rows for a table
+            tables.append({"block": int(block["block_num"][0]), "rows": rows})
 
-    for block_num, lines in blocks.items():
-        # Analyze if this block has table-like structure
-        if len(lines) < 2:
-            continue
+    return tables
 
-        # Get all left positions across lines
-        all_left_positions: list[int] = []
-        for line_words in lines.values():
-            all_left_positions.extend([w["left"] for w in line_words])
 
-        if len(all_left_positions) < 4:
-            continue
+def _word_arrays(ocr_data: dict[str, list], keys: tuple[str, ...]) -> dict[str, np.ndarray]:
+    """
+    The non-empty words of ``image_to_data`` output as arrays, in table order.
 
-        # Cluster left positions to find columns
-        sorted_positions = sorted(set(all_left_positions))
-        column_clusters: list[list[int]] = []
-        current_cluster: list[int] = [sorted_positions[0]]
+    Only the ``keys`` columns (and the text) are converted, all in one call.
+    """
+    text = np.array(list(map(str.strip, ocr_data["text"])), dtype=object)
+    keep = np.flatnonzero(text != "")
+    words = dict(zip(keys, np.array([ocr_data[key] for key in keys], dtype=np.int64)[:, keep]))
+    words["text"] = text[keep]
+    return _table_order(words)
 
-        # Tolerance for column alignment (5% of image width)
-        tolerance = img_width * 0.05
 
-        for pos in sorted_positions[1:]:
-            if pos - current_cluster[-1] < tolerance:
-                current_cluster.append(pos)
-            else:
-                if len(current_cluster) >= 2:  # Column must appear in at least 2 lines
-                    column_clusters.append(current_cluster)
-                current_cluster = [pos]
+def _tsv_arrays(tsv: str, keys: tuple[str, ...]) -> dict[str, np.ndarray]:
+    """
+    The non-empty words of tesseract's TSV output as arrays, in table order.
 
-        if len(current_cluster) >= 2:
-            column_clusters.append(current_cluster)
+    Splitting the TSV into lists costs more than detecting the tables, so it
+    is read as bytes instead: the tab and newline positions give the range
+    of every field, the ``keys`` columns are summed a digit place at a time,
+    and ASCII words are gathered into a fixed-width string array. A row
+    missing a field sends the whole output through pytesseract's parser.
+    """
+    header, _, body = tsv.partition("\n")
+    names = header.split("\t")
+    body = body.rstrip("\n") + "\n"
+    data = body.encode("utf-8")
+    raw = np.frombuffer(data, dtype=np.uint8)
+    # Every row is one tab per field but the last, then a newline
+    cuts = np.flatnonzero((raw == ord("\t")) | (raw == ord("\n")))
+    if len(cuts) % len(names) or not (raw[cuts[len(names) - 1 :: len(names)]] == ord("\n")).all():
+        ocr_data = file_to_dict(tsv, "\t", -1) or {key: [] for key in ("text", *keys)}
+        return _word_arrays(ocr_data, keys)
+    cuts = cuts.reshape(-1, len(names))
+
+    columns = [names.index(key) for key in keys]
+    first, last = cuts[:, np.subtract(columns, 1)] + 1, cuts[:, columns]
+    values = np.zeros(first.shape, dtype=np.int64)
+    for place in range(int((last - first).max(initial=0))):
+        at = last - 1 - place
+        values += np.where(at >= first, raw[at] - np.int64(ord("0")), 0) * 10**place
+
+    # The text field is the last one; whitespace-only fields are not words
+    low, high = cuts[:, -2] + 1, cuts[:, -1]
+    width = int((high - low).max(initial=1))
+    at = low[:, None] + np.arange(width)
+    cells = np.where(at < high[:, None], raw[np.minimum(at, len(raw) - 1)], 0)
+    solid = cells > ord(" ")
+    keep = np.flatnonzero(solid.any(axis=1))
+    if len(data) == len(body):
+        # ASCII: trailing whitespace becomes padding, which the str array drops
+        cells, solid = cells[keep], solid[keep]
+        cells[np.cumsum(solid[:, ::-1], axis=1)[:, ::-1] == 0] = 0
+        text = cells.astype(np.uint32).view(f"U{width}")[:, 0]
+        for index in np.flatnonzero(~solid[:, 0]):  # Leading whitespace, which tesseract omits
+            text[index] = text[index].lstrip()
+    else:
+        pieces = map(data.__getitem__, map(slice, low[keep].tolist(), high[keep].tolist()))
+        text = np.array([piece.decode("utf-8").strip() for piece in pieces], dtype=object)
+        keep, text = keep[text != ""], text[text != ""]  # Other Unicode whitespace
+
+    words = dict(zip(keys, values[keep].T))
+    words["text"] = text
+    return _table_order(words)
+
+
+def _table_order(words: dict[str, np.ndarray]) -> dict[str, np.ndarray]:
+    """
+    ``words`` in table order.
 
-        # Need at least min_columns aligned columns for a table
-        if len(column_clusters) < min_columns:
-            continue
+    Blocks keep the order they first appear in; within a block, words are
+    sorted by line, then left edge. Tesseract's output is in that order
+    already, so the sorts are skipped when nothing is out of place.
+    """
+    if not len(words["text"]):
+        return words
+
+    # Rank of each word's block by first appearance
+    words["block"] = words["block_num"]
+    if (np.diff(words["block_num"]) < 0).any():
+        _, first, block = np.unique(words["block_num"], return_index=True, return_inverse=True)
+        words["block"] = np.argsort(np.argsort(first))[block]
+    # One sort key; stable, so words at the same left edge keep their reading order
+    line, left = words["line_num"] - words["line_num"].min(), words["left"] - words["left"].min()
+    rank = (words["block"] * (line.max() + 1) + line) * (left.max() + 1) + left
+    if (np.diff(rank) < 0).any():
+        order = np.argsort(rank, kind="stable")
+        words = {key: values[order] for key, values in words.items()}
+    return words
+
+
+def _column_bounds(left: np.ndarray, tolerance: float) -> tuple[np.ndarray, np.ndarray] | None:
+    """
+    ``(mins, maxs)`` of the aligned columns of left edges, or ``None``.
 
-        # Get column boundaries
-        column_bounds = [(min(c), max(c)) for c in column_clusters]
-
-        # Extract table rows
-        table_rows = []
-        for line_num in sorted(lines.keys()):
-            line_words = sorted(lines[line_num], key=lambda w: w["left"])
-            row: list[str] = [""] * len(column_bounds)
-
-            for word in line_words:
-                word_center = word["left"] + word["width"] // 2
-                # Find which column this word belongs to
-                for col_idx, (col_min, col_max) in enumerate(column_bounds):
-                    # Word center is within column bounds (with tolerance)
-                    if col_min - tolerance <= word_center <= col_max + tolerance * 3:
-                        if row[col_idx]:
-                            row[col_idx] += " " + word["text"]
-                        else:
-                            row[col_idx] = word["text"]
-                        break
-                else:
-                    # Word doesn't fit in any column, append to nearest
-                    min_dist = float("inf")
-                    nearest_col = 0
-                    for col_idx, (col_min, col_max) in enumerate(column_bounds):
-                        dist = min(abs(word_center - col_min), abs(word_center - col_max))
-                        if dist < min_dist:
-                            min_dist = dist
-                            nearest_col = col_idx
-                    if row[nearest_col]:
-                        row[nearest_col] += " " + word["text"]
-                    else:
-                        row[nearest_col] = word["text"]
-
-            # Only add rows that have content in multiple columns
-            non_empty_cols = sum(1 for cell in row if cell.strip())
-            if non_empty_cols >= min_columns:
-                table_rows.append(row)
-
-        if len(table_rows) >= 2:  # Need at least 2 rows for a table
-            tables.append({"block": block_num, "rows": table_rows})
+    Sorted unique edges form a column while each is within ``tolerance`` of
+    the one before; a column needs at least two distinct edges.
+    """
+    # Sorted unique edges, counted over the pixel range they span
+    low = left.min()
+    edges = np.flatnonzero(np.bincount(left - low)) + low
+    breaks = np.flatnonzero(np.diff(edges) >= tolerance) + 1
+    starts = np.concatenate(([0], breaks))
+    ends = np.concatenate((breaks, [len(edges)]))
+    aligned = ends - starts >= 2
+    if not aligned.any():
+        return None
+    return edges[starts[aligned]], edges[ends[aligned] - 1]
+
+
+def _assign_columns(
+    center: np.ndarray, mins: np.ndarray, maxs: np.ndarray, tolerance: float
+) -> np.ndarray:
+    """
+    Column of each word center: the first whose span (widened by the
+    tolerance, three times on the right) holds it, else the nearest.
+    """
+    # Both ends of the widened spans increase with the column, so the spans
+    # holding a center are a contiguous run: from the first whose right end
+    # reaches it to the last whose left end does
+    first = np.searchsorted(maxs + tolerance * 3, center, side="left")
+    last = np.searchsorted(mins - tolerance, center, side="right") - 1
+    held = first <= last
+
+    # Otherwise the nearest column starts just before or just after the center
+    after = np.clip(np.searchsorted(mins, center, side="left"), 0, len(mins) - 1)
+    before = np.clip(after - 1, 0, None)
+    distance_before = np.minimum(abs(center - mins[before]), abs(center - maxs[before]))
+    distance_after = np.minimum(abs(center - mins[after]), abs(center - maxs[after]))
+    nearest = np.where(distance_before <= distance_after, before, after)
+    return np.where(held, first, nearest)
+
+
+def _vertical_rules(dark: np.ndarray, block: dict[str, np.ndarray]) -> np.ndarray:
+    """
+    x positions of the vertical ruling lines between a block's words.
 
-    return tables
+    A ruling line is a run of pixel columns dark over ``RULE_COVERAGE`` of
+    the rows the words span; lines on the outer edge of the table are left
+    out, as they separate no columns.
+    """
+    top = int(block["top"].min())
+    bottom = int((block["top"] + block["height"]).max())
+    left = int(block["left"].min())
+    right = int((block["left"] + block["width"]).max())
+    area = dark[top:bottom, left:right]
+    if not area.size:
+        return np.empty(0)
+
+    # Count a pixel as dark if a neighbour is, so slightly skewed rules stay whole
+    wide = area.copy()
+    wide[:, 1:] |= area[:, :-1]
+    wide[:, :-1] |= area[:, 1:]
+    ruled = np.concatenate(([0], wide.mean(axis=0) >= RULE_COVERAGE, [0])).astype(np.int8)
+    edges = np.flatnonzero(np.diff(ruled))
+    return left + (edges[::2] + edges[1::2]) / 2
+
+
+def _table_rows(
+    text: np.ndarray, line: np.ndarray, column: np.ndarray, columns: int, min_columns: int
+) -> list[list[str]]:
+    """Rows of cells, joining the words of each line and column in order."""
+    cell = line * columns + column
+    # Words come in reading order, so cells usually do too; the sort is stable,
+    # so the words of a cell stay in left-to-right order
+    if (np.diff(cell) < 0).any():
+        order = np.argsort(cell, kind="stable")
+        cell, text = cell[order], text[order]
+    starts = np.flatnonzero(np.diff(cell, prepend=-1))
+    ends = np.append(starts[1:], len(cell))
+    row, index = np.divmod(cell[starts], columns)
+
+    grid = np.full((line[-1] + 1, columns), "", dtype=object)
+    single = ends - starts == 1
+    grid[row[single], index[single]] = text[starts[single]]
+    # Only cells of several words are joined, then placed in one assignment
+    multi = ~single
+    if multi.any():
+        words = text.tolist()
+        joined = np.empty(multi.sum(), dtype=object)
+        joined[:] = [
+            " ".join(words[start:end])
+            for start, end in zip(starts[multi].tolist(), ends[multi].tolist(), strict=True)
+        ]
+        grid[row[multi], index[multi]] = joined
+
+    # Only rows that have content in multiple columns
+    filled = np.bincount(row, minlength=len(grid)) >= min_columns
+    return grid[filled].tolist()
 
 
 def _extract_all_text_as_table(ocr_data: dict[str, list]) -> list[list[str]]:
@@ -186,77 +342,93 @@ class OCRTableOperation(BasePDFOperation):
             input_path: Path to input PDF
             output_path: Path to output file
             lang: OCR language (default: eng)
-            dpi: DPI for conversion (default: 300)
+            dpi: DPI for conversion, or auto per page (default: 300)
             format: Output format: csv, tsv, json (default: csv)
             pages: Specific pages to extract (default: all)
             min_columns: Minimum columns to detect as table (default: 2)
+            roi: OCR only the text blocks found by a layout pre-pass (default: False)
+            template: JSON file or list of named regions to OCR instead of the page
+            workers: Threads OCRing the regions of a page (default: 4)
+            rasterizer: Page renderer: pdf2image, pdfium (default: pdf2image)
+            ocr_engine: OCR engine: auto, tesserocr, pytesseract (default: auto)
         """
         lang = kwargs.get("lang", "eng")
         dpi = kwargs.get("dpi", 300)
         output_format = kwargs.get("format", "csv")
         pages = kwargs.get("pages")
+        if pages is not None:
+            pages = PageSelection.coerce(pages, len(PdfReader(input_path).pages))
         min_columns = kwargs.get("min_columns", 2)
+        template = load_template(kwargs["template"]) if kwargs.get("template") else None
+        roi = kwargs.get("roi", False) or template is not None
+        workers = kwargs.get("workers", 4)
 
         # PSM 3 for auto page segmentation, better for mixed content
         tess_config = "--psm 3 --oem 3"
 
-        if pages:
-            images = convert_from_path(
-                input_path,
-                dpi=dpi,
-                first_page=pages[0],
-                last_page=pages[-1],
-            )
-        else:
-            images = convert_from_path(input_path, dpi=dpi)
+        images = render_for_ocr(
+            get_rasterizer(kwargs.get("rasterizer")), input_path, pages, dpi=dpi
+        )
+        engine = get_ocr_engine(kwargs.get("ocr_engine"))
 
         all_tables: list[dict] = []
-        for page_num, image in enumerate(images, start=1):
-            img_width = image.width
-
-            # Get OCR data with position info
-            ocr_data = pytesseract.image_to_data(
-                image,
-                lang=lang,
-                config=tess_config,
-                output_type=pytesseract.Output.DICT,
-            )
-
-            # Try to detect actual tables
-            tables = _detect_table_regions(ocr_data, img_width, min_columns)
-
-            if tables:
-                for table_idx, table in enumerate(tables):
-                    all_tables.append(
-                        {
-                            "page": page_num,
-                            "table_num": table_idx + 1,
-                            "rows": table["rows"],
-                        }
-                    )
+        # One pool for the run, so region workers keep their engine sessions
+        with ThreadPoolExecutor(max_workers=max(1, workers)) as pool:
+            for page_num, image in images:
+                img_width = image.width
+
+                # Get OCR data with position info
+                if roi:
+                    # Full-width blocks, so each table is read as one
+                    regions = page_regions(image, page_num, template, split_columns=False)
+                    ocr_data = ocr_regions(
+                        engine,
+                        image,
+                        regions,
+                        ["data"],
+                        lang=lang,
+                        config=tess_config,
+                        executor=pool,
+                    )["data"]
+                else:
+                    # Left as TSV, which the detector reads straight into arrays
+                    ocr_data = engine.image_to_tsv(image, lang=lang, config=tess_config)
+
+                # Try to detect actual tables
+                tables = _detect_table_regions(ocr_data, img_width, min_columns, image)
+
+                if tables:
+                    for table_idx, table in enumerate(tables):
+                        all_tables.append(
+                            {
+                                "page": page_num,
+                                "table_num": table_idx + 1,
+                                "rows": table["rows"],
+                            }
+                        )
 
         # Output based on format
         if not all_tables:
             # If no tables detected, create an empty output with a note
             if output_format == "json":
                 output_path = output_path.with_suffix(".json")
-                output_path.write_text(
+                write_text(
                     json.dumps(
-                        {"message": "No tables detected in document", "tables": []},
-                        indent=2,
+                        {"message": "No tables detected in document", "tables": []}, indent=2
                     ),
-                    encoding="utf-8",
+                    output_path,
+                    **kwargs,
                 )
             else:
                 suffix = ".csv" if output_format == "csv" else ".tsv"
                 output_path = output_path.with_suffix(suffix)
-                with open(output_path, "w", newline="", encoding="utf-8") as f:
+                with atomic_text_output(output_path, newline="", **kwargs) as f:
                     f.write("# No tables detected in document\n")
             return
 
         if output_format == "csv":
             output_path = output_path.with_suffix(".csv")
-            with open(output_path, "w", newline="", encoding="utf-8") as f:
+            with atomic_text_output(output_path, newline="", **kwargs) as f:
                 writer = csv.writer(f)
                 for table in all_tables:
                     writer.writerow([f"# Page {table['page']}, Table {table['table_num']}"])
@@ -266,7 +438,7 @@ class OCRTableOperation(BasePDFOperation):
 
         elif output_format == "tsv":
             output_path = output_path.with_suffix(".tsv")
-            with open(output_path, "w", newline="", encoding="utf-8") as f:
+            with atomic_text_output(output_path, newline="", **kwargs) as f:
                 writer = csv.writer(f, delimiter="\t")
                 for table in all_tables:
                     writer.writerow([f"# Page {table['page']}, Table {table['table_num']}"])
@@ -276,6 +448,4 @@ class OCRTableOperation(BasePDFOperation):
 
         elif output_format == "json":
             output_path = output_path.with_suffix(".json")
-            output_path.write_text(
-                json.dumps(all_tables, indent=2, ensure_ascii=False), encoding="utf-8"
-            )
+            write_text(json.dumps(all_tables, indent=2, ensure_ascii=False), output_path, **kwargs)
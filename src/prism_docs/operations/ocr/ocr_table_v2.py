@@ -6,7 +6,8 @@ import csv
 import json
 import os
 
-from prism_docs.core import BasePDFOperation, register_operation
+from prism_docs.core import BasePDFOperation, PageSelection, register_operation
+from prism_docs.core.output import atomic_output, atomic_text_output, write_text
 
 
 def _get_device() -> str:
@@ -25,7 +26,7 @@ def _get_device() -> str:
 
 def _extract_tables_img2table(
     pdf_path: Path,
-    pages: list[int] | None = None,
+    pages: PageSelection | None = None,
     ocr_lang: str = "eng",
     implicit_rows: bool = True,
     borderless_tables: bool = True,
@@ -36,7 +37,7 @@ def _extract_tables_img2table(
 
     Args:
         pdf_path: Path to the PDF file
-        pages: List of page numbers to process (1-indexed), None for all
+        pages: Pages to process (1-indexed, resolved), None for all
         ocr_lang: OCR language for text extraction
         implicit_rows: Detect implicit rows in tables
         borderless_tables: Detect tables without borders
@@ -54,11 +55,6 @@ def _extract_tables_img2table(
     # Initialize PDF document
     doc = PDF(src=str(pdf_path))
 
-    # Convert 1-indexed pages to 0-indexed if specified
-    page_indices = None
-    if pages:
-        page_indices = [p - 1 for p in pages]
-
     # Extract tables with OCR
     extracted = doc.extract_tables(
         ocr=ocr,
@@ -70,11 +66,11 @@ def _extract_tables_img2table(
     all_tables = []
 
     for page_idx, tables in extracted.items():
-        # Skip pages not in our list
-        if page_indices is not None and page_idx not in page_indices:
-            continue
+        page_num = page_idx + 1  # Convert to 1-indexed
 
-        page_num = page_idx + 1  # Convert back to 1-indexed
+        # Skip pages not in the selection
+        if pages is not None and page_num not in pages:
+            continue
 
         for table_idx, table in enumerate(tables):
             # Get the table as a pandas DataFrame
@@ -149,6 +145,10 @@ class OCRTableV2Operation(BasePDFOperation):
         lang = kwargs.get("lang", "eng")
         output_format = kwargs.get("format", "csv")
         pages = kwargs.get("pages")
+        if pages is not None:
+            from pypdf import PdfReader
+
+            pages = PageSelection.coerce(pages, len(PdfReader(input_path).pages))
         implicit_rows = kwargs.get("implicit_rows", True)
         borderless = kwargs.get("borderless", True)
         min_confidence = kwargs.get("min_confidence", 50)
@@ -179,31 +179,32 @@ class OCRTableV2Operation(BasePDFOperation):
         if not all_tables:
             if output_format == "json":
                 output_path = output_path.with_suffix(".json")
-                output_path.write_text(
+                write_text(
                     json.dumps(
-                        {"message": "No tables detected in document", "tables": []},
-                        indent=2,
+                        {"message": "No tables detected in document", "tables": []}, indent=2
                     ),
-                    encoding="utf-8",
+                    output_path,
+                    **kwargs,
                 )
             elif output_format == "xlsx":
                 output_path = output_path.with_suffix(".xlsx")
                 import pandas as pd
 
-                pd.DataFrame({"Note": ["No tables detected in document"]}).to_excel(
-                    output_path, index=False
-                )
+                with atomic_output(output_path, **kwargs) as f:
+                    pd.DataFrame({"Note": ["No tables detected in document"]}).to_excel(
+                        f, index=False
+                    )
             else:
                 suffix = ".csv" if output_format == "csv" else ".tsv"
                 output_path = output_path.with_suffix(suffix)
-                with open(output_path, "w", newline="", encoding="utf-8") as f:
+                with atomic_text_output(output_path, newline="", **kwargs) as f:
                     f.write("# No tables detected in document\n")
             return
 
         # Output based on format
         if output_format == "csv":
             output_path = output_path.with_suffix(".csv")
-            with open(output_path, "w", newline="", encoding="utf-8") as f:
+            with atomic_text_output(output_path, newline="", **kwargs) as f:
                 writer = csv.writer(f)
                 for table in all_tables:
                     writer.writerow([f"# Page {table['page']}, Table {table['table_num']}"])
@@ -213,7 +214,7 @@ class OCRTableV2Operation(BasePDFOperation):
 
         elif output_format == "tsv":
             output_path = output_path.with_suffix(".tsv")
-            with open(output_path, "w", newline="", encoding="utf-8") as f:
+            with atomic_text_output(output_path, newline="", **kwargs) as f:
                 writer = csv.writer(f, delimiter="\t")
                 for table in all_tables:
                     writer.writerow([f"# Page {table['page']}, Table {table['table_num']}"])
@@ -223,16 +224,16 @@ class OCRTableV2Operation(BasePDFOperation):
 
         elif output_format == "json":
             output_path = output_path.with_suffix(".json")
-            output_path.write_text(
-                json.dumps(all_tables, indent=2, ensure_ascii=False),
-                encoding="utf-8",
-            )
+            write_text(json.dumps(all_tables, indent=2, ensure_ascii=False), output_path, **kwargs)
 
         elif output_format == "xlsx":
             output_path = output_path.with_suffix(".xlsx")
             import pandas as pd
 
-            with pd.ExcelWriter(output_path, engine="openpyxl") as writer:
+            with (
+                atomic_output(output_path, **kwargs) as f,
+                pd.ExcelWriter(f, engine="openpyxl") as writer,
+            ):
                 for table in all_tables:
                     sheet_name = f"Page{table['page']}_Table{table['table_num']}"
                     # Truncate sheet name to Excel's 31-char limit
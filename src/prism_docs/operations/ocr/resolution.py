@@ -0,0 +1,116 @@
+"""Rendering resolution for OCR, fixed or chosen per page.
+
+With ``dpi="auto"`` every page is first rendered at a low probe resolution.
+The x-height of its text is measured from row projection profiles, and the
+page is then rendered at the lowest resolution that makes that x-height
+reach ``TARGET_X_HEIGHT`` pixels. Pages of large print are read from small
+images, and pages of small print still get a high resolution. Pages that end
+up at the same resolution are rendered together, so batching rasterizers
+keep their batches.
+"""
+
+from collections.abc import Iterable, Iterator
+from pathlib import Path
+
+import numpy as np
+from PIL import Image
+
+from prism_docs.core.raster import Rasterizer
+from prism_docs.operations.ocr.preprocess import otsu_threshold
+
+AUTO_DPI = "auto"
+
+# Resolution of the measuring render
+PROBE_DPI = 100
+
+# x-height in pixels to render text at; Tesseract's accuracy drops on smaller text
+TARGET_X_HEIGHT = 20
+
+# Bounds and rounding of the chosen resolution
+MIN_DPI = 100
+MAX_DPI = 600
+DPI_STEP = 50
+
+# Resolution for pages with no measurable text
+FALLBACK_DPI = 300
+
+# Vertical strips measured separately, so columns with offset lines don't merge
+STRIPS = 4
+
+
+def render_for_ocr(
+    rasterizer: Rasterizer,
+    input_path: Path,
+    pages: Iterable[int] | None = None,
+    dpi: int | str = 300,
+) -> Iterator[tuple[int, Image.Image]]:
+    """
+    Yield ``(page_number, image)`` rendered at ``dpi``, or per page with ``"auto"``.
+
+    Each image's resolution is recorded in ``image.info["dpi"]``, so the OCR
+    engine and anything mapping pixels back to points can read it.
+    """
+    if dpi != AUTO_DPI:
+        for page_num, image in rasterizer.render(input_path, pages, dpi=int(dpi)):
+            image.info["dpi"] = (int(dpi), int(dpi))
+            yield page_num, image
+        return
+
+    chosen = {
+        page_num: choose_dpi(estimate_x_height(probe))
+        for page_num, probe in rasterizer.render(input_path, pages, dpi=PROBE_DPI)
+    }
+
+    # Consecutive pages at the same resolution share one render call
+    runs: list[tuple[int, list[int]]] = []
+    for page_num, page_dpi in chosen.items():
+        if runs and runs[-1][0] == page_dpi:
+            runs[-1][1].append(page_num)
+        else:
+            runs.append((page_dpi, [page_num]))
+
+    for page_dpi, run in runs:
+        for page_num, image in rasterizer.render(input_path, run, dpi=page_dpi):
+            image.info["dpi"] = (page_dpi, page_dpi)
+            yield page_num, image
+
+
+def choose_dpi(x_height: float | None, probe_dpi: int = PROBE_DPI) -> int:
+    """Lowest resolution (in ``DPI_STEP`` steps) giving ``TARGET_X_HEIGHT`` pixel text."""
+    if not x_height:
+        return FALLBACK_DPI
+    dpi = probe_dpi * TARGET_X_HEIGHT / x_height
+    dpi = DPI_STEP * int(np.ceil(dpi / DPI_STEP))
+    return int(min(max(dpi, MIN_DPI), MAX_DPI))
+
+
+def estimate_x_height(image: Image.Image) -> float | None:
+    """
+    Median x-height in pixels of the text lines on a page image.
+
+    Dark rows form a band per text line; within a band the rows dense with
+    ink (at least half the band's peak) are the x-height zone, while rows
+    crossed only by ascenders and descenders are sparse. Returns ``None``
+    when too few lines are found to measure.
+    """
+    gray = image.convert("L")
+    hist = np.array(gray.histogram())
+    dark = np.asarray(gray) <= otsu_threshold(hist)
+    if not 0.001 < dark.mean() < 0.4:
+        return None  # Blank, or mostly picture
+
+    heights = []
+    for strip in np.array_split(dark, STRIPS, axis=1):
+        counts = strip.sum(axis=1)
+        # Ignore rows with only a speck of ink
+        inked = np.concatenate(([False], counts > 1, [False]))
+        edges = np.flatnonzero(np.diff(inked.astype(np.int8)))
+        for start, end in zip(edges[::2], edges[1::2], strict=True):
+            band = counts[start:end]
+            if end - start < 3:
+                continue
+            heights.append(int((band >= band.max() / 2).sum()))
+
+    if len(heights) < 3:
+        return None
+    return float(np.median(heights))
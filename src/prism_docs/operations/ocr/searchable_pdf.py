@@ -1,13 +1,18 @@
 """Create searchable PDF from scanned PDF using OCR."""
 
+from io import BytesIO
 from pathlib import Path
 from typing import Any
 
-import pytesseract
-from pdf2image import convert_from_path
 from pypdf import PdfReader, PdfWriter
 
 from prism_docs.core import BasePDFOperation, register_operation
+from prism_docs.core.output import write_pdf, write_text
+from prism_docs.core.raster import get_rasterizer
+from prism_docs.operations.ocr.engine import get_ocr_engine
+from prism_docs.operations.ocr.ocr_data import page_items_from_data
+from prism_docs.operations.ocr.resolution import render_for_ocr
+from prism_docs.operations.ocr.text_layer import add_text_font, add_text_layer
 
 
 @register_operation("searchable-pdf")
@@ -34,45 +39,59 @@ class SearchablePDFOperation(BasePDFOperation):
             input_path: Path to input scanned PDF
             output_path: Path to output searchable PDF
             lang: OCR language(s) (default: eng)
-            dpi: DPI for conversion (default: 300)
+            dpi: DPI for conversion, or auto per page (default: 300)
             psm: Page segmentation mode (default: 3)
             oem: OCR engine mode (default: 3)
             timeout: Timeout per page in seconds (default: 60)
+            mode: image (rebuild pages from renders) or overlay (keep pages) (default: image)
+            sidecar: Also write the text to a .txt beside the PDF, same OCR pass (default: False)
+            rasterizer: Page renderer: pdf2image, pdfium (default: pdf2image)
+            ocr_engine: OCR engine: auto, tesserocr, pytesseract (default: auto)
         """
         lang = kwargs.get("lang", "eng")
         dpi = kwargs.get("dpi", 300)
         psm = kwargs.get("psm", 3)
         oem = kwargs.get("oem", 3)
         timeout = kwargs.get("timeout", 60)
+        sidecar = kwargs.get("sidecar", False)
+        mode = kwargs.get("mode", "image")
 
         tess_config = f"--psm {psm} --oem {oem}"
 
         # Convert PDF to images
-        images = convert_from_path(input_path, dpi=dpi)
-
-        # Generate PDF with text layer for each page
-        pdf_pages: list[bytes] = []
-        for image in images:
-            # Get PDF bytes with invisible text layer
-            pdf_result = pytesseract.image_to_pdf_or_hocr(
-                image,
-                lang=lang,
-                config=tess_config,
-                timeout=timeout,
-                extension="pdf",
+        rasterizer = get_rasterizer(kwargs.get("rasterizer"))
+        images = render_for_ocr(rasterizer, input_path, dpi=dpi)
+        engine = get_ocr_engine(kwargs.get("ocr_engine"))
+
+        if mode == "overlay":
+            # Keep the original pages and draw the recognized words over them
+            writer = PdfWriter(clone_from=input_path)
+            font = add_text_font(writer)
+        elif mode == "image":
+            writer = PdfWriter()
+        else:
+            raise ValueError(f"Unknown mode '{mode}' (choose from image, overlay)")
+
+        # OCR one page at a time (the text too, in the same pass)
+        text_parts: list[str] = []
+        formats = ["data" if mode == "overlay" else "pdf"] + (["text"] if sidecar else [])
+        for i, image in images:
+            outputs = engine.image_to_outputs(
+                image, formats, lang=lang, config=tess_config, timeout=timeout
             )
-            pdf_bytes = pdf_result if isinstance(pdf_result, bytes) else pdf_result.encode()
-            pdf_pages.append(pdf_bytes)
-
-        # Merge all pages into single PDF
-        writer = PdfWriter()
-        for pdf_bytes in pdf_pages:
-            from io import BytesIO
-
-            reader = PdfReader(BytesIO(pdf_bytes))
-            for page in reader.pages:
-                writer.add_page(page)
+            if mode == "overlay":
+                words = page_items_from_data(outputs["data"])
+                add_text_layer(
+                    writer, writer.pages[i - 1], words, image.size, font, rasterizer.page_box
+                )
+            else:
+                # Page image with an invisible text layer, rendered by tesseract
+                for page in PdfReader(BytesIO(outputs["pdf"])).pages:
+                    writer.add_page(page)
+            if sidecar:
+                text_parts.append(f"--- Page {i} ---\n{outputs['text']}")
 
         # Write output
-        with open(output_path, "wb") as f:
-            writer.write(f)
+        write_pdf(writer, output_path, **kwargs)
+        if sidecar:
+            write_text("\n\n".join(text_parts), output_path.with_suffix(".txt"), **kwargs)
@@ -0,0 +1,199 @@
+"""Invisible OCR text layers drawn over existing PDF pages."""
+
+from collections.abc import Callable
+
+from pypdf import PageObject, PdfWriter
+from pypdf.generic import (
+    ArrayObject,
+    DecodedStreamObject,
+    DictionaryObject,
+    IndirectObject,
+    NameObject,
+    NumberObject,
+    TextStringObject,
+)
+
+from prism_docs.operations.security.flatten import wrap_contents
+
+FONT_NAME = "/FOCR"
+
+# Glyph advance of the text layer font, in thousandths of an em
+GLYPH_WIDTH = 500
+
+
+def _to_unicode_cmap() -> bytes:
+    """Map each 2-byte code to the UTF-16 code unit of the same value."""
+    ranges = [f"<{hi:02X}00> <{hi:02X}FF> <{hi:02X}00>" for hi in range(256)]
+    blocks = []
+    # At most 100 ranges per block
+    for start in range(0, len(ranges), 100):
+        chunk = ranges[start : start + 100]
+        blocks.append(f"{len(chunk)} beginbfrange\n" + "\n".join(chunk) + "\nendbfrange")
+    return (
+        "/CIDInit /ProcSet findresource begin\n12 dict begin\nbegincmap\n"
+        "/CIDSystemInfo << /Registry (Adobe) /Ordering (UCS) /Supplement 0 >> def\n"
+        "/CMapName /Adobe-Identity-UCS def\n/CMapType 2 def\n"
+        "1 begincodespacerange\n<0000> <FFFF>\nendcodespacerange\n"
+        + "\n".join(blocks)
+        + "\nendcmap\nCMapName currentdict /CMap defineresource pop\nend\nend\n"
+    ).encode("ascii")
+
+
+def add_text_font(writer: PdfWriter) -> IndirectObject:
+    """
+    Add the font the text layer is drawn with.
+
+    A composite font whose character codes are UTF-16 code units, so any text
+    is encoded and extracted through its ToUnicode map. It draws nothing
+    (render mode 3), so no font program is embedded.
+    """
+    to_unicode = DecodedStreamObject()
+    to_unicode.set_data(_to_unicode_cmap())
+
+    cid_system_info = DictionaryObject(
+        {
+            NameObject("/Registry"): TextStringObject("Adobe"),
+            NameObject("/Ordering"): TextStringObject("Identity"),
+            NameObject("/Supplement"): NumberObject(0),
+        }
+    )
+    descriptor = DictionaryObject(
+        {
+            NameObject("/Type"): NameObject("/FontDescriptor"),
+            NameObject("/FontName"): NameObject("/GlyphLessFont"),
+            NameObject("/Flags"): NumberObject(5),
+            NameObject("/FontBBox"): ArrayObject(
+                [NumberObject(0), NumberObject(0), NumberObject(GLYPH_WIDTH), NumberObject(1000)]
+            ),
+            NameObject("/ItalicAngle"): NumberObject(0),
+            NameObject("/Ascent"): NumberObject(1000),
+            NameObject("/Descent"): NumberObject(0),
+            NameObject("/CapHeight"): NumberObject(1000),
+            NameObject("/StemV"): NumberObject(80),
+        }
+    )
+    descendant = DictionaryObject(
+        {
+            NameObject("/Type"): NameObject("/Font"),
+            NameObject("/Subtype"): NameObject("/CIDFontType2"),
+            NameObject("/BaseFont"): NameObject("/GlyphLessFont"),
+            NameObject("/CIDSystemInfo"): cid_system_info,
+            NameObject("/FontDescriptor"): writer._add_object(descriptor),
+            NameObject("/DW"): NumberObject(GLYPH_WIDTH),
+            NameObject("/CIDToGIDMap"): NameObject("/Identity"),
+        }
+    )
+    font = DictionaryObject(
+        {
+            NameObject("/Type"): NameObject("/Font"),
+            NameObject("/Subtype"): NameObject("/Type0"),
+            NameObject("/BaseFont"): NameObject("/GlyphLessFont"),
+            NameObject("/Encoding"): NameObject("/Identity-H"),
+            NameObject("/DescendantFonts"): ArrayObject([writer._add_object(descendant)]),
+            NameObject("/ToUnicode"): writer._add_object(to_unicode.flate_encode()),
+        }
+    )
+    return writer._add_object(font)
+
+
+def page_transform(
+    image_size: tuple[int, int], page: PageObject, page_box: str = "mediabox"
+) -> tuple[Callable[[float, float], tuple[float, float]], float, float, int]:
+    """
+    Map an image rendered from ``page`` onto the page's user space.
+
+    Returns ``(to_user, scale_x, scale_y, rotate)``. Pixels times the scales
+    are displayed points from the image's top left corner, and ``to_user``
+    turns those into unrotated user-space points, honouring ``/Rotate`` and
+    the page box the image covers (``Rasterizer.page_box``).
+    """
+    box = getattr(page, page_box)
+    x0, y0, x1, y1 = (float(v) for v in (box.left, box.bottom, box.right, box.top))
+    rotate = page.rotation % 360
+    # Displayed page size, after /Rotate
+    width, height = (x1 - x0, y1 - y0) if rotate in (0, 180) else (y1 - y0, x1 - x0)
+
+    def to_user(u: float, v: float) -> tuple[float, float]:
+        # Displayed point (from the top left, in points) -> unrotated user space
+        if rotate == 90:
+            return x0 + v, y0 + u
+        if rotate == 180:
+            return x1 - u, y0 + v
+        if rotate == 270:
+            return x1 - v, y1 - u
+        return x0 + u, y1 - v
+
+    return to_user, width / image_size[0], height / image_size[1], rotate
+
+
+def text_layer_operations(
+    words: list[dict],
+    image_size: tuple[int, int],
+    page: PageObject,
+    page_box: str = "mediabox",
+) -> list[str]:
+    """
+    Content operators drawing ``words`` as invisible text over ``page``.
+
+    Args:
+        words: OCR words as from ``page_items_from_data``, in reading order
+        image_size: Size in pixels of the image the words were read from
+        page: Page the image was rendered from
+        page_box: Page box the image covers (``Rasterizer.page_box``)
+    """
+    to_user, scale_x, scale_y, rotate = page_transform(image_size, page, page_box)
+
+    # Text runs left to right across the displayed page
+    a, b = {0: (1, 0), 90: (0, 1), 180: (-1, 0), 270: (0, -1)}.get(rotate, (1, 0))
+
+    operations = ["BT", "3 Tr"]
+    for i, word in enumerate(words):
+        bbox = word["bbox"]
+        word_width = bbox["width"] * scale_x
+        size = bbox["height"] * scale_y
+        if word_width <= 0 or size <= 0:
+            continue
+
+        text = word["text"]
+        encoded = text.encode("utf-16-be")
+        glyphs = len(encoded) // 2
+        # Stretch the glyphs to span the word's box
+        stretch = 100 * word_width / (glyphs * size * GLYPH_WIDTH / 1000)
+        # Words on a line are separated by a space for text extraction
+        next_word = words[i + 1] if i + 1 < len(words) else None
+        if next_word is not None and _line(next_word) == _line(word):
+            encoded += " ".encode("utf-16-be")
+
+        x, y = to_user(bbox["x"] * scale_x, (bbox["y"] + bbox["height"]) * scale_y)
+        operations.append(
+            f"{FONT_NAME} {size:.2f} Tf {stretch:.2f} Tz "
+            f"{a} {b} {-b} {a} {x:.2f} {y:.2f} Tm <{encoded.hex().upper()}> Tj"
+        )
+    operations.append("ET")
+    return operations
+
+
+def _line(word: dict) -> tuple[int, int]:
+    return word["block_num"], word["line_num"]
+
+
+def add_text_layer(
+    writer: PdfWriter,
+    page: PageObject,
+    words: list[dict],
+    image_size: tuple[int, int],
+    font: IndirectObject,
+    page_box: str = "mediabox",
+) -> None:
+    """Draw ``words`` invisibly over a writer page, leaving its content untouched."""
+    if not words:
+        return
+
+    if "/Resources" not in page:
+        page[NameObject("/Resources")] = DictionaryObject()
+    resources = page["/Resources"].get_object()
+    if "/Font" not in resources:
+        resources[NameObject("/Font")] = DictionaryObject()
+    resources["/Font"].get_object()[NameObject(FONT_NAME)] = font
+
+    wrap_contents(writer, page, text_layer_operations(words, image_size, page, page_box))
@@ -5,7 +5,9 @@ from typing import Any
 
 from pypdf import PdfReader, PdfWriter
 
-from prism_docs.core import BasePDFOperation, register_operation
+from prism_docs.core import BasePDFOperation, PageSelection, register_operation
+from prism_docs.core.output import write_pdf
+from prism_docs.core.pages import iter_pages, page_count
 
 
 @register_operation("extract-pages")
@@ -27,25 +29,21 @@ class ExtractPagesOperation(BasePDFOperation):
     def _execute(self, input_path: Path, output_path: Path, **kwargs: Any) -> None:
         start: int = kwargs.get("start", 1)
         end: int | None = kwargs.get("end")
-        pages: list[int] | None = kwargs.get("pages")  # Specific pages to extract
 
         reader = PdfReader(input_path)
         writer = PdfWriter()
 
-        total_pages = len(reader.pages)
+        # Only the requested leaves of the page tree are loaded and copied
+        total_pages = page_count(reader)
+        pages = PageSelection.coerce(kwargs.get("pages"), total_pages)  # Specific pages
 
-        if pages is not None:
-            # Extract specific pages
-            for page_num in pages:
-                if 1 <= page_num <= total_pages:
-                    writer.add_page(reader.pages[page_num - 1])
-        else:
+        if pages is None:
             # Extract range
             if end is None:
                 end = total_pages
+            pages = PageSelection([(max(start, 1), min(end, total_pages), 1)])
 
-            for i in range(start - 1, min(end, total_pages)):
-                writer.add_page(reader.pages[i])
+        for _, page in iter_pages(reader, pages):
+            writer.add_page(page)
 
-        with open(output_path, "wb") as f:
-            writer.write(f)
+        write_pdf(writer, output_path, **kwargs)
@@ -5,7 +5,14 @@ from typing import Any
 
 from pypdf import PdfReader
 
-from prism_docs.core import BasePDFOperation, OperationResult, OutputConfig, register_operation
+from prism_docs.core import (
+    BasePDFOperation,
+    OperationResult,
+    OutputConfig,
+    PageSelection,
+    register_operation,
+)
+from prism_docs.core.output import write_text
 
 
 @register_operation("extract-text")
@@ -65,18 +72,17 @@ class ExtractTextOperation(BasePDFOperation):
 
     def _execute(self, input_path: Path, output_path: Path, **kwargs: Any) -> None:
         separator: str = kwargs.get("separator", "\n\n")
-        pages: list[int] | None = kwargs.get("pages")
 
         reader = PdfReader(input_path)
+        pages = PageSelection.coerce(kwargs.get("pages"), len(reader.pages))
 
         def _page_text(page_index: int) -> str:
             text = reader.pages[page_index].extract_text()
             return text or ""
 
         if pages is not None:
-            texts = [_page_text(p - 1) for p in pages if 1 <= p <= len(reader.pages)]
+            texts = [_page_text(p - 1) for p in pages]
         else:
             texts = [text or "" for text in (page.extract_text() for page in reader.pages)]
 
-        with open(output_path, "w", encoding="utf-8") as f:
-            f.write(separator.join(texts))
+        write_text(separator.join(texts), output_path, **kwargs)
@@ -6,6 +6,7 @@ from typing import Any
 from pypdf import PdfReader, PdfWriter
 
 from prism_docs.core import BasePDFOperation, OperationResult, OutputConfig, register_operation
+from prism_docs.core.output import write_pdf
 
 
 @register_operation("interleave")
@@ -109,5 +110,4 @@ class InterleaveOperation(BasePDFOperation):
             for page in pages2:
                 writer.add_page(page)
 
-        with open(output_path, "wb") as f:
-            writer.write(f)
+        write_pdf(writer, output_path, **kwargs)
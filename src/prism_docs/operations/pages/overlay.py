@@ -5,7 +5,8 @@ from typing import Any
 
 from pypdf import PdfReader, PdfWriter
 
-from prism_docs.core import BasePDFOperation, register_operation
+from prism_docs.core import BasePDFOperation, PageSelection, register_operation
+from prism_docs.core.output import write_pdf
 
 
 @register_operation("overlay")
@@ -27,13 +28,13 @@ class OverlayOperation(BasePDFOperation):
     def _execute(self, input_path: Path, output_path: Path, **kwargs: Any) -> None:
         overlay_path: Path = Path(kwargs["overlay_path"])
         mode: str = kwargs.get("mode", "foreground")  # foreground or background
-        pages: list[int] | None = kwargs.get("pages")  # None = all pages
         repeat: bool = kwargs.get("repeat", True)  # Repeat overlay for all pages
 
         overlay_reader = PdfReader(overlay_path)
         overlay_pages = list(overlay_reader.pages)
 
         reader = PdfReader(input_path)
+        pages = PageSelection.coerce(kwargs.get("pages"), len(reader.pages))  # None = all
         writer = PdfWriter()
 
         for i, page in enumerate(reader.pages):
@@ -59,5 +60,4 @@ class OverlayOperation(BasePDFOperation):
             else:
                 writer.add_page(page)
 
-        with open(output_path, "wb") as f:
-            writer.write(f)
+        write_pdf(writer, output_path, **kwargs)
@@ -6,6 +6,7 @@ from typing import Any
 from pypdf import PdfReader, PdfWriter
 
 from prism_docs.core import BasePDFOperation, register_operation
+from prism_docs.core.output import write_pdf
 
 
 @register_operation("page-numbers")
@@ -69,8 +70,7 @@ class PageNumbersOperation(BasePDFOperation):
                 },
             )
 
-        with open(output_path, "wb") as f:
-            writer.write(f)
+        write_pdf(writer, output_path, **kwargs)
 
     def _calculate_position(
         self,
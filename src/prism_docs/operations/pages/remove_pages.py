@@ -5,7 +5,9 @@ from typing import Any
 
 from pypdf import PdfReader, PdfWriter
 
-from prism_docs.core import BasePDFOperation, register_operation
+from prism_docs.core import BasePDFOperation, PageSelection, register_operation
+from prism_docs.core.output import write_pdf
+from prism_docs.core.pages import iter_pages, page_count
 
 
 @register_operation("remove-pages")
@@ -25,24 +27,21 @@ class RemovePagesOperation(BasePDFOperation):
         return "trimmed"
 
     def _execute(self, input_path: Path, output_path: Path, **kwargs: Any) -> None:
-        pages_to_remove: list[int] = kwargs.get("pages", [])
-
-        if not pages_to_remove:
+        if not kwargs.get("pages"):
             raise ValueError("No pages specified to remove")
 
         reader = PdfReader(input_path)
         writer = PdfWriter()
 
-        # Convert to set for O(1) lookup, adjust to 0-indexed
-        remove_set = {p - 1 for p in pages_to_remove}
+        total_pages = page_count(reader)
+        pages_to_remove = PageSelection.coerce(kwargs["pages"], total_pages)
 
-        for i, page in enumerate(reader.pages):
-            if i not in remove_set:
-                writer.add_page(page)
+        kept = (i for i in range(1, total_pages + 1) if i not in pages_to_remove)
+        for _, page in iter_pages(reader, kept):
+            writer.add_page(page)
 
         # Copy metadata
         if reader.metadata:
             writer.add_metadata(reader.metadata)
 
-        with open(output_path, "wb") as f:
-            writer.write(f)
+        write_pdf(writer, output_path, **kwargs)
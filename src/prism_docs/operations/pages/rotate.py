@@ -5,7 +5,8 @@ from typing import Any
 
 from pypdf import PdfReader, PdfWriter
 
-from prism_docs.core import BasePDFOperation, register_operation
+from prism_docs.core import BasePDFOperation, PageSelection, register_operation
+from prism_docs.core.output import write_pdf
 
 
 @register_operation("rotate")
@@ -26,12 +27,12 @@ class RotateOperation(BasePDFOperation):
 
     def _execute(self, input_path: Path, output_path: Path, **kwargs: Any) -> None:
         degrees: int = kwargs.get("degrees", 90)
-        pages: list[int] | None = kwargs.get("pages")  # None = all pages
 
         if degrees not in (90, 180, 270):
             raise ValueError(f"Rotation must be 90, 180, or 270 degrees, got {degrees}")
 
         reader = PdfReader(input_path)
+        pages = PageSelection.coerce(kwargs.get("pages"), len(reader.pages))  # None = all
         writer = PdfWriter()
 
         for i, page in enumerate(reader.pages):
@@ -39,5 +40,4 @@ class RotateOperation(BasePDFOperation):
                 page.rotate(degrees)
             writer.add_page(page)
 
-        with open(output_path, "wb") as f:
-            writer.write(f)
+        write_pdf(writer, output_path, **kwargs)
@@ -6,6 +6,8 @@ from typing import Any
 from pypdf import PdfReader, PdfWriter
 
 from prism_docs.core import BasePDFOperation, OperationResult, OutputConfig, register_operation
+from prism_docs.core.output import write_pdf
+from prism_docs.core.pages import iter_pages, page_count
 
 
 @register_operation("split")
@@ -50,20 +52,20 @@ class SplitOperation(BasePDFOperation):
                     writer.add_page(page)
 
                     output_path = output_dir / f"{input_path.stem}_page_{i}.pdf"
-                    with open(output_path, "wb") as f:
-                        writer.write(f)
+                    write_pdf(writer, output_path, **kwargs)
                     output_paths.append(output_path)
 
             elif mode == "ranges":
                 # Split by specified ranges
+                # Resolve only the pages inside the ranges, not the whole page tree
+                total_pages = page_count(reader)
                 for j, (start, end) in enumerate(ranges, start=1):
                     writer = PdfWriter()
-                    for i in range(start - 1, min(end, len(reader.pages))):
-                        writer.add_page(reader.pages[i])
+                    for _, page in iter_pages(reader, range(start, min(end, total_pages) + 1)):
+                        writer.add_page(page)
 
                     output_path = output_dir / f"{input_path.stem}_part_{j}.pdf"
-                    with open(output_path, "wb") as f:
-                        writer.write(f)
+                    write_pdf(writer, output_path, **kwargs)
                     output_paths.append(output_path)
 
             return OperationResult(
@@ -5,7 +5,8 @@ from typing import Any
 
 from pypdf import PdfReader, PdfWriter
 
-from prism_docs.core import BasePDFOperation, register_operation
+from prism_docs.core import BasePDFOperation, PageSelection, register_operation
+from prism_docs.core.output import write_pdf
 
 
 @register_operation("stamp")
@@ -30,7 +31,6 @@ class StampOperation(BasePDFOperation):
         font_size: int = kwargs.get("font_size", 24)
         color: str = kwargs.get("color", "red")
         opacity: float = kwargs.get("opacity", 0.5)
-        pages: list[int] | None = kwargs.get("pages")
         margin: int = kwargs.get("margin", 36)
 
         # Color mapping (RGB values 0-1)
@@ -44,6 +44,7 @@ class StampOperation(BasePDFOperation):
         r, g, b = colors.get(color, colors["red"])
 
         reader = PdfReader(input_path)
+        pages = PageSelection.coerce(kwargs.get("pages"), len(reader.pages))
         writer = PdfWriter()
 
         for i, page in enumerate(reader.pages):
@@ -82,8 +83,7 @@ class StampOperation(BasePDFOperation):
                 },
             )
 
-        with open(output_path, "wb") as f:
-            writer.write(f)
+        write_pdf(writer, output_path, **kwargs)
 
     def _calculate_position(
         self,
@@ -3,10 +3,269 @@
 from pathlib import Path
 from typing import Any
 
-from pypdf import PdfReader, PdfWriter
-from pypdf.generic import NameObject, NumberObject
+from pypdf import PageObject, PdfReader, PdfWriter
+from pypdf.generic import (
+    ArrayObject,
+    DecodedStreamObject,
+    DictionaryObject,
+    NameObject,
+    NumberObject,
+    StreamObject,
+)
 
 from prism_docs.core import BasePDFOperation, register_operation
+from prism_docs.core.output import write_pdf
+
+# Annotation flags (PDF 32000-1, 12.5.3) that keep an annotation off the page
+HIDDEN_FLAGS = 2 | 32  # Hidden, NoView
+
+# Annotations that never carry printable appearance of their own
+SKIP_SUBTYPES = {"/Popup", "/Link"}
+
+
+def _appearance_stream(annot: DictionaryObject) -> StreamObject | None:
+    """Return the normal appearance stream of an annotation, honouring /AS."""
+    ap = annot.get("/AP")
+    if ap is None:
+        return None
+    normal = ap.get_object().get("/N")
+    if normal is None:
+        return None
+    normal = normal.get_object()
+
+    if isinstance(normal, StreamObject):
+        return normal
+
+    # Appearance sub-dictionary keyed by state (checkboxes, radio buttons)
+    state = annot.get("/AS")
+    if state is not None and state in normal:
+        stream = normal[state].get_object()
+        return stream if isinstance(stream, StreamObject) else None
+    return None
+
+
+def _placement_matrix(annot: DictionaryObject, stream: StreamObject) -> list[float] | None:
+    """
+    Compute the ``cm`` matrix that maps an appearance stream onto its /Rect.
+
+    Follows PDF 32000-1, 12.5.5: the form's /BBox is transformed by its
+    /Matrix, then scaled and translated to fit the annotation rectangle.
+    """
+    rect = [float(v) for v in annot["/Rect"]]
+    x1, x2 = sorted((rect[0], rect[2]))
+    y1, y2 = sorted((rect[1], rect[3]))
+
+    bbox = [float(v) for v in stream.get("/BBox", [0, 0, x2 - x1, y2 - y1])]
+    a, b, c, d, e, f = (float(v) for v in stream.get("/Matrix", [1, 0, 0, 1, 0, 0]))
+
+    corners = [
+        (a * x + c * y + e, b * x + d * y + f)
+        for x in (bbox[0], bbox[2])
+        for y in (bbox[1], bbox[3])
+    ]
+    bx1 = min(x for x, _ in corners)
+    bx2 = max(x for x, _ in corners)
+    by1 = min(y for _, y in corners)
+    by2 = max(y for _, y in corners)
+
+    if bx2 - bx1 <= 0 or by2 - by1 <= 0:
+        return None
+
+    sx = (x2 - x1) / (bx2 - bx1)
+    sy = (y2 - y1) / (by2 - by1)
+    return [sx, 0, 0, sy, x1 - bx1 * sx, y1 - by1 * sy]
+
+
+def _merge_resources(stream: StreamObject, defaults: DictionaryObject) -> None:
+    """
+    Give an appearance stream the form's default resources (/DR) it relies on.
+
+    Appearance streams of form fields may name fonts that only /DR defines;
+    once the form is gone, those names must resolve in the stream itself.
+    Entries the stream already has win.
+    """
+    if "/Resources" not in stream:
+        stream[NameObject("/Resources")] = DictionaryObject()
+    resources = stream["/Resources"].get_object()
+    for category, entries in defaults.items():
+        entries = entries.get_object()
+        if category not in resources:
+            resources[NameObject(category)] = (
+                DictionaryObject(entries) if isinstance(entries, DictionaryObject) else entries
+            )
+            continue
+        existing = resources[category].get_object()
+        if isinstance(existing, DictionaryObject) and isinstance(entries, DictionaryObject):
+            for name, value in entries.items():
+                if name not in existing:
+                    existing[NameObject(name)] = value
+
+
+def _prune_fields(fields: ArrayObject, removed: set[int]) -> None:
+    """Drop flattened widgets from a field tree, and fields left without widgets."""
+    for ref in list(fields):
+        field = ref.get_object()
+        kids = field.get("/Kids")
+        if kids is not None:
+            kids = kids.get_object()
+            _prune_fields(kids, removed)
+            if not kids:
+                fields.remove(ref)
+        elif getattr(ref, "idnum", None) in removed:
+            fields.remove(ref)
+
+
+def wrap_contents(writer: PdfWriter, page: PageObject, operations: list[str]) -> None:
+    """Append drawing operations to a page, isolating the original content state."""
+    existing = page.get("/Contents")
+    if existing is None:
+        streams = ArrayObject()
+    elif isinstance(existing.get_object(), ArrayObject):
+        streams = ArrayObject(existing.get_object())
+    else:
+        streams = ArrayObject([existing])
+
+    before = DecodedStreamObject()
+    before.set_data(b"q\n")
+    after = DecodedStreamObject()
+    after.set_data(("Q\n" + "\n".join(operations) + "\n").encode("latin-1"))
+
+    page[NameObject("/Contents")] = ArrayObject(
+        [writer._add_object(before), *streams, writer._add_object(after)]
+    )
+
+
+def flatten_page(
+    writer: PdfWriter,
+    page: PageObject,
+    forms: bool = True,
+    annotations: bool = False,
+    default_resources: DictionaryObject | None = None,
+    removed_widgets: set[int] | None = None,
+) -> tuple[int, int]:
+    """
+    Burn annotation appearance streams into a writer page's content.
+
+    Widgets are flattened when ``forms`` is set, all other annotations when
+    ``annotations`` is set. Widgets without an appearance stream cannot be
+    drawn and are kept, marked read-only. Burned widget appearances get the
+    form's ``default_resources`` merged in, and the object numbers of the
+    widgets taken off the page are added to ``removed_widgets``.
+
+    Returns:
+        Tuple of (flattened annotations, widgets left on the page)
+    """
+    annots_ref = page.get("/Annots")
+    if not annots_ref:
+        return 0, 0
+
+    if "/Resources" not in page:
+        page[NameObject("/Resources")] = DictionaryObject()
+    resources = page["/Resources"].get_object()
+    if "/XObject" not in resources:
+        resources[NameObject("/XObject")] = DictionaryObject()
+    xobjects = resources["/XObject"].get_object()
+
+    kept = ArrayObject()
+    operations: list[str] = []
+    flattened = 0
+    widgets_left = 0
+
+    for annot_ref in annots_ref.get_object():
+        annot = annot_ref.get_object()
+        subtype = annot.get("/Subtype")
+        is_widget = subtype == "/Widget"
+
+        if (is_widget and not forms) or (not is_widget and not annotations):
+            kept.append(annot_ref)
+            widgets_left += is_widget
+            continue
+        if subtype in SKIP_SUBTYPES:
+            kept.append(annot_ref)
+            continue
+
+        if int(annot.get("/F", 0)) & HIDDEN_FLAGS:
+            # Hidden annotations are dropped without drawing anything
+            flattened += 1
+            if is_widget and removed_widgets is not None:
+                removed_widgets.add(getattr(annot_ref, "idnum", -1))
+            continue
+
+        stream = _appearance_stream(annot)
+        matrix = _placement_matrix(annot, stream) if stream is not None else None
+        if stream is None or matrix is None:
+            if is_widget:
+                # Set read-only flag; keep existing bits if present
+                current_flags = annot.get("/Ff", 0)
+                annot[NameObject("/Ff")] = NumberObject(int(current_flags) | 1)
+                widgets_left += 1
+            kept.append(annot_ref)
+            continue
+
+        stream[NameObject("/Type")] = NameObject("/XObject")
+        stream[NameObject("/Subtype")] = NameObject("/Form")
+        if is_widget:
+            if default_resources:
+                _merge_resources(stream, default_resources)
+            if removed_widgets is not None:
+                removed_widgets.add(getattr(annot_ref, "idnum", -1))
+        if stream.indirect_reference is None:
+            stream_ref = writer._add_object(stream)
+        else:
+            stream_ref = stream.indirect_reference
+
+        index = len(xobjects)
+        while f"/Flat{index}" in xobjects:
+            index += 1
+        name = f"/Flat{index}"
+        xobjects[NameObject(name)] = stream_ref
+
+        cm = " ".join(f"{v:.6g}" for v in matrix)
+        operations.append(f"q {cm} cm {name} Do Q")
+        flattened += 1
+
+    if operations:
+        wrap_contents(writer, page, operations)
+
+    if kept:
+        page[NameObject("/Annots")] = kept
+    else:
+        del page["/Annots"]
+
+    return flattened, widgets_left
+
+
+def flatten_writer(writer: PdfWriter, forms: bool = True, annotations: bool = False) -> int:
+    """
+    Flatten every page of a writer and drop the form once no widgets remain.
+
+    Returns:
+        Number of annotations flattened
+    """
+    acroform = writer._root_object.get("/AcroForm")
+    acroform = acroform.get_object() if acroform is not None else None
+    default_resources = acroform.get("/DR") if acroform is not None else None
+    if default_resources is not None:
+        default_resources = default_resources.get_object()
+
+    flattened = 0
+    widgets_left = 0
+    removed: set[int] = set()
+    for page in writer.pages:
+        page_flattened, page_widgets = flatten_page(
+            writer, page, forms, annotations, default_resources, removed
+        )
+        flattened += page_flattened
+        widgets_left += page_widgets
+
+    if forms and acroform is not None:
+        if widgets_left == 0:
+            del writer._root_object["/AcroForm"]
+        elif removed and "/Fields" in acroform:
+            # The form stays for the widgets left; it must not list burned ones
+            _prune_fields(acroform["/Fields"].get_object(), removed)
+
+    return flattened
 
 
 @register_operation("flatten")
@@ -27,41 +286,11 @@ class FlattenOperation(BasePDFOperation):
 
     def _execute(self, input_path: Path, output_path: Path, **kwargs: Any) -> None:
         flatten_forms: bool = kwargs.get("forms", True)
+        flatten_annotations: bool = kwargs.get("annotations", False)
 
         reader = PdfReader(input_path)
-        writer = PdfWriter()
-
-        for page in reader.pages:
-            writer.add_page(page)
-
-        # Flatten form fields if present
-        root = reader.trailer.get("/Root")
-        if flatten_forms and root and "/AcroForm" in root:
-            # Reset form fields to make them non-editable
-            for page_num in range(len(writer.pages)):
-                page = writer.pages[page_num]
-                if "/Annots" in page:
-                    annotations = page["/Annots"]
-                    if annotations:
-                        annot_array = (
-                            annotations.get_object()
-                            if hasattr(annotations, "get_object")
-                            else annotations
-                        )
-                        if hasattr(annot_array, "__iter__"):
-                            for annot in annot_array:  # type: ignore[union-attr]
-                                annot_obj = (
-                                    annot.get_object() if hasattr(annot, "get_object") else annot
-                                )
-                                if (
-                                    hasattr(annot_obj, "get")
-                                    and annot_obj.get("/Subtype") == "/Widget"
-                                ):
-                                    # Set read-only flag; keep existing bits if present
-                                    current_flags = annot_obj.get("/Ff", 0)
-                                    annot_obj[NameObject("/Ff")] = NumberObject(
-                                        int(current_flags) | 1
-                                    )  # type: ignore[index]
-
-        with open(output_path, "wb") as f:
-            writer.write(f)
+        writer = PdfWriter(clone_from=reader)
+
+        flatten_writer(writer, forms=flatten_forms, annotations=flatten_annotations)
+
+        write_pdf(writer, output_path, **kwargs)
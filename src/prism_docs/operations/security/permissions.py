@@ -7,6 +7,8 @@ from pypdf import PdfReader, PdfWriter
 from pypdf.constants import UserAccessPermissions
 
 from prism_docs.core import BasePDFOperation, register_operation
+from prism_docs.core.output import write_pdf
+from prism_docs.operations.basic.encrypt import encrypt_writer
 
 
 @register_operation("permissions")
@@ -38,16 +40,10 @@ class PermissionsOperation(BasePDFOperation):
         allow_extract: bool = kwargs.get("extract", True)
         allow_assemble: bool = kwargs.get("assemble", False)
         print_quality: str = kwargs.get("print_quality", "high")  # high or low
+        algorithm: str = kwargs.get("algorithm", "RC4-128")
 
         reader = PdfReader(input_path)
-        writer = PdfWriter()
-
-        for page in reader.pages:
-            writer.add_page(page)
-
-        # Copy metadata
-        if reader.metadata:
-            writer.add_metadata(reader.metadata)
+        writer = PdfWriter(clone_from=reader)
 
         # Build permissions
         permissions = UserAccessPermissions.all()
@@ -81,11 +77,12 @@ class PermissionsOperation(BasePDFOperation):
                 permissions &= ~doc_assembly
 
         # Encrypt with permissions
-        writer.encrypt(
+        encrypt_writer(
+            writer,
             user_password=user_password,
             owner_password=owner_password or user_password or "owner",
-            permissions_flag=permissions,
+            algorithm=algorithm,
+            permissions=permissions,
         )
 
-        with open(output_path, "wb") as f:
-            writer.write(f)
+        write_pdf(writer, output_path, **kwargs)
@@ -1,11 +1,258 @@
 """Redact content from PDF."""
 
+import re
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from typing import Any
 
-from pypdf import PdfReader, PdfWriter
+from pypdf import PageObject, PdfReader, PdfWriter
 
-from prism_docs.core import BasePDFOperation, register_operation
+from prism_docs.core import BasePDFOperation, PageSelection, register_operation
+from prism_docs.core.output import write_pdf
+from prism_docs.core.raster import get_rasterizer
+
+# Built-in patterns for common sensitive data
+PATTERN_PRESETS = {
+    "ssn": r"\b\d{3}-\d{2}-\d{4}\b",
+    "email": r"\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}\b",
+    "phone": r"(?:\+?1[ .-]?)?\(?\b\d{3}\)?[ .-]?\d{3}[ .-]?\d{4}\b",
+    "credit-card": r"\b(?:\d[ -]?){13,16}\b",
+    "iban": r"\b[A-Z]{2}\d{2}(?: ?[A-Z0-9]{4}){2,7}(?: ?[A-Z0-9]{1,4})?\b",
+    "account": r"\b\d{8,17}\b",
+}
+
+# Default glyph advance (fraction of the font size) when the font has no widths
+DEFAULT_CHAR_WIDTH = 0.5
+
+# Pages per worker task when locating matches in parallel
+PAGE_CHUNK_SIZE = 16
+
+
+def compile_matcher(
+    patterns: list[str] | None = None,
+    terms: list[str] | None = None,
+    presets: list[str] | None = None,
+    ignore_case: bool = False,
+) -> re.Pattern[str] | None:
+    """
+    Compile regex patterns, literal terms and presets into a single matcher.
+
+    All alternatives are joined into one expression so each page is scanned
+    once, regardless of how many patterns are requested.
+    """
+    alternatives: list[str] = []
+
+    for preset in presets or []:
+        if preset not in PATTERN_PRESETS:
+            raise ValueError(
+                f"Unknown redaction preset '{preset}'. "
+                f"Choose from: {', '.join(sorted(PATTERN_PRESETS))}"
+            )
+        alternatives.append(PATTERN_PRESETS[preset])
+
+    alternatives.extend(p for p in patterns or [] if p)
+
+    # Longest terms first so overlapping terms redact the widest match
+    literal_terms = sorted({t for t in terms or [] if t}, key=len, reverse=True)
+    if literal_terms:
+        alternatives.append("|".join(re.escape(t) for t in literal_terms))
+
+    if not alternatives:
+        return None
+
+    flags = re.IGNORECASE if ignore_case else 0
+    return re.compile("|".join(f"(?:{alt})" for alt in alternatives), flags)
+
+
+def _char_widths(text: str, font: Any, font_size: float) -> list[float]:
+    """Estimate per-character advances (in text space) from the font's /Widths."""
+    default = font_size * DEFAULT_CHAR_WIDTH
+    if not font or "/Widths" not in font:
+        return [default] * len(text)
+
+    try:
+        widths = font["/Widths"].get_object()
+        first_char = int(font.get("/FirstChar", 0))
+    except Exception:
+        return [default] * len(text)
+
+    result = []
+    for char in text:
+        index = ord(char) - first_char
+        if 0 <= index < len(widths):
+            result.append(float(widths[index]) * font_size / 1000)
+        else:
+            result.append(default)
+    return result
+
+
+def _text_runs(page: PageObject) -> list[dict]:
+    """
+    Collect positioned text runs from a page's content stream.
+
+    Each run holds its text, baseline origin, font height and per-character
+    advances, all in default user space (points).
+    """
+    runs: list[dict] = []
+
+    def visitor(text: str, cm: list, tm: list, font: Any, font_size: float) -> None:
+        if not text or not text.strip():
+            return
+
+        # Combine text matrix with CTM: origin and scale in user space
+        a = tm[0] * cm[0] + tm[1] * cm[2]
+        d = tm[2] * cm[1] + tm[3] * cm[3]
+        x = tm[4] * cm[0] + tm[5] * cm[2] + cm[4]
+        y = tm[4] * cm[1] + tm[5] * cm[3] + cm[5]
+        scale_x = abs(a) or 1.0
+        height = abs(font_size * (d or 1.0))
+
+        widths = [w * scale_x for w in _char_widths(text, font, font_size or 1.0)]
+        runs.append({"text": text, "x": x, "y": y, "height": height, "widths": widths})
+
+    page.extract_text(visitor_text=visitor)
+    return runs
+
+
+def _ocr_runs(input_path: Path, page_num: int, page: PageObject, **kwargs: Any) -> list[dict]:
+    """Build text runs from OCR word boxes for pages without a text layer."""
+    try:
+        from prism_docs.operations.ocr.engine import get_ocr_engine
+        from prism_docs.operations.ocr.ocr_data import page_items_from_data
+        from prism_docs.operations.ocr.resolution import render_for_ocr
+        from prism_docs.operations.ocr.text_layer import page_transform
+    except ImportError:
+        raise ImportError(
+            "OCR fallback requires the 'ocr' extra. Install with: uv sync --extra ocr"
+        )
+
+    dpi: int | str = kwargs.get("dpi", 300)
+    lang: str = kwargs.get("lang", "eng")
+    min_confidence: int = kwargs.get("min_confidence", 0)
+
+    rasterizer = get_rasterizer(kwargs.get("rasterizer"))
+    rendered = render_for_ocr(rasterizer, input_path, [page_num], dpi)
+    image = next(rendered, (None, None))[1]
+    if image is None:
+        return []
+
+    data = get_ocr_engine(kwargs.get("ocr_engine")).image_to_data(
+        image, lang=lang, config="--psm 3 --oem 3"
+    )
+    items = page_items_from_data(data, target_level=5, min_confidence=min_confidence)
+
+    # Runs are laid out in displayed points with y up (the negated distance
+    # from the top), and their boxes are mapped to user space when matched,
+    # so the page box the image covers and /Rotate are honoured
+    to_user, scale_x, scale_y, _ = page_transform(image.size, page, rasterizer.page_box)
+
+    def transform(x: float, y: float) -> tuple[float, float]:
+        return to_user(x, -y)
+
+    runs = []
+    for item in items:
+        box = item["bbox"]
+        text = item["text"]
+        width = box["width"] * scale_x
+        runs.append(
+            {
+                "text": text,
+                "x": box["x"] * scale_x,
+                "y": -(box["y"] + box["height"]) * scale_y,
+                "height": box["height"] * scale_y,
+                "widths": [width / len(text)] * len(text),
+                "line": (item["block_num"], item["line_num"]),
+                "transform": transform,
+            }
+        )
+    return runs
+
+
+def _match_regions(
+    runs: list[dict], matcher: re.Pattern[str], page_num: int, padding: float
+) -> list[dict]:
+    """Run the matcher over a page's runs and return rectangles for every match."""
+    if not runs:
+        return []
+
+    # Join runs into one string, remembering which run each character came from
+    parts: list[str] = []
+    owners: list[tuple[int, int]] = []
+    for run_idx, run in enumerate(runs):
+        if run_idx > 0:
+            prev = runs[run_idx - 1]
+            same_line = (
+                prev.get("line") == run.get("line")
+                if "line" in run
+                else abs(prev["y"] - run["y"]) < max(prev["height"], 1.0) / 2
+            )
+            parts.append(" " if same_line else "\n")
+            owners.append((-1, -1))
+        parts.append(run["text"])
+        owners.extend((run_idx, char_idx) for char_idx in range(len(run["text"])))
+
+    page_text = "".join(parts)
+    regions = []
+
+    for match in matcher.finditer(page_text):
+        # Group matched characters per run so matches spanning runs get one box each
+        spans: dict[int, list[int]] = {}
+        for pos in range(match.start(), match.end()):
+            run_idx, char_idx = owners[pos]
+            if run_idx >= 0:
+                spans.setdefault(run_idx, []).append(char_idx)
+
+        for run_idx, chars in spans.items():
+            run = runs[run_idx]
+            offsets = run["widths"]
+            x1 = run["x"] + sum(offsets[: chars[0]])
+            x2 = run["x"] + sum(offsets[: chars[-1] + 1])
+            # Cover descenders below the baseline and ascenders above it
+            y1 = run["y"] - run["height"] * 0.25
+            y2 = run["y"] + run["height"]
+            if "transform" in run:
+                corners = [run["transform"](x1, y1), run["transform"](x2, y2)]
+                (x1, x2), (y1, y2) = (sorted(axis) for axis in zip(*corners, strict=True))
+            regions.append(
+                {
+                    "page": page_num,
+                    "x1": x1 - padding,
+                    "y1": y1 - padding,
+                    "x2": x2 + padding,
+                    "y2": y2 + padding,
+                    "match": match.group(0),
+                }
+            )
+
+    return regions
+
+
+def find_text_regions(
+    input_path: Path,
+    page_numbers: list[int],
+    matcher: re.Pattern[str],
+    **kwargs: Any,
+) -> list[dict]:
+    """
+    Locate matches on the given pages (1-indexed) and return redaction regions.
+
+    Pages without a text layer fall back to OCR word boxes when
+    ``ocr_fallback`` is enabled.
+    """
+    ocr_fallback: bool = kwargs.get("ocr_fallback", False)
+    padding: float = kwargs.get("padding", 1.0)
+
+    reader = PdfReader(input_path)
+    regions: list[dict] = []
+
+    for page_num in page_numbers:
+        page = reader.pages[page_num - 1]
+        runs = _text_runs(page)
+        if not runs and ocr_fallback:
+            runs = _ocr_runs(input_path, page_num, page, **kwargs)
+        regions.extend(_match_regions(runs, matcher, page_num, padding))
+
+    return regions
 
 
 @register_operation("redact")
@@ -28,25 +275,49 @@ class RedactOperation(BasePDFOperation):
         """
         Add redaction annotations.
 
+        Regions come from fixed coordinates (``regions``) and/or from text
+        matches (``text_pattern``, ``patterns``, ``terms``, ``presets``).
+
         Note: For full redaction (removing underlying text), you need to
         use the 'apply' mode which requires additional processing.
         """
-        regions: list[dict] = kwargs.get("regions", [])
-        pages: list[int] | None = kwargs.get("pages")
+        regions: list[dict] = list(kwargs.get("regions", []))
         color: tuple = kwargs.get("color", (0, 0, 0))  # Black
 
         reader = PdfReader(input_path)
+        pages = PageSelection.coerce(kwargs.get("pages"), len(reader.pages))
         writer = PdfWriter()
 
-        for i, page in enumerate(reader.pages):
+        for page in reader.pages:
             writer.add_page(page)
 
+        patterns = list(kwargs.get("patterns", []))
+        if kwargs.get("text_pattern"):
+            patterns.append(kwargs["text_pattern"])
+
+        matcher = compile_matcher(
+            patterns=patterns,
+            terms=kwargs.get("terms"),
+            presets=kwargs.get("presets"),
+            ignore_case=kwargs.get("ignore_case", False),
+        )
+
+        if matcher is not None:
+            search_pages = [
+                n for n in range(1, len(reader.pages) + 1) if pages is None or n in pages
+            ]
+            regions.extend(self._search(input_path, search_pages, matcher, **kwargs))
+
+        for i in range(len(writer.pages)):
             # Apply redactions to specified pages or all pages
             if pages is not None and (i + 1) not in pages:
                 continue
 
             # Add redaction annotations for each region
             for region in regions:
+                if "page" in region and region["page"] != i + 1:
+                    continue
+
                 x1 = region.get("x1", 0)
                 y1 = region.get("y1", 0)
                 x2 = region.get("x2", 100)
@@ -64,5 +335,45 @@ class RedactOperation(BasePDFOperation):
                     },
                 )
 
-        with open(output_path, "wb") as f:
-            writer.write(f)
+        write_pdf(writer, output_path, **kwargs)
+
+    def _search(
+        self,
+        input_path: Path,
+        page_numbers: list[int],
+        matcher: re.Pattern[str],
+        **kwargs: Any,
+    ) -> list[dict]:
+        """Locate text matches, spreading page chunks over worker processes."""
+        workers: int = kwargs.get("workers", 1)
+        search_kwargs = {
+            key: kwargs[key]
+            for key in (
+                "ocr_fallback",
+                "padding",
+                "dpi",
+                "lang",
+                "min_confidence",
+                "rasterizer",
+                "ocr_engine",
+            )
+            if key in kwargs
+        }
+
+        if workers <= 1 or len(page_numbers) <= PAGE_CHUNK_SIZE:
+            return find_text_regions(input_path, page_numbers, matcher, **search_kwargs)
+
+        chunks = [
+            page_numbers[i : i + PAGE_CHUNK_SIZE]
+            for i in range(0, len(page_numbers), PAGE_CHUNK_SIZE)
+        ]
+        regions: list[dict] = []
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = [
+                executor.submit(find_text_regions, input_path, chunk, matcher, **search_kwargs)
+                for chunk in chunks
+            ]
+            for future in futures:
+                regions.extend(future.result())
+
+        return regions
@@ -1,8 +1,9 @@
-"""Utility PDF operations (info, validate, crop, resize, bookmarks)."""
+"""Utility PDF operations (info, validate, inventory, crop, resize, bookmarks)."""
 
 from prism_docs.operations.utils.bookmarks import BookmarksOperation
 from prism_docs.operations.utils.crop import CropOperation
 from prism_docs.operations.utils.info import InfoOperation
+from prism_docs.operations.utils.inventory import InventoryOperation
 from prism_docs.operations.utils.resize import ResizeOperation
 from prism_docs.operations.utils.validate import ValidateOperation
 
@@ -10,6 +11,7 @@ __all__ = [
     "BookmarksOperation",
     "CropOperation",
     "InfoOperation",
+    "InventoryOperation",
     "ResizeOperation",
     "ValidateOperation",
 ]
@@ -4,8 +4,12 @@ from pathlib import Path
 from typing import Any
 
 from pypdf import PdfReader, PdfWriter
+from pypdf.generic import ArrayObject, DictionaryObject, NameObject, NumberObject, TextStringObject
 
 from prism_docs.core import BasePDFOperation, OperationResult, OutputConfig, register_operation
+from prism_docs.core.incremental import IncrementalWriter
+from prism_docs.core.output import write_pdf, write_text
+from prism_docs.core.pages import iter_pages, page_count
 
 
 @register_operation("bookmarks")
@@ -58,7 +62,6 @@ class BookmarksOperation(BasePDFOperation):
 
     def _execute(self, input_path: Path, output_path: Path, **kwargs: Any) -> None:
         """Not used - see execute override."""
-        pass
 
     def _view_bookmarks(self, input_path: Path, **kwargs: Any) -> OperationResult:
         """View existing bookmarks."""
@@ -120,8 +123,7 @@ class BookmarksOperation(BasePDFOperation):
         lines: list[str] = []
         self._extract_outline(outline, lines, level=0, reader=reader)
 
-        with open(output_path, "w", encoding="utf-8") as f:
-            f.write("\n".join(lines))
+        write_text("\n".join(lines), output_path, **kwargs)
 
         return OperationResult(
             success=True,
@@ -176,12 +178,28 @@ class BookmarksOperation(BasePDFOperation):
                 message="No bookmarks provided",
             )
 
+        in_place: bool = kwargs.get("in_place", False)
         output_path = kwargs.get("output_path")
-        if output_path is None:
+        if in_place:
+            output_path = input_path
+        elif output_path is None:
             output_path = output_config.resolve_output_path(input_path, self.default_suffix)
         else:
             output_path = Path(output_path)
 
+        if kwargs.get("incremental", False) or in_place:
+            if kwargs.get("linearize", False):
+                raise ValueError("An incremental update cannot be linearized")
+            with IncrementalWriter(input_path) as writer:
+                added = self._append_outline_items(writer, bookmarks)
+                writer.write(output_path, fsync=kwargs.get("fsync", False))
+            return OperationResult(
+                success=True,
+                input_path=input_path,
+                output_path=output_path,
+                message=f"Added {added} bookmarks to '{output_path}'",
+            )
+
         reader = PdfReader(input_path)
         writer = PdfWriter()
 
@@ -196,8 +214,7 @@ class BookmarksOperation(BasePDFOperation):
             if 0 <= page < len(writer.pages):
                 writer.add_outline_item(title, page)
 
-        with open(output_path, "wb") as f:
-            writer.write(f)
+        write_pdf(writer, output_path, **kwargs)
 
         return OperationResult(
             success=True,
@@ -206,6 +223,63 @@ class BookmarksOperation(BasePDFOperation):
             message=f"Added {len(bookmarks)} bookmarks to '{output_path}'",
         )
 
+    def _append_outline_items(self, writer: IncrementalWriter, bookmarks: list[dict]) -> int:
+        """
+        Append top-level outline items as an incremental update.
+
+        Only the outline root, its current last item, the new items and (when
+        the document had no outline) the catalog are written; pages are
+        looked up through the page tree without loading the rest.
+        """
+        wanted = [bookmark.get("page", 1) for bookmark in bookmarks]
+        count = page_count(writer.reader)
+        pages = {
+            number: page.indirect_reference
+            for number, page in iter_pages(writer.reader, [p for p in wanted if p <= count])
+        }
+
+        root = writer.root
+        if "/Outlines" in root:
+            outlines = root["/Outlines"].get_object()
+            outlines_ref = outlines.indirect_reference
+            writer.update(outlines)
+        else:
+            outlines = DictionaryObject({NameObject("/Type"): NameObject("/Outlines")})
+            outlines_ref = writer.add_object(outlines)
+            root[NameObject("/Outlines")] = outlines_ref
+            writer.update(root)
+
+        last_ref = outlines.get("/Last")
+        last = last_ref.get_object() if last_ref is not None else None
+        added = 0
+        for bookmark in bookmarks:
+            page_ref = pages.get(bookmark.get("page", 1))
+            if page_ref is None:
+                continue
+
+            item = DictionaryObject(
+                {
+                    NameObject("/Title"): TextStringObject(bookmark.get("title", "Bookmark")),
+                    NameObject("/Parent"): outlines_ref,
+                    NameObject("/Dest"): ArrayObject([page_ref, NameObject("/Fit")]),
+                }
+            )
+            item_ref = writer.add_object(item)
+            if last is None:
+                outlines[NameObject("/First")] = item_ref
+            else:
+                item[NameObject("/Prev")] = last_ref
+                last[NameObject("/Next")] = item_ref
+                if added == 0:
+                    writer.update(last)  # the previous last item, read from the file
+            last_ref, last = item_ref, item
+            added += 1
+
+        if last_ref is not None:
+            outlines[NameObject("/Last")] = last_ref
+        outlines[NameObject("/Count")] = NumberObject(int(outlines.get("/Count", 0)) + added)
+        return added
+
     def _load_bookmarks_from_file(self, path: Path) -> list[dict]:
         """Load bookmarks from a text file (format: title|page)."""
         bookmarks = []
@@ -5,7 +5,8 @@ from typing import Any
 
 from pypdf import PdfReader, PdfWriter
 
-from prism_docs.core import BasePDFOperation, register_operation
+from prism_docs.core import BasePDFOperation, PageSelection, register_operation
+from prism_docs.core.output import write_pdf
 
 
 @register_operation("crop")
@@ -39,9 +40,8 @@ class CropOperation(BasePDFOperation):
         # Or use percentage
         percent: float | None = kwargs.get("percent")
 
-        pages: list[int] | None = kwargs.get("pages")
-
         reader = PdfReader(input_path)
+        pages = PageSelection.coerce(kwargs.get("pages"), len(reader.pages))
         writer = PdfWriter()
 
         for i, page in enumerate(reader.pages):
@@ -75,5 +75,4 @@ class CropOperation(BasePDFOperation):
 
             writer.add_page(page)
 
-        with open(output_path, "wb") as f:
-            writer.write(f)
+        write_pdf(writer, output_path, **kwargs)
@@ -4,14 +4,23 @@ from pathlib import Path
 from typing import Any
 
 from pypdf import PdfReader
+from pypdf.errors import PdfReadError
 
 from prism_docs.core import BasePDFOperation, OperationResult, OutputConfig, register_operation
+from prism_docs.core.config import StorageConfig
+from prism_docs.core.pages import iter_pages, page_count
+from prism_docs.core.scanner import scan_many, scan_pdf, write_jsonl
+from prism_docs.core.storage import open_input, parse_location, url_name
+
+METADATA_KEYS = ["title", "author", "subject", "creator", "producer", "created", "modified"]
 
 
 @register_operation("info")
 class InfoOperation(BasePDFOperation):
     """Show PDF information and metadata."""
 
+    reads_urls = True
+
     @property
     def name(self) -> str:
         return "info"
@@ -30,22 +39,41 @@ class InfoOperation(BasePDFOperation):
         output_config: OutputConfig,
         **kwargs: Any,
     ) -> OperationResult:
-        """Override to return info without creating output file."""
-        input_path = Path(input_path)
+        """
+        Override to return info without creating output file.
+
+        Args:
+            input_path: PDF file, or a directory to scan recursively. An
+                http(s):// or s3:// URL is read with ranged requests (``fast``
+                does not apply)
+            output_config: Output configuration (unused)
+            verbose: Include metadata in the text report
+            json: Report as JSON
+            fast: Read only the header, trailer and xref instead of parsing the document
+            storage: StorageConfig for URL inputs
+            jsonl: Stream one JSON line per file to this path ("-" for stdout);
+                implied (to stdout) when the input is a directory
+            inputs: All files and directories to scan into the JSONL stream
+            workers: Worker processes for JSONL scans (default: 1)
+        """
+        input_path = parse_location(input_path)
 
         try:
+            if isinstance(input_path, Path) and (kwargs.get("jsonl") or input_path.is_dir()):
+                return self._scan_corpus(input_path, **kwargs)
+
             info = self._get_info(input_path, **kwargs)
 
             return OperationResult(
                 success=True,
-                input_path=input_path,
+                input_path=input_path,  # type: ignore[arg-type]
                 message=info,
             )
 
         except Exception as e:
             return OperationResult(
                 success=False,
-                input_path=input_path,
+                input_path=input_path,  # type: ignore[arg-type]
                 message=f"Failed to read PDF info: {e}",
                 error=e,
             )
@@ -54,40 +82,81 @@ class InfoOperation(BasePDFOperation):
         """Not used - see execute override."""
         pass
 
-    def _get_info(self, input_path: Path, **kwargs: Any) -> str:
+    def _scan_corpus(self, input_path: Path, **kwargs: Any) -> OperationResult:
+        """Scan many files with the fast scanner and stream JSONL records."""
+        target = kwargs.get("jsonl") or "-"
+        results = scan_many(kwargs.get("inputs") or [input_path], workers=kwargs.get("workers", 1))
+        scanned, failed = write_jsonl(results, target)
+        return OperationResult(
+            success=True,
+            input_path=input_path,
+            output_path=None if target == "-" else Path(target),
+            message=f"Scanned {scanned} files ({failed} with issues)",
+        )
+
+    def _get_info(self, input_path: Path | str, **kwargs: Any) -> str:
         verbose: bool = kwargs.get("verbose", False)
         json_output: bool = kwargs.get("json", False)
+        fast: bool = kwargs.get("fast", False)
+
+        if isinstance(input_path, str):
+            info = self._read_remote_info(input_path, kwargs.get("storage"))
+            name = url_name(input_path)
+        else:
+            info = self._scan_info(input_path) if fast else self._read_info(input_path)
+            name = input_path.name
+
+        if json_output:
+            import json
+
+            return json.dumps(info, indent=2, default=str)
+
+        # Format as text
+        lines = [f"PDF Info: {name}"]
+        lines.append("-" * 40)
+        lines.append(f"  Pages: {info['pages']}")
+        lines.append(f"  Size: {info['size']}")
+        if "page_size" in info:
+            lines.append(f"  Page Size: {info['page_size']}")
+        lines.append(f"  Encrypted: {info['encrypted']}")
 
-        reader = PdfReader(input_path)
+        if verbose and any(info.get(key) for key in METADATA_KEYS):
+            lines.append("")
+            lines.append("Metadata:")
+            for key in METADATA_KEYS:
+                if key in info and info[key]:
+                    lines.append(f"  {key.title()}: {info[key]}")
+
+        return "\n".join(lines)
 
+    def _read_info(self, input_path: Path) -> dict[str, Any]:
+        """Collect info with a full reader."""
+        return self._reader_info(PdfReader(input_path), str(input_path), input_path.stat().st_size)
+
+    def _read_remote_info(self, url: str, storage: StorageConfig | None) -> dict[str, Any]:
+        """Collect info over ranged reads: the reader fetches only the objects it resolves."""
+        with open_input(url, storage) as f:
+            size = f.raw.size  # type: ignore[attr-defined]
+            try:
+                # A lenient reader seeks to every object to check the xref offsets
+                return self._reader_info(PdfReader(f, strict=True), url, size)
+            except PdfReadError:
+                f.seek(0)
+                return self._reader_info(PdfReader(f), url, size)
+
+    def _reader_info(self, reader: PdfReader, file: str, size: int) -> dict[str, Any]:
         # Basic info
-        info = {
-            "file": str(input_path),
-            "pages": len(reader.pages),
+        info: dict[str, Any] = {
+            "file": file,
+            "pages": page_count(reader),
             "encrypted": reader.is_encrypted,
+            "size": _format_size(size),
         }
 
-        # File size
-        file_size = input_path.stat().st_size
-        if file_size < 1024:
-            info["size"] = f"{file_size} B"
-        elif file_size < 1024 * 1024:
-            info["size"] = f"{file_size / 1024:.1f} KB"
-        else:
-            info["size"] = f"{file_size / (1024 * 1024):.1f} MB"
-
         # Page dimensions (from first page)
-        if reader.pages:
-            page = reader.pages[0]
+        for _, page in iter_pages(reader, [1]):
             media_box = page.mediabox
-            width_pt = float(media_box.width)
-            height_pt = float(media_box.height)
-            # Convert to inches
-            width_in = width_pt / 72
-            height_in = height_pt / 72
-            info["page_size"] = (
-                f"{width_pt:.0f} x {height_pt:.0f} pt ({width_in:.1f} x {height_in:.1f} in)"
-            )
+            info["page_size"] = _format_page_size(float(media_box.width), float(media_box.height))
 
         # Metadata
         if reader.metadata:
@@ -106,25 +175,46 @@ class InfoOperation(BasePDFOperation):
         if hasattr(reader, "pdf_header"):
             info["version"] = reader.pdf_header
 
-        if json_output:
-            import json
+        return info
 
-            return json.dumps(info, indent=2, default=str)
+    def _scan_info(self, input_path: Path) -> dict[str, Any]:
+        """Collect info from the header, trailer and xref only (no full parse)."""
+        scan = scan_pdf(input_path)
+        if scan.pages is None:
+            raise ValueError("; ".join(scan.issues) or "Unable to read the page tree")
 
-        # Format as text
-        lines = [f"PDF Info: {input_path.name}"]
-        lines.append("-" * 40)
-        lines.append(f"  Pages: {info['pages']}")
-        lines.append(f"  Size: {info['size']}")
-        if "page_size" in info:
-            lines.append(f"  Page Size: {info['page_size']}")
-        lines.append(f"  Encrypted: {info['encrypted']}")
-
-        if verbose and reader.metadata:
-            lines.append("")
-            lines.append("Metadata:")
-            for key in ["title", "author", "subject", "creator", "producer", "created", "modified"]:
-                if key in info and info[key]:
-                    lines.append(f"  {key.title()}: {info[key]}")
-
-        return "\n".join(lines)
+        info: dict[str, Any] = {
+            "file": str(input_path),
+            "pages": scan.pages,
+            "encrypted": scan.encrypted,
+            "size": _format_size(scan.size),
+        }
+        if scan.page_size:
+            info["page_size"] = _format_page_size(*scan.page_size)
+
+        for key in ("title", "author", "subject", "creator", "producer"):
+            if key in scan.info:
+                info[key] = scan.info[key]
+        if "creationdate" in scan.info:
+            info["created"] = scan.info["creationdate"]
+        if "moddate" in scan.info:
+            info["modified"] = scan.info["moddate"]
+
+        if scan.version:
+            info["version"] = f"%PDF-{scan.version}"
+        return info
+
+
+def _format_size(file_size: int) -> str:
+    if file_size < 1024:
+        return f"{file_size} B"
+    elif file_size < 1024 * 1024:
+        return f"{file_size / 1024:.1f} KB"
+    return f"{file_size / (1024 * 1024):.1f} MB"
+
+
+def _format_page_size(width_pt: float, height_pt: float) -> str:
+    # Convert to inches
+    width_in = width_pt / 72
+    height_in = height_pt / 72
+    return f"{width_pt:.0f} x {height_pt:.0f} pt ({width_in:.1f} x {height_in:.1f} in)"
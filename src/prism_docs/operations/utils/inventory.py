@@ -0,0 +1,311 @@
+"""Corpus inventory: aggregate statistics over a directory tree of PDFs."""
+
+import json
+import re
+from collections import Counter
+from collections.abc import Iterable, Iterator
+from pathlib import Path
+from typing import Any
+
+from prism_docs.core import BasePDFOperation, OperationResult, OutputConfig, register_operation
+from prism_docs.core.output import atomic_output, write_text
+from prism_docs.core.scanner import ScanResult, scan_many, write_jsonl
+from prism_docs.operations.utils.resize import PAGE_SIZES
+
+# Upper bounds of the page count histogram buckets
+PAGE_BUCKETS = (1, 2, 5, 10, 20, 50, 100, 500, 1000)
+
+# Distinct producers/sizes kept before the rest are counted as "other"
+MAX_CATEGORIES = 500
+
+# Points of slack when matching a page size to a named size
+SIZE_TOLERANCE = 3
+
+# A trailing version number such as " 9.55.0", "-1.40.27" or " v2.1"
+_VERSION = re.compile(r"(?<=[\s/(\-_])v?\d[\w.\-]*\)?$", re.IGNORECASE)
+
+
+def producer_family(producer: str | None) -> str:
+    """Strip trailing version numbers so "pdfTeX-1.40.27" and "pdfTeX-1.40.25" count once."""
+    family = _VERSION.sub("", (producer or "").strip()).rstrip(" -_/(;,")
+    return family or "unknown"
+
+
+def page_size_name(size: list[float] | tuple[float, float] | None) -> str:
+    """Name a page size (either orientation), or round it to whole points."""
+    if not size:
+        return "unknown"
+    width, height = sorted(size)
+    for name, (named_width, named_height) in PAGE_SIZES.items():
+        if (
+            abs(width - named_width) <= SIZE_TOLERANCE
+            and abs(height - named_height) <= SIZE_TOLERANCE
+        ):
+            return name
+    return f"{width:.0f}x{height:.0f}"
+
+
+def _bucket(pages: int) -> str:
+    lower = 1
+    for upper in PAGE_BUCKETS:
+        if pages <= upper:
+            return str(upper) if lower == upper else f"{lower}-{upper}"
+        lower = upper + 1
+    return f"{lower}+"
+
+
+class InventoryStats:
+    """
+    Running corpus statistics, updated one record at a time.
+
+    Only counters are kept, so memory does not grow with the number of
+    files. Producers and unusual page sizes are capped at ``MAX_CATEGORIES``
+    distinct values each.
+    """
+
+    def __init__(self) -> None:
+        self.files = 0
+        self.invalid = 0
+        self.encrypted = 0
+        self.linearized = 0
+        self.scanned = 0
+        self.born_digital = 0
+        self.total_bytes = 0
+        self.image_bytes = 0
+        self.total_pages = 0
+        self.max_pages = 0
+        self.page_counts: Counter[str] = Counter()
+        self.producers: Counter[str] = Counter()
+        self.page_sizes: Counter[str] = Counter()
+        self.versions: Counter[str] = Counter()
+
+    @staticmethod
+    def _count(counter: Counter[str], key: str) -> None:
+        if key in counter or len(counter) < MAX_CATEGORIES:
+            counter[key] += 1
+        else:
+            counter["other"] += 1
+
+    def add(self, record: dict[str, Any]) -> None:
+        """Add one per-file record (a :meth:`ScanResult.to_dict` dictionary)."""
+        self.files += 1
+        self.total_bytes += record.get("size") or 0
+        if not record.get("valid", True):
+            self.invalid += 1
+        if record.get("encrypted"):
+            self.encrypted += 1
+        if record.get("linearized"):
+            self.linearized += 1
+
+        scanned = record.get("scanned")
+        if scanned is True:
+            self.scanned += 1
+        elif scanned is False:
+            self.born_digital += 1
+        self.image_bytes += record.get("image_bytes") or 0
+
+        pages = record.get("pages")
+        if isinstance(pages, int) and pages > 0:
+            self.total_pages += pages
+            self.max_pages = max(self.max_pages, pages)
+            self.page_counts[_bucket(pages)] += 1
+
+        self._count(self.producers, producer_family((record.get("info") or {}).get("producer")))
+        self._count(self.page_sizes, page_size_name(record.get("page_size")))
+        self.versions[record.get("version") or "unknown"] += 1
+
+    def to_dict(self) -> dict[str, Any]:
+        """Summary with counts, shares and distributions."""
+
+        def share(part: int, whole: int) -> float:
+            return round(part / whole, 4) if whole else 0.0
+
+        surveyed = self.scanned + self.born_digital
+        counted = sum(self.page_counts.values())
+        return {
+            "files": self.files,
+            "invalid": self.invalid,
+            "encrypted": self.encrypted,
+            "encrypted_share": share(self.encrypted, self.files),
+            "linearized": self.linearized,
+            "scanned": self.scanned,
+            "born_digital": self.born_digital,
+            "scanned_share": share(self.scanned, surveyed),
+            "total_bytes": self.total_bytes,
+            "image_bytes": self.image_bytes,
+            "image_bytes_share": share(self.image_bytes, self.total_bytes),
+            "pages": {
+                "total": self.total_pages,
+                "mean": round(self.total_pages / counted, 2) if counted else 0,
+                "max": self.max_pages,
+                "distribution": {
+                    bucket: self.page_counts[bucket]
+                    for bucket in [_bucket(upper) for upper in PAGE_BUCKETS] + [_bucket(10**9)]
+                    if bucket in self.page_counts
+                },
+            },
+            "producers": dict(self.producers.most_common()),
+            "page_sizes": dict(self.page_sizes.most_common()),
+            "versions": dict(sorted(self.versions.items())),
+        }
+
+
+def write_summary(summary: dict[str, Any], path: Path) -> None:
+    """
+    Write the summary as JSON, or as Parquet for a ``.parquet`` path.
+
+    Parquet output is a long table of ``(metric, key, value)`` rows, with
+    scalar metrics under an empty key, and needs pyarrow.
+    """
+    if path.suffix.lower() != ".parquet":
+        write_text(json.dumps(summary, indent=2), path)
+        return
+
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+    except ImportError:
+        raise ImportError(
+            "pyarrow is required for Parquet output. Install with: pip install pyarrow"
+        )
+
+    rows: list[tuple[str, str, float]] = []
+
+    def flatten(prefix: str, value: Any) -> None:
+        if isinstance(value, dict):
+            for key, item in value.items():
+                if isinstance(item, dict):
+                    flatten(f"{prefix}.{key}" if prefix else key, item)
+                elif prefix:
+                    rows.append((prefix, str(key), float(item)))
+                else:
+                    rows.append((key, "", float(item)))
+
+    flatten("", summary)
+    metric, key, value = zip(*rows) if rows else ((), (), ())
+    table = pa.table({"metric": list(metric), "key": list(key), "value": list(value)})
+    with atomic_output(path) as f:
+        pq.write_table(table, f)
+
+
+def completed_records(records_path: Path) -> int:
+    """
+    Count complete records in a per-file JSONL from an earlier run.
+
+    A torn last line (from an interrupted run) is cut off so appending
+    continues on a clean line.
+    """
+    if not records_path.exists():
+        return 0
+
+    count = 0
+    good_until = 0
+    with open(records_path, "rb+") as f:
+        for line in f:
+            if not line.endswith(b"\n"):
+                break
+            count += 1
+            good_until += len(line)
+        f.truncate(good_until)
+    return count
+
+
+@register_operation("inventory")
+class InventoryOperation(BasePDFOperation):
+    """Scan a corpus and report aggregated statistics."""
+
+    @property
+    def name(self) -> str:
+        return "inventory"
+
+    @property
+    def description(self) -> str:
+        return "Scan a directory tree and report corpus statistics"
+
+    @property
+    def default_suffix(self) -> str:
+        return "inventory"
+
+    def execute(
+        self,
+        input_path: Path,
+        output_config: OutputConfig,
+        **kwargs: Any,
+    ) -> OperationResult:
+        """
+        Override to scan many files into one summary and one per-file JSONL.
+
+        Args:
+            input_path: Directory (or file) to scan
+            output_config: Output configuration
+            inputs: All files and directories to scan (default: input_path)
+            output_path: Summary file, .json or .parquet
+            records: Per-file JSONL (default: summary path with .jsonl)
+            workers: Worker processes (default: 1)
+            deep: Also verify every object offset and stream length
+            resume: Continue an interrupted run from its per-file JSONL
+        """
+        input_path = Path(input_path)
+
+        try:
+            workers: int = kwargs.get("workers", 1)
+            deep: bool = kwargs.get("deep", False)
+            resume: bool = kwargs.get("resume", False)
+
+            summary_path = kwargs.get("output_path")
+            if summary_path is None:
+                output_dir = output_config.output_dir or input_path.parent
+                summary_path = output_dir / f"{input_path.stem or 'corpus'}_inventory.json"
+            summary_path = Path(summary_path)
+            records_path = Path(kwargs.get("records") or summary_path.with_suffix(".jsonl"))
+            summary_path.parent.mkdir(parents=True, exist_ok=True)
+
+            stats = InventoryStats()
+            done = completed_records(records_path) if resume else 0
+            if done:
+                # Rebuild the running totals from the finished records
+                with open(records_path, encoding="utf-8") as f:
+                    for line in f:
+                        stats.add(json.loads(line))
+
+            results = scan_many(
+                kwargs.get("inputs") or [input_path],
+                deep=deep,
+                workers=workers,
+                survey=True,
+                skip=done,
+            )
+            write_jsonl(_tally(results, stats), records_path, append=bool(done))
+
+            summary = stats.to_dict()
+            write_summary(summary, summary_path)
+
+            resumed = f", resumed after {done}" if done else ""
+            return OperationResult(
+                success=True,
+                input_path=input_path,
+                output_path=summary_path,
+                message=(
+                    f"Inventoried {summary['files']} files{resumed} "
+                    f"({summary['pages']['total']} pages, {summary['encrypted']} encrypted, "
+                    f"{summary['scanned']} scanned) -> '{summary_path}'"
+                ),
+            )
+
+        except Exception as e:
+            return OperationResult(
+                success=False,
+                input_path=input_path,
+                message=f"Inventory of '{input_path}' failed: {e}",
+                error=e,
+            )
+
+    def _execute(self, input_path: Path, output_path: Path, **kwargs: Any) -> None:
+        """Not used - see execute override."""
+
+
+def _tally(results: Iterable[ScanResult], stats: InventoryStats) -> Iterator[ScanResult]:
+    """Pass scan results through, adding each to the running statistics."""
+    for result in results:
+        stats.add(result.to_dict())
+        yield result
@@ -5,7 +5,8 @@ from typing import Any
 
 from pypdf import PageObject, PdfReader, PdfWriter, Transformation
 
-from prism_docs.core import BasePDFOperation, register_operation
+from prism_docs.core import BasePDFOperation, PageSelection, register_operation
+from prism_docs.core.output import write_pdf
 
 # Standard page sizes in points (72 points = 1 inch)
 PAGE_SIZES = {
@@ -40,7 +41,6 @@ class ResizeOperation(BasePDFOperation):
         height: float | None = kwargs.get("height")  # In points
         scale: float | None = kwargs.get("scale")  # Scale factor
         fit: str = kwargs.get("fit", "contain")  # contain, cover, stretch
-        pages: list[int] | None = kwargs.get("pages")
 
         # Determine target size
         target_width: float | None
@@ -56,6 +56,7 @@ class ResizeOperation(BasePDFOperation):
             target_width, target_height = PAGE_SIZES["A4"]
 
         reader = PdfReader(input_path)
+        pages = PageSelection.coerce(kwargs.get("pages"), len(reader.pages))
         writer = PdfWriter()
 
         for i, page in enumerate(reader.pages):
@@ -116,5 +117,4 @@ class ResizeOperation(BasePDFOperation):
                 # No resize needed
                 writer.add_page(page)
 
-        with open(output_path, "wb") as f:
-            writer.write(f)
+        write_pdf(writer, output_path, **kwargs)
@@ -7,6 +7,8 @@ from pypdf import PdfReader
 from pypdf.errors import PdfReadError
 
 from prism_docs.core import BasePDFOperation, OperationResult, OutputConfig, register_operation
+from prism_docs.core.repair import repair_pdf
+from prism_docs.core.scanner import scan_many, scan_pdf, write_jsonl
 
 
 @register_operation("validate")
@@ -31,11 +33,35 @@ class ValidateOperation(BasePDFOperation):
         output_config: OutputConfig,
         **kwargs: Any,
     ) -> OperationResult:
-        """Override to validate without creating output file."""
+        """
+        Override to validate without creating output file.
+
+        Args:
+            input_path: PDF file, or a directory to scan recursively
+            output_config: Output configuration (unused)
+            strict: Use pypdf's strict mode
+            fast: Check the header, xref and trailer instead of parsing the document
+            deep: Like fast, and also verify every object offset and stream length
+            jsonl: Stream one JSON line per file to this path ("-" for stdout);
+                implied (to stdout) when the input is a directory
+            inputs: All files and directories to scan into the JSONL stream
+            workers: Worker processes for JSONL scans (default: 1)
+            repair: Rebuild the cross-reference data of a damaged file into a
+                ``-repaired`` copy (implies deep)
+            output_path: Where to write the repaired file
+        """
         input_path = Path(input_path)
 
         try:
-            issues = self._validate(input_path, **kwargs)
+            if kwargs.get("jsonl") or input_path.is_dir():
+                return self._scan_corpus(input_path, **kwargs)
+
+            if kwargs.get("repair", False):
+                issues = scan_pdf(input_path, deep=True).issues
+                if issues:
+                    return self._repair(input_path, output_config, issues, **kwargs)
+            else:
+                issues = self._validate(input_path, **kwargs)
 
             if issues:
                 return OperationResult(
@@ -71,8 +97,50 @@ class ValidateOperation(BasePDFOperation):
         """Not used - see execute override."""
         pass
 
+    def _repair(
+        self, input_path: Path, output_config: OutputConfig, issues: list[str], **kwargs: Any
+    ) -> OperationResult:
+        """Write a repaired copy and check it again."""
+        output_path = Path(
+            kwargs.get("output_path") or output_config.resolve_output_path(input_path, "repaired")
+        )
+        report = repair_pdf(input_path, output_path, **kwargs)
+        remaining = scan_pdf(output_path, deep=True).issues
+
+        found = "\n".join(f"  - {i}" for i in issues)
+        message = f"Repaired '{input_path}' -> '{output_path}': {report.summary()}\n{found}"
+        if remaining:
+            message += "\nStill invalid after repair:\n" + "\n".join(f"  - {i}" for i in remaining)
+        return OperationResult(
+            success=not remaining,
+            input_path=input_path,
+            output_path=output_path,
+            message=message,
+        )
+
+    def _scan_corpus(self, input_path: Path, **kwargs: Any) -> OperationResult:
+        """Scan many files with the structural scanner and stream JSONL records."""
+        target = kwargs.get("jsonl") or "-"
+        results = scan_many(
+            kwargs.get("inputs") or [input_path],
+            deep=kwargs.get("deep", False),
+            workers=kwargs.get("workers", 1),
+        )
+        scanned, failed = write_jsonl(results, target)
+        return OperationResult(
+            success=failed == 0,
+            input_path=input_path,
+            output_path=None if target == "-" else Path(target),
+            message=f"Validated {scanned} files ({failed} with issues)",
+        )
+
     def _validate(self, input_path: Path, **kwargs: Any) -> list[str]:
         strict: bool = kwargs.get("strict", False)
+        deep: bool = kwargs.get("deep", False)
+
+        if deep or kwargs.get("fast", False):
+            return scan_pdf(input_path, deep=deep).issues
+
         issues = []
 
         # Try to read the PDF
@@ -17,3 +17,122 @@ def make_pdf(path: Path, pages: int = 1, metadata: dict | None = None) -> Path:
         writer.write(f)
 
     return path
+
+
+def make_text_pdf(path: Path, lines: list[str]) -> Path:
+    """Create a single-page PDF that draws each line with Helvetica 12pt."""
+    from pypdf.generic import DecodedStreamObject, DictionaryObject, NameObject
+
+    writer = PdfWriter()
+    page = writer.add_blank_page(width=300, height=300)
+
+    font = DictionaryObject(
+        {
+            NameObject("/Type"): NameObject("/Font"),
+            NameObject("/Subtype"): NameObject("/Type1"),
+            NameObject("/BaseFont"): NameObject("/Helvetica"),
+        }
+    )
+    page[NameObject("/Resources")] = DictionaryObject(
+        {NameObject("/Font"): DictionaryObject({NameObject("/F1"): writer._add_object(font)})}
+    )
+
+    ops = []
+    for i, line in enumerate(lines):
+        ops.append(f"BT /F1 12 Tf 20 {260 - i * 20} Td ({line}) Tj ET")
+    content = DecodedStreamObject()
+    content.set_data("\n".join(ops).encode("latin-1"))
+    page[NameObject("/Contents")] = writer._add_object(content)
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "wb") as f:
+        writer.write(f)
+
+    return path
+
+
+def make_form_pdf(path: Path) -> Path:
+    """Create a single-page form with a text field "name" and a checkbox "agree"."""
+    from pypdf.generic import (
+        ArrayObject,
+        DecodedStreamObject,
+        DictionaryObject,
+        NameObject,
+        NumberObject,
+        TextStringObject,
+    )
+
+    writer = PdfWriter()
+    page = writer.add_blank_page(width=300, height=300)
+
+    font = DictionaryObject(
+        {
+            NameObject("/Type"): NameObject("/Font"),
+            NameObject("/Subtype"): NameObject("/Type1"),
+            NameObject("/BaseFont"): NameObject("/Helvetica"),
+        }
+    )
+    font_ref = writer._add_object(font)
+
+    def state(data: bytes):
+        stream = DecodedStreamObject()
+        stream.set_data(data)
+        stream[NameObject("/Type")] = NameObject("/XObject")
+        stream[NameObject("/Subtype")] = NameObject("/Form")
+        stream[NameObject("/BBox")] = ArrayObject([NumberObject(v) for v in (0, 0, 10, 10)])
+        return writer._add_object(stream)
+
+    def rect(*values: int) -> ArrayObject:
+        return ArrayObject([NumberObject(v) for v in values])
+
+    text = DictionaryObject(
+        {
+            NameObject("/Type"): NameObject("/Annot"),
+            NameObject("/Subtype"): NameObject("/Widget"),
+            NameObject("/FT"): NameObject("/Tx"),
+            NameObject("/T"): TextStringObject("name"),
+            NameObject("/Rect"): rect(20, 250, 200, 270),
+            NameObject("/DA"): TextStringObject("/Helv 12 Tf 0 g"),
+            NameObject("/P"): page.indirect_reference,
+        }
+    )
+    checkbox = DictionaryObject(
+        {
+            NameObject("/Type"): NameObject("/Annot"),
+            NameObject("/Subtype"): NameObject("/Widget"),
+            NameObject("/FT"): NameObject("/Btn"),
+            NameObject("/T"): TextStringObject("agree"),
+            NameObject("/Rect"): rect(20, 220, 30, 230),
+            NameObject("/V"): NameObject("/Off"),
+            NameObject("/AS"): NameObject("/Off"),
+            NameObject("/AP"): DictionaryObject(
+                {
+                    NameObject("/N"): DictionaryObject(
+                        {
+                            NameObject("/Yes"): state(b"0 0 10 10 re f"),
+                            NameObject("/Off"): state(b""),
+                        }
+                    )
+                }
+            ),
+            NameObject("/P"): page.indirect_reference,
+        }
+    )
+
+    fields = ArrayObject([writer._add_object(text), writer._add_object(checkbox)])
+    page[NameObject("/Annots")] = fields
+    writer._root_object[NameObject("/AcroForm")] = DictionaryObject(
+        {
+            NameObject("/Fields"): ArrayObject(fields),
+            NameObject("/DR"): DictionaryObject(
+                {NameObject("/Font"): DictionaryObject({NameObject("/Helv"): font_ref})}
+            ),
+            NameObject("/DA"): TextStringObject("/Helv 0 Tf 0 g"),
+        }
+    )
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "wb") as f:
+        writer.write(f)
+
+    return path
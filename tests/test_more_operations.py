@@ -1,11 +1,25 @@
+import json
 from io import BytesIO
 from pathlib import Path
 
+import pytest
 from pypdf import PdfReader, PdfWriter
-from pypdf.generic import ArrayObject, DictionaryObject, NameObject, NumberObject
+from pypdf.generic import (
+    ArrayObject,
+    DecodedStreamObject,
+    DictionaryObject,
+    NameObject,
+    NumberObject,
+    TextStringObject,
+)
 
-from prism_docs.core.types import OutputConfig, OverwritePolicy
+from prism_docs.core.incremental import IncrementalWriter
+from prism_docs.core.raster import Rasterizer, page_runs
+from prism_docs.core.types import OperationResult, OutputConfig, OverwritePolicy
 from prism_docs.operations.basic.merge import MergeOperation
+from prism_docs.operations.basic.metadata import MetadataOperation
+from prism_docs.operations.forms.form_fill import FormFillOperation
+from prism_docs.operations.images.pdf_to_images import PdfToImagesOperation
 from prism_docs.operations.pages.extract_text import ExtractTextOperation
 from prism_docs.operations.pages.interleave import InterleaveOperation
 from prism_docs.operations.pages.overlay import OverlayOperation
@@ -14,7 +28,8 @@ from prism_docs.operations.security.flatten import FlattenOperation
 from prism_docs.operations.security.redact import RedactOperation
 from prism_docs.operations.utils.bookmarks import BookmarksOperation
 from prism_docs.operations.utils.info import InfoOperation
-from tests.helpers import make_pdf
+from prism_docs.operations.utils.inventory import InventoryOperation
+from tests.helpers import make_form_pdf, make_pdf, make_text_pdf
 
 
 def test_split_ranges(tmp_path: Path) -> None:
@@ -74,6 +89,37 @@ def test_redact_adds_annotations(tmp_path: Path) -> None:
     assert annots is not None
 
 
+def test_redact_finds_patterns_and_terms(tmp_path: Path) -> None:
+    src = make_text_pdf(
+        tmp_path / "pii.pdf",
+        ["SSN 123-45-6789 on file", "Contact jane@example.com", "Nothing here"],
+    )
+    result = RedactOperation().execute(
+        src,
+        OutputConfig(),
+        presets=["ssn"],
+        terms=["JANE@EXAMPLE.COM"],
+        ignore_case=True,
+    )
+    assert result.success
+    reader = PdfReader(result.output_path)
+    annots = [a.get_object() for a in reader.pages[0].get("/Annots")]
+    assert len(annots) == 2
+
+    # SSN line is drawn at y=260 starting at x=20 ("SSN " precedes the match)
+    x1, y1, x2, y2 = (float(v) for v in annots[0]["/Rect"])
+    assert 20 < x1 < x2 < 300
+    assert y1 < 260 < y2
+
+
+def test_redact_pattern_without_matches_adds_nothing(tmp_path: Path) -> None:
+    src = make_text_pdf(tmp_path / "clean.pdf", ["Nothing sensitive"])
+    result = RedactOperation().execute(src, OutputConfig(), text_pattern=r"\d{9}")
+    assert result.success
+    reader = PdfReader(result.output_path)
+    assert reader.pages[0].get("/Annots") is None
+
+
 def _pdf_with_form(path: Path) -> Path:
     writer = PdfWriter()
     page = writer.add_blank_page(width=200, height=200)
@@ -107,6 +153,174 @@ def test_flatten_sets_widget_readonly(tmp_path: Path) -> None:
     assert annot_obj.get("/Ff") == 1
 
 
+def _pdf_with_filled_widget(path: Path, unfilled: bool = False) -> Path:
+    """A form whose filled field draws with the form's /DR font; optionally one more, unfilled."""
+    writer = PdfWriter()
+    page = writer.add_blank_page(width=200, height=200)
+
+    appearance = DecodedStreamObject()
+    appearance.set_data(b"0 0 1 rg 0 0 50 20 re f BT /Helv 12 Tf 2 5 Td (Ada) Tj ET")
+    appearance.update(
+        {
+            NameObject("/Type"): NameObject("/XObject"),
+            NameObject("/Subtype"): NameObject("/Form"),
+            NameObject("/BBox"): ArrayObject([NumberObject(v) for v in (0, 0, 50, 20)]),
+        }
+    )
+    widget = DictionaryObject()
+    widget.update(
+        {
+            NameObject("/Type"): NameObject("/Annot"),
+            NameObject("/Subtype"): NameObject("/Widget"),
+            NameObject("/FT"): NameObject("/Tx"),
+            NameObject("/T"): TextStringObject("name"),
+            NameObject("/Rect"): ArrayObject([NumberObject(v) for v in (10, 10, 110, 50)]),
+            NameObject("/AP"): DictionaryObject({NameObject("/N"): writer._add_object(appearance)}),
+        }
+    )
+    widgets = [writer._add_object(widget)]
+    if unfilled:
+        blank = DictionaryObject(widget)
+        blank[NameObject("/T")] = TextStringObject("city")
+        del blank["/AP"]
+        widgets.append(writer._add_object(blank))
+    page[NameObject("/Annots")] = ArrayObject(widgets)
+    helvetica = DictionaryObject(
+        {
+            NameObject("/Type"): NameObject("/Font"),
+            NameObject("/Subtype"): NameObject("/Type1"),
+            NameObject("/BaseFont"): NameObject("/Helvetica"),
+        }
+    )
+    writer._root_object.update(
+        {
+            NameObject("/AcroForm"): DictionaryObject(
+                {
+                    NameObject("/Fields"): ArrayObject(widgets),
+                    NameObject("/DR"): DictionaryObject(
+                        {
+                            NameObject("/Font"): DictionaryObject(
+                                {NameObject("/Helv"): writer._add_object(helvetica)}
+                            )
+                        }
+                    ),
+                }
+            )
+        }
+    )
+
+    with open(path, "wb") as f:
+        writer.write(f)
+    return path
+
+
+def test_flatten_burns_appearance_into_content(tmp_path: Path) -> None:
+    src = _pdf_with_filled_widget(tmp_path / "filled.pdf")
+    result = FlattenOperation().execute(src, OutputConfig())
+    assert result.success
+
+    reader = PdfReader(result.output_path)
+    page = reader.pages[0]
+    assert page.get("/Annots") is None
+    assert "/AcroForm" not in reader.trailer["/Root"]
+
+    xobjects = page["/Resources"]["/XObject"]
+    assert len(xobjects) == 1
+    content = page.get_contents().get_data()
+    # 50x20 appearance box scaled 2x into the 100x40 rect at (10, 10)
+    assert b"2 0 0 2 10 10 cm" in content
+    assert b"Do" in content
+    # The appearance's font came from the form's /DR, which is gone
+    [flat] = xobjects.values()
+    assert flat.get_object()["/Resources"]["/Font"]["/Helv"]["/BaseFont"] == "/Helvetica"
+
+
+def test_flatten_keeps_only_unflattened_fields(tmp_path: Path) -> None:
+    src = _pdf_with_filled_widget(tmp_path / "partial.pdf", unfilled=True)
+    result = FlattenOperation().execute(src, OutputConfig())
+    assert result.success
+
+    reader = PdfReader(result.output_path)
+    # The widget without an appearance stays, and is the form's only field
+    assert len(reader.pages[0]["/Annots"]) == 1
+    assert list(reader.get_fields()) == ["city"]
+
+
+def test_form_fill_writes_one_pdf_per_record(tmp_path: Path) -> None:
+    template = make_form_pdf(tmp_path / "form.pdf")
+    data = tmp_path / "people.csv"
+    data.write_text("id,name,agree\na1,Ada,yes\nb2,Bob,no\n", encoding="utf-8")
+
+    result = FormFillOperation().execute(
+        template, OutputConfig(), data=data, output_path=tmp_path / "out", name_field="id"
+    )
+
+    assert result.success
+    ada = PdfReader(tmp_path / "out" / "a1.pdf").get_fields()
+    bob = PdfReader(tmp_path / "out" / "b2.pdf").get_fields()
+    assert ada["name"]["/V"] == "Ada"
+    assert ada["agree"]["/V"] == "/Yes"
+    assert bob["name"]["/V"] == "Bob"
+    assert bob["agree"]["/V"] == "/Off"
+
+
+def test_form_fill_resolves_duplicate_and_existing_names(tmp_path: Path) -> None:
+    template = make_form_pdf(tmp_path / "form.pdf")
+    data = tmp_path / "people.csv"
+    data.write_text("id,name\na1,Ada\na1,Bob\n", encoding="utf-8")
+    out = tmp_path / "out"
+
+    def fill(policy: OverwritePolicy) -> OperationResult:
+        return FormFillOperation().execute(
+            template, OutputConfig(overwrite=policy), data=data, output_path=out, name_field="id"
+        )
+
+    # Records named alike don't overwrite each other
+    assert fill(OverwritePolicy.OVERWRITE).success
+    assert PdfReader(out / "a1.pdf").get_fields()["name"]["/V"] == "Ada"
+    assert PdfReader(out / "a1_1.pdf").get_fields()["name"]["/V"] == "Bob"
+
+    skipped = fill(OverwritePolicy.SKIP)
+    assert skipped.success and "2 existing skipped" in skipped.message
+    assert not fill(OverwritePolicy.ERROR).success
+    assert fill(OverwritePolicy.RENAME).success
+    assert sorted(p.name for p in out.iterdir()) == ["a1.pdf", "a1_1.pdf", "a1_2.pdf", "a1_3.pdf"]
+
+
+def test_form_fill_merge_keeps_each_record_value(tmp_path: Path) -> None:
+    template = make_form_pdf(tmp_path / "form.pdf")
+    data = tmp_path / "people.csv"
+    data.write_text("name,agree\nAda,yes\nBob,no\n", encoding="utf-8")
+    output = tmp_path / "all.pdf"
+
+    result = FormFillOperation().execute(
+        template, OutputConfig(), data=data, output_path=output, merge=True
+    )
+
+    assert result.success
+    fields = PdfReader(output).get_fields()
+    assert fields["record1.name"]["/V"] == "Ada"
+    assert fields["record2.name"]["/V"] == "Bob"
+    assert fields["record1.agree"]["/V"] == "/Yes"
+
+
+def test_form_fill_merges_and_flattens(tmp_path: Path) -> None:
+    template = make_form_pdf(tmp_path / "form.pdf")
+    data = tmp_path / "people.jsonl"
+    data.write_text('{"name": "Ada", "agree": true}\n{"name": "Bob"}\n', encoding="utf-8")
+    output = tmp_path / "all.pdf"
+
+    result = FormFillOperation().execute(
+        template, OutputConfig(), data=data, output_path=output, merge=True, flatten=True
+    )
+
+    assert result.success
+    reader = PdfReader(output)
+    assert len(reader.pages) == 2
+    assert "/AcroForm" not in reader.trailer["/Root"]
+    assert all("/Annots" not in page for page in reader.pages)
+
+
 def test_bookmarks_view_and_from_file(tmp_path: Path) -> None:
     # No bookmarks path
     empty = make_pdf(tmp_path / "nobook.pdf", pages=1)
@@ -131,6 +345,64 @@ def test_bookmarks_view_and_from_file(tmp_path: Path) -> None:
     assert "Intro" in Path(extract.output_path).read_text()
 
 
+def test_bookmarks_incremental_appends_update(tmp_path: Path) -> None:
+    src = make_pdf(tmp_path / "inc.pdf", pages=3)
+    original = src.read_bytes()
+    out = tmp_path / "inc_out.pdf"
+
+    result = BookmarksOperation().execute(
+        src,
+        OutputConfig(),
+        action="add",
+        bookmarks=[{"title": "One", "page": 1}, {"title": "Three", "page": 3}],
+        incremental=True,
+        output_path=out,
+    )
+    assert result.success
+    assert src.read_bytes() == original
+    data = out.read_bytes()
+    assert data.startswith(original)
+    assert b"/Prev" in data[len(original) :]
+
+    reader = PdfReader(out, strict=True)
+    assert [(item.title, reader.get_destination_page_number(item)) for item in reader.outline] == [
+        ("One", 0),
+        ("Three", 2),
+    ]
+
+
+def test_metadata_in_place_keeps_original_bytes(tmp_path: Path) -> None:
+    src = make_pdf(tmp_path / "meta_inc.pdf", pages=2, metadata={"/Title": "Old"})
+    original = src.read_bytes()
+
+    result = MetadataOperation().execute(
+        src, OutputConfig(), action="edit", title="New", in_place=True
+    )
+    assert result.success
+    assert result.output_path == src
+    assert src.read_bytes().startswith(original)
+
+    reader = PdfReader(src, strict=True)
+    assert reader.metadata.title == "New"
+    assert len(reader.pages) == 2
+
+
+def test_incremental_xref_stream_writes_are_repeatable(tmp_path: Path) -> None:
+    pikepdf = pytest.importorskip("pikepdf")
+    src = tmp_path / "xref_stream.pdf"
+    with pikepdf.new() as pdf:
+        pdf.add_blank_page()
+        pdf.save(src, object_stream_mode=pikepdf.ObjectStreamMode.generate)
+
+    with IncrementalWriter(src) as writer:
+        writer.info()[NameObject("/Title")] = TextStringObject("New")
+        first = writer.write(tmp_path / "first.pdf").read_bytes()
+        second = writer.write(tmp_path / "second.pdf").read_bytes()
+    assert first == second
+    reader = PdfReader(tmp_path / "second.pdf", strict=True)
+    assert reader.metadata.title == "New"
+
+
 def test_info_json_includes_metadata(tmp_path: Path) -> None:
     writer = PdfWriter()
     writer.add_blank_page(width=200, height=200)
@@ -144,6 +416,45 @@ def test_info_json_includes_metadata(tmp_path: Path) -> None:
     assert '"title": "T"' in result.message or '"title": "T"' in result.message.lower()
 
 
+def test_info_fast_matches_full_read(tmp_path: Path) -> None:
+    path = make_pdf(tmp_path / "fast.pdf", pages=4, metadata={"/Title": "Fast", "/Author": "A"})
+
+    full = json.loads(InfoOperation().execute(path, OutputConfig(), json=True).message)
+    fast = json.loads(InfoOperation().execute(path, OutputConfig(), json=True, fast=True).message)
+    for key in ("pages", "encrypted", "size", "page_size", "title", "author", "version"):
+        assert fast[key] == full[key]
+
+
+def test_inventory_summarises_and_resumes(tmp_path: Path) -> None:
+    corpus = tmp_path / "corpus"
+    corpus.mkdir()
+    for index, pages in enumerate([1, 3, 12]):
+        make_pdf(corpus / f"doc{index}.pdf", pages=pages, metadata={"/Producer": "Tool 1.2"})
+    summary_path = tmp_path / "summary.json"
+
+    result = InventoryOperation().execute(corpus, OutputConfig(), output_path=summary_path)
+    assert result.success
+    summary = json.loads(summary_path.read_text())
+    assert summary["files"] == 3
+    assert summary["pages"]["total"] == 16
+    assert summary["pages"]["distribution"] == {"1": 1, "3-5": 1, "11-20": 1}
+    assert summary["producers"] == {"Tool": 3}
+    assert summary["born_digital"] == 3
+
+    # Simulate an interrupted run: one finished record and a torn line
+    records = summary_path.with_suffix(".jsonl")
+    first = records.read_text().splitlines()[0]
+    records.write_text(first + "\n" + '{"path": "tor')
+
+    resumed = InventoryOperation().execute(
+        corpus, OutputConfig(), output_path=summary_path, resume=True
+    )
+    assert resumed.success
+    assert "resumed after 1" in resumed.message
+    assert json.loads(summary_path.read_text()) == summary
+    assert len(records.read_text().splitlines()) == 3
+
+
 def test_merge_uses_custom_output(tmp_path: Path) -> None:
     a = make_pdf(tmp_path / "ma.pdf")
     b = make_pdf(tmp_path / "mb.pdf")
@@ -151,3 +462,65 @@ def test_merge_uses_custom_output(tmp_path: Path) -> None:
     result = MergeOperation().execute(a, OutputConfig(), merge_inputs=[a, b], output_path=out)
     assert result.success
     assert result.output_path == out
+
+
+def test_pdf_to_images_chunks_only_requested_pages() -> None:
+    # Runs of consecutive pages, capped at the chunk size; gaps are never rendered
+    assert page_runs([1, 2, 3, 4, 5, 9, 10, 12], 2) == [(1, 2), (3, 4), (5, 5), (9, 10), (12, 12)]
+    assert page_runs(list(range(1, 8)), 4) == [(1, 4), (5, 7)]
+
+
+class _SizedRasterizer(Rasterizer):
+    """Renders page ``n`` as a (100 + n) x 50 image and records what it rendered."""
+
+    name = "sized"
+
+    def __init__(self) -> None:
+        self.rendered: list[int] = []
+
+    def render(self, input_path, pages=None, dpi=200):
+        from PIL import Image
+
+        for page_num in self._pages(input_path, pages):
+            self.rendered.append(page_num)
+            yield page_num, Image.new("RGB", (100 + page_num, 50), "white")
+
+
+def test_pdf_to_images_renders_gapped_pages_with_thumbnails(tmp_path: Path) -> None:
+    from PIL import Image
+
+    pdf = make_pdf(tmp_path / "doc.pdf", pages=5)
+    out = tmp_path / "images"
+    out.mkdir()
+    rasterizer = _SizedRasterizer()
+
+    paths = PdfToImagesOperation()._execute_pdf_to_images(
+        pdf,
+        out,
+        pages=[1, 3, 4],
+        format="bmp",
+        workers=2,
+        thumbnails=[20, 60],
+        rasterizer=rasterizer,
+    )
+
+    # Gaps are never rendered; each page is followed by its thumbnails, largest first
+    assert sorted(rasterizer.rendered) == [1, 3, 4]
+    assert [p.name for p in paths] == [
+        name
+        for page in (1, 3, 4)
+        for name in (
+            f"doc_page_{page}.bmp",
+            f"doc_page_{page}_60px.bmp",
+            f"doc_page_{page}_20px.bmp",
+        )
+    ]
+    for page in (1, 3, 4):
+        with Image.open(out / f"doc_page_{page}.bmp") as image:
+            assert image.format == "BMP" and image.size == (100 + page, 50)
+        for size in (60, 20):
+            with Image.open(out / f"doc_page_{page}_{size}px.bmp") as thumbnail:
+                assert max(thumbnail.size) == size
+
+    # The staging directory is gone once the pages are in place
+    assert sorted(p.name for p in out.iterdir()) == sorted(p.name for p in paths)
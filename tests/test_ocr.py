@@ -0,0 +1,675 @@
+import importlib.util
+import json
+import threading
+from collections.abc import Iterable, Iterator
+from io import BytesIO
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+import pytest
+from PIL import Image, ImageDraw, ImageEnhance
+from pypdf import PdfReader, PdfWriter
+from pypdf.generic import RectangleObject
+
+from prism_docs.core.raster import Rasterizer
+from prism_docs.core.types import OutputConfig
+from prism_docs.operations.ocr.engine import (
+    TSV_HEADER,
+    OCREngine,
+    PytesseractEngine,
+    _parse_config,
+    get_ocr_engine,
+)
+from prism_docs.operations.ocr.extract_ocr_text import ExtractOCRTextOperation
+from prism_docs.operations.ocr.ocr_data import OCRDataOperation
+from prism_docs.operations.ocr.ocr_language import OCRDetectLanguageOperation
+from prism_docs.operations.ocr.ocr_pdf import OCRPDFOperation
+from prism_docs.operations.ocr.ocr_table import _detect_table_regions
+from prism_docs.operations.ocr.preprocess import estimate_skew, preprocess_image
+from prism_docs.operations.ocr.regions import find_text_blocks
+from prism_docs.operations.ocr.resolution import render_for_ocr
+from prism_docs.operations.ocr.searchable_pdf import SearchablePDFOperation
+from prism_docs.operations.ocr.text_layer import text_layer_operations
+from prism_docs.operations.security.redact import RedactOperation
+from tests.helpers import make_pdf, make_text_pdf
+
+
+class _BlankRasterizer(Rasterizer):
+    """Renders every page as a white image, without poppler."""
+
+    name = "blank"
+
+    def render(
+        self, input_path: Path, pages: Iterable[int] | None = None, dpi: int = 200
+    ) -> Iterator[tuple[int, Image.Image]]:
+        for page_num in self._pages(input_path, pages):
+            yield page_num, Image.new("L", (dpi, dpi), 255)
+
+
+class _WordEngine(OCREngine):
+    """Reads one word per page, without tesseract."""
+
+    name = "word"
+
+    def __init__(self) -> None:
+        self.calls: list[tuple[tuple[int, int], str, str]] = []
+
+    def image_to_data(
+        self, image: Image.Image, lang: str = "eng", config: str = "", timeout: float = 0
+    ) -> dict[str, list[Any]]:
+        self.calls.append((image.size, lang, config))
+        return {
+            "level": [1, 5],
+            "page_num": [1, 1],
+            "block_num": [0, 1],
+            "par_num": [0, 1],
+            "line_num": [0, 1],
+            "word_num": [0, 1],
+            "left": [0, 10],
+            "top": [0, 20],
+            "width": [image.width, 30],
+            "height": [image.height, 12],
+            "conf": [-1, 91],
+            "text": ["", "hello"],
+        }
+
+
+def test_ocr_data_uses_configured_engine_and_rasterizer(tmp_path: Path) -> None:
+    path = make_pdf(tmp_path / "scan.pdf", pages=3)
+    engine = _WordEngine()
+
+    result = OCRDataOperation().execute(
+        path,
+        OutputConfig(),
+        dpi=100,
+        lang="deu",
+        rasterizer=_BlankRasterizer(),
+        ocr_engine=engine,
+    )
+
+    assert result.success, result.message
+    pages = json.loads(Path(result.output_path).with_suffix(".json").read_text())
+    assert [page["page"] for page in pages] == [1, 2, 3]
+    assert [item["text"] for item in pages[0]["items"]] == ["hello"]
+    assert engine.calls == [((100, 100), "deu", "--psm 3 --oem 3")] * 3
+
+
+def test_ocr_engine_selection_and_config_parsing() -> None:
+    if importlib.util.find_spec("tesserocr") is None:
+        # Without tesserocr, auto falls back to the tesseract command
+        assert isinstance(get_ocr_engine("auto"), PytesseractEngine)
+    assert get_ocr_engine("pytesseract") is get_ocr_engine("pytesseract")
+    with pytest.raises(ValueError, match="Unknown OCR engine"):
+        get_ocr_engine("nope")
+
+    assert _parse_config("--psm 6 --oem 1 -c preserve_interword_spaces=1") == (
+        6,
+        1,
+        0,
+        {"preserve_interword_spaces": "1"},
+    )
+    assert _parse_config("") == (3, 3, 0, {})
+    # Options the API cannot apply send the call to the tesseract command
+    assert _parse_config("--tessdata-dir /opt/tessdata") is None
+
+
+class _PassEngine(OCREngine):
+    """Counts recognition passes and returns every format from each one."""
+
+    name = "pass"
+
+    def __init__(self) -> None:
+        self.passes: list[list[str]] = []
+
+    def image_to_outputs(
+        self,
+        image: Image.Image,
+        formats: Iterable[str],
+        lang: str = "eng",
+        config: str = "",
+        timeout: float = 0,
+    ) -> dict[str, Any]:
+        self.passes.append(list(formats))
+        writer = PdfWriter()
+        writer.add_blank_page(width=72, height=72)
+        pdf = BytesIO()
+        writer.write(pdf)
+        outputs = {"text": "recognized", "hocr": "<html/>", "pdf": pdf.getvalue()}
+        return {fmt: outputs[fmt] for fmt in formats}
+
+
+def test_ocr_extract_writes_every_format_from_one_pass(tmp_path: Path) -> None:
+    path = make_pdf(tmp_path / "scan.pdf", pages=2)
+    engine = _PassEngine()
+
+    result = ExtractOCRTextOperation().execute(
+        path,
+        OutputConfig(),
+        format="text,hocr,pdf",
+        dpi=50,
+        rasterizer=_BlankRasterizer(),
+        ocr_engine=engine,
+    )
+
+    assert result.success, result.message
+    assert engine.passes == [["text", "hocr", "pdf"]] * 2
+    output = Path(result.output_path)
+    assert output.with_suffix(".txt").read_text().count("recognized") == 2
+    assert output.with_suffix(".hocr").read_text().count("<html/>") == 2
+    assert len(PdfReader(output.with_suffix(".pdf")).pages) == 2
+
+
+def test_tesseract_runs_all_renderers_in_one_invocation(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    # A stand-in tesseract that writes one file per requested renderer
+    log = tmp_path / "calls.log"
+    script = tmp_path / "tesseract"
+    script.write_text(
+        "#!/bin/sh\n"
+        f'echo "$@" >> {log}\n'
+        'base="$2"\n'
+        'for arg in "$@"; do case "$arg" in\n'
+        '  tessedit_create_txt=1) echo "hello" > "$base.txt" ;;\n'
+        '  tessedit_create_tsv=1) printf "level\\ttext\\n5\\thello\\n" > "$base.tsv" ;;\n'
+        '  tessedit_create_alto=1) echo "<alto/>" > "$base.xml" ;;\n'
+        "esac; done\n"
+    )
+    script.chmod(0o755)
+    monkeypatch.setattr("pytesseract.pytesseract.tesseract_cmd", str(script))
+
+    image = Image.new("L", (10, 10), 255)
+    image.info["dpi"] = (300, 300)
+    outputs = PytesseractEngine().image_to_outputs(
+        image, ["text", "data", "alto"], lang="fra", config="--psm 6"
+    )
+
+    assert outputs == {
+        "text": "hello\n",
+        "data": {"level": [5], "text": ["hello"]},
+        "alto": "<alto/>\n",
+    }
+    [call] = log.read_text().splitlines()
+    # The render resolution is passed on, as the temporary image file lacks it
+    assert "-l fra --psm 6 --dpi 300" in call
+    assert "tessedit_create_txt=1" in call and "tessedit_create_alto=1" in call
+
+
+def test_searchable_pdf_overlay_keeps_original_pages(tmp_path: Path) -> None:
+    path = make_text_pdf(tmp_path / "born.pdf", ["Original vector text"])
+    original_size = path.stat().st_size
+
+    class _Words(OCREngine):
+        def image_to_outputs(
+            self,
+            image: Image.Image,
+            formats: Iterable[str],
+            lang: str = "eng",
+            config: str = "",
+            timeout: float = 0,
+        ) -> dict[str, Any]:
+            assert "pdf" not in formats  # No page images from tesseract
+            return {
+                "data": {
+                    "level": [5, 5],
+                    "block_num": [1, 1],
+                    "line_num": [1, 1],
+                    "word_num": [1, 2],
+                    "left": [10, 80],
+                    "top": [10, 10],
+                    "width": [60, 70],
+                    "height": [20, 20],
+                    "conf": [95, 93],
+                    "text": ["Überschrift", "añadida"],
+                }
+            }
+
+    result = SearchablePDFOperation().execute(
+        path,
+        OutputConfig(),
+        mode="overlay",
+        dpi=72,
+        rasterizer=_BlankRasterizer(),
+        ocr_engine=_Words(),
+    )
+
+    assert result.success, result.message
+    [page] = PdfReader(result.output_path).pages
+    text = page.extract_text()
+    assert "Original vector text" in text
+    assert "Überschrift añadida" in text
+    assert "/XObject" not in page["/Resources"]  # Still the original vector page
+    # Only the font and a few operators were added
+    assert Path(result.output_path).stat().st_size < original_size + 4096
+
+
+def test_text_layer_follows_page_rotation() -> None:
+    writer = PdfWriter()
+    page = writer.add_blank_page(width=200, height=100)
+    page.rotate(90)
+    word = {
+        "text": "up",
+        "bbox": {"x": 0, "y": 0, "width": 20, "height": 10},
+        "block_num": 1,
+        "line_num": 1,
+    }
+
+    # Displayed as 100x200: the word's bottom-left is 10pt down from the top-left corner
+    [operation] = text_layer_operations([word], (100, 200), page)[2:-1]
+    assert operation.endswith("0 1 -1 0 10.00 0.00 Tm <00750070> Tj")
+
+
+def test_preprocess_matches_pillow_enhancers_in_one_pass() -> None:
+    image = Image.fromarray(np.random.default_rng(0).integers(0, 256, (64, 64), dtype=np.uint8))
+
+    enhanced = ImageEnhance.Brightness(ImageEnhance.Contrast(image).enhance(1.2)).enhance(0.9)
+    expected = enhanced.point(lambda p: 0 if p > 100 else 255)
+
+    result = preprocess_image(
+        image, "threshold", threshold=100, contrast=1.2, brightness=0.9, invert=True
+    )
+    assert np.array_equal(np.asarray(result), np.asarray(expected))
+
+
+def test_preprocess_binarizes_uneven_scans() -> None:
+    # Dark text strokes on a background that darkens from left to right
+    background = np.tile(np.linspace(250, 120, 200), (100, 1))
+    background[40:45, 20:180] -= 100
+    image = Image.fromarray(background.astype(np.uint8))
+
+    # One global threshold loses the shaded side; Sauvola's local one keeps it
+    otsu = np.asarray(preprocess_image(image, "otsu"))
+    assert set(np.unique(otsu)) <= {0, 255}
+    assert (otsu[70:90, 150:190] == 0).all()
+
+    sauvola = np.asarray(preprocess_image(image, "sauvola"))
+    assert set(np.unique(sauvola)) <= {0, 255}
+    assert (sauvola[40:45, 20:180] == 0).mean() > 0.9
+    assert (sauvola[70:90, 150:190] == 255).mean() > 0.9
+
+    # Inverting thresholds the page as is and flips the result once
+    inverted = np.asarray(preprocess_image(image, "sauvola", invert=True))
+    assert (inverted == 255 - sauvola).all()
+    assert (inverted[40:45, 20:180] == 255).mean() > 0.9
+
+
+def test_preprocess_deskews_and_crops_borders() -> None:
+    page = Image.new("L", (600, 400), 255)
+    draw = ImageDraw.Draw(page)
+    for y in range(40, 360, 20):
+        draw.rectangle((40, y, 560, y + 6), fill=0)
+    tilted = page.rotate(3, resample=Image.Resampling.BICUBIC, fillcolor=255)
+
+    assert estimate_skew(np.asarray(tilted)) == pytest.approx(-3, abs=0.1)
+
+    # A black scanner edge along the top and left
+    scanned = Image.new("L", (620, 420), 0)
+    scanned.paste(page, (20, 20))
+    cropped = preprocess_image(scanned, crop_borders=True)
+    assert cropped.size == (600, 400)
+
+
+class _PrintRasterizer(Rasterizer):
+    """Renders pages of text in a given point size, recording each call's pages and DPI."""
+
+    name = "print"
+
+    def __init__(self, sizes: list[float]) -> None:
+        self.sizes = sizes
+        self.calls: list[tuple[list[int], int]] = []
+
+    def render(
+        self, input_path: Path, pages: Iterable[int] | None = None, dpi: int = 200
+    ) -> Iterator[tuple[int, Image.Image]]:
+        pages = list(pages or range(1, len(self.sizes) + 1))
+        self.calls.append((pages, dpi))
+        for page_num in pages:
+            size = self.sizes[page_num - 1] * dpi / 72
+            image = Image.new("L", (int(8.5 * dpi), int(11 * dpi)), 255)
+            draw = ImageDraw.Draw(image)
+            for i in range(20):
+                y = dpi // 2 + i * size * 1.5
+                draw.text((dpi // 2, y), "The quick brown fox jumps", fill=0, font_size=size)
+            yield page_num, image
+
+
+def test_auto_dpi_follows_print_size(tmp_path: Path) -> None:
+    rasterizer = _PrintRasterizer([24, 24, 7, 11])
+
+    rendered = {
+        page: image.info["dpi"][0]
+        for page, image in render_for_ocr(rasterizer, tmp_path / "scan.pdf", dpi="auto")
+    }
+
+    assert list(rendered) == [1, 2, 3, 4]
+    assert rendered[1] == rendered[2] <= 150
+    assert rendered[3] >= 400
+    assert rendered[1] < rendered[4] < rendered[3]
+    # One probe pass, then one call per run of pages at the same resolution
+    assert rasterizer.calls[0] == ([1, 2, 3, 4], 100)
+    assert rasterizer.calls[1:] == [([1, 2], rendered[1]), ([3], rendered[3]), ([4], rendered[4])]
+
+    fixed = render_for_ocr(rasterizer, tmp_path / "scan.pdf", [2], dpi=200)
+    assert [image.info["dpi"] for _, image in fixed] == [(200, 200)]
+
+
+def test_cascade_retries_only_low_confidence_pages(tmp_path: Path) -> None:
+    path = make_pdf(tmp_path / "scan.pdf", pages=3)
+    rasterizer = _PrintRasterizer([12, 12, 12])
+
+    class _ConfidenceEngine(OCREngine):
+        """Page 2 reads badly until it is rendered at 300 DPI or more."""
+
+        def __init__(self) -> None:
+            self.reads: list[tuple[int, str]] = []
+
+        def image_to_outputs(
+            self,
+            image: Image.Image,
+            formats: Iterable[str],
+            lang: str = "eng",
+            config: str = "",
+            timeout: float = 0,
+        ) -> dict[str, Any]:
+            dpi = image.info["dpi"][0]
+            page = len(self.reads) + 1 if dpi == 150 else 2
+            self.reads.append((dpi, config))
+            conf = 40 if page == 2 and dpi < 300 else 92
+            data = {"conf": [-1, conf], "text": ["", "word"]}
+            return {"text": f"page {page} at {dpi}", "data": data}
+
+    engine = _ConfidenceEngine()
+    result = OCRPDFOperation().execute(
+        path, OutputConfig(), cascade=True, rasterizer=rasterizer, ocr_engine=engine
+    )
+
+    assert result.success, result.message
+    text = Path(result.output_path).with_suffix(".txt").read_text()
+    assert "page 1 at 150" in text and "page 2 at 300" in text and "page 3 at 150" in text
+    # One fast pass over every page, then one retry of page 2 only
+    assert [call[1] for call in rasterizer.calls] == [150, 300]
+    assert rasterizer.calls[1][0] == [2]
+    assert engine.reads[0] == (150, "--psm 3 --oem 1")
+    assert len(engine.reads) == 4
+
+
+def test_roi_finds_text_blocks_and_skips_pictures() -> None:
+    page = Image.new("L", (1275, 1650), 255)
+    page.info["dpi"] = (150, 150)
+    draw = ImageDraw.Draw(page)
+    draw.rectangle((50, 50, 250, 200), fill=0)  # Logo
+    draw.text((900, 60), "INVOICE 2024-117", fill=0, font_size=30)
+    for row in range(6):
+        for x in (80, 500, 900):
+            draw.text((x, 800 + row * 30), f"cell {row} 12.50", fill=0, font_size=20)
+
+    regions = find_text_blocks(page)
+    # The heading, then the three table columns; never the logo
+    assert len(regions) == 4
+    assert regions[0].box[0] > 850 and regions[0].box[3] < 120
+    assert [r.box[0] < 100 for r in regions[1:]] == [True, False, False]
+
+    [_, table] = find_text_blocks(page, split_columns=False)
+    assert table.box[0] < 100 and table.box[2] > 1000
+
+
+def test_ocr_data_template_regions_map_to_page_coordinates(tmp_path: Path) -> None:
+    path = make_pdf(tmp_path / "form.pdf", pages=1)
+
+    class _CropEngine(OCREngine):
+        def image_to_outputs(
+            self,
+            image: Image.Image,
+            formats: Iterable[str],
+            lang: str = "eng",
+            config: str = "",
+            timeout: float = 0,
+        ) -> dict[str, Any]:
+            data = {
+                "level": [5],
+                "page_num": [1],
+                "block_num": [1],
+                "par_num": [1],
+                "line_num": [1],
+                "word_num": [1],
+                "left": [3],
+                "top": [4],
+                "width": [image.width - 6],
+                "height": [image.height - 8],
+                "conf": [90],
+                "text": [f"{image.width}x{image.height}"],
+            }
+            return {"data": data}
+
+    template = [
+        {"name": "number", "x1": 10, "y1": 60, "x2": 40, "y2": 70},
+        {"name": "total", "page": 2, "x1": 0, "y1": 0, "x2": 10, "y2": 10},
+    ]
+    result = OCRDataOperation().execute(
+        path,
+        OutputConfig(),
+        dpi=72,
+        template=template,
+        rasterizer=_BlankRasterizer(),
+        ocr_engine=_CropEngine(),
+    )
+
+    assert result.success, result.message
+    [page] = json.loads(Path(result.output_path).with_suffix(".json").read_text())
+    # Points from the bottom-left of a 72x72 render: rows 2-12 from the top
+    assert page["items"] == [
+        {
+            "text": "30x10",
+            "confidence": 90,
+            "bbox": {"x": 13, "y": 6, "width": 24, "height": 2},
+            "block_num": 1,
+            "line_num": 1,
+            "word_num": 1,
+            "region": "number",
+        }
+    ]
+
+
+def test_ocr_regions_share_one_pool_across_pages(tmp_path: Path) -> None:
+    path = make_pdf(tmp_path / "forms.pdf", pages=3)
+    threads: list[str] = []
+
+    class _ThreadEngine(OCREngine):
+        def image_to_outputs(
+            self,
+            image: Image.Image,
+            formats: Iterable[str],
+            lang: str = "eng",
+            config: str = "",
+            timeout: float = 0,
+        ) -> dict[str, Any]:
+            threads.append(threading.current_thread().name)
+            return {"text": "field"}
+
+    template = [
+        {"name": name, "x1": 0, "y1": top, "x2": 50, "y2": top + 10}
+        for name, top in (("a", 0), ("b", 20), ("c", 40))
+    ]
+    result = OCRPDFOperation().execute(
+        path,
+        OutputConfig(),
+        dpi=72,
+        template=template,
+        workers=2,
+        rasterizer=_BlankRasterizer(),
+        ocr_engine=_ThreadEngine(),
+    )
+
+    assert result.success, result.message
+    assert len(threads) == 9
+    # Threads are named <pool>_<n>: every page ran on the same two workers
+    assert len({name.rpartition("_")[0] for name in threads}) == 1
+    assert len(set(threads)) <= 2
+
+
+def test_detect_lang_renders_once_and_caches_scripts(tmp_path: Path) -> None:
+    path = make_pdf(tmp_path / "mixed.pdf", pages=3)
+
+    class _ScriptEngine(OCREngine):
+        """Page 2 is Cyrillic, the others Latin."""
+
+        def __init__(self) -> None:
+            self.osd: list[tuple[int, int]] = []
+            self.reads: list[tuple[str, str]] = []
+
+        def image_to_osd(self, image: Image.Image, timeout: float = 0) -> dict[str, Any]:
+            self.osd.append(image.size)
+            return {"script": "Cyrillic" if len(self.osd) == 2 else "Latin"}
+
+        def image_to_string(
+            self, image: Image.Image, lang: str = "eng", config: str = "", timeout: float = 0
+        ) -> str:
+            self.reads.append((lang, config))
+            return f"read as {lang}"
+
+    def run(engine: _ScriptEngine, rasterizer: Rasterizer) -> str:
+        result = OCRDetectLanguageOperation().execute(
+            path,
+            OutputConfig(),
+            per_page=True,
+            psm=6,
+            ocr_cache=tmp_path / "cache",
+            rasterizer=rasterizer,
+            ocr_engine=engine,
+        )
+        assert result.success, result.message
+        return Path(result.output_path).with_suffix(".txt").read_text()
+
+    engine, rasterizer = _ScriptEngine(), _PrintRasterizer([12, 12, 12])
+    text = run(engine, rasterizer)
+
+    # Sampled pages aren't rendered again, and OSD reads small crops of the text
+    assert rasterizer.calls == [([1, 2, 3], 300)]
+    assert len(engine.osd) == 3
+    assert all(w < 8.5 * 150 and h < 11 * 150 for w, h in engine.osd)
+    assert engine.reads == [(lang, "--psm 6 --oem 3") for lang in ("eng", "rus", "eng")]
+    assert text.startswith("Detected languages: eng (pages 1,3), rus (pages 2)")
+    assert "--- Page 2 (rus) ---\nread as rus" in text
+
+    # A rerun takes the scripts from the cache
+    engine = _ScriptEngine()
+    assert run(engine, _PrintRasterizer([12, 12, 12])) == text
+    assert engine.osd == []
+
+
+def test_table_columns_follow_alignment_or_ruling_lines() -> None:
+    def data(words: list[tuple[int, int, str]]) -> dict[str, list]:
+        """``image_to_data`` of (line, left, text) words in one block."""
+        return {
+            "block_num": [1] * len(words),
+            "line_num": [line for line, _, _ in words],
+            "left": [left for _, left, _ in words],
+            "top": [40 + line * 100 for line, _, _ in words],
+            "width": [20 * len(text) for _, _, text in words],
+            "height": [30] * len(words),
+            "text": [text for _, _, text in words],
+        }
+
+    aligned = data(
+        [(1, 40, "Item"), (1, 400, "Qty"), (1, 700, "Price"), (1, 0, " ")]
+        + [(2, 42, "Large"), (2, 120, "box"), (2, 402, "3"), (2, 705, "12.50")]
+        + [(3, 38, "Tape"), (3, 398, "10"), (3, 702, "1.20"), (3, 960, "x")]
+    )
+    assert _detect_table_regions(aligned, 1000) == [
+        {
+            "block": 1,
+            "rows": [
+                ["Item", "Qty", "Price"],
+                ["Large box", "3", "12.50"],
+                ["Tape", "10", "1.20 x"],
+            ],
+        }
+    ]
+    assert _detect_table_regions({**aligned, "text": [" "] * 12}, 1000) == []
+
+    # Right-aligned amounts don't line up on the left, but the rules separate them
+    ruled = data(
+        [(1, 40, "Fees"), (1, 320, "1,250.00"), (1, 620, "A")]
+        + [(2, 40, "Rent"), (2, 430, "80.00"), (2, 625, "B")]
+        + [(3, 40, "Tax"), (3, 500, "5.00"), (3, 630, "C")]
+    )
+    assert _detect_table_regions(ruled, 1000) == []
+    page = Image.new("L", (1000, 500), 255)
+    draw = ImageDraw.Draw(page)
+    for x in (20, 300, 600, 980):
+        draw.line((x, 100, x, 420), fill=0, width=3)
+    [table] = _detect_table_regions(ruled, 1000, image=page)
+    assert table["rows"] == [
+        ["Fees", "1,250.00", "A"],
+        ["Rent", "80.00", "B"],
+        ["Tax", "5.00", "C"],
+    ]
+
+
+def test_table_detection_reads_tsv_as_data() -> None:
+    rows = [(1, 0, 0, ""), (2, 1, 40, "Item"), (2, 1, 400, "Qty"), (2, 1, 700, " ")]
+    rows += [(2, 2, 402, "3"), (2, 2, 42, "Large"), (2, 2, 120, "box"), (2, 3, 38, "Tape")]
+    rows += [(2, 3, 398, "10"), (3, 1, 0, "  Note "), (3, 2, 0, "end")]
+
+    def tsv(words: list[tuple[int, int, int, str]]) -> str:
+        return "\n".join(
+            [TSV_HEADER]
+            + [
+                f"5\t1\t{block}\t1\t{line}\t1\t{left}\t{line * 50}\t{20 * len(text)}\t30"
+                f"\t{-1 if not text else 95.5}\t{text}"
+                for block, line, left, text in words
+            ]
+        )
+
+    for words in (rows, [(*row[:3], row[3].replace("Large", "Größe")) for row in rows]):
+        data = {
+            "block_num": [block for block, _, _, _ in words],
+            "line_num": [line for _, line, _, _ in words],
+            "left": [left for _, _, left, _ in words],
+            "width": [20 * len(text) for _, _, _, text in words],
+            "text": [text for _, _, _, text in words],
+        }
+        [table] = _detect_table_regions(tsv(words), 1000)
+        assert table == _detect_table_regions(data, 1000)[0]
+        assert table["rows"][1][0] in ("Large box", "Größe box")
+    # An empty text field at the very end may be cut off
+    short = tsv([*rows, (3, 3, 0, "")]).removesuffix("\t")
+    assert _detect_table_regions(short, 1000) == _detect_table_regions(tsv(rows), 1000)
+
+
+def test_redact_ocr_boxes_follow_crop_box_and_rotation(tmp_path: Path) -> None:
+    writer = PdfWriter()
+    page = writer.add_blank_page(width=200, height=200)
+    page.cropbox = RectangleObject((50, 50, 150, 150))
+    page.rotate(90)
+    path = tmp_path / "scan.pdf"
+    writer.write(path)
+
+    class _CropRasterizer(_BlankRasterizer):
+        """Renders the crop box, as pdfium does."""
+
+        page_box = "cropbox"
+
+        def render(
+            self, input_path: Path, pages: Iterable[int] | None = None, dpi: int = 200
+        ) -> Iterator[tuple[int, Image.Image]]:
+            for page_num in self._pages(input_path, pages):
+                yield page_num, Image.new("L", (100 * dpi // 72,) * 2, 255)
+
+    result = RedactOperation().execute(
+        path,
+        OutputConfig(),
+        terms=["hello"],
+        ocr_fallback=True,
+        dpi=72,
+        rasterizer=_CropRasterizer(),
+        ocr_engine=_WordEngine(),
+    )
+
+    assert result.success, result.message
+    [annot] = PdfReader(result.output_path).pages[0]["/Annots"]
+    # The word at pixels x 10-40, y 20-32 of the rotated crop box, in user space
+    x1, y1, x2, y2 = (float(v) for v in annot.get_object()["/Rect"])
+    assert (x1, x2) == (pytest.approx(69), pytest.approx(86))
+    assert (y1, y2) == (pytest.approx(59), pytest.approx(91))
@@ -1,5 +1,9 @@
 from pathlib import Path
 
+import pytest
+from pypdf import PdfReader, PdfWriter
+
+from prism_docs.core.output import atomic_text_output, write_image, write_pdf, write_text
 from prism_docs.core.types import OutputConfig, OutputNaming, OverwritePolicy
 
 
@@ -51,3 +55,46 @@ def test_skip_and_error_policies(tmp_path: Path) -> None:
     error_cfg = OutputConfig(overwrite=OverwritePolicy.ERROR)
     with pytest.raises(FileExistsError):
         error_cfg.resolve_output_path(target, "x")
+
+
+def test_write_pdf_replaces_output_atomically(tmp_path: Path) -> None:
+    out = tmp_path / "out.pdf"
+    writer = PdfWriter()
+    writer.add_blank_page(width=100, height=100)
+    write_pdf(writer, out, fsync=True)
+    before = out.read_bytes()
+
+    class Broken:
+        def write(self, stream) -> None:
+            stream.write(b"%PDF-1.7 partial")
+            raise OSError("disk full")
+
+    with pytest.raises(OSError):
+        write_pdf(Broken(), out)
+
+    # The earlier output is untouched and no temporary file is left behind
+    assert out.read_bytes() == before
+    assert [p.name for p in tmp_path.iterdir()] == ["out.pdf"]
+    assert len(PdfReader(out).pages) == 1
+
+
+def test_text_and_image_outputs_are_atomic(tmp_path: Path) -> None:
+    from PIL import Image
+
+    text = write_text("caf\u00e9\n", tmp_path / "out.txt")
+    assert text.read_text(encoding="utf-8") == "caf\u00e9\n"
+
+    with atomic_text_output(tmp_path / "out.csv", newline="") as f:
+        f.write("a,b\r\n")
+    assert (tmp_path / "out.csv").read_bytes() == b"a,b\r\n"
+
+    image = write_image(Image.new("RGB", (4, 3), "red"), tmp_path / "out.png")
+    with Image.open(image) as saved:
+        assert saved.format == "PNG" and saved.size == (4, 3)
+
+    with pytest.raises(OSError), atomic_text_output(tmp_path / "out.txt") as f:
+        f.write("partial")
+        raise OSError("disk full")
+
+    assert text.read_text(encoding="utf-8") == "caf\u00e9\n"
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["out.csv", "out.png", "out.txt"]
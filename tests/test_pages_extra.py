@@ -1,11 +1,17 @@
 from pathlib import Path
 
+import pytest
 from pypdf import PdfReader, PdfWriter
+from pypdf.generic import ArrayObject, DictionaryObject, NameObject, NumberObject
 
+from prism_docs.core import PageSelection
+from prism_docs.core.pages import iter_pages, page_count
 from prism_docs.core.types import OutputConfig
 from prism_docs.operations.basic.watermark import WatermarkOperation
+from prism_docs.operations.pages.extract_pages import ExtractPagesOperation
 from prism_docs.operations.pages.page_numbers import PageNumbersOperation
 from prism_docs.operations.pages.reverse import ReverseOperation
+from prism_docs.operations.pages.rotate import RotateOperation
 from prism_docs.operations.pages.stamp import StampOperation
 from prism_docs.operations.utils.crop import CropOperation
 from prism_docs.operations.utils.resize import ResizeOperation
@@ -114,3 +120,82 @@ def test_resize_sets_target_size(tmp_path: Path) -> None:
     # A5 width ~420, height ~595
     assert 410 < float(box.width) < 430
     assert 585 < float(box.height) < 605
+
+
+def test_page_selection_ranges_negative_and_step() -> None:
+    selection = PageSelection.parse("1,3,5-8,-2-,10-:3").resolve(20)
+
+    assert list(selection) == [1, 3, 5, 6, 7, 8, 10, 13, 16, 19, 20]
+    assert 13 in selection and 14 not in selection
+    assert selection.first == 1 and selection.last == 20
+
+    big = PageSelection.parse("1-500000").resolve(600000)
+    assert len(big) == 500000
+    assert 500000 in big and 500001 not in big
+
+    # Unresolved negative parts cannot answer membership
+    with pytest.raises(ValueError):
+        _ = 1 in PageSelection.parse("-1")
+
+
+def test_rotate_accepts_page_spec_from_end(tmp_path: Path) -> None:
+    src = make_pdf(tmp_path / "rotate.pdf", pages=4)
+
+    result = RotateOperation().execute(src, OutputConfig(), degrees=90, pages="-2-")
+
+    assert result.success
+    rotations = [page.rotation for page in PdfReader(result.output_path).pages]
+    assert rotations == [0, 0, 90, 90]
+
+
+def make_nested_page_tree_pdf(path: Path) -> Path:
+    """Five pages in a nested tree with an empty node and an inherited MediaBox."""
+    writer = PdfWriter()
+
+    def box(width: int) -> ArrayObject:
+        return ArrayObject([NumberObject(v) for v in (0, 0, width, 100)])
+
+    def pages_node(kids: list, **extra) -> DictionaryObject:
+        node = DictionaryObject({NameObject("/Type"): NameObject("/Pages"), **extra})
+        ref = writer._add_object(node)
+        node[NameObject("/Kids")] = ArrayObject(kids)
+        count = 0
+        for kid in kids:
+            kid.get_object()[NameObject("/Parent")] = ref
+            count += int(kid.get_object().get("/Count", 1))
+        node[NameObject("/Count")] = NumberObject(count)
+        return ref
+
+    def leaf(width: int | None = None):
+        page = DictionaryObject({NameObject("/Type"): NameObject("/Page")})
+        if width:
+            page[NameObject("/MediaBox")] = box(width)
+        return writer._add_object(page)
+
+    first = pages_node([leaf(101), leaf(102)])
+    second = pages_node([pages_node([]), leaf(104), leaf()])
+    root = pages_node([first, leaf(103), second], **{NameObject("/MediaBox"): box(100)})
+    writer._root_object[NameObject("/Pages")] = root
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "wb") as f:
+        writer.write(f)
+    return path
+
+
+def test_iter_pages_descends_nested_tree(tmp_path: Path) -> None:
+    reader = PdfReader(make_nested_page_tree_pdf(tmp_path / "nested.pdf"))
+
+    assert page_count(reader) == 5
+    widths = {n: int(page.mediabox.width) for n, page in iter_pages(reader, [5, 2, 4, 9])}
+    assert widths == {2: 102, 4: 104, 5: 100}
+
+
+def test_extract_pages_from_nested_tree(tmp_path: Path) -> None:
+    src = make_nested_page_tree_pdf(tmp_path / "nested.pdf")
+
+    result = ExtractPagesOperation().execute(src, OutputConfig(), pages="3-")
+
+    assert result.success
+    widths = [int(page.mediabox.width) for page in PdfReader(result.output_path).pages]
+    assert widths == [103, 104, 100]
@@ -1,5 +1,8 @@
 from pathlib import Path
 
+import pytest
+from pypdf import PdfReader
+
 from prism_docs.core import Config
 from prism_docs.core.runner import PDFRunner
 from .helpers import make_pdf
@@ -36,3 +39,43 @@ def test_runner_dry_run_returns_messages(tmp_path: Path) -> None:
     assert res.success
     assert res.output_path is None
     assert "[DRY RUN]" in res.message
+
+
+def test_runner_linearize_reaches_writers(tmp_path: Path) -> None:
+    pdf = make_pdf(tmp_path / "d.pdf", pages=3)
+
+    config = Config()
+    config.default_output.linearize = True
+    config.default_output.output_dir = tmp_path / "out"
+
+    runner = PDFRunner(config)
+    [res] = runner.run("compress", pdf)
+
+    try:
+        import pikepdf  # noqa: F401
+    except ImportError:
+        assert not res.success
+        assert "pikepdf" in res.message
+        return
+
+    assert res.success and res.output_path is not None
+    assert b"/Linearized" in res.output_path.read_bytes()[:1024]
+
+
+def test_runner_linearize_keeps_encryption(tmp_path: Path) -> None:
+    pytest.importorskip("pikepdf")
+    pdf = make_pdf(tmp_path / "e.pdf", pages=3)
+
+    config = Config()
+    config.default_output.linearize = True
+    config.default_output.output_dir = tmp_path / "out"
+
+    runner = PDFRunner(config)
+    [res] = runner.run("encrypt", pdf, password="pw")
+
+    assert res.success and res.output_path is not None
+    assert b"/Linearized" in res.output_path.read_bytes()[:1024]
+    reader = PdfReader(res.output_path)
+    assert reader.is_encrypted
+    assert reader.decrypt("pw")
+    assert len(reader.pages) == 3
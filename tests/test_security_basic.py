@@ -1,9 +1,13 @@
 from pathlib import Path
 
-from pypdf import PdfReader
+import pytest
+from pypdf import PdfReader, PdfWriter
 
+from prism_docs import cli
+from prism_docs.core import Config
+from prism_docs.core.runner import PDFRunner
 from prism_docs.core.types import OutputConfig
-from prism_docs.operations.basic.decrypt import DecryptOperation
+from prism_docs.operations.basic.decrypt import DecryptOperation, candidate_passwords
 from prism_docs.operations.basic.encrypt import EncryptOperation
 from tests.helpers import make_pdf
 
@@ -26,3 +30,89 @@ def test_encrypt_and_decrypt_roundtrip(tmp_path: Path) -> None:
     dec_reader = PdfReader(dec_result.output_path)
     assert not dec_reader.is_encrypted
     assert len(dec_reader.pages) == 1
+
+
+def test_cli_decrypt_accepts_trailing_password(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str]
+) -> None:
+    src = make_pdf(tmp_path / "secure.pdf")
+    enc_result = EncryptOperation().execute(src, OutputConfig(), password="pw")
+    assert enc_result.success
+    out = tmp_path / "unlocked.pdf"
+
+    argv = ["prism-docs", "decrypt", str(enc_result.output_path), "pw", "-o", str(out)]
+    monkeypatch.setattr("sys.argv", argv)
+    assert cli.main() == 0
+    assert "deprecated" in capsys.readouterr().err
+    assert not PdfReader(out).is_encrypted
+
+
+def test_encrypt_keys_each_file_and_keeps_outline(tmp_path: Path) -> None:
+    writer = PdfWriter()
+    writer.add_blank_page(width=200, height=200)
+    writer.add_outline_item("Intro", 0)
+    writer.add_metadata({"/Title": "Report"})
+    src = tmp_path / "report.pdf"
+    with open(src, "wb") as f:
+        writer.write(f)
+    other = make_pdf(tmp_path / "other.pdf")
+
+    first = EncryptOperation().execute(src, OutputConfig(), password="pw")
+    second = EncryptOperation().execute(other, OutputConfig(), password="pw")
+    assert first.success and second.success
+
+    # Same password, but each file has its own key and password entries
+    enc_a = PdfReader(first.output_path).trailer["/Encrypt"].get_object()
+    enc_b = PdfReader(second.output_path).trailer["/Encrypt"].get_object()
+    assert enc_a["/U"] != enc_b["/U"]
+    assert enc_a["/UE"] != enc_b["/UE"]
+
+    result = DecryptOperation().execute(first.output_path, OutputConfig(), password="pw")
+    reader = PdfReader(result.output_path)
+    assert reader.outline[0]["/Title"] == "Intro"
+    assert reader.metadata.title == "Report"
+
+
+def test_runner_process_executor_encrypts_batch(tmp_path: Path) -> None:
+    inputs = [make_pdf(tmp_path / f"doc{i}.pdf") for i in range(3)]
+
+    config = Config()
+    config.global_settings.parallel = True
+    config.global_settings.executor = "process"
+    config.global_settings.max_workers = 2
+
+    results = PDFRunner(config).run("encrypt", inputs, password="pw")
+
+    assert all(r.success for r in results)
+    for result in results:
+        reader = PdfReader(result.output_path)
+        assert reader.is_encrypted
+        assert reader.decrypt("pw")
+
+
+def test_decrypt_tries_keyring_and_caches_per_directory(tmp_path: Path) -> None:
+    sender = tmp_path / "acme"
+    first = make_pdf(sender / "one.pdf")
+    second = make_pdf(sender / "two.pdf")
+    encrypted = [
+        EncryptOperation().execute(src, OutputConfig(), password="bravo").output_path
+        for src in (first, second)
+    ]
+    keyring = tmp_path / "keyring.txt"
+    keyring.write_text("# partners\nalpha\nbravo\n", encoding="utf-8")
+
+    result = DecryptOperation().execute(encrypted[0], OutputConfig(), keyring=keyring)
+    assert result.success
+    assert not PdfReader(result.output_path).is_encrypted
+
+    # The winning password is tried first for the next file from the same sender
+    assert candidate_passwords(encrypted[1])[0] == "bravo"
+
+    failed = DecryptOperation().execute(encrypted[1], OutputConfig(), passwords=["nope"])
+    assert failed.success  # cached password still opens it
+
+    other = EncryptOperation().execute(
+        make_pdf(tmp_path / "other" / "x.pdf"), OutputConfig(), password="zulu"
+    )
+    missing = DecryptOperation().execute(other.output_path, OutputConfig(), passwords=["nope"])
+    assert not missing.success
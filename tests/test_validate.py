@@ -1,9 +1,11 @@
+import json
+import re
 from pathlib import Path
 
 from prism_docs.core.types import OutputConfig
 from prism_docs.operations.security.permissions import PermissionsOperation
 from prism_docs.operations.utils.validate import ValidateOperation
-from .helpers import make_pdf
+from .helpers import make_pdf, make_text_pdf
 
 
 def test_validate_passes_on_good_pdf(tmp_path: Path) -> None:
@@ -28,3 +30,63 @@ def test_validate_flags_encrypted_pdf(tmp_path: Path) -> None:
     result = ValidateOperation().execute(encrypted.output_path, OutputConfig())
     assert not result.success
     assert "encrypted" in result.message
+
+
+def test_validate_deep_flags_bad_stream_length(tmp_path: Path) -> None:
+    pdf = make_text_pdf(tmp_path / "text.pdf", ["hello"])
+    assert ValidateOperation().execute(pdf, OutputConfig(), deep=True).success
+
+    data = pdf.read_bytes()
+    length = re.search(rb"/Length (\d+)", data)
+    assert length is not None
+    broken = tmp_path / "broken.pdf"
+    broken.write_bytes(
+        data[: length.start(1)] + str(int(length.group(1)) - 3).encode() + data[length.end(1) :]
+    )
+
+    assert ValidateOperation().execute(broken, OutputConfig(), fast=True).success
+    result = ValidateOperation().execute(broken, OutputConfig(), deep=True)
+    assert not result.success
+    assert "/Length" in result.message
+
+
+def test_validate_directory_streams_jsonl(tmp_path: Path) -> None:
+    corpus = tmp_path / "corpus"
+    (corpus / "nested").mkdir(parents=True)
+    make_pdf(corpus / "a.pdf", pages=2)
+    make_pdf(corpus / "nested" / "b.pdf", pages=3)
+    (corpus / "nested" / "c.pdf").write_bytes(b"%PDF-1.4\nnot really a pdf")
+    out = tmp_path / "scan.jsonl"
+
+    result = ValidateOperation().execute(corpus, OutputConfig(), jsonl=out, deep=True)
+    assert not result.success
+    assert "3 files (1 with issues)" in result.message
+
+    records = {Path(r["path"]).name: r for r in map(json.loads, out.read_text().splitlines())}
+    assert records["a.pdf"]["pages"] == 2 and records["a.pdf"]["valid"]
+    assert records["b.pdf"]["pages"] == 3
+    assert not records["c.pdf"]["valid"]
+
+
+def test_validate_repair_rebuilds_xref_and_drops_broken_page(tmp_path: Path) -> None:
+    from pypdf import PdfReader, PdfWriter
+
+    writer = PdfWriter()
+    for word in ("one", "two", "three"):
+        writer.append(make_text_pdf(tmp_path / f"{word}.pdf", [word]))
+    writer.write(tmp_path / "text.pdf")
+    data = (tmp_path / "text.pdf").read_bytes()
+    # Break the second page dictionary and the cross-reference table
+    page = list(re.finditer(rb"\d+ 0 obj\s*<<\s*/Type /Page\b", data))[1]
+    data = data[: page.end()] + b" ]]] " + data[page.end() :]
+    data = data[: data.rfind(b"xref")] + b"%%EOF\n"
+    broken = tmp_path / "broken.pdf"
+    broken.write_bytes(data)
+
+    result = ValidateOperation().execute(broken, OutputConfig(), repair=True)
+    assert result.success, result.message
+    assert result.output_path == tmp_path / "broken-repaired.pdf"
+    assert "salvaged pages 1,3 of 3" in result.message
+
+    reader = PdfReader(result.output_path, strict=True)
+    assert [p.extract_text().strip() for p in reader.pages] == ["one", "three"]